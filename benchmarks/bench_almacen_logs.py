@@ -0,0 +1,66 @@
+# -------------------------------------------------------------
+# bench_almacen_logs.py - Consultas sobre el almacén de logs con muchos registros.
+#
+# Llena una base temporal con N registros sintéticos (varios usuarios,
+# archivos, fases y un año de fechas) y mide consultas típicas de
+# "python src/cli.py logs". Con los índices, las consultas filtradas
+# tardan milisegundos aunque la base tenga millones de registros.
+# Uso: python benchmarks/bench_almacen_logs.py [N_REGISTROS]
+# -------------------------------------------------------------
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from almacen import AlmacenLogs  # noqa: E402
+
+FASES = ("lexico", "sintactico", "semantico")
+USUARIOS = [f"usuario{i}" for i in range(20)]
+HASHES = [f"{i:040x}" for i in range(5000)]
+AHORA = time.time()
+SEMANA = 7 * 86400
+
+
+def llenar(almacen, n, tanda=100_000):
+    # Las fechas crecen como en un almacén real (se agrega al final); cubren un año
+    aleatorio = random.Random(0)
+    paso = 52 * SEMANA / n
+    for inicio in range(0, n, tanda):
+        registros = []
+        for i in range(inicio, min(inicio + tanda, n)):
+            linea = aleatorio.randint(1, 2000)
+            registros.append((
+                aleatorio.choice(FASES), aleatorio.choice(USUARIOS), AHORA - 52 * SEMANA + i * paso,
+                aleatorio.choice(HASHES), linea, "error", f"Línea {linea}: Error semántico de prueba",
+            ))
+        almacen.agregar(registros)
+
+
+CONSULTAS = [
+    ("semántico, línea 15, última semana", {"fase": "semantico", "severidad": "error", "linea": 15, "desde": AHORA - SEMANA}),
+    ("un archivo (hash)", {"hash_codigo": HASHES[42]}),
+    ("un usuario, último día", {"usuario": "usuario7", "desde": AHORA - 86400}),
+    ("últimos 50 registros", {}),
+]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as carpeta:
+        almacen = AlmacenLogs(os.path.join(carpeta, "registros.sqlite3"))
+        inicio = time.perf_counter()
+        llenar(almacen, n)
+        print(f"{n} registros insertados en {time.perf_counter() - inicio:.1f} s")
+        print(f"{'consulta':<38} {'registros':>10} {'ms':>8}")
+        for nombre, filtros in CONSULTAS:
+            inicio = time.perf_counter()
+            filas = almacen.consultar(limite=50, **filtros)
+            cantidad = almacen.contar(**filtros)
+            ms = (time.perf_counter() - inicio) * 1000
+            print(f"{nombre:<38} {cantidad:>10} {ms:>8.2f}")
+            assert len(filas) == min(50, cantidad)
+        almacen.cerrar()
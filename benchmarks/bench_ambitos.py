@@ -0,0 +1,48 @@
+# -------------------------------------------------------------
+# bench_ambitos.py - Costo de la tabla de símbolos con ámbitos.
+#
+# Analiza programas con miles de funciones que repiten los mismos nombres
+# de parámetros y locales. Abrir y cerrar un ámbito cuesta lo que se
+# declaró dentro, así que el tiempo por función debe mantenerse plano
+# aunque crezca la cantidad de funciones.
+# Uso: python benchmarks/bench_ambitos.py [N_MAXIMO]
+# -------------------------------------------------------------
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from main import Analizador  # noqa: E402
+from semantic import AnalizadorSemantico, TablaSimbolos  # noqa: E402
+
+
+def programa(n):
+    return "int total = 0;\n" + "".join(
+        f"int f{i}(int a, int b) {{ int x = a + b; for (int i = 0; i < x; i = i + 1) {{ int y = i * 2; total = total + y; }} return x; }}\n"
+        for i in range(n)
+    )
+
+
+def medir(n):
+    arbol = Analizador().parsear(programa(n))[0]
+    mejor = float("inf")
+    for _ in range(3):
+        tabla = TablaSimbolos()
+        inicio = time.perf_counter()
+        analizador = AnalizadorSemantico(tabla)
+        analizador.analizar(arbol)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    assert not analizador.errores and tabla.nivel == 0 and set(tabla) == {"total"} | {f"f{i}" for i in range(n)}
+    return mejor
+
+
+if __name__ == "__main__":
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    print(f"{'funciones':>10} {'ms':>9} {'µs/función':>11}")
+    n = 500
+    while n <= maximo:
+        segundos = medir(n)
+        print(f"{n:>10} {segundos * 1000:>9.1f} {segundos / n * 1e6:>11.1f}")
+        n *= 2
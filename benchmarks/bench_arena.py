@@ -0,0 +1,63 @@
+# -------------------------------------------------------------
+# bench_arena.py - Memoria del AST de tuplas frente al ArbolPlano.
+#
+# Parsea copias de Test/*.cs y mide con tracemalloc lo que queda
+# ocupado por el AST de tuplas de syntax.py y por el ArbolPlano de
+# arena.py (el buffer de tokens se crea antes y no se cuenta), el pico
+# de memoria durante cada parseo y su tiempo. Verifica además que el
+# ArbolPlano vuelva a armar exactamente las mismas tuplas.
+# Uso: python benchmarks/bench_arena.py [COPIAS]
+# -------------------------------------------------------------
+
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(RAIZ, "src"))
+
+from arena import construir_arbol  # noqa: E402
+from lexer import AlimentadorTokens, tokenizar  # noqa: E402
+from syntax import parsear  # noqa: E402
+
+
+def programa(copias):
+    codigo = "".join(open(r, encoding="utf-8").read() + "\n" for r in sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs"))))
+    return codigo * copias
+
+
+def medir(construir):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = construir()
+    segundos = time.perf_counter() - inicio
+    memoria, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, memoria, pico, segundos
+
+
+def sin_lineas(nodo):
+    # Los Identificador del AST de tuplas se comparan como str
+    if isinstance(nodo, list):
+        return [sin_lineas(n) for n in nodo]
+    if isinstance(nodo, tuple):
+        return tuple(sin_lineas(n) for n in nodo)
+    return str(nodo) if isinstance(nodo, str) else nodo
+
+
+if __name__ == "__main__":
+    copias = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    entrada = programa(copias)
+    buffer = tokenizar(entrada)
+    tuplas, memoria_tuplas, pico_tuplas, s_tuplas = medir(lambda: parsear(AlimentadorTokens(buffer)))
+    arbol, memoria_arbol, pico_arbol, s_arbol = medir(lambda: construir_arbol(entrada, buffer))
+    assert arbol.a_tuplas() == sin_lineas(tuplas)
+    print(f"{len(buffer.tokens)} tokens, {len(arbol)} nodos")
+    print(f"{'':<14} {'MB':>8} {'bytes/nodo':>11} {'pico MB':>8} {'segundos':>9}")
+    for nombre, memoria, pico, segundos in (("tuplas", memoria_tuplas, pico_tuplas, s_tuplas),
+                                            ("ArbolPlano", memoria_arbol, pico_arbol, s_arbol)):
+        print(f"{nombre:<14} {memoria / 2**20:>8.1f} {memoria / len(arbol):>11.1f} {pico / 2**20:>8.1f} {segundos:>9.2f}")
+    print(f"memoria retenida {memoria_tuplas / memoria_arbol:.1f}x menor; "
+          f"pico {pico_arbol / pico_tuplas:.1f}x y tiempo {s_arbol / s_tuplas:.1f}x los del parseo con tuplas")
@@ -0,0 +1,60 @@
+# -------------------------------------------------------------
+# bench_arranque.py - Tiempo de arranque en frío de lexer + parser.
+#
+# Compara, en procesos nuevos, el tiempo de "import syntax":
+#   - sin tablas: una copia nueva de src/ sin lextab_cs.py ni parsetab_cs.py
+#     en cada ejecución (lo que ocurría antes en cada job de CI con checkout
+#     limpio o en despliegues de solo lectura: PLY reconstruye todo).
+#   - con tablas: src/ con las tablas precompiladas versionadas.
+# Uso: python benchmarks/bench_arranque.py [REPETICIONES]
+# -------------------------------------------------------------
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+MODULOS = ("lexer.py", "syntax.py", "tablas.py")
+
+
+def medir(codigo, repeticiones, preparar=None):
+    # Con caché de bytecode habilitada, como en una instalación normal
+    entorno = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    tiempos = []
+    for _ in range(repeticiones):
+        if preparar:
+            preparar()
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], check=True, stderr=subprocess.DEVNULL, env=entorno)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+
+def medir_import(directorio, repeticiones, preparar=None):
+    return medir(f"import sys; sys.path.insert(0, {directorio!r}); import syntax", repeticiones, preparar)
+
+
+def copiar_sin_tablas(directorio):
+    shutil.rmtree(directorio, ignore_errors=True)
+    os.makedirs(directorio)
+    for nombre in MODULOS:
+        shutil.copy(os.path.join(SRC, nombre), directorio)
+
+
+if __name__ == "__main__":
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    interprete = medir("pass", repeticiones)
+    sin_tablas = os.path.join(tempfile.mkdtemp(prefix="analizador_arranque_"), "src")
+    try:
+        antes = medir_import(sin_tablas, repeticiones, lambda: copiar_sin_tablas(sin_tablas))
+    finally:
+        shutil.rmtree(os.path.dirname(sin_tablas))
+    despues = medir_import(os.path.abspath(SRC), repeticiones)
+    print(f"intérprete vacío:     {interprete * 1000:8.1f} ms")
+    print(f"sin tablas (antes):   {antes * 1000:8.1f} ms")
+    print(f"con tablas (después): {despues * 1000:8.1f} ms")
+    print(f"mejora sobre el import: {(antes - interprete) / (despues - interprete):.1f}x")
@@ -0,0 +1,109 @@
+# -------------------------------------------------------------
+# bench_cache.py - Caché en disco de resultados de análisis.
+#
+# Compara analizar_codigo sin caché con una consulta que acierta en el
+# caché (y verifica que el resultado sea idéntico), prueba el descarte
+# LRU con un límite chico y escribe/lee la misma base desde varios
+# procesos a la vez, comprobando que el total de bytes quede consistente.
+# Uso: python benchmarks/bench_cache.py [PROCESOS]
+# -------------------------------------------------------------
+
+import glob
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(RAIZ, "src"))
+
+import cache as modulo_cache  # noqa: E402
+from cache import CacheAnalisis  # noqa: E402
+from main import Analizador  # noqa: E402
+
+
+def entradas():
+    pruebas = [open(r, encoding="utf-8").read() for r in sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs")))]
+    # Un archivo grande además de los de prueba
+    return pruebas + ["\n".join(pruebas) * 20]
+
+
+def mejor_de(funcion, repeticiones=20):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def comparar(ruta):
+    cache = CacheAnalisis(ruta)
+    sin_cache = Analizador()
+    sin_cache.cache = None
+    con_cache = Analizador()
+    con_cache.cache = cache
+    print(f"{'bytes':>9} {'sin caché ms':>13} {'acierto µs':>11} {'con AST µs':>11} {'guardado KB':>12}")
+    for entrada in entradas():
+        esperado = sin_cache.analizar_codigo(entrada)
+        con_cache.analizar_codigo(entrada)
+        obtenido = con_cache.analizar_codigo(entrada)
+        assert obtenido[0] == esperado[0] and obtenido[1] == esperado[1] and obtenido[2] == esperado[2]
+        # El AST guardado es el mismo que construye el parser
+        assert cache.obtener(entrada, con_arbol=True)[1] == sin_cache.parsear(entrada)[0]
+        analisis = mejor_de(lambda: sin_cache.analizar_codigo(entrada), 5)
+        acierto = mejor_de(lambda: cache.obtener(entrada))
+        con_arbol = mejor_de(lambda: cache.obtener(entrada, con_arbol=True))
+        blob = sqlite3.connect(ruta).execute("SELECT MAX(bytes) FROM entradas").fetchone()[0]
+        print(f"{len(entrada):>9} {analisis * 1000:>13.2f} {acierto * 1e6:>11.1f} {con_arbol * 1e6:>11.1f} {blob / 1024:>12.1f}")
+        cache.limpiar()
+    cache.cerrar()
+
+
+def verificar_lru(ruta):
+    # Cada lectura actualiza el último uso, para ver el orden exacto
+    modulo_cache.RESOLUCION_USO = 0
+    cache = CacheAnalisis(ruta, max_bytes=4000)
+    analizador = Analizador()
+    analizador.cache = cache
+    codigos = [f"int x{i} = {i};\nstring s{i} = \"{'a' * (i % 7)}\";\n" * 5 for i in range(60)]
+    for codigo in codigos:
+        analizador.analizar_codigo(codigo)
+        # El primero se sigue usando: nunca es el menos usado
+        cache.obtener(codigos[0])
+    entradas_guardadas, total = cache.estadisticas()
+    assert total <= cache.max_bytes, total
+    assert cache.obtener(codigos[0]) is not None and cache.obtener(codigos[-1]) is not None
+    assert cache.obtener(codigos[1]) is None
+    print(f"LRU: {entradas_guardadas} de {len(codigos)} entradas guardadas, {total} bytes (máximo {cache.max_bytes})")
+    cache.cerrar()
+
+
+def _trabajador(ruta, numero):
+    # Mitad de códigos compartidos entre procesos y mitad propios
+    analizador = Analizador()
+    analizador.cache = CacheAnalisis(ruta, max_bytes=60_000)
+    for i in range(80):
+        clave = i % 20 if i % 2 else f"{numero}-{i}"
+        analizador.analizar_codigo(f"int v = {i % 20};\nstring s = \"{clave}\";\nbool b = v > 3;\n")
+    return analizador.cache.aciertos
+
+
+def verificar_procesos(ruta, procesos):
+    with ProcessPoolExecutor(procesos) as pool:
+        aciertos = sum(pool.map(_trabajador, [ruta] * procesos, range(procesos)))
+    conexion = sqlite3.connect(ruta)
+    suma = conexion.execute("SELECT COALESCE(SUM(bytes), 0) FROM entradas").fetchone()[0]
+    total = conexion.execute("SELECT bytes FROM totales").fetchone()[0]
+    assert suma == total, (suma, total)
+    print(f"{procesos} procesos: {aciertos} aciertos, total consistente ({total} bytes)")
+
+
+if __name__ == "__main__":
+    procesos = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    with tempfile.TemporaryDirectory() as carpeta:
+        comparar(os.path.join(carpeta, "comparar.sqlite3"))
+        verificar_lru(os.path.join(carpeta, "lru.sqlite3"))
+        verificar_procesos(os.path.join(carpeta, "procesos.sqlite3"), procesos)
@@ -0,0 +1,95 @@
+# -------------------------------------------------------------
+# bench_demonio.py - Demonio de análisis (demonio.py) contra la CLI.
+#
+# Analiza los archivos de Test/ y programas sintéticos (generar_cs.py)
+# de tres maneras y mide archivos/seg:
+#   1. un proceso "cli.py analyze -q" por archivo (como un hook hoy),
+#   2. un proceso "cli.py client -q" por archivo, con el demonio ya
+#      en ejecución,
+#   3. todos los archivos en una sola conexión con pipelining.
+# Verifica que las tres den exactamente los mismos errores.
+# Uso: python benchmarks/bench_demonio.py [ARCHIVOS] [LINEAS] [TRABAJADORES]
+# -------------------------------------------------------------
+
+import glob
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+CLI = os.path.join(RAIZ, "src", "cli.py")
+sys.path.insert(0, os.path.join(RAIZ, "src"))
+
+from cliente import ClienteDemonio  # noqa: E402
+from generar_cs import generar_programa  # noqa: E402
+
+
+def ejecutar_cli(argumentos, entorno):
+    proceso = subprocess.run([sys.executable, CLI, *argumentos], stdout=subprocess.PIPE, env=entorno,
+                             universal_newlines=True, encoding="utf-8")
+    return proceso.returncode, proceso.stdout
+
+
+def por_archivo(comando, rutas, entorno):
+    inicio = time.perf_counter()
+    salidas = [ejecutar_cli([comando, ruta, "-q"], entorno) for ruta in rutas]
+    return time.perf_counter() - inicio, salidas
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    lineas = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    trabajadores = sys.argv[3] if len(sys.argv) > 3 else str(os.cpu_count() or 1)
+
+    carpeta = tempfile.mkdtemp(prefix="bench_demonio_")
+    ruta_socket = os.path.join(carpeta, "demonio.sock")
+    entorno = dict(os.environ, ANALIZADOR_LOGS="0", ANALIZADOR_SOCKET=ruta_socket)
+    entorno.pop("ANALIZADOR_CACHE", None)
+
+    rutas = sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs")))
+    for semilla in range(max(0, cantidad - len(rutas))):
+        ruta = os.path.join(carpeta, f"sintetico_{semilla}.cs")
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(generar_programa(lineas, semilla=semilla))
+        rutas.append(ruta)
+
+    segundos_cli, salidas_cli = por_archivo("analyze", rutas, entorno)
+
+    inicio = time.perf_counter()
+    demonio = subprocess.Popen([sys.executable, CLI, "daemon", "--jobs", trabajadores, "--idle", "0"], env=entorno)
+    while not os.path.exists(ruta_socket):
+        time.sleep(0.01)
+    arranque = time.perf_counter() - inicio
+    try:
+        segundos_cliente, salidas_cliente = por_archivo("client", rutas, entorno)
+
+        entradas = []
+        for ruta in rutas:
+            with open(ruta, encoding="utf-8") as f:
+                entradas.append((ruta, f.read()))
+        inicio = time.perf_counter()
+        with ClienteDemonio(ruta_socket) as conexion:
+            respuestas = list(conexion.analizar(entradas, detalle=False))
+        segundos_pipeline = time.perf_counter() - inicio
+        with ClienteDemonio(ruta_socket) as conexion:
+            conexion.solicitar("apagar")
+    finally:
+        demonio.wait(30)
+
+    # El texto de los errores de cada archivo, en el orden en que los imprime la CLI
+    errores_pipeline = ["".join(re.sub(r"<[^>]+>", "", linea) + "\n"
+                                for fase in ("lex", "syntax", "semantic") for linea in r["errores"][fase])
+                        for r in respuestas]
+    print(f"{len(rutas)} archivos ({lineas} líneas los sintéticos), {trabajadores} trabajadores; "
+          f"arranque del demonio {arranque * 1000:.0f} ms")
+    for nombre, segundos in (("cli.py analyze por archivo", segundos_cli),
+                             ("cli.py client por archivo", segundos_cliente),
+                             ("una conexión, pipelining", segundos_pipeline)):
+        print(f"  {nombre:28s} {segundos:7.2f} s  {len(rutas) / segundos:8.1f} archivos/seg  "
+              f"{segundos_cli / segundos:5.1f}x")
+    print("salidas y códigos de salida del cliente iguales a analyze:", salidas_cliente == salidas_cli)
+    print("errores con pipelining iguales a analyze:", errores_pipeline == [salida for _, salida in salidas_cli])
+    print("código de salida del demonio:", demonio.returncode)
@@ -0,0 +1,38 @@
+# -------------------------------------------------------------
+# bench_errores_lexicos.py - Escalamiento de analizar_lexico con
+# entradas llenas de caracteres no definidos.
+#
+# Uso: python benchmarks/bench_errores_lexicos.py
+# Si la recuperación de errores es lineal, la columna "us/línea"
+# se mantiene aproximadamente constante al crecer la entrada.
+# -------------------------------------------------------------
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from main import analizar_lexico  # noqa: E402
+
+
+# Cada línea mezcla tokens válidos con caracteres sueltos y secuencias inválidas
+LINEA = "int a@ = 1 # 2; ` x $$ & y ~ '?';\n"
+
+
+def generar_entrada(lineas):
+    return LINEA * lineas
+
+
+def medir(lineas):
+    entrada = generar_entrada(lineas)
+    inicio = time.perf_counter()
+    resultado = analizar_lexico(entrada)
+    return time.perf_counter() - inicio, len(resultado)
+
+
+if __name__ == "__main__":
+    print(f"{'líneas':>10} {'entradas':>10} {'segundos':>10} {'us/línea':>10}")
+    for lineas in (1_000, 4_000, 16_000, 64_000):
+        segundos, n = medir(lineas)
+        print(f"{lineas:>10} {n:>10} {segundos:>10.3f} {segundos / lineas * 1e6:>10.2f}")
@@ -0,0 +1,51 @@
+# -------------------------------------------------------------
+# bench_escaner.py - Tokens por segundo: lexer de PLY vs escaner.py.
+#
+# Tokeniza con cada backend una entrada armada con copias de Test/*.cs
+# (sin pasar por el caché de buffers) y reporta tokens/seg. Ambos llenan
+# la misma TablaTokens, así que la diferencia es solo el reconocimiento.
+# Uso: python benchmarks/bench_escaner.py [COPIAS] [REPETICIONES]
+# -------------------------------------------------------------
+
+import glob
+import os
+import sys
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(RAIZ, "src"))
+
+from lexer import lexer, _ejecutar_lexer  # noqa: E402
+from escaner import escanear  # noqa: E402
+
+
+def entrada_de_prueba(copias):
+    codigo = "".join(open(r, encoding="utf-8").read() + "\n" for r in sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs"))))
+    return codigo * copias
+
+
+def medir(funcion, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        cantidad = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return cantidad, mejor
+
+
+if __name__ == "__main__":
+    copias = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    entrada = entrada_de_prueba(copias)
+    backends = {
+        "ply": lambda: len(_ejecutar_lexer(lexer.clone(), entrada).tokens),
+        "manual": lambda: len(escanear(entrada)[0]),
+    }
+    print(f"{len(entrada) / 2**20:.1f} MB")
+    print(f"{'backend':<8} {'tokens':>10} {'segundos':>9} {'tokens/seg':>12}")
+    resultados = {}
+    for nombre, funcion in backends.items():
+        cantidad, segundos = medir(funcion, repeticiones)
+        resultados[nombre] = segundos
+        print(f"{nombre:<8} {cantidad:>10} {segundos:>9.3f} {cantidad / segundos:>12,.0f}")
+    print(f"manual es {resultados['ply'] / resultados['manual']:.2f}x más rápido")
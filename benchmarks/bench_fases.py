@@ -0,0 +1,145 @@
+# -------------------------------------------------------------
+# bench_fases.py - Tiempo y memoria de cada fase a distintas escalas.
+#
+# Genera programas sintéticos (generar_cs.py) de 1k a 1M líneas y analiza
+# cada uno en un proceso aparte, que informa el tiempo de las fases
+# léxica, sintáctica y semántica, tokens/seg y el pico de memoria
+# (ru_maxrss) al terminar cada fase. Con --json guarda los resultados
+# para comparar corridas; con --comparar muestra cuánto cambió cada fase
+# respecto de un JSON anterior.
+# Uso: python benchmarks/bench_fases.py [--tamanos 1000,10000,...] [--profundidad N]
+#          [--semilla S] [--lexer ply|manual] [--json salida.json] [--comparar anterior.json]
+# -------------------------------------------------------------
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from generar_cs import generar_programa
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+FASES = ("lex", "syntax", "semantic")
+TAMANOS = (1_000, 10_000, 100_000, 1_000_000)
+
+# Corre en el proceso hijo: analiza el archivo fase por fase y reporta en JSON
+_HIJO = """
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+import main, syntax, semantic
+def pico_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+with open(sys.argv[2], encoding="utf-8") as f:
+    entrada = f.read()
+analizador = main.Analizador()
+analizador.cache = None
+fases = {}
+base = pico_mb()
+def medir(fase, funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    fases[fase] = {"segundos": time.perf_counter() - inicio, "pico_mb": pico_mb()}
+    return resultado
+buffer = medir("lex", lambda: analizador.tokenizar(entrada))
+# parsear vuelve a pedir los tokens, que ya están en el caché del lexer
+arbol, sintactico = medir("syntax", lambda: analizador.parsear(entrada))
+semantico = medir("semantic", lambda: analizador.analizar_semantico(entrada, arbol))
+print(json.dumps({
+    "tokens": len(buffer.tokens),
+    "base_mb": base,
+    "fases": fases,
+    "errores": {
+        "lex": len(buffer.errores),
+        "syntax": len(main.errores_sintacticos(sintactico)),
+        "semantic": len(main.errores_semanticos(semantico)),
+    },
+}))
+"""
+
+
+def medir_tamano(lineas, profundidad, semilla, carpeta):
+    programa = generar_programa(lineas, profundidad, semilla)
+    ruta = os.path.join(carpeta, f"sintetico_{lineas}.cs")
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(programa)
+    entorno = dict(os.environ, ANALIZADOR_LOGS="0")
+    entorno.pop("ANALIZADOR_CACHE", None)
+    salida = subprocess.run([sys.executable, "-c", _HIJO, os.path.join(RAIZ, "src"), ruta],
+                            capture_output=True, text=True, check=True, env=entorno).stdout
+    os.remove(ruta)
+    resultado = json.loads(salida)
+    resultado["lineas"] = programa.count("\n")
+    resultado["bytes"] = len(programa.encode("utf-8"))
+    resultado["segundos"] = sum(f["segundos"] for f in resultado["fases"].values())
+    resultado["tokens_por_segundo"] = resultado["tokens"] / resultado["fases"]["lex"]["segundos"]
+    return resultado
+
+
+def imprimir_fila(r):
+    fases = r["fases"]
+    print(f"{r['lineas']:>9} {r['tokens']:>10} "
+          + " ".join(f"{fases[fase]['segundos']:>9.3f}" for fase in FASES)
+          + f" {r['tokens_por_segundo']:>11,.0f} {r['lineas'] / r['segundos']:>10,.0f}"
+          + f" {fases['semantic']['pico_mb']:>8.1f}"
+          + ("" if not any(r["errores"].values()) else f"  errores {r['errores']}"))
+
+
+def comparar(anterior, resultados):
+    # Cociente de tiempos por fase (anterior / ahora: >1 es más rápido ahora) para los tamaños en común
+    previos = {r["lineas"]: r for r in anterior["resultados"]}
+    print(f"\nComparación con la corrida del {anterior['fecha']} (veces más rápido; memoria anterior/ahora)")
+    print(f"{'líneas':>9} " + " ".join(f"{fase:>9}" for fase in FASES) + f" {'total':>9} {'memoria':>9}")
+    for r in resultados:
+        previo = previos.get(r["lineas"])
+        if previo is None:
+            continue
+        cocientes = [previo["fases"][f]["segundos"] / r["fases"][f]["segundos"] for f in FASES]
+        memoria = previo["fases"]["semantic"]["pico_mb"] / r["fases"]["semantic"]["pico_mb"]
+        print(f"{r['lineas']:>9} " + " ".join(f"{c:>9.2f}" for c in cocientes)
+              + f" {previo['segundos'] / r['segundos']:>9.2f} {memoria:>9.2f}")
+
+
+def _tamanos(texto):
+    return [int(t) for t in texto.split(",") if t.strip()]
+
+
+if __name__ == "__main__":
+    argumentos = argparse.ArgumentParser(description="Benchmark por fase con programas sintéticos.")
+    argumentos.add_argument("--tamanos", type=_tamanos, default=list(TAMANOS),
+                            help="líneas de cada programa, separadas por comas (por defecto 1k a 1M)")
+    argumentos.add_argument("--profundidad", type=int, default=3, help="anidamiento máximo de bloques")
+    argumentos.add_argument("--semilla", type=int, default=0)
+    argumentos.add_argument("--lexer", choices=("ply", "manual"), default=None,
+                            help="backend del análisis léxico (por defecto ANALIZADOR_LEXER o ply)")
+    argumentos.add_argument("--json", help="archivo donde guardar los resultados")
+    argumentos.add_argument("--comparar", help="JSON de una corrida anterior con el que comparar")
+    args = argumentos.parse_args()
+    if args.lexer:
+        os.environ["ANALIZADOR_LEXER"] = args.lexer
+
+    corrida = {
+        "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "lexer": os.environ.get("ANALIZADOR_LEXER", "ply"),
+        "semilla": args.semilla,
+        "profundidad": args.profundidad,
+        "resultados": [],
+    }
+    print(f"{'líneas':>9} {'tokens':>10} " + " ".join(f"{fase + ' s':>9}" for fase in FASES)
+          + f" {'tokens/s':>11} {'líneas/s':>10} {'pico MB':>8}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for lineas in args.tamanos:
+            resultado = medir_tamano(lineas, args.profundidad, args.semilla, carpeta)
+            corrida["resultados"].append(resultado)
+            imprimir_fila(resultado)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(corrida, f, indent=2)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            comparar(json.load(f), corrida["resultados"])
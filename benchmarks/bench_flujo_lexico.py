@@ -0,0 +1,61 @@
+# -------------------------------------------------------------
+# bench_flujo_lexico.py - Memoria del análisis léxico por flujo.
+#
+# Genera archivos C# de distintos tamaños (copias de Test/*.cs) y los
+# recorre con analizar_lexico_flujo en un proceso aparte, que informa su
+# pico de memoria (ru_maxrss). El pico debe mantenerse plano al crecer el
+# archivo; con analizar_lexico (todo en memoria) crece con el tamaño.
+# Uso: python benchmarks/bench_flujo_lexico.py [MB_MAXIMO] [--completo]
+# -------------------------------------------------------------
+
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Corre en el proceso hijo: consume el generador y reporta tokens y memoria
+_HIJO = """
+import resource, sys
+sys.path.insert(0, sys.argv[1])
+import main
+ruta, completo = sys.argv[2], sys.argv[3] == "1"
+with open(ruta, encoding="utf-8") as f:
+    if completo:
+        n = len(main.analizar_lexico(f.read()))
+    else:
+        n = sum(1 for _ in main.analizar_lexico_flujo(f))
+print(n, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def generar(ruta, megabytes):
+    codigo = "".join(open(r, encoding="utf-8").read() + "\n" for r in sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs"))))
+    objetivo = megabytes * 1024 * 1024
+    with open(ruta, "w", encoding="utf-8") as f:
+        escrito = 0
+        while escrito < objetivo:
+            f.write(codigo)
+            escrito += len(codigo)
+
+
+if __name__ == "__main__":
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 100
+    completo = "--completo" in sys.argv
+    print(f"{'MB':>6} {'renglones':>12} {'segundos':>9} {'pico MB':>8}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for megabytes in (m for m in (1, 10, 100, 1000) if m <= maximo):
+            ruta = os.path.join(carpeta, f"entrada_{megabytes}.cs")
+            generar(ruta, megabytes)
+            inicio = time.perf_counter()
+            salida = subprocess.run(
+                [sys.executable, "-c", _HIJO, os.path.join(RAIZ, "src"), ruta, "1" if completo else "0"],
+                capture_output=True, text=True, check=True,
+            ).stdout.split()
+            segundos = time.perf_counter() - inicio
+            renglones, pico_kb = int(salida[0]), int(salida[1])
+            print(f"{megabytes:>6} {renglones:>12} {segundos:>9.1f} {pico_kb / 1024:>8.1f}")
+            os.remove(ruta)
@@ -0,0 +1,54 @@
+# -------------------------------------------------------------
+# bench_incremental.py - Latencia del análisis en vivo (incremental.py)
+# frente al análisis completo, para dos ediciones en la mitad de archivos
+# cada vez más grandes: un carácter dentro de una línea y un salto de
+# línea (que desplaza las líneas de todo lo que sigue).
+#
+# Uso: python benchmarks/bench_incremental.py
+# Con el análisis incremental las columnas de edición deben quedar casi
+# constantes mientras "completo" crece; además se verifica que ambos
+# resultados sean idénticos después de cada edición (fuera del tiempo).
+# -------------------------------------------------------------
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from main import analizar_codigo  # noqa: E402
+from incremental import AnalisisIncremental  # noqa: E402
+
+EDICIONES = 10
+
+
+def generar_entrada(lineas):
+    bloque = "int v{0} = {0};\nv{0} = v{0} + 1;\nif (v{0} > 2) {{\n  Console.WriteLine(v{0});\n}}\n"
+    return "".join(bloque.format(i) for i in range(lineas // 5))
+
+
+def medir(lineas, insertar):
+    """Retorna (completo, edición) en segundos; insertar(k) es el texto de la k-ésima edición."""
+    texto = generar_entrada(lineas)
+    inicio = time.perf_counter()
+    analizar_codigo(texto)
+    completo = time.perf_counter() - inicio
+    incremental = AnalisisIncremental()
+    incremental.actualizar(texto)
+    posicion = texto.index("= ", len(texto) // 2) + 2
+    total = 0.0
+    for k in range(EDICIONES):
+        texto = texto[:posicion] + insertar(k) + texto[posicion:]
+        inicio = time.perf_counter()
+        resultado = incremental.actualizar(texto)
+        total += time.perf_counter() - inicio
+        assert resultado == analizar_codigo(texto), "el resultado incremental difiere del completo"
+    return completo, total / EDICIONES
+
+
+if __name__ == "__main__":
+    print(f"{'líneas':>10} {'completo ms':>12} {'carácter ms':>12} {'salto ms':>10}")
+    for lineas in (1_000, 4_000, 16_000):
+        completo, caracter = medir(lineas, str)
+        _, salto = medir(lineas, lambda k: "\n")
+        print(f"{lineas:>10} {completo * 1000:>12.1f} {caracter * 1000:>12.2f} {salto * 1000:>10.2f}")
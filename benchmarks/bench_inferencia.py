@@ -0,0 +1,137 @@
+# -------------------------------------------------------------
+# bench_inferencia.py - Inferencia de tipos en cadenas largas.
+#
+# Arma expresiones como las que produce el parser para a + b + c + ...
+# (aritméticas, mezclando int/float/double) y p && q || r ... (lógicas
+# con comparaciones) y mide InferenciaTipos frente a la inferencia de
+# antes: recursiva y con una cadena de "op in [...]" por nodo, que se
+# incluye abajo tal como era para esos operadores. La de antes se queda
+# sin pila en las cadenas de varios miles de términos. También mide la
+# misma expresión inferida de nuevo, con y sin una declaración de otro
+# nombre en el medio: lo guardado sigue valiendo si no leyó ese nombre.
+# Uso: python benchmarks/bench_inferencia.py [TERMINOS_MAXIMO]
+# -------------------------------------------------------------
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from lexer import Identificador  # noqa: E402
+from semantic import ErrorTipo, InferenciaTipos  # noqa: E402
+
+
+def antes(expr, tabla):
+    # inferir_tipo_expresion de antes, reducida a literales, identificadores y operadores
+    if isinstance(expr, bool):
+        return 'bool'
+    if isinstance(expr, int):
+        return 'int'
+    if isinstance(expr, float):
+        return 'float'
+    if isinstance(expr, Identificador):
+        if expr in tabla:
+            return tabla[expr]['tipo']
+        return f"Error: Variable '{expr}' no declarada"
+    op = expr[0]
+    if op in ['+', '-', '*', '/']:
+        izq, der = antes(expr[1], tabla), antes(expr[2], tabla)
+        for tipo in (izq, der):
+            if tipo.startswith("Error"):
+                return tipo
+        if izq == der:
+            return izq
+        if 'double' in (izq, der):
+            if izq in ['int', 'float', 'double'] and der in ['int', 'float', 'double']:
+                return 'double'
+        if 'float' in (izq, der):
+            if izq in ['int', 'float'] and der in ['int', 'float']:
+                return 'float'
+        return f"Error: Operación entre tipos incompatibles: {izq} y {der}"
+    if op in ['and', 'or']:
+        izq, der = antes(expr[1], tabla), antes(expr[2], tabla)
+        for tipo in (izq, der):
+            if tipo.startswith("Error"):
+                return tipo
+        if izq == der == 'bool':
+            return 'bool'
+        return f"Error: Operador lógico requiere booleanos, se recibió {izq} y {der}"
+    if op in ['>', '<', '>=', '<=', '==', '!=']:
+        izq, der = antes(expr[1], tabla), antes(expr[2], tabla)
+        for tipo in (izq, der):
+            if tipo.startswith("Error"):
+                return tipo
+        if izq == der or (izq in ['int', 'float', 'double'] and der in ['int', 'float', 'double']):
+            return 'bool'
+        return f"Error: Comparación entre tipos incompatibles: {izq} y {der}"
+    return f"Error: No se puede inferir el tipo de la expresión {expr}"
+
+
+def identificador(nombre):
+    ident = Identificador(nombre)
+    ident.lineno = 1
+    return ident
+
+
+TABLA = {n: {"tipo": t, "valor": None} for n, t in (("i", "int"), ("f", "float"), ("d", "double"), ("b", "bool"))}
+
+
+def aritmetica(n):
+    # ((i + f) * d - i) / ... : asociativa a izquierda, como la arma el parser
+    ops, nombres = "+*-/", "ifdi"
+    expr = identificador("i")
+    for k in range(1, n):
+        expr = (ops[k % 4], expr, identificador(nombres[k % 4]) if k % 3 else k)
+    return expr
+
+
+def logica(n):
+    # i < f && b || d >= i && ...
+    expr = ('<', identificador("i"), identificador("f"))
+    for k in range(1, n):
+        termino = identificador("b") if k % 2 else ('>=', identificador("d"), k)
+        expr = ('and' if k % 3 else 'or', expr, termino)
+    return expr
+
+
+def medir(funcion, repeticiones, rondas=5):
+    # Mejor de varias rondas, para no medir el ruido de la máquina
+    mejor = None
+    for _ in range(rondas):
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            resultado = funcion()
+        segundos = (time.perf_counter() - inicio) / repeticiones
+        mejor = segundos if mejor is None else min(mejor, segundos)
+    return resultado, mejor
+
+
+if __name__ == "__main__":
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'cadena':<11} {'términos':>9} {'antes µs':>10} {'ahora µs':>10} {'repetida µs':>12} "
+          f"{'tras declarar otra µs':>22}")
+    for nombre, construir in (("aritmética", aritmetica), ("lógica", logica)):
+        for n in (t for t in (10, 100, 900, 10_000, 100_000) if t <= maximo):
+            expr = construir(n)
+            repeticiones = max(1, 20_000 // n)
+            try:
+                esperado, s_antes = medir(lambda: antes(expr, TABLA), repeticiones)
+                texto_antes = f"{s_antes * 1e6:>10.1f}"
+            except RecursionError:
+                esperado, texto_antes = None, f"{'sin pila':>10}"
+            tipo, s_ahora = medir(lambda: InferenciaTipos(TABLA).inferir(expr), repeticiones)
+            assert not isinstance(tipo, ErrorTipo) and esperado in (None, tipo), (esperado, tipo)
+            # Misma expresión en el mismo análisis (var x = ...; validación): sale de lo guardado
+            motor = InferenciaTipos(TABLA)
+            motor.inferir(expr)
+            _, s_repetida = medir(lambda: motor.inferir(expr), repeticiones)
+            # Otra sentencia declaró un nombre que la expresión no usa (int otra = 1;)
+
+            def tras_declarar():
+                motor.invalidar("otra")
+                return motor.inferir(expr)
+            tipo_tras, s_tras = medir(tras_declarar, repeticiones)
+            assert tipo_tras == tipo
+            print(f"{nombre:<11} {n:>9} {texto_antes} {s_ahora * 1e6:>10.1f} {s_repetida * 1e6:>12.2f} "
+                  f"{s_tras * 1e6:>22.2f}")
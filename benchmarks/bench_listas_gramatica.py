@@ -0,0 +1,44 @@
+# -------------------------------------------------------------
+# bench_listas_gramatica.py - Escalamiento del parser con listas largas.
+#
+# Mide solo el tiempo de parseo (sin traza) para:
+#   - un programa con N sentencias de nivel superior
+#   - un literal new List<int> { ... } con N elementos
+# Uso: python benchmarks/bench_listas_gramatica.py [N_MAXIMO]
+# Con construcción lineal de listas, "us/elemento" se mantiene constante.
+# -------------------------------------------------------------
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from lexer import tokenizar, AlimentadorTokens  # noqa: E402
+from syntax import parsear  # noqa: E402
+
+
+def programa_sentencias(n):
+    return "int x = 0;\n" + "x = x + 1;\n" * n
+
+
+def programa_lista(n):
+    elementos = ", ".join(str(i % 1000) for i in range(n))
+    return f"List<int> l = new List<int> {{ {elementos} }};\n"
+
+
+def medir(generador, n):
+    buffer = tokenizar(generador(n))
+    inicio = time.perf_counter()
+    parsear(AlimentadorTokens(buffer))
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tamanos = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= maximo]
+    print(f"{'caso':<12} {'N':>10} {'segundos':>10} {'us/elemento':>12}")
+    for nombre, generador in (("sentencias", programa_sentencias), ("lista", programa_lista)):
+        for n in tamanos:
+            segundos = medir(generador, n)
+            print(f"{nombre:<12} {n:>10} {segundos:>10.3f} {segundos / n * 1e6:>12.2f}")
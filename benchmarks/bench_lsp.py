@@ -0,0 +1,143 @@
+# -------------------------------------------------------------
+# bench_lsp.py - Latencia de los diagnósticos del servidor LSP (lsp.py).
+#
+# Inicia el servidor por stdio como lo haría un editor, abre un programa
+# sintético (generar_cs.py) y escribe declaraciones nuevas de a un
+# carácter con didChange incrementales, cada una en una línea nueva (un
+# Enter en la mitad del archivo, que desplaza todas las líneas
+# siguientes). Mide, para cada tecla, el tiempo hasta recibir los
+# diagnósticos de esa versión (incluye la espera de ESPERA_DIAGNOSTICOS),
+# y aparte el de los Enter. Después repite las mismas ediciones sobre un
+# Documento en este proceso y mide solo Documento.diagnosticos, sin el
+# protocolo ni la espera. Al final verifica que los diagnósticos
+# publicados sean los mismos que da un análisis desde cero del texto final.
+# Uso: python benchmarks/bench_lsp.py [LINEAS] [TECLAS]
+# -------------------------------------------------------------
+
+import json
+import os
+import queue
+import random
+import subprocess
+import sys
+import threading
+import time
+
+RAIZ_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, RAIZ_SRC)
+
+from generar_cs import generar_programa  # noqa: E402
+from lsp import Documento, escribir_mensaje, leer_mensaje  # noqa: E402
+
+URI = "file:///sintetico.cs"
+
+
+class Cliente:
+    def __init__(self):
+        entorno = dict(os.environ, ANALIZADOR_LOGS="0")
+        entorno.pop("ANALIZADOR_CACHE", None)
+        self.proceso = subprocess.Popen([sys.executable, os.path.join(RAIZ_SRC, "lsp.py")],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=entorno)
+        self.mensajes = queue.Queue()
+        threading.Thread(target=self._leer, daemon=True).start()
+        self._id = 0
+
+    def _leer(self):
+        while True:
+            cuerpo = leer_mensaje(self.proceso.stdout)
+            if cuerpo is None:
+                return
+            self.mensajes.put((time.perf_counter(), json.loads(cuerpo)))
+
+    def enviar(self, metodo, parametros, solicitud=False):
+        mensaje = {"jsonrpc": "2.0", "method": metodo, "params": parametros}
+        if solicitud:
+            self._id += 1
+            mensaje["id"] = self._id
+        escribir_mensaje(self.proceso.stdin, mensaje)
+
+    def esperar(self, condicion, limite=30):
+        while True:
+            momento, mensaje = self.mensajes.get(timeout=limite)
+            if condicion(mensaje):
+                return momento, mensaje
+
+
+def diagnosticos_de(version):
+    return lambda m: m.get("method") == "textDocument/publishDiagnostics" and m["params"].get("version") == version
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+if __name__ == "__main__":
+    lineas = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    teclas = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    texto = generar_programa(lineas)
+    azar = random.Random(0)
+
+    inicio = time.perf_counter()
+    cliente = Cliente()
+    cliente.enviar("initialize", {"processId": os.getpid(), "capabilities": {}}, solicitud=True)
+    cliente.esperar(lambda m: m.get("id") == 1)
+    cliente.enviar("initialized", {})
+    arranque = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    cliente.enviar("textDocument/didOpen",
+                   {"textDocument": {"uri": URI, "languageId": "csharp", "version": 0, "text": texto}})
+    cliente.esperar(diagnosticos_de(0))
+    apertura = time.perf_counter() - inicio
+
+    # Declaraciones nuevas después de sentencias que terminan en ';', escritas de a un carácter
+    renglones = texto.split("\n")
+    latencias, enter, cambios, version, con_errores = [], [], [], 0, 0
+    while len(latencias) < teclas:
+        numero = azar.choice([i for i, r in enumerate(renglones) if r.rstrip().endswith(";")])
+        columna = len(renglones[numero])
+        nuevo = f"\nint tecla{version} = {version};"
+        for caracter in nuevo:
+            version += 1
+            cambio = {"range": {"start": {"line": numero, "character": columna},
+                                "end": {"line": numero, "character": columna}}, "text": caracter}
+            cambios.append(cambio)
+            enviado = time.perf_counter()
+            cliente.enviar("textDocument/didChange", {"textDocument": {"uri": URI, "version": version},
+                                                      "contentChanges": [cambio]})
+            recibido, mensaje = cliente.esperar(diagnosticos_de(version))
+            latencias.append(recibido - enviado)
+            con_errores += bool(mensaje["params"]["diagnostics"])
+            if caracter == "\n":
+                enter.append(recibido - enviado)
+                numero, columna = numero + 1, 0
+                renglones.insert(numero, "")
+            else:
+                renglones[numero] += caracter
+                columna += 1
+    final = mensaje["params"]["diagnostics"]
+    cliente.enviar("shutdown", None, solicitud=True)
+    cliente.esperar(lambda m: m.get("id") == 2)
+    cliente.enviar("exit", None)
+    cliente.proceso.wait(10)
+
+    # Las mismas ediciones sin el servidor: solo el análisis de cada versión
+    documento = Documento(URI, texto, 0)
+    documento.diagnosticos("utf-16")
+    analisis = []
+    for cambio in cambios:
+        documento.aplicar_cambios([cambio], "utf-16")
+        inicio = time.perf_counter()
+        documento.diagnosticos("utf-16")
+        analisis.append(time.perf_counter() - inicio)
+
+    esperado = Documento(URI, "\n".join(renglones), version).diagnosticos("utf-16")
+    print(f"{len(renglones)} líneas; arranque {arranque * 1000:.0f} ms, didOpen {apertura * 1000:.0f} ms")
+    print(f"{len(latencias)} teclas ({con_errores} con diagnósticos): mediana {percentil(latencias, 0.5) * 1000:.1f} ms, "
+          f"p95 {percentil(latencias, 0.95) * 1000:.1f} ms, máximo {max(latencias) * 1000:.1f} ms")
+    print(f"  de ellas {len(enter)} Enter: mediana {percentil(enter, 0.5) * 1000:.1f} ms, "
+          f"máximo {max(enter) * 1000:.1f} ms")
+    print(f"Documento.diagnosticos solo: mediana {percentil(analisis, 0.5) * 1000:.1f} ms, "
+          f"p95 {percentil(analisis, 0.95) * 1000:.1f} ms, máximo {max(analisis) * 1000:.1f} ms")
+    print("diagnósticos finales iguales al análisis desde cero:", final == esperado,
+          f"({len(final)} diagnósticos); código de salida {cliente.proceso.returncode}")
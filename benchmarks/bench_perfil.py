@@ -0,0 +1,56 @@
+# -------------------------------------------------------------
+# bench_perfil.py - Costo de perfilar el análisis.
+#
+# Analiza un programa sintético (generar_cs.py) sin perfil y con un
+# Perfil (perfil.py), alternando las corridas, y muestra el mejor tiempo
+# de cada fase. Sin perfil el parser y las reglas de inferencia son los
+# de siempre; con perfil cada reducción se mide, así que la fase
+# sintáctica es la que más se demora.
+# Uso: python benchmarks/bench_perfil.py [LINEAS] [REPETICIONES]
+# -------------------------------------------------------------
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generar_cs import generar_programa  # noqa: E402
+from main import Analizador  # noqa: E402
+from perfil import Perfil  # noqa: E402
+
+FASES = ("lex", "syntax", "semantic")
+
+
+def medir(programa, perfil):
+    analizador = Analizador(perfil=perfil)
+    analizador.cache = None
+    tiempos = {}
+    inicio = time.perf_counter()
+    analizador.tokenizar(programa)
+    tiempos["lex"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    arbol = analizador.parsear(programa)[0]
+    tiempos["syntax"] = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    analizador.analizar_semantico(programa, arbol)
+    tiempos["semantic"] = time.perf_counter() - inicio
+    return tiempos
+
+
+if __name__ == "__main__":
+    lineas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    programa = generar_programa(lineas)
+    mejores = {"sin perfil": dict.fromkeys(FASES, float("inf")), "con perfil": dict.fromkeys(FASES, float("inf"))}
+    for i in range(repeticiones):
+        for j, (modo, perfil) in enumerate((("sin perfil", None), ("con perfil", Perfil()))):
+            # Espacios distintos al final: cada corrida tokeniza de nuevo (no usa el caché de buffers)
+            for fase, segundos in medir(programa + " " * (2 * i + j), perfil).items():
+                mejores[modo][fase] = min(mejores[modo][fase], segundos)
+    print(f"{programa.count(chr(10))} líneas, mejor de {repeticiones}")
+    print(f"{'':<12}" + "".join(f"{fase + ' ms':>14}" for fase in FASES))
+    for modo, tiempos in mejores.items():
+        print(f"{modo:<12}" + "".join(f"{tiempos[fase] * 1000:>14.1f}" for fase in FASES))
+    sin, con = mejores["sin perfil"], mejores["con perfil"]
+    print(f"{'costo':<12}" + "".join(f"{(con[fase] / sin[fase] - 1) * 100:>13.0f}%" for fase in FASES))
@@ -0,0 +1,62 @@
+# -------------------------------------------------------------
+# bench_tabla_tokens.py - Memoria por token de la TablaTokens.
+#
+# Compara, con tracemalloc, lo que ocupaba el resultado léxico antes
+# (una lista de LexToken y una lista de renglones ya formateados) con la
+# TablaTokens de columnas y el ResultadoLexico que formatea al pedirlo.
+# Uso: python benchmarks/bench_tabla_tokens.py [N_SENTENCIAS]
+# -------------------------------------------------------------
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from lexer import lexer, tokenizar  # noqa: E402
+from main import formatear_lexico  # noqa: E402
+
+
+def programa(n):
+    # 7 tokens por sentencia, con identificadores y constantes que se repiten
+    return "".join(f"int x{i % 500} = {i % 1000} + y;\n" for i in range(n))
+
+
+def medir(construir):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = construir()
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return resultado, memoria, segundos
+
+
+def antes(entrada):
+    # Como antes: todos los LexToken en una lista y todos los renglones formateados
+    lex = lexer.clone()
+    lex.errores = []
+    lex.input(entrada)
+    toks = list(iter(lex.token, None))
+    return toks, [f"Línea {t.lineno}: {t.type} -> {t.value}" for t in toks]
+
+
+def ahora(entrada):
+    buffer = tokenizar(entrada, lexer.clone())
+    return buffer, formatear_lexico(buffer)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 150_000
+    entrada = programa(n)
+    (toks, _), memoria_antes, s_antes = medir(lambda: antes(entrada))
+    cantidad = len(toks)
+    del toks
+    (buffer, resultado), memoria_ahora, s_ahora = medir(lambda: ahora(entrada))
+    assert len(buffer.tokens) == cantidad and resultado[-1] == f"Línea {n}: SEMICOLON -> ;"
+    print(f"{cantidad} tokens")
+    print(f"{'':<34} {'MB':>8} {'bytes/token':>12} {'segundos':>9}")
+    print(f"{'LexToken + renglones formateados':<34} {memoria_antes / 2**20:>8.1f} {memoria_antes / cantidad:>12.1f} {s_antes:>9.2f}")
+    print(f"{'TablaTokens + ResultadoLexico':<34} {memoria_ahora / 2**20:>8.1f} {memoria_ahora / cantidad:>12.1f} {s_ahora:>9.2f}")
+    print(f"reducción: {memoria_antes / memoria_ahora:.1f}x")
@@ -0,0 +1,66 @@
+# -------------------------------------------------------------
+# diferencial_escaner.py - escaner.py contra el lexer de PLY.
+#
+# Tokeniza con los dos backends cada archivo de Test/*.cs y variantes
+# aleatorias (con semilla) armadas con fragmentos de esos archivos y con
+# los casos borde de las reglas: "Add" pegado a identificadores, números
+# con y sin parte decimal, & y | sueltos, cadenas sin cerrar, comentarios
+# /* */ abiertos, \r\n, caracteres no ASCII y dígitos Unicode.
+# Compara tipo, valor (y su clase), línea, posición y largo de cada token
+# y los caracteres no definidos. Sale con código 1 si hay diferencias.
+# Uso: python benchmarks/diferencial_escaner.py [VARIANTES]
+# -------------------------------------------------------------
+
+import glob
+import os
+import random
+import sys
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(RAIZ, "src"))
+
+from lexer import lexer, _ejecutar_lexer  # noqa: E402
+from escaner import escanear  # noqa: E402
+
+FRAGMENTOS_BORDE = [
+    "AddItem", "Adder", "xAdd", "_Add", "Add", "Parse", "List", "1.5f", "1.", ".5", "12.34F", "7F",
+    "&&&", "& ", "|||", "| ", '"abc', '"abc"', "/* x\n y */", "/* abierto", "/*/", "// c\r\n",
+    "\r\r\n", "\t", "ñ", "é", "٣٤.٥", "#$", "'a'", "\\", "\x00", "\x7f", "++=", "--", "<=>", "!==",
+]
+
+
+def flujo(tabla, errores):
+    return [(tabla.tipo(i), tabla.valor(i), type(tabla.valor(i)).__name__, tabla.lineas[i],
+             tabla.posiciones[i], tabla.longitudes[i]) for i in range(len(tabla))], errores
+
+
+def con_ply(entrada):
+    buffer = _ejecutar_lexer(lexer.clone(), entrada)
+    return flujo(buffer.tokens, buffer.errores)
+
+
+def con_escaner(entrada):
+    return flujo(*escanear(entrada))
+
+
+def casos(variantes):
+    archivos = [open(r, encoding="utf-8").read() for r in sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs")))]
+    yield from archivos
+    aleatorio = random.Random(0)
+    piezas = [p for codigo in archivos for p in codigo.split()] + FRAGMENTOS_BORDE
+    separadores = [" ", "\n", "", "\t", "\r\n"]
+    for _ in range(variantes):
+        yield "".join(aleatorio.choice(piezas) + aleatorio.choice(separadores) for _ in range(aleatorio.randint(1, 60)))
+
+
+if __name__ == "__main__":
+    variantes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    total = diferencias = 0
+    for entrada in casos(variantes):
+        total += 1
+        if con_ply(entrada) != con_escaner(entrada):
+            diferencias += 1
+            if diferencias <= 3:
+                print(f"Diferencia en: {entrada[:200]!r}")
+    print(f"{total} entradas comparadas: {diferencias} diferencias")
+    sys.exit(1 if diferencias else 0)
@@ -0,0 +1,116 @@
+# -------------------------------------------------------------
+# diferencial_sintaxis.py - Fija la salida del análisis sintáctico.
+#
+# Arma en memoria la gramática original de syntax.py (sin el nivel de
+# precedencia de los operadores relacionales y sin las producciones de
+# recuperación de errores) y compara su salida con la de
+# main.analizar_sintactico:
+# - Test/*.cs: la salida (traza y errores) debe ser idéntica a la original.
+# - Programas de generar_cs.py y variantes aleatorias (con semilla) con
+#   tokens borrados, duplicados o insertados: la salida debe ser idéntica a
+#   la de la gramática sin recuperación de errores (con la precedencia
+#   relacional), es decir, la recuperación solo cambia el árbol.
+# - Expresiones relacionales: el árbol de cada caso de CASOS_RELACIONALES.
+# Sale con código 1 si hay diferencias.
+# Uso: python benchmarks/diferencial_sintaxis.py [VARIANTES]
+# -------------------------------------------------------------
+
+import glob
+import os
+import random
+import sys
+import types
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(RAIZ, "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ply.yacc as yacc  # noqa: E402
+
+import main  # noqa: E402
+import syntax  # noqa: E402
+from lexer import AlimentadorTokens  # noqa: E402
+from generar_cs import generar_programa  # noqa: E402
+
+RELACIONALES = ('LT', 'GT', 'LE', 'GE', 'EQ', 'NE')
+
+# (declaración, árbol de la expresión): los relacionales asocian a izquierda
+# y ligan más que && y || pero menos que la aritmética
+CASOS_RELACIONALES = [
+    ("bool r = a == a == a;", ('==', ('==', 'a', 'a'), 'a')),
+    ("int n = 1 < 2 < 3;", ('<', ('<', 1, 2), 3)),
+    ("bool b = a > 1 && b;", ('and', ('>', 'a', 1), 'b')),
+    ("bool b = a || b != c;", ('or', 'a', ('!=', 'b', 'c'))),
+    ("bool b = a + 1 >= b * 2;", ('>=', ('+', 'a', 1), ('*', 'b', 2))),
+    ("bool b = -a <= b;", ('<=', ('neg', 'a'), 'b')),
+    ("bool b = (a < b) == c;", ('==', ('<', 'a', 'b'), 'c')),
+]
+
+
+def gramatica(relacional=True, recuperacion=False):
+    """Parser sin tablas en disco con o sin el nivel relacional y la recuperación."""
+    excluidas = () if recuperacion else syntax.REGLAS_RECUPERACION
+    espacio = {nombre: valor for nombre, valor in vars(syntax).items() if nombre not in excluidas}
+    if not relacional:
+        espacio["precedence"] = tuple(nivel for nivel in syntax.precedence if nivel[1] not in RELACIONALES)
+    return yacc.yacc(module=types.SimpleNamespace(**espacio), tabmodule="_diferencial_sin_tabla",
+                     debug=False, write_tables=False, errorlog=yacc.NullLogger())
+
+
+def salida(entrada, parser):
+    # Mismo formato que Analizador.parsear, con un solo parseo y sin recuperación
+    sumidero = syntax.SumideroTraza()
+    syntax.parsear(AlimentadorTokens(main.Analizador().tokenizar(entrada)), sumidero, parser)
+    renglones = list(sumidero.lineas())
+    if not sumidero.errores:
+        renglones.append("Análisis sintáctico exitoso.")
+    return renglones
+
+
+def variantes(programas, cantidad):
+    aleatorio = random.Random(0)
+    piezas = [p for codigo in programas for p in codigo.split()]
+    for _ in range(cantidad):
+        palabras = aleatorio.choice(programas).split()
+        for _ in range(aleatorio.randint(1, 3)):
+            i = aleatorio.randrange(len(palabras))
+            operacion = aleatorio.randrange(3)
+            if operacion == 0:
+                del palabras[i]
+            elif operacion == 1:
+                palabras.insert(i, palabras[i])
+            else:
+                palabras.insert(i, aleatorio.choice(piezas))
+        yield " ".join(palabras)
+
+
+def comparar(entradas, parser, nombre):
+    total = diferencias = 0
+    for entrada in entradas:
+        total += 1
+        esperada, obtenida = salida(entrada, parser), main.analizar_sintactico(entrada)
+        if esperada != obtenida:
+            diferencias += 1
+            if diferencias <= 3:
+                renglon = next((a, b) for a, b in zip(esperada + [None], obtenida + [None]) if a != b)
+                print(f"Diferencia ({nombre}) en: {entrada[:200]!r}\n  esperada: {renglon[0]}\n  obtenida: {renglon[1]}")
+    print(f"{nombre}: {total} entradas comparadas, {diferencias} diferencias")
+    return diferencias
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    archivos = [open(r, encoding="utf-8").read() for r in sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs")))]
+    programas = archivos + [generar_programa(60, semilla=s) for s in range(20)]
+
+    diferencias = comparar(archivos, gramatica(relacional=False), "gramática original")
+    diferencias += comparar(programas + list(variantes(programas, cantidad)), gramatica(), "sin recuperación")
+
+    fallos = 0
+    for codigo, esperado in CASOS_RELACIONALES:
+        arbol = syntax.parsear(AlimentadorTokens(main.Analizador().tokenizar(codigo)), None, syntax.nuevo_parser())
+        if arbol[0][-1] != esperado or main.analizar_sintactico(codigo)[-1] != "Análisis sintáctico exitoso.":
+            fallos += 1
+            print(f"Árbol inesperado en {codigo!r}: {arbol[0][-1]!r}")
+    print(f"expresiones relacionales: {len(CASOS_RELACIONALES)} casos, {fallos} fallos")
+    sys.exit(1 if diferencias or fallos else 0)
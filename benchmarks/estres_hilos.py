@@ -0,0 +1,76 @@
+# -------------------------------------------------------------
+# estres_hilos.py - Prueba de estrés del Analizador en varios hilos.
+#
+# Analiza en serie variantes de los archivos de Test/ (desplazadas
+# unas líneas y con otros nombres de variables, para que cada una
+# tenga distinto contenido, números de línea y símbolos) y después
+# las vuelve a analizar desde N hilos a la vez, cada hilo con su
+# propio Analizador. Los resultados deben ser idénticos byte a byte
+# a los de la ejecución en serie.
+# Uso: python benchmarks/estres_hilos.py [HILOS] [RONDAS]
+# -------------------------------------------------------------
+
+import glob
+import os
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(RAIZ, "src"))
+
+from main import Analizador  # noqa: E402
+
+# Más variantes que MAX_BUFFERS_CACHE, para que los hilos también tokenicen en paralelo
+VARIANTES_POR_ARCHIVO = 8
+
+
+def generar_entradas():
+    entradas = []
+    for ruta in sorted(glob.glob(os.path.join(RAIZ, "Test", "*.cs"))):
+        with open(ruta, encoding="utf-8") as f:
+            codigo = f.read()
+        for i in range(VARIANTES_POR_ARCHIVO):
+            # Una variable propia por variante; en las impares, con un error semántico
+            prefijo = "\n" * i + f"int variante{i} = {i};\n"
+            if i % 2:
+                prefijo += f'variante{i} = "texto";\n'
+            entradas.append(prefijo + codigo)
+    return entradas
+
+
+def serializar(resultados):
+    return "\x00".join("\x01".join(fase) for fase in resultados).encode("utf-8")
+
+
+def analizar_en_serie(entradas):
+    return [serializar(Analizador().analizar_codigo(e)) for e in entradas]
+
+
+def analizar_en_hilos(entradas, hilos, rondas):
+    locales = threading.local()
+
+    def tarea(indice):
+        # Cada hilo reutiliza su Analizador entre archivos
+        if not hasattr(locales, "analizador"):
+            locales.analizador = Analizador()
+        return indice, serializar(locales.analizador.analizar_codigo(entradas[indice]))
+
+    orden = [i for _ in range(rondas) for i in range(len(entradas))]
+    random.Random(0).shuffle(orden)
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        return list(pool.map(tarea, orden))
+
+
+if __name__ == "__main__":
+    hilos = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    rondas = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    # Un intervalo de cambio de hilo muy corto fuerza más intercalados
+    sys.setswitchinterval(1e-6)
+    entradas = generar_entradas()
+    esperados = analizar_en_serie(entradas)
+    diferencias = [i for i, obtenido in analizar_en_hilos(entradas, hilos, rondas) if obtenido != esperados[i]]
+    total = len(entradas) * rondas
+    print(f"{total} análisis en {hilos} hilos, {len(entradas)} entradas distintas: {len(diferencias)} diferencias")
+    sys.exit(1 if diferencias else 0)
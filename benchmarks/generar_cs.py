@@ -0,0 +1,446 @@
+# -------------------------------------------------------------
+# generar_cs.py - Generador de programas C# sintéticos.
+#
+# Arma programas válidos (sin errores de sintaxis ni semánticos) que usan
+# todas las producciones de src/syntax.py salvo la de recuperación de
+# errores: clases con campos, métodos y constructores, funciones, for/if/
+# else if/else anidados, listas (literales, acceso, Add, asignación),
+# llamadas, Console.WriteLine e int.Parse(Console.ReadLine()).
+# Con la misma semilla genera siempre el mismo programa.
+# Uso: python benchmarks/generar_cs.py LINEAS [--profundidad N] [--semilla S]
+#          [-o archivo.cs] [--cobertura]
+# -------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+
+SANGRIA = "    "
+
+# Tipos escalares con los que se declaran variables; char solo se declara
+ESCALARES = ("int", "float", "double", "bool", "string")
+TIPOS_LISTA = ("int", "float", "double", "bool", "string")
+
+# Tipos que se pueden usar donde se espera cada tipo (casting implícito de semantic.py)
+ASIGNABLES = {
+    "int": ("int",),
+    "float": ("int", "float"),
+    "double": ("int", "float", "double"),
+    "bool": ("bool",),
+    "string": ("string",),
+}
+
+PALABRAS = ("total", "valor", "indice", "suma", "dato", "nombre", "limite", "paso", "clave", "texto",
+            "monto", "nivel", "cuenta", "saldo", "edad", "precio", "activo", "lista", "item", "resto")
+
+# Profundidad máxima de las expresiones
+PROFUNDIDAD_EXPRESION = 3
+
+
+class GeneradorCS:
+    """
+    Genera el programa de a una declaración de nivel superior por vez,
+    llevando las variables y funciones visibles en cada punto para que el
+    análisis semántico no encuentre errores.
+    - profundidad: anidamiento máximo de bloques (if/for dentro de funciones, etc.).
+    """
+
+    def __init__(self, semilla=0, profundidad=3):
+        self.azar = random.Random(semilla)
+        self.profundidad = profundidad
+        self.lineas = []
+        self._contador = 0
+        # Nombres visibles por tipo ('int', 'list<int>', ...); al cerrar un
+        # ámbito se recortan las listas al largo que tenían al abrirlo
+        self._visibles = {}
+        self._marcas = []
+        # Funciones visibles por tipo de retorno: [(nombre, tipos de parámetros)]
+        self._funciones = {}
+        self._marcas_funciones = []
+
+    # ---------- Nombres y ámbitos ----------
+
+    def _nombre(self, prefijo=None):
+        self._contador += 1
+        return f"{prefijo or self.azar.choice(PALABRAS)}{self._contador}"
+
+    def _abrir(self):
+        self._marcas.append({tipo: len(nombres) for tipo, nombres in self._visibles.items()})
+        self._marcas_funciones.append({tipo: len(f) for tipo, f in self._funciones.items()})
+
+    def _cerrar(self):
+        for tabla, marca in ((self._visibles, self._marcas.pop()), (self._funciones, self._marcas_funciones.pop())):
+            for tipo in list(tabla):
+                if tipo in marca:
+                    del tabla[tipo][marca[tipo]:]
+                else:
+                    del tabla[tipo]
+
+    def _declarar(self, tipo, nombre):
+        self._visibles.setdefault(tipo, []).append(nombre)
+
+    def _variable(self, tipo):
+        nombres = self._visibles.get(tipo)
+        return self.azar.choice(nombres) if nombres else None
+
+    def _linea(self, nivel, texto):
+        self.lineas.append(SANGRIA * nivel + texto)
+
+    # ---------- Expresiones ----------
+
+    def _literal(self, tipo):
+        azar = self.azar
+        if tipo == "int":
+            return str(azar.randint(0, 999))
+        if tipo == "float":
+            return f"{azar.randint(0, 99)}.{azar.randint(0, 99)}" + azar.choice(("", "f"))
+        if tipo == "bool":
+            return azar.choice(("true", "false"))
+        if tipo == "string":
+            return f'"{azar.choice(PALABRAS)} {azar.randint(0, 99)}"'
+        # double no tiene literal propio: un float se convierte solo
+        return self._literal("float")
+
+    def _llamada(self, tipo):
+        # Llamada a una función visible que retorna tipo, o None si no hay
+        funciones = self._funciones.get(tipo)
+        if not funciones:
+            return None
+        nombre, parametros = self.azar.choice(funciones)
+        return f"{nombre}({', '.join(self.expresion(p, 1) for p in parametros)})"
+
+    def expresion(self, tipo, profundidad=PROFUNDIDAD_EXPRESION):
+        """Expresión cuyo tipo inferido se puede usar donde se espera tipo."""
+        return self._expresion(tipo, profundidad)[0]
+
+    def _agrupada(self, tipo, profundidad):
+        # Operando que debe mantenerse junto: entre paréntesis si es una operación binaria
+        texto, compuesta = self._expresion(tipo, profundidad)
+        return f"({texto})" if compuesta else texto
+
+    def _expresion(self, tipo, profundidad):
+        # Retorna (texto, compuesta); compuesta indica una operación binaria sin
+        # paréntesis, que dentro de otra puede agruparse distinto por precedencia
+        if tipo.startswith("list<"):
+            return self._expresion_lista(tipo[5:-1]), False
+        azar = self.azar
+        opcion = azar.random()
+        # Hojas: literal, variable, acceso a lista o llamada
+        if profundidad <= 0 or opcion < 0.35:
+            candidato = None
+            eleccion = azar.random()
+            tipo_hoja = azar.choice(ASIGNABLES[tipo])
+            if eleccion < 0.4:
+                candidato = self._variable(tipo_hoja)
+            elif eleccion < 0.55:
+                lista = self._variable(f"list<{tipo_hoja}>")
+                if lista:
+                    candidato = f"{lista}[{self.expresion('int', 0)}]"
+            elif eleccion < 0.65 and profundidad > 0:
+                candidato = self._llamada(tipo_hoja)
+            elif eleccion < 0.7 and tipo_hoja == "int":
+                candidato = "int.Parse(Console.ReadLine())"
+            elif eleccion < 0.75 and tipo_hoja == "string":
+                candidato = "Console.ReadLine()"
+            return candidato or self._literal(tipo_hoja), False
+        siguiente = profundidad - 1
+        if tipo in ("int", "float", "double"):
+            # Entre numéricos la precedencia no cambia el tipo: sin paréntesis
+            if opcion < 0.8:
+                operador = azar.choice(("+", "-", "*", "/"))
+                return f"{self.expresion(tipo, siguiente)} {operador} {self.expresion(tipo, siguiente)}", True
+            if opcion < 0.9:
+                return f"({self.expresion(tipo, siguiente)})", False
+            operando = self._agrupada(tipo, siguiente)
+            # "--" sería el token MINUSMINUS
+            return (f"-({operando})" if operando.startswith("-") else f"-{operando}"), False
+        if tipo == "string":
+            # string + cualquier tipo es string; la derecha se agrupa para que
+            # "a" + 1 - 2 no quede como ("a" + 1) - 2
+            otro = azar.choice(ESCALARES)
+            return f"{self.expresion('string', siguiente)} + {self._agrupada(otro, siguiente)}", True
+        # bool
+        if opcion < 0.6:
+            if azar.random() < 0.8:
+                operador = azar.choice((">", "<", ">=", "<=", "==", "!="))
+                return f"{self.expresion('double', siguiente)} {operador} {self.expresion('double', siguiente)}", True
+            operador = azar.choice(("==", "!="))
+            return f"{self.expresion('string', siguiente)} {operador} {self.expresion('string', siguiente)}", True
+        if opcion < 0.75:
+            operador = azar.choice(("&&", "||"))
+            return f"{self.expresion('bool', siguiente)} {operador} {self.expresion('bool', siguiente)}", True
+        if opcion < 0.9:
+            # ! tiene menor precedencia que los demás operadores: lo que le siga se
+            # agruparía dentro de él, así que también cuenta como compuesta
+            return f"!{self._agrupada('bool', siguiente)}", True
+        return f"({self.expresion('bool', siguiente)})", False
+
+    def _expresion_lista(self, elemento):
+        opcion = self.azar.random()
+        existente = self._variable(f"list<{elemento}>")
+        if existente and opcion < 0.2:
+            return existente
+        if opcion < 0.5:
+            return f"new List<{elemento}>()"
+        elementos = ", ".join(self.expresion(elemento, 1) for _ in range(self.azar.randint(0, 4)))
+        return f"new List<{elemento}> {{ {elementos} }}" if elementos else f"new List<{elemento}> {{ }}"
+
+    # ---------- Sentencias ----------
+
+    def _tipo_declaracion(self):
+        azar = self.azar
+        if azar.random() < 0.2:
+            return f"list<{azar.choice(TIPOS_LISTA)}>"
+        return azar.choice(ESCALARES)
+
+    @staticmethod
+    def _texto_tipo(tipo):
+        return f"List<{tipo[5:-1]}>" if tipo.startswith("list<") else tipo
+
+    def _declaracion(self, nivel):
+        azar = self.azar
+        tipo = self._tipo_declaracion()
+        nombre = self._nombre()
+        opcion = azar.random()
+        # Con var el tipo es el de la expresión: solo tipos cuyas expresiones
+        # asignables son exactamente de ese tipo (ver ASIGNABLES)
+        exacto = tipo not in ("float", "double")
+        if opcion < 0.1 and exacto:
+            # var sin inicializar: toma el tipo en la primera asignación
+            self._linea(nivel, f"var {nombre};")
+            self._linea(nivel, f"{nombre} = {self.expresion(tipo)};")
+        elif opcion < 0.2 and exacto:
+            self._linea(nivel, f"var {nombre} = {self.expresion(tipo)};")
+        elif opcion < 0.3:
+            self._linea(nivel, f"{self._texto_tipo(tipo)} {nombre};")
+        elif opcion < 0.33:
+            self._linea(nivel, f"char {nombre};")
+            return
+        else:
+            self._linea(nivel, f"{self._texto_tipo(tipo)} {nombre} = {self.expresion(tipo)};")
+        self._declarar(tipo, nombre)
+
+    def _sentencia_simple(self, nivel):
+        azar = self.azar
+        opcion = azar.random()
+        if opcion < 0.35:
+            self._declaracion(nivel)
+            return
+        if opcion < 0.55:
+            tipo = azar.choice(ESCALARES)
+            nombre = self._variable(tipo)
+            if nombre:
+                self._linea(nivel, f"{nombre} = {self.expresion(tipo)};")
+                return
+        elif opcion < 0.65:
+            elemento = azar.choice(TIPOS_LISTA)
+            lista = self._variable(f"list<{elemento}>")
+            if lista:
+                self._linea(nivel, f"{lista}.Add({self.expresion(elemento)});")
+                return
+        elif opcion < 0.72:
+            elemento = azar.choice(TIPOS_LISTA)
+            lista = self._variable(f"list<{elemento}>")
+            if lista:
+                self._linea(nivel, f"{lista}[{self.expresion('int', 1)}] = {self.expresion(elemento)};")
+                return
+        elif opcion < 0.8:
+            llamada = self._llamada(azar.choice(ESCALARES))
+            if llamada:
+                self._linea(nivel, f"{llamada};")
+                return
+        self._linea(nivel, f"Console.WriteLine({self.expresion(azar.choice(ESCALARES))});")
+
+    def _bloque(self, nivel, profundidad, minimo=1, maximo=5, retorno=None):
+        # Cuerpo de un bloque en su propio ámbito
+        self._abrir()
+        for _ in range(self.azar.randint(minimo, maximo)):
+            self._sentencia(nivel, profundidad)
+        if retorno is not None:
+            self._linea(nivel, f"return {self.expresion(retorno)};")
+        self._cerrar()
+
+    def _sentencia(self, nivel, profundidad):
+        opcion = self.azar.random()
+        if profundidad > 0 and opcion < 0.15:
+            self._if(nivel, profundidad)
+        elif profundidad > 0 and opcion < 0.25:
+            self._for(nivel, profundidad)
+        else:
+            self._sentencia_simple(nivel)
+
+    def _if(self, nivel, profundidad):
+        azar = self.azar
+        self._linea(nivel, f"if ({self.expresion('bool')}) {{")
+        self._bloque(nivel + 1, profundidad - 1, minimo=0)
+        while azar.random() < 0.3:
+            self._linea(nivel, f"}} else if ({self.expresion('bool')}) {{")
+            self._bloque(nivel + 1, profundidad - 1)
+        if azar.random() < 0.5:
+            self._linea(nivel, "} else {")
+            self._bloque(nivel + 1, profundidad - 1)
+        self._linea(nivel, "}")
+
+    def _for(self, nivel, profundidad):
+        azar = self.azar
+        self._abrir()
+        contador = self._variable("int")
+        opcion = azar.random()
+        if opcion < 0.75 or contador is None:
+            contador = self._nombre("i")
+            inicio = f"int {contador} = {self.expresion('int', 1)}"
+        elif opcion < 0.85:
+            inicio = f"{contador} = 0"
+        elif opcion < 0.95:
+            inicio = ""
+        else:
+            inicio = self._llamada("int") or contador
+        condicion = "" if azar.random() < 0.05 else f"{contador} < {self.expresion('int', 1)}"
+        opcion = azar.random()
+        if opcion < 0.9:
+            paso = f"{contador} = {contador} + {azar.randint(1, 3)}"
+        elif opcion < 0.95:
+            paso = ""
+        else:
+            paso = self._llamada("int") or contador
+        self._linea(nivel, f"for ({inicio}; {condicion}; {paso}) {{")
+        self._declarar("int", contador)
+        self._bloque(nivel + 1, profundidad - 1, minimo=0)
+        self._linea(nivel, "}")
+        self._cerrar()
+
+    # ---------- Funciones y clases ----------
+
+    def _parametros(self):
+        parametros = [(self.azar.choice(ESCALARES), self._nombre("p")) for _ in range(self.azar.randint(0, 3))]
+        return parametros, ", ".join(f"{tipo} {nombre}" for tipo, nombre in parametros)
+
+    def _funcion(self, nivel, modificador=None, void=False):
+        azar = self.azar
+        tipo = "void" if void else azar.choice(ESCALARES)
+        nombre = self._nombre("calcular" if not void else "mostrar")
+        parametros, texto = self._parametros()
+        prefijo = f"{modificador} " if modificador else ""
+        self._linea(nivel, f"{prefijo}{tipo} {nombre}({texto}) {{")
+        self._abrir()
+        for tipo_param, nombre_param in parametros:
+            self._declarar(tipo_param, nombre_param)
+        self._bloque(nivel + 1, self.profundidad - 1, minimo=0 if void else 1, retorno=None if void else tipo)
+        self._cerrar()
+        self._linea(nivel, "}")
+        # Se registra al terminar: así no se llama a sí misma
+        self._funciones.setdefault(tipo, []).append((nombre, [t for t, _ in parametros]))
+
+    def _modificador(self):
+        return self.azar.choice((None, "public", "private", "protected"))
+
+    def _prefijo_modificador(self):
+        modificador = self._modificador()
+        return f"{modificador} " if modificador else ""
+
+    def _clase(self, nivel):
+        azar = self.azar
+        nombre = self._nombre("Clase")
+        modificador = azar.choice((None, "public"))
+        self._linea(nivel, f"{modificador + ' ' if modificador else ''}class {nombre} {{")
+        self._abrir()
+        vacia = azar.random() < 0.05
+        for _ in range(0 if vacia else azar.randint(0, 3)):
+            tipo = self._tipo_declaracion()
+            campo = self._nombre("campo")
+            prefijo = self._prefijo_modificador()
+            if azar.random() < 0.5:
+                self._linea(nivel + 1, f"{prefijo}{self._texto_tipo(tipo)} {campo} = {self.expresion(tipo)};")
+            else:
+                self._linea(nivel + 1, f"{prefijo}{self._texto_tipo(tipo)} {campo};")
+            self._declarar(tipo, campo)
+        if not vacia and azar.random() < 0.7:
+            parametros, texto = self._parametros()
+            prefijo = self._prefijo_modificador()
+            self._linea(nivel + 1, f"{prefijo}{nombre}({texto}) {{")
+            self._abrir()
+            for tipo_param, nombre_param in parametros:
+                self._declarar(tipo_param, nombre_param)
+            self._bloque(nivel + 2, self.profundidad - 1, minimo=0)
+            self._cerrar()
+            self._linea(nivel + 1, "}")
+        for _ in range(0 if vacia else azar.randint(0, 3)):
+            self._funcion(nivel + 1, self._modificador(), void=azar.random() < 0.4)
+        self._cerrar()
+        self._linea(nivel, "}")
+
+    def agregar_unidad(self):
+        """Agrega una declaración de nivel superior (función, clase o sentencia)."""
+        opcion = self.azar.random()
+        if opcion < 0.3:
+            self._funcion(0)
+        elif opcion < 0.45:
+            self._clase(0)
+        else:
+            self._sentencia(0, self.profundidad)
+
+    def generar(self, lineas):
+        """Agrega unidades hasta tener al menos lineas renglones y retorna el programa."""
+        while len(self.lineas) < lineas:
+            self.agregar_unidad()
+        return "\n".join(self.lineas) + "\n"
+
+
+def generar_programa(lineas, profundidad=3, semilla=0):
+    """Retorna un programa C# válido de al menos lineas renglones."""
+    return GeneradorCS(semilla, profundidad).generar(lineas)
+
+
+def cobertura(programa):
+    """
+    Parsea el programa contando cuántas veces se reduce cada producción.
+    Retorna (conteo por nombre de regla p_*, reglas que ninguna acción de las
+    tablas LALR reduce, errores de sintaxis, errores semánticos).
+    """
+    from main import Analizador, errores_semanticos, errores_sintacticos
+    from perfil import Perfil
+    from syntax import nuevo_parser
+
+    # Número de cada producción que alguna acción reduce (en las tablas, -número)
+    tablas = nuevo_parser()
+    reducidas = {-accion for acciones in tablas.action.values() for accion in acciones.values()
+                  if accion is not None and accion < 0}
+    alcanzables = {produccion.callable.__name__ for numero, produccion in enumerate(tablas.productions)
+                   if produccion.callable is not None and numero in reducidas}
+    perfil = Perfil()
+    analizador = Analizador(perfil=perfil)
+    analizador.cache = None
+    arbol, sintactico = analizador.parsear(programa)
+    semanticos = errores_semanticos(analizador.analizar_semantico(programa, arbol))
+    conteo = {nombre: reducciones for nombre, (reducciones, _) in perfil.reglas.items()}
+    return conteo, sorted(set(conteo) - alcanzables), errores_sintacticos(sintactico), semanticos
+
+
+if __name__ == "__main__":
+    argumentos = argparse.ArgumentParser(description="Genera un programa C# sintético válido.")
+    argumentos.add_argument("lineas", type=int, help="cantidad mínima de renglones")
+    argumentos.add_argument("--profundidad", type=int, default=3, help="anidamiento máximo de bloques")
+    argumentos.add_argument("--semilla", type=int, default=0)
+    argumentos.add_argument("-o", "--salida", help="archivo de salida (por defecto, la salida estándar)")
+    argumentos.add_argument("--cobertura", action="store_true",
+                            help="en lugar de escribir el programa, informa las producciones usadas y los errores")
+    args = argumentos.parse_args()
+    programa = generar_programa(args.lineas, args.profundidad, args.semilla)
+    if args.cobertura:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+        conteo, inalcanzables, sintacticos, semanticos = cobertura(programa)
+        sin_usar = sorted(nombre for nombre, n in conteo.items() if n == 0 and nombre not in inalcanzables)
+        print(f"{len(conteo) - len(inalcanzables) - len(sin_usar)} de {len(conteo) - len(inalcanzables)} producciones alcanzables usadas")
+        for nombre in sin_usar:
+            print(f"  sin usar: {nombre}")
+        for nombre in inalcanzables:
+            print(f"  inalcanzable en las tablas LALR: {nombre}")
+        print(f"errores de sintaxis: {len(sintacticos)}, errores semánticos: {len(semanticos)}")
+        for error in (list(sintacticos) + semanticos)[:10]:
+            print(f"  {error}")
+    elif args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(programa)
+    else:
+        sys.stdout.write(programa)
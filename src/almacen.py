@@ -0,0 +1,126 @@
+# -------------------------------------------------------------
+# almacen.py - Almacén estructurado de logs (SQLite)
+#
+# Alternativa a los logs de texto: cada error de cada análisis se guarda
+# como un registro (fase, usuario, fecha, hash del código, línea,
+# severidad, mensaje) en una base SQLite con índices, para consultas como
+# "errores semánticos en la línea 15 de la última semana" sin recorrer
+# miles de archivos. Lo alimenta el hilo escritor de registro.py y se
+# consulta con "python src/cli.py logs".
+# -------------------------------------------------------------
+
+import hashlib
+import re
+import sqlite3
+
+RUTA_ALMACEN = "logs/registros.sqlite3"
+
+SEVERIDAD_ERROR = "error"
+SEVERIDAD_INFO = "info"
+
+_PATRON_LINEA = re.compile(r"[Ll]ínea (\d+)")
+_ETIQUETA_HTML = re.compile(r"<[^>]+>")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS registros (
+    id INTEGER PRIMARY KEY,
+    fase TEXT NOT NULL,
+    usuario TEXT NOT NULL,
+    fecha REAL NOT NULL,
+    hash TEXT,
+    linea INTEGER,
+    severidad TEXT NOT NULL,
+    mensaje TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS registros_fase_linea ON registros (fase, severidad, linea, fecha);
+CREATE INDEX IF NOT EXISTS registros_fecha ON registros (fecha);
+CREATE INDEX IF NOT EXISTS registros_hash ON registros (hash, fecha);
+CREATE INDEX IF NOT EXISTS registros_usuario ON registros (usuario, fecha);
+"""
+
+# Columnas que retorna consultar(), en orden
+COLUMNAS = ("fecha", "fase", "usuario", "hash", "linea", "severidad", "mensaje")
+
+
+def hash_entrada(entrada):
+    """Hash del código analizado; es el mismo que usa lexer.clave_entrada."""
+    return hashlib.sha1(entrada.encode("utf-8")).hexdigest()
+
+
+def registros_de_resultado(fase, usuario, fecha, hash_codigo, errores):
+    """
+    Arma los registros de un análisis: uno por error (con la línea si el
+    mensaje la indica) y uno de resumen con la cantidad de errores, para
+    que también queden las ejecuciones sin errores.
+    """
+    registros = []
+    for mensaje in errores:
+        mensaje = _ETIQUETA_HTML.sub("", mensaje)
+        coincidencia = _PATRON_LINEA.search(mensaje)
+        linea = int(coincidencia.group(1)) if coincidencia else None
+        registros.append((fase, usuario, fecha, hash_codigo, linea, SEVERIDAD_ERROR, mensaje))
+    registros.append((fase, usuario, fecha, hash_codigo, None, SEVERIDAD_INFO, f"{len(errores)} error(es)"))
+    return registros
+
+
+class AlmacenLogs:
+    """
+    Conexión a la base de registros. Cada hilo o proceso abre la suya; el
+    modo WAL permite consultar mientras otro proceso escribe.
+    """
+
+    def __init__(self, ruta=RUTA_ALMACEN):
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta, timeout=10)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.executescript(_ESQUEMA)
+
+    def agregar(self, registros):
+        """Inserta los registros en una sola transacción."""
+        with self._conexion:
+            self._conexion.executemany(
+                "INSERT INTO registros (fase, usuario, fecha, hash, linea, severidad, mensaje) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                registros,
+            )
+
+    def _filtros(self, fase=None, usuario=None, desde=None, hasta=None, hash_codigo=None,
+                 linea=None, severidad=None, texto=None):
+        condiciones, parametros = [], []
+        for columna, valor in (("fase", fase), ("usuario", usuario), ("hash", hash_codigo),
+                               ("linea", linea), ("severidad", severidad)):
+            if valor is not None:
+                condiciones.append(f"{columna} = ?")
+                parametros.append(valor)
+        if desde is not None:
+            condiciones.append("fecha >= ?")
+            parametros.append(desde)
+        if hasta is not None:
+            condiciones.append("fecha < ?")
+            parametros.append(hasta)
+        if texto is not None:
+            # Sin índice: recorre los registros que dejen pasar los demás filtros
+            condiciones.append("instr(mensaje, ?) > 0")
+            parametros.append(texto)
+        donde = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        return donde, parametros
+
+    def consultar(self, limite=100, **filtros):
+        """
+        Retorna los registros más recientes que cumplen los filtros (fase,
+        usuario, desde/hasta como timestamp, hash_codigo, linea, severidad,
+        texto contenido en el mensaje), como tuplas en el orden de COLUMNAS.
+        """
+        donde, parametros = self._filtros(**filtros)
+        consulta = f"SELECT {', '.join(COLUMNAS)} FROM registros{donde} ORDER BY fecha DESC, id DESC"
+        if limite is not None:
+            consulta += " LIMIT ?"
+            parametros.append(limite)
+        return self._conexion.execute(consulta, parametros).fetchall()
+
+    def contar(self, **filtros):
+        donde, parametros = self._filtros(**filtros)
+        return self._conexion.execute(f"SELECT COUNT(*) FROM registros{donde}", parametros).fetchone()[0]
+
+    def cerrar(self):
+        self._conexion.close()
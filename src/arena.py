@@ -0,0 +1,451 @@
+# -------------------------------------------------------------
+# arena.py - AST plano en arrays, con la posición de cada nodo
+#
+# El parser de syntax.py arma tuplas anidadas ('if_else', cond, cuerpo,
+# else) sin posiciones. Este módulo construye, en el mismo parseo, una
+# representación opcional en columnas: por nodo, su tipo, el rango
+# [inicio, fin) del código que cubre y dónde empiezan sus hijos en un
+# único array de hijos. Una vez armado retiene unas 4 veces menos
+# memoria que las tuplas y se recorre sin recursión (preorden/postorden
+# con pila).
+# Las reglas de syntax.py no cambian: se envuelven en una copia del
+# parser y, tras cada reducción, se agrega el nodo que la regla armó.
+# Por eso las tuplas se arman igual: el pico de memoria del parseo es el
+# de las tuplas más el del árbol plano, y el parseo tarda entre 2 y 2,5
+# veces lo que tarda solo (cada reducción empareja los elementos de la
+# tupla con los símbolos de la producción). Conviene para guardar
+# árboles o buscar nodos por posición, no para bajar el pico del parseo.
+# El AST de tuplas sigue siendo el que usan el análisis semántico y la GUI.
+# -------------------------------------------------------------
+
+import copy
+from array import array
+
+from ply.lex import LexToken
+
+from lexer import Identificador, AlimentadorTokens, linea_columna, indice_lineas, tokenizar
+from syntax import nuevo_parser, parsear
+
+# Hijo ausente (None en las tuplas: else vacío, clase sin modificador, ...)
+NULO = -1
+
+# Forma de cada nodo, para poder volver a armar la tupla equivalente
+HOJA, TUPLA, TUPLA_SIN_TIPO, LISTA = range(4)
+
+# Terminales cuyo valor forma parte de las tuplas; la puntuación, los
+# operadores y las palabras clave solo aportan a la posición del nodo
+TERMINALES_CON_VALOR = frozenset({
+    'ID', 'INT_CONST', 'FLOAT_CONST', 'STRING_CONST', 'TRUE', 'FALSE',
+    'INT', 'FLOAT', 'BOOL', 'STRING', 'CHAR', 'VAR', 'DOUBLE', 'VOID',
+    'PUBLIC', 'PRIVATE', 'PROTECTED',
+})
+
+
+class ArbolPlano:
+    """
+    AST guardado en arrays paralelos, un renglón por nodo:
+    - tipos: índice en nombres_tipos ('if_else', 'declarations', 'ID', ...).
+    - formas: HOJA, TUPLA, TUPLA_SIN_TIPO (los parámetros) o LISTA.
+    - inicios / fines: rango [inicio, fin) en la entrada; -1 si el nodo no
+      cubre código (una lista vacía al final del archivo).
+    - primer_hijo / cantidad_hijos: tramo del array hijos con sus hijos,
+      que son índices de nodo o NULO.
+    - valores: índice en el conjunto de valores de las hojas, o -1.
+    Los nodos se agregan en postorden: cada hijo tiene índice menor que su padre.
+    """
+
+    def __init__(self, entrada=""):
+        self.entrada = entrada
+        self.tipos = array('H')
+        self.formas = array('B')
+        self.inicios = array('i')
+        self.fines = array('i')
+        self.primer_hijo = array('i')
+        self.cantidad_hijos = array('i')
+        self.valores = array('i')
+        self.hijos = array('i')
+        self.nombres_tipos = []
+        self._indice_tipos = {}
+        self._conjunto_valores = []
+        self._indice_valores = {}
+        self._inicios_linea = None
+        self.raiz = NULO
+
+    def agregar(self, tipo, forma, inicio, fin, hijos=(), valor=None):
+        """Agrega un nodo y retorna su índice."""
+        numero = self._indice_tipos.get(tipo)
+        if numero is None:
+            numero = self._indice_tipos[tipo] = len(self.nombres_tipos)
+            self.nombres_tipos.append(tipo)
+        if forma == HOJA:
+            # Como en TablaTokens, la clave incluye la clase para no confundir 1, 1.0 y True
+            if isinstance(valor, Identificador):
+                valor = str(valor)
+            clave = (valor.__class__, valor)
+            indice_valor = self._indice_valores.get(clave)
+            if indice_valor is None:
+                indice_valor = self._indice_valores[clave] = len(self._conjunto_valores)
+                self._conjunto_valores.append(valor)
+        else:
+            indice_valor = -1
+        self.tipos.append(numero)
+        self.formas.append(forma)
+        self.inicios.append(-1 if inicio is None else inicio)
+        self.fines.append(-1 if fin is None else fin)
+        self.primer_hijo.append(len(self.hijos))
+        self.cantidad_hijos.append(len(hijos))
+        self.valores.append(indice_valor)
+        self.hijos.extend(hijos)
+        return len(self.tipos) - 1
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += len(self.tipos)
+        return Nodo(self, indice)
+
+    def tipo(self, indice):
+        return self.nombres_tipos[self.tipos[indice]]
+
+    def valor(self, indice):
+        i = self.valores[indice]
+        return None if i < 0 else self._conjunto_valores[i]
+
+    def indices_hijos(self, indice):
+        primero = self.primer_hijo[indice]
+        return self.hijos[primero:primero + self.cantidad_hijos[indice]]
+
+    def posicion(self, pos):
+        """Retorna (línea, columna) de una posición de la entrada."""
+        if self._inicios_linea is None:
+            self._inicios_linea = indice_lineas(self.entrada)
+        return linea_columna(self._inicios_linea, pos)
+
+    # ---------------------------
+    # Recorridos sin recursión
+    # ---------------------------
+
+    def preorden(self, desde=None):
+        """Genera (índice, profundidad) de cada nodo, el padre antes que sus hijos."""
+        desde = self.raiz if desde is None else desde
+        if desde == NULO:
+            return
+        pila = [(desde, 0)]
+        hijos, primer_hijo, cantidad_hijos = self.hijos, self.primer_hijo, self.cantidad_hijos
+        while pila:
+            indice, profundidad = pila.pop()
+            yield indice, profundidad
+            primero = primer_hijo[indice]
+            # Se apilan al revés para visitarlos en orden
+            for k in range(primero + cantidad_hijos[indice] - 1, primero - 1, -1):
+                if hijos[k] != NULO:
+                    pila.append((hijos[k], profundidad + 1))
+
+    def postorden(self, desde=None):
+        """Genera el índice de cada nodo después de los de sus hijos."""
+        desde = self.raiz if desde is None else desde
+        if desde == NULO:
+            return
+        pila = [(desde, False)]
+        hijos, primer_hijo, cantidad_hijos = self.hijos, self.primer_hijo, self.cantidad_hijos
+        while pila:
+            indice, visitado = pila.pop()
+            if visitado:
+                yield indice
+                continue
+            pila.append((indice, True))
+            primero = primer_hijo[indice]
+            for k in range(primero + cantidad_hijos[indice] - 1, primero - 1, -1):
+                if hijos[k] != NULO:
+                    pila.append((hijos[k], False))
+
+    def nodo_en(self, pos):
+        """
+        Retorna el nodo más profundo cuyo rango contiene pos (un índice de la
+        entrada), o None si ninguno lo contiene.
+        """
+        if self.raiz == NULO:
+            return None
+        encontrado = None
+        actual = self.raiz
+        while actual != NULO:
+            if not self.inicios[actual] <= pos < self.fines[actual]:
+                break
+            encontrado = actual
+            siguiente = NULO
+            for hijo in self.indices_hijos(actual):
+                if hijo != NULO and self.inicios[hijo] <= pos < self.fines[hijo]:
+                    siguiente = hijo
+                    break
+            actual = siguiente
+        return None if encontrado is None else Nodo(self, encontrado)
+
+    def a_tuplas(self, desde=None):
+        """
+        Vuelve a armar el AST de tuplas equivalente al de syntax.py (los
+        identificadores quedan como str, sin número de línea).
+        """
+        desde = self.raiz if desde is None else desde
+        if desde == NULO:
+            return None
+        armados = {NULO: None}
+        for indice in self.postorden(desde):
+            forma = self.formas[indice]
+            if forma == HOJA:
+                armados[indice] = self.valor(indice)
+                continue
+            hijos = [armados.pop(h) if h != NULO else None for h in self.indices_hijos(indice)]
+            if forma == LISTA:
+                armados[indice] = hijos
+            elif forma == TUPLA_SIN_TIPO:
+                armados[indice] = tuple(hijos)
+            else:
+                armados[indice] = (self.tipo(indice), *hijos)
+        return armados[desde]
+
+
+class Nodo:
+    """Vista liviana de un nodo de un ArbolPlano; no copia sus datos."""
+
+    __slots__ = ("arbol", "indice")
+
+    def __init__(self, arbol, indice):
+        self.arbol = arbol
+        self.indice = indice
+
+    def __eq__(self, otro):
+        return isinstance(otro, Nodo) and otro.arbol is self.arbol and otro.indice == self.indice
+
+    def __hash__(self):
+        return hash((id(self.arbol), self.indice))
+
+    def __repr__(self):
+        return f"Nodo({self.tipo!r}, {self.inicio}, {self.fin})"
+
+    @property
+    def tipo(self):
+        return self.arbol.tipo(self.indice)
+
+    @property
+    def es_hoja(self):
+        return self.arbol.formas[self.indice] == HOJA
+
+    @property
+    def es_lista(self):
+        return self.arbol.formas[self.indice] == LISTA
+
+    @property
+    def valor(self):
+        return self.arbol.valor(self.indice)
+
+    @property
+    def inicio(self):
+        inicio = self.arbol.inicios[self.indice]
+        return None if inicio < 0 else inicio
+
+    @property
+    def fin(self):
+        fin = self.arbol.fines[self.indice]
+        return None if fin < 0 else fin
+
+    @property
+    def texto(self):
+        """Código fuente que cubre el nodo."""
+        if self.inicio is None:
+            return ""
+        return self.arbol.entrada[self.inicio:self.fin]
+
+    @property
+    def linea(self):
+        return None if self.inicio is None else self.arbol.posicion(self.inicio)[0]
+
+    @property
+    def columna(self):
+        return None if self.inicio is None else self.arbol.posicion(self.inicio)[1]
+
+    @property
+    def hijos(self):
+        """Hijos en el orden de la tupla; None donde la tupla tiene None."""
+        arbol = self.arbol
+        return [None if h == NULO else Nodo(arbol, h) for h in arbol.indices_hijos(self.indice)]
+
+    def recorrer(self):
+        """Genera (nodo, profundidad) del subárbol en preorden."""
+        for indice, profundidad in self.arbol.preorden(self.indice):
+            yield Nodo(self.arbol, indice), profundidad
+
+
+# ---------------------------
+# Construcción durante el parseo
+# ---------------------------
+
+class _Constructor:
+    """
+    Agrega al ArbolPlano el nodo de cada reducción. Identifica los hijos
+    comparando los elementos de la tupla que armó la regla con los símbolos
+    de la producción (terminales con valor y no terminales), en orden.
+    En cada símbolo no terminal deja:
+    - arena_inicio / arena_fin: su rango en la entrada.
+    - arena_nodo: índice de su nodo, o arena_lista: (tipo, índices) si su
+      valor es una lista que todavía puede crecer (declarations, params, ...).
+    """
+
+    def __init__(self, arbol):
+        self.arbol = arbol
+        self.ultimo = None
+
+    def reducir(self, nombre, simbolos, lexer):
+        destino = simbolos[0]
+        inicio, fin = self._rango(simbolos)
+        if inicio is None:
+            # Producción vacía: ancho cero donde empieza el siguiente token
+            inicio = fin = getattr(lexer, 'lexpos', None)
+        destino.arena_inicio, destino.arena_fin = inicio, fin
+        self.ultimo = destino
+        valor = destino.value
+        candidatos = [s for s in simbolos[1:] if s.type in TERMINALES_CON_VALOR or hasattr(s, 'arena_inicio')]
+
+        if valor is None:
+            destino.arena_nodo = NULO
+        elif isinstance(valor, list):
+            previo = simbolos[1] if len(simbolos) > 1 else None
+            pendiente = getattr(previo, 'arena_lista', None)
+            if pendiente is not None and previo.value is valor:
+                # Misma lista: la regla la extendió con append (o la pasó tal cual)
+                tipo, indices = pendiente
+                nuevos = valor[len(indices):]
+                indices.extend(self._emparejar(nuevos, candidatos[1:], inicio))
+                destino.arena_lista = (tipo, indices)
+            else:
+                destino.arena_lista = (nombre, self._emparejar(valor, candidatos, inicio))
+        elif isinstance(valor, tuple):
+            k = self._buscar(valor, candidatos)
+            if k is not None:
+                # La regla pasó el valor de un hijo tal cual (expresión entre paréntesis)
+                destino.arena_nodo = self._nodo(candidatos[k])
+            elif valor and isinstance(valor[0], str) and self._buscar(valor[0], candidatos) is None:
+                hijos = self._emparejar(valor[1:], candidatos, inicio)
+                destino.arena_nodo = self.arbol.agregar(valor[0], TUPLA, inicio, fin, hijos)
+            else:
+                # (tipo, ID) de param: la tupla no empieza con su nombre
+                hijos = self._emparejar(valor, candidatos, inicio)
+                destino.arena_nodo = self.arbol.agregar(nombre, TUPLA_SIN_TIPO, inicio, fin, hijos)
+        else:
+            k = self._buscar(valor, candidatos)
+            if k is not None:
+                destino.arena_nodo = self._nodo(candidatos[k])
+            else:
+                # Valor calculado por la regla (true/false -> Booleano): hoja del token que lo originó
+                terminales = [s for s in candidatos if isinstance(s, LexToken)]
+                tipo = terminales[0].type if len(terminales) == 1 else nombre
+                destino.arena_nodo = self.arbol.agregar(tipo, HOJA, inicio, fin, valor=valor)
+
+    def raiz(self):
+        return NULO if self.ultimo is None else self._nodo(self.ultimo)
+
+    @staticmethod
+    def _rango(simbolos):
+        inicio = fin = None
+        for s in simbolos[1:]:
+            if isinstance(s, LexToken):
+                a, b = s.lexpos, getattr(s, 'endlexpos', s.lexpos)
+            elif hasattr(s, 'arena_inicio'):
+                a, b = s.arena_inicio, s.arena_fin
+            elif isinstance(getattr(s, 'value', None), LexToken):
+                # Símbolo error de PLY: su valor es el token donde se detectó
+                a, b = s.value.lexpos, getattr(s.value, 'endlexpos', s.value.lexpos)
+            else:
+                continue
+            if a is None:
+                continue
+            if inicio is None:
+                inicio = a
+            fin = b
+        return inicio, fin
+
+    @staticmethod
+    def _buscar(elemento, candidatos):
+        for k, candidato in enumerate(candidatos):
+            if candidato.value is elemento:
+                return k
+        return None
+
+    def _emparejar(self, elementos, candidatos, inicio):
+        # Cada elemento se busca después del anterior: dos constantes iguales
+        # (el mismo objeto del conjunto de valores) quedan en su lugar
+        indices = []
+        k = 0
+        for elemento in elementos:
+            if elemento is None:
+                indices.append(NULO)
+                continue
+            encontrado = None
+            for j in range(k, len(candidatos)):
+                if candidatos[j].value is elemento:
+                    encontrado = j
+                    break
+            if encontrado is None:
+                # Literal escrito en la regla ('void', 'int'): el terminal con el mismo texto
+                for j in range(k, len(candidatos)):
+                    c = candidatos[j]
+                    if isinstance(c, LexToken) and c.value.__class__ is elemento.__class__ and c.value == elemento:
+                        encontrado = j
+                        break
+            if encontrado is None:
+                indices.append(self.arbol.agregar('literal', HOJA, inicio, inicio, valor=elemento))
+                continue
+            indices.append(self._nodo(candidatos[encontrado]))
+            k = encontrado + 1
+        return indices
+
+    def _nodo(self, simbolo):
+        if isinstance(simbolo, LexToken):
+            return self.arbol.agregar(simbolo.type, HOJA, simbolo.lexpos,
+                                      getattr(simbolo, 'endlexpos', simbolo.lexpos), valor=simbolo.value)
+        pendiente = getattr(simbolo, 'arena_lista', None)
+        if pendiente is not None:
+            # La lista ya no crece: se guarda como nodo y la reutiliza quien la pase tal cual
+            tipo, indices = pendiente
+            simbolo.arena_nodo = self.arbol.agregar(tipo, LISTA, simbolo.arena_inicio, simbolo.arena_fin, indices)
+            del simbolo.arena_lista
+        return simbolo.arena_nodo
+
+
+def _envolver(regla, nombre, constructor):
+    def envuelta(p):
+        regla(p)
+        constructor.reducir(nombre, p.slice, p.lexer)
+    return envuelta
+
+
+def _parser_con_constructor(constructor):
+    # Copia del parser (comparte las tablas LALR) con cada regla envuelta
+    propio = nuevo_parser()
+    producciones = []
+    for produccion in propio.productions:
+        copia = copy.copy(produccion)
+        if produccion.callable is not None:
+            copia.callable = _envolver(produccion.callable, produccion.name, constructor)
+        producciones.append(copia)
+    propio.productions = producciones
+    return propio
+
+
+def construir_arbol(entrada, buffer=None, sumidero=None):
+    """
+    Parsea la entrada y retorna su ArbolPlano; las tuplas que arman las
+    reglas se descartan al terminar (hasta entonces ocupan lo mismo que en
+    syntax.parsear). Si ya se tokenizó, pasar el
+    BufferTokens en buffer. Los eventos de la traza van a sumidero, como en
+    syntax.parsear. Si no se pudo construir el árbol, raiz queda en NULO.
+    """
+    if buffer is None:
+        buffer = tokenizar(entrada)
+    arbol = ArbolPlano(buffer.entrada)
+    constructor = _Constructor(arbol)
+    tuplas = parsear(AlimentadorTokens(buffer), sumidero, _parser_con_constructor(constructor))
+    if tuplas is not None:
+        arbol.raiz = constructor.raiz()
+    return arbol
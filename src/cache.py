@@ -0,0 +1,309 @@
+# -------------------------------------------------------------
+# cache.py - Caché en disco de resultados de análisis
+#
+# Guarda, por contenido, el resultado completo de analizar un código:
+# tokens (columnas de la TablaTokens), AST y los renglones del análisis
+# sintáctico y semántico. La clave combina el hash del código, la versión
+# de las tablas de la gramática y la de los módulos del analizador, así
+# que cualquier cambio en el código fuente del analizador invalida lo
+# guardado sin borrar nada a mano.
+# Es una base SQLite en modo WAL: varios procesos (lotes, CI, la GUI)
+# leen y escriben a la vez. Al pasar de max_bytes se descartan las
+# entradas usadas hace más tiempo (LRU).
+# Se activa con ANALIZADOR_CACHE=1 (o la ruta de la base) o con --cache
+# en la CLI.
+# Los datos se guardan con marshal, que al leer solo arma tuplas, listas,
+# números y textos: una base ajena (por ejemplo un caché compartido en CI)
+# puede dar resultados falsos, pero no ejecutar código. Aun así conviene
+# que la base no sea escribible por otros usuarios.
+# -------------------------------------------------------------
+
+import hashlib
+import importlib
+import marshal
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from functools import lru_cache
+
+from tablas import DIRECTORIO_TABLAS, MODULO_LEXTAB, MODULO_PARSETAB, MODULO_PARSETAB_TRAZA, calcular_firma
+
+RUTA_CACHE = ".cache/analisis.sqlite3"
+# Tamaño máximo de los datos guardados; al pasarlo se borra hasta quedar en FRACCION_LIBERAR
+MAX_BYTES_CACHE = 256 * 1024 * 1024
+FRACCION_LIBERAR = 0.9
+# El último uso de una entrada se actualiza como mucho una vez por este lapso
+# (segundos), para que leer no sea también escribir en cada acierto
+RESOLUCION_USO = 60
+
+# Módulos cuyo código fuente define el resultado del análisis (y cache, el formato guardado)
+MODULOS_ANALIZADOR = ("lexer", "escaner", "syntax", "semantic", "main", "cache")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS entradas (
+    clave TEXT PRIMARY KEY,
+    datos BLOB NOT NULL,
+    arbol BLOB NOT NULL,
+    bytes INTEGER NOT NULL,
+    uso REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entradas_uso ON entradas (uso);
+CREATE TABLE IF NOT EXISTS totales (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totales (id, bytes) VALUES (0, 0);
+"""
+
+
+@lru_cache(maxsize=None)
+def version_gramatica():
+    """Firma de las tablas del lexer y del parser (ver tablas.py)."""
+    firmas = []
+    for modulo in (MODULO_LEXTAB, MODULO_PARSETAB, MODULO_PARSETAB_TRAZA):
+        try:
+            firmas.append(getattr(importlib.import_module(modulo), "_firma_gramatica", None))
+        except ImportError:
+            firmas.append(None)
+    return calcular_firma(*firmas)
+
+
+@lru_cache(maxsize=None)
+def version_analizador():
+    """Hash del código fuente de los módulos de análisis (MODULOS_ANALIZADOR)."""
+    h = hashlib.sha1()
+    for modulo in MODULOS_ANALIZADOR:
+        with open(os.path.join(DIRECTORIO_TABLAS, modulo + ".py"), "rb") as f:
+            h.update(f.read())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def clave_cache(entrada):
+    """Clave de una entrada: hash del código, de la gramática y del analizador."""
+    h = hashlib.sha1(entrada.encode("utf-8"))
+    h.update(version_gramatica().encode("ascii"))
+    h.update(version_analizador().encode("ascii"))
+    return h.hexdigest()
+
+
+def _comprimir(objeto):
+    return zlib.compress(marshal.dumps(objeto), 1)
+
+
+def _descomprimir(blob):
+    return marshal.loads(zlib.decompress(blob))
+
+
+def _codificar_arbol(nodo):
+    # marshal no guarda subclases de str: un Identificador pasa a {nombre: (línea, posición)} y
+    # un Booleano a True/False (el AST no tiene diccionarios ni bool, así que no se
+    # confunden con otro nodo)
+    from lexer import Booleano, Identificador
+    def codificar(nodo):
+        if isinstance(nodo, Identificador):
+            return {str(nodo): (nodo.lineno, nodo.lexpos)}
+        if isinstance(nodo, Booleano):
+            return nodo == 'true'
+        if isinstance(nodo, tuple):
+            return tuple(codificar(hijo) for hijo in nodo)
+        if isinstance(nodo, list):
+            return [codificar(hijo) for hijo in nodo]
+        return nodo
+    return codificar(nodo)
+
+
+def _decodificar_arbol(nodo):
+    from lexer import Booleano, Identificador
+    def decodificar(nodo):
+        if nodo is True or nodo is False:
+            return Booleano('true' if nodo else 'false')
+        if isinstance(nodo, dict):
+            (nombre, (linea, posicion)), = nodo.items()
+            identificador = Identificador(nombre)
+            identificador.lineno = linea
+            identificador.lexpos = posicion
+            return identificador
+        if isinstance(nodo, tuple):
+            return tuple(decodificar(hijo) for hijo in nodo)
+        if isinstance(nodo, list):
+            return [decodificar(hijo) for hijo in nodo]
+        return nodo
+    return decodificar(nodo)
+
+
+def serializar(buffer, arbol, sintactico, semantico, filas_error):
+    """
+    Arma los dos blobs guardados, marshal comprimido: el de las columnas de
+    tokens (sin la entrada, que la tiene quien consulta), los renglones de
+    resultado y sus renglones de error (Analizador.filas_error), y el del AST,
+    que es lo más lento de leer y se carga aparte.
+    """
+    tabla = buffer.tokens
+    columnas = tuple((c.typecode, c.tobytes()) for c in (tabla.tipos, tabla.lineas, tabla.posiciones,
+                                                          tabla.longitudes, tabla.valores))
+    datos = (columnas, list(tabla._conjunto_valores), list(buffer.errores),
+             list(sintactico), list(semantico),
+             {"syntax": list(filas_error["syntax"]), "semantic": list(filas_error["semantic"])})
+    return _comprimir(datos), _comprimir(_codificar_arbol(arbol))
+
+
+def deserializar(datos, arbol, entrada):
+    """
+    Inverso de serializar: retorna (BufferTokens, arbol, sintactico, semantico, filas_error).
+    Con arbol None no se carga el AST y el árbol retornado es None.
+    """
+    from lexer import BufferTokens, TablaTokens
+    columnas, valores, errores, sintactico, semantico, filas_error = _descomprimir(datos)
+    arbol = _decodificar_arbol(_descomprimir(arbol)) if arbol is not None else None
+    tabla = TablaTokens()
+    tabla.tipos, tabla.lineas, tabla.posiciones, tabla.longitudes, tabla.valores = (
+        array(codigo, bytes_columna) for codigo, bytes_columna in columnas)
+    tabla._conjunto_valores = valores
+    # Los tokens ya están completos: no hace falta el índice que usa agregar()
+    tabla._indice_valores = None
+    return BufferTokens(entrada, tabla, errores), arbol, sintactico, semantico, filas_error
+
+
+class CacheAnalisis:
+    """
+    Conexión a la base del caché, compartible entre los hilos de un proceso.
+    Cada proceso abre la suya (ver cache_analisis); SQLite se encarga de
+    que los accesos de distintos procesos no se pisen.
+    """
+
+    def __init__(self, ruta=RUTA_CACHE, max_bytes=MAX_BYTES_CACHE):
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        carpeta = os.path.dirname(ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        self._lock = threading.Lock()
+        # Sin transacciones implícitas: las escrituras usan BEGIN IMMEDIATE
+        self._conexion = sqlite3.connect(ruta, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.executescript(_ESQUEMA)
+
+    def obtener(self, entrada, con_arbol=False):
+        """
+        Retorna (BufferTokens, arbol, sintactico, semantico, filas_error) si el
+        resultado de esta entrada está guardado, o None. El AST solo se lee con con_arbol
+        (si no, arbol es None).
+        """
+        clave = clave_cache(entrada)
+        columna_arbol = "arbol" if con_arbol else "NULL"
+        with self._lock:
+            fila = self._conexion.execute(f"SELECT uso, datos, {columna_arbol} FROM entradas WHERE clave = ?",
+                                          (clave,)).fetchone()
+            if fila is None:
+                self.fallos += 1
+                return None
+            ahora = time.time()
+            if ahora - fila[0] > RESOLUCION_USO:
+                self._conexion.execute("UPDATE entradas SET uso = ? WHERE clave = ?", (ahora, clave))
+        try:
+            guardado = deserializar(fila[1], fila[2], entrada)
+        except (ValueError, EOFError, TypeError, zlib.error):
+            # Entrada dañada o escrita por otra cosa: se analiza de nuevo y se reemplaza
+            with self._lock:
+                self.fallos += 1
+            return None
+        with self._lock:
+            self.aciertos += 1
+        return guardado
+
+    def guardar(self, entrada, buffer, arbol, sintactico, semantico, filas_error):
+        """
+        Guarda el resultado completo de una entrada y descarta las menos usadas si hace falta.
+        filas_error es Analizador.filas_error con las fases "syntax" y "semantic".
+        """
+        clave = clave_cache(entrada)
+        datos, blob_arbol = serializar(buffer, arbol, sintactico, semantico, filas_error)
+        tamano = len(datos) + len(blob_arbol)
+        with self._lock:
+            conexion = self._conexion
+            conexion.execute("BEGIN IMMEDIATE")
+            try:
+                anterior = conexion.execute("SELECT bytes FROM entradas WHERE clave = ?", (clave,)).fetchone()
+                conexion.execute("INSERT OR REPLACE INTO entradas (clave, datos, arbol, bytes, uso) VALUES (?, ?, ?, ?, ?)",
+                                 (clave, datos, blob_arbol, tamano, time.time()))
+                conexion.execute("UPDATE totales SET bytes = bytes + ? WHERE id = 0",
+                                 (tamano - (anterior[0] if anterior else 0),))
+                total = conexion.execute("SELECT bytes FROM totales WHERE id = 0").fetchone()[0]
+                if total > self.max_bytes:
+                    self._descartar(total - int(self.max_bytes * FRACCION_LIBERAR))
+                conexion.execute("COMMIT")
+            except BaseException:
+                conexion.execute("ROLLBACK")
+                raise
+
+    def _descartar(self, bytes_a_liberar):
+        # Dentro de la transacción de guardar: borra desde la entrada usada hace más tiempo
+        claves, liberados = [], 0
+        for clave, bytes_entrada in self._conexion.execute("SELECT clave, bytes FROM entradas ORDER BY uso"):
+            if liberados >= bytes_a_liberar:
+                break
+            claves.append((clave,))
+            liberados += bytes_entrada
+        self._conexion.executemany("DELETE FROM entradas WHERE clave = ?", claves)
+        self._conexion.execute("UPDATE totales SET bytes = bytes - ? WHERE id = 0", (liberados,))
+
+    def estadisticas(self):
+        """Retorna (entradas, bytes) guardados."""
+        with self._lock:
+            entradas = self._conexion.execute("SELECT COUNT(*) FROM entradas").fetchone()[0]
+            total = self._conexion.execute("SELECT bytes FROM totales WHERE id = 0").fetchone()[0]
+        return entradas, total
+
+    def limpiar(self):
+        """Borra todas las entradas."""
+        with self._lock:
+            self._conexion.execute("BEGIN IMMEDIATE")
+            try:
+                self._conexion.execute("DELETE FROM entradas")
+                self._conexion.execute("UPDATE totales SET bytes = 0 WHERE id = 0")
+                self._conexion.execute("COMMIT")
+            except BaseException:
+                self._conexion.execute("ROLLBACK")
+                raise
+
+    def cerrar(self):
+        with self._lock:
+            self._conexion.close()
+
+
+def _ruta_entorno():
+    # Ruta de la base según ANALIZADOR_CACHE, o None si el caché está desactivado
+    valor = os.environ.get("ANALIZADOR_CACHE", "")
+    if valor.lower() in ("", "0", "no", "false", "off"):
+        return None
+    if valor.lower() in ("1", "si", "sí", "true", "on"):
+        return RUTA_CACHE
+    return valor
+
+
+_cache = None
+_cache_pid = None
+_cache_global_lock = threading.Lock()
+
+
+def cache_analisis():
+    """
+    Retorna el CacheAnalisis del proceso según ANALIZADOR_CACHE, o None si
+    está desactivado. Los procesos creados con fork abren su propia conexión.
+    """
+    global _cache, _cache_pid
+    ruta = _ruta_entorno()
+    if ruta is None:
+        return None
+    with _cache_global_lock:
+        if _cache is None or _cache_pid != os.getpid() or _cache.ruta != ruta:
+            _cache = CacheAnalisis(ruta)
+            _cache_pid = os.getpid()
+        return _cache
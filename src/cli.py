@@ -0,0 +1,435 @@
+# -------------------------------------------------------------
+# cli.py - Interfaz de línea de comandos del Analizador C#
+#
+# Permite usar el analizador sin interfaz gráfica (hooks, CI):
+#   python src/cli.py analyze archivo.cs --phases lex,syntax,semantic
+#   python src/cli.py batch directorio/ --jobs 4
+#   python src/cli.py analyze archivo.cs -q --profile
+#   python src/cli.py logs --phase semantic --line 15 --since 7d
+#   python src/cli.py cache --clear
+#   python src/cli.py lsp          (servidor LSP por stdio para editores)
+#   python src/cli.py daemon &     (demonio en un socket Unix)
+#   python src/cli.py client archivo.cs -q [--start]
+#
+# Nunca importa PyQt5/QScintilla. Los módulos de análisis se importan
+# solo después de leer los argumentos y solo los de las fases pedidas,
+# y el usuario de Git se consulta únicamente si se guardan logs.
+# -------------------------------------------------------------
+
+import argparse
+import re
+import sys
+from contextlib import nullcontext
+
+FASES = ("lex", "syntax", "semantic")
+
+# Código de salida: 0 sin errores, 1 si alguna fase encontró errores, 2 error de uso o de lectura
+SALIDA_OK = 0
+SALIDA_ERRORES = 1
+SALIDA_USO = 2
+
+_ETIQUETA_HTML = re.compile(r"<[^>]+>")
+
+# Fase de la CLI -> fase guardada en el almacén de logs
+FASES_ALMACEN = {"lex": "lexico", "syntax": "sintactico", "semantic": "semantico"}
+
+TITULOS_FASES = {"lex": "Léxico", "syntax": "Sintáctico", "semantic": "Semántico"}
+
+# Igual que lexer.BACKENDS_LEXER (sin importar el lexer para armar la ayuda)
+BACKENDS_LEXER = ("ply", "manual")
+
+_UNIDADES_TIEMPO = {"m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def _texto_plano(linea):
+    # El resultado léxico marca los errores con <span> para la GUI
+    return _ETIQUETA_HTML.sub("", linea)
+
+
+def _fases(texto):
+    fases = [f.strip() for f in texto.split(",") if f.strip()]
+    invalidas = [f for f in fases if f not in FASES]
+    if invalidas or not fases:
+        raise argparse.ArgumentTypeError(
+            f"fases no válidas: {', '.join(invalidas) or repr(texto)}. Opciones: {', '.join(FASES)}"
+        )
+    return fases
+
+
+def _momento(texto):
+    # "7d", "12h", "30m", "2w" (hace cuánto) o una fecha "2026-10-01[T10:00]"; retorna un timestamp
+    import time
+    from datetime import datetime
+    if texto[:-1].isdigit() and texto[-1] in _UNIDADES_TIEMPO:
+        return time.time() - int(texto[:-1]) * _UNIDADES_TIEMPO[texto[-1]]
+    try:
+        return datetime.fromisoformat(texto).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"momento no válido: {texto!r} (use 7d, 12h, 30m o AAAA-MM-DD)")
+
+
+def crear_parser_argumentos():
+    parser = argparse.ArgumentParser(prog="analizador", description="Analizador léxico, sintáctico y semántico de C#.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    analyze = comandos.add_parser("analyze", help="Analiza un archivo .cs")
+    analyze.add_argument("archivo", help="archivo C# a analizar ('-' para leer de la entrada estándar)")
+    analyze.add_argument("--phases", type=_fases, default=list(FASES),
+                         help="fases a ejecutar separadas por comas (lex,syntax,semantic)")
+    analyze.add_argument("--quiet", "-q", action="store_true",
+                         help="solo muestra los errores, no el detalle de cada fase")
+    analyze.add_argument("--log", action="store_true",
+                         help="guarda los resultados en logs/ como la interfaz gráfica")
+    analyze.add_argument("--lexer", choices=BACKENDS_LEXER, default=None,
+                         help="backend del análisis léxico (por defecto ANALIZADOR_LEXER o ply)")
+    analyze.add_argument("--stream", action="store_true",
+                         help="análisis léxico por flujo, con memoria constante (archivos muy grandes; solo --phases lex)")
+    analyze.add_argument("--cache", nargs="?", const="1", default=None, metavar="RUTA",
+                         help="reutiliza resultados guardados de análisis anteriores (por defecto .cache/analisis.sqlite3)")
+    _agregar_opciones_perfil(analyze)
+
+    batch = comandos.add_parser("batch", help="Analiza en paralelo directorios, globs o archivos .cs")
+    batch.add_argument("rutas", nargs="+", help="directorios (recursivos), globs ('src/**/*.cs') o archivos")
+    batch.add_argument("--phases", type=_fases, default=list(FASES),
+                       help="fases a ejecutar separadas por comas (lex,syntax,semantic)")
+    batch.add_argument("--jobs", "-j", type=int, default=None,
+                       help="cantidad de procesos (por defecto, uno por núcleo)")
+    batch.add_argument("--lexer", choices=BACKENDS_LEXER, default=None,
+                       help="backend del análisis léxico (por defecto ANALIZADOR_LEXER o ply)")
+    batch.add_argument("--unordered", action="store_true",
+                       help="muestra cada archivo al terminar en lugar de respetar el orden de entrada")
+    batch.add_argument("--quiet", "-q", action="store_true",
+                       help="solo muestra los archivos con errores y el resumen")
+    batch.add_argument("--cache", nargs="?", const="1", default=None, metavar="RUTA",
+                       help="reutiliza resultados guardados de análisis anteriores (por defecto .cache/analisis.sqlite3)")
+    _agregar_opciones_perfil(batch)
+
+    cache = comandos.add_parser("cache", help="Muestra o vacía el caché de resultados (--cache, ANALIZADOR_CACHE)")
+    cache.add_argument("--db", default=None, help="base del caché (por defecto .cache/analisis.sqlite3)")
+    cache.add_argument("--clear", action="store_true", help="borra todas las entradas")
+
+    lsp = comandos.add_parser("lsp", help="Servidor Language Server Protocol por stdio (diagnósticos en el editor)")
+    lsp.add_argument("--debounce", type=float, default=None, metavar="MS",
+                     help="milisegundos sin cambios antes de publicar los diagnósticos (por defecto 10)")
+    lsp.add_argument("--lexer", choices=BACKENDS_LEXER, default=None,
+                     help="backend del análisis léxico (por defecto ANALIZADOR_LEXER o ply)")
+
+    daemon = comandos.add_parser("daemon", help="Demonio de análisis en un socket Unix (para hooks y CI)")
+    daemon.add_argument("--socket", default=None, metavar="RUTA",
+                        help="socket Unix (por defecto ANALIZADOR_SOCKET o analizador.sock en XDG_RUNTIME_DIR o en un directorio privado del temporal)")
+    daemon.add_argument("--jobs", "-j", type=int, default=None,
+                        help="cantidad de procesos trabajadores (por defecto, uno por núcleo)")
+    daemon.add_argument("--idle", type=float, default=None, metavar="SEGUNDOS",
+                        help="termina tras este tiempo sin solicitudes (por defecto 600; 0 = nunca)")
+
+    client = comandos.add_parser("client", help="Analiza archivos .cs con el demonio en ejecución")
+    client.add_argument("archivos", nargs="*", help="archivos C# a analizar ('-' para la entrada estándar)")
+    client.add_argument("--phases", type=_fases, default=list(FASES),
+                        help="fases a ejecutar separadas por comas (lex,syntax,semantic)")
+    client.add_argument("--quiet", "-q", action="store_true",
+                        help="solo muestra los errores, no el detalle de cada fase")
+    client.add_argument("--socket", default=None, metavar="RUTA", help="socket del demonio")
+    client.add_argument("--start", action="store_true", help="inicia el demonio si no hay uno en ejecución")
+    client.add_argument("--status", action="store_true", help="muestra el estado del demonio")
+    client.add_argument("--stop", action="store_true", help="detiene el demonio")
+
+    logs = comandos.add_parser("logs", help="Consulta el almacén de logs estructurados (ANALIZADOR_LOGS=sqlite)")
+    logs.add_argument("--db", default=None, help="base de registros (por defecto logs/registros.sqlite3)")
+    logs.add_argument("--phase", choices=FASES, help="fase del análisis")
+    logs.add_argument("--user", help="usuario de Git")
+    logs.add_argument("--since", type=_momento, help="desde (7d, 12h, 30m o AAAA-MM-DD)")
+    logs.add_argument("--until", type=_momento, help="hasta (mismo formato que --since)")
+    logs.add_argument("--line", type=int, help="línea del error")
+    logs.add_argument("--severity", choices=("error", "info"), help="severidad del registro")
+    logs.add_argument("--file", help="solo análisis de un archivo con el mismo contenido que este")
+    logs.add_argument("--hash", help="hash (SHA-1) del código analizado")
+    logs.add_argument("--grep", help="texto contenido en el mensaje")
+    logs.add_argument("--limit", type=int, default=50, help="cantidad máxima de registros (0 = todos)")
+    logs.add_argument("--count", action="store_true", help="solo muestra la cantidad de registros")
+    return parser
+
+
+def _agregar_opciones_perfil(comando):
+    comando.add_argument("--profile", action="store_true",
+                         help="muestra en stderr el tiempo de cada fase, de cada regla del parser y de la inferencia")
+    comando.add_argument("--profile-json", default=None, metavar="RUTA",
+                         help="guarda el mismo reporte en JSON")
+
+
+def _crear_perfil(args):
+    if not (args.profile or args.profile_json):
+        return None
+    from perfil import Perfil
+    return Perfil()
+
+
+def _informar_perfil(perfil, args):
+    if perfil is None:
+        return
+    if args.profile:
+        for linea in perfil.formatear():
+            print(linea, file=sys.stderr)
+    if args.profile_json:
+        perfil.guardar_json(args.profile_json)
+
+
+def _leer_entrada(ruta):
+    if ruta == "-":
+        return sys.stdin.read()
+    with open(ruta, encoding="utf-8") as f:
+        return f.read()
+
+
+def _imprimir(titulo, lineas, errores, quiet):
+    if quiet:
+        for linea in errores:
+            print(_texto_plano(linea))
+        return
+    print(f"--- {titulo} ---")
+    for linea in lineas:
+        print(_texto_plano(linea))
+
+
+def _analyze_flujo(args):
+    # Lee el archivo por bloques y muestra cada renglón a medida que se genera
+    import main
+    hubo_errores = False
+    try:
+        archivo = sys.stdin if args.archivo == "-" else open(args.archivo, encoding="utf-8")
+    except OSError as e:
+        print(f"No se pudo leer {args.archivo}: {e}", file=sys.stderr)
+        return SALIDA_USO
+    with archivo:
+        if not args.quiet:
+            print("--- Léxico ---")
+        for linea in main.analizar_lexico_flujo(archivo):
+            es_error = bool(main.errores_lexicos([linea]))
+            hubo_errores |= es_error
+            if es_error or not args.quiet:
+                print(_texto_plano(linea))
+    return SALIDA_ERRORES if hubo_errores else SALIDA_OK
+
+
+def comando_analyze(args):
+    if args.stream:
+        if args.phases != ["lex"] or args.log:
+            print("--stream solo admite --phases lex y no guarda logs", file=sys.stderr)
+            return SALIDA_USO
+        return _analyze_flujo(args)
+    try:
+        entrada = _leer_entrada(args.archivo)
+    except OSError as e:
+        print(f"No se pudo leer {args.archivo}: {e}", file=sys.stderr)
+        return SALIDA_USO
+
+    import main
+    perfil = _crear_perfil(args)
+    resultados = main.Analizador(perfil=perfil).analizar_fases(entrada, args.phases)
+
+    hubo_errores = False
+    # Al perfilar, se espera a que el hilo escritor termine para medir los logs
+    medir_logs = perfil.escritura_logs(main.escritor_logs()) if perfil is not None and args.log else nullcontext()
+    with medir_logs:
+        for fase, filtrar_errores, guardar_log in (
+            ("lex", main.errores_lexicos, main.guardar_log_lexico),
+            ("syntax", main.errores_sintacticos, main.guardar_log_sintactico),
+            ("semantic", main.errores_semanticos, main.guardar_log_semantico),
+        ):
+            if fase not in args.phases:
+                continue
+            resultado = resultados[fase]
+            errores = filtrar_errores(resultado)
+            hubo_errores |= bool(errores)
+            _imprimir(TITULOS_FASES[fase], resultado, errores, args.quiet)
+            if args.log:
+                guardar_log(resultado, entrada)
+    _informar_perfil(perfil, args)
+
+    return SALIDA_ERRORES if hubo_errores else SALIDA_OK
+
+
+def _estado_archivo(resultado):
+    if resultado["fallo"]:
+        return f"FALLO  {resultado['ruta']}: {resultado['fallo']}"
+    conteo = ", ".join(f"{fase}={n}" for fase, n in resultado["errores"].items())
+    estado = "ERROR" if any(resultado["errores"].values()) else "OK"
+    return f"{estado:<6} {resultado['ruta']} ({conteo})"
+
+
+def comando_batch(args):
+    import lote
+    rutas = lote.expandir_rutas(args.rutas)
+    if not rutas:
+        print("No se encontraron archivos .cs", file=sys.stderr)
+        return SALIDA_USO
+    if args.jobs is not None and args.jobs < 1:
+        print("--jobs debe ser al menos 1", file=sys.stderr)
+        return SALIDA_USO
+
+    resumen = lote.ResumenLote()
+    perfilar = bool(args.profile or args.profile_json)
+    for resultado in lote.analizar_lote(rutas, args.phases, args.jobs, ordenado=not args.unordered, perfilar=perfilar):
+        resumen.agregar(resultado)
+        if not args.quiet or resultado["fallo"] or any(resultado["errores"].values()):
+            print(_estado_archivo(resultado), flush=True)
+    for linea in resumen.formatear():
+        print(linea)
+    if resumen.perfil is not None:
+        _informar_perfil(resumen.perfil, args)
+
+    if resumen.fallos:
+        return SALIDA_USO
+    return SALIDA_ERRORES if resumen.con_errores else SALIDA_OK
+
+
+def comando_logs(args):
+    import os
+    from datetime import datetime
+    import almacen
+    ruta = args.db or almacen.RUTA_ALMACEN
+    if not os.path.exists(ruta):
+        print(f"No existe el almacén de logs {ruta} (se crea al analizar con ANALIZADOR_LOGS=sqlite)", file=sys.stderr)
+        return SALIDA_USO
+    hash_codigo = args.hash
+    if args.file:
+        try:
+            hash_codigo = almacen.hash_entrada(_leer_entrada(args.file))
+        except OSError as e:
+            print(f"No se pudo leer {args.file}: {e}", file=sys.stderr)
+            return SALIDA_USO
+
+    filtros = {
+        "fase": FASES_ALMACEN.get(args.phase), "usuario": args.user, "desde": args.since, "hasta": args.until,
+        "hash_codigo": hash_codigo, "linea": args.line, "severidad": args.severity, "texto": args.grep,
+    }
+    base = almacen.AlmacenLogs(ruta)
+    try:
+        if args.count:
+            print(base.contar(**filtros))
+            return SALIDA_OK
+        for fecha, fase, usuario, hash_registro, linea, severidad, mensaje in base.consultar(args.limit or None, **filtros):
+            momento = datetime.fromtimestamp(fecha).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{momento}  {fase:<10} {usuario:<12} {(hash_registro or '-')[:10]:<10} "
+                  f"{linea if linea is not None else '-':>5}  {severidad:<5}  {mensaje}")
+    finally:
+        base.cerrar()
+    return SALIDA_OK
+
+
+def comando_cache(args):
+    import os
+    import cache
+    ruta = args.db or cache.RUTA_CACHE
+    if not os.path.exists(ruta):
+        print(f"No existe el caché {ruta} (se crea al analizar con --cache o ANALIZADOR_CACHE=1)", file=sys.stderr)
+        return SALIDA_USO
+    base = cache.CacheAnalisis(ruta)
+    try:
+        if args.clear:
+            base.limpiar()
+        entradas, total = base.estadisticas()
+        print(f"{ruta}: {entradas} entradas, {total / 2**20:.1f} MB (máximo {base.max_bytes / 2**20:.0f} MB)")
+    finally:
+        base.cerrar()
+    return SALIDA_OK
+
+
+def comando_lsp(args):
+    import lsp
+    if args.debounce is None:
+        return lsp.servir_stdio()
+    return lsp.servir_stdio(args.debounce / 1000)
+
+
+def comando_daemon(args):
+    import demonio
+    inactividad = demonio.INACTIVIDAD if args.idle is None else args.idle
+    return demonio.ejecutar(args.socket, args.jobs, inactividad)
+
+
+def comando_client(args):
+    # Solo importa cliente.py: el análisis lo hace el demonio
+    import cliente
+    try:
+        ruta = args.socket or cliente.ruta_socket()
+        if args.start:
+            try:
+                conexion = cliente.ClienteDemonio(ruta)
+            except PermissionError:
+                raise
+            except OSError:
+                conexion = cliente.iniciar_demonio(ruta)
+        else:
+            conexion = cliente.ClienteDemonio(ruta)
+    except PermissionError as e:
+        print(f"No se usa el socket del demonio: {e}", file=sys.stderr)
+        return SALIDA_USO
+    except OSError as e:
+        print(f"No hay un demonio escuchando en {ruta} ({e}); "
+              "inícielo con 'cli.py daemon' o use --start", file=sys.stderr)
+        return SALIDA_USO
+
+    with conexion:
+        if args.status or args.stop:
+            respuesta = conexion.solicitar("apagar" if args.stop else "estado")
+            for clave, valor in respuesta.items():
+                if clave != "id":
+                    print(f"{clave}: {valor}")
+            if not args.archivos:
+                return SALIDA_OK
+
+        entradas, salida = [], SALIDA_OK
+        for ruta in args.archivos:
+            try:
+                entradas.append((ruta, _leer_entrada(ruta)))
+            except OSError as e:
+                print(f"No se pudo leer {ruta}: {e}", file=sys.stderr)
+                salida = SALIDA_USO
+        hubo_errores = False
+        respuestas = conexion.analizar(entradas, args.phases, detalle=not args.quiet)
+        for (ruta, _), respuesta in zip(entradas, respuestas):
+            if len(args.archivos) > 1:
+                print(f"==> {ruta} <==")
+            if respuesta.get("fallo"):
+                print(f"No se pudo analizar {ruta}: {respuesta['fallo']}", file=sys.stderr)
+                salida = SALIDA_USO
+                continue
+            for fase in FASES:
+                if fase not in args.phases:
+                    continue
+                errores = respuesta["errores"][fase]
+                hubo_errores |= bool(errores)
+                _imprimir(TITULOS_FASES[fase], respuesta.get("resultados", {}).get(fase, ()), errores, args.quiet)
+    if salida == SALIDA_OK and hubo_errores:
+        salida = SALIDA_ERRORES
+    return salida
+
+
+COMANDOS = {
+    "analyze": comando_analyze,
+    "batch": comando_batch,
+    "logs": comando_logs,
+    "cache": comando_cache,
+    "lsp": comando_lsp,
+    "daemon": comando_daemon,
+    "client": comando_client,
+}
+
+
+def ejecutar(argv=None):
+    """Punto de entrada de la CLI. Retorna el código de salida."""
+    args = crear_parser_argumentos().parse_args(argv)
+    if getattr(args, "lexer", None):
+        # Por el entorno, para que también lo usen los procesos de "batch"
+        import os
+        os.environ["ANALIZADOR_LEXER"] = args.lexer
+        if "lexer" in sys.modules:
+            sys.modules["lexer"].usar_backend_lexer(args.lexer)
+    if getattr(args, "cache", None):
+        import os
+        os.environ["ANALIZADOR_CACHE"] = args.cache
+    return COMANDOS[args.comando](args)
+
+
+if __name__ == "__main__":
+    sys.exit(ejecutar())
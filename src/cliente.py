@@ -0,0 +1,162 @@
+# -------------------------------------------------------------
+# cliente.py - Cliente del demonio de análisis (demonio.py)
+#
+# Envía códigos al demonio por su socket Unix y recibe los resultados.
+# No importa nada del analizador, así que un hook que lo usa solo paga
+# el arranque de Python y la conexión:
+#   python src/cli.py client archivo.cs -q [--start]
+# Protocolo: una solicitud JSON por línea y una respuesta JSON por línea
+# con el mismo "id". Se pueden enviar varias solicitudes sin esperar las
+# respuestas (pipelining); el demonio responde a medida que terminan.
+# -------------------------------------------------------------
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+FASES = ("lex", "syntax", "semantic")
+
+
+def verificar_propio(ruta, directorio=False):
+    """
+    Lanza PermissionError si ruta es de otro usuario (o, si es un directorio,
+    si otros pueden entrar o escribir en él). No sigue enlaces simbólicos.
+    """
+    info = os.lstat(ruta)
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"{ruta} pertenece a otro usuario")
+    if directorio and (not stat.S_ISDIR(info.st_mode) or info.st_mode & 0o077):
+        raise PermissionError(f"{ruta} no es un directorio privado (0700)")
+
+
+def ruta_socket():
+    """
+    Socket del demonio: ANALIZADOR_SOCKET, o analizador.sock en XDG_RUNTIME_DIR o
+    en analizador-<uid> del directorio temporal, que se crea con permisos 0700.
+    En el temporal otro usuario podría crear antes ese nombre: si no es un
+    directorio privado del usuario actual se lanza PermissionError.
+    """
+    ruta = os.environ.get("ANALIZADOR_SOCKET")
+    if ruta:
+        return ruta
+    carpeta = os.environ.get("XDG_RUNTIME_DIR")
+    if not carpeta:
+        carpeta = os.path.join(tempfile.gettempdir(), f"analizador-{os.getuid()}")
+        try:
+            os.mkdir(carpeta, 0o700)
+        except FileExistsError:
+            pass
+        verificar_propio(carpeta, directorio=True)
+    return os.path.join(carpeta, "analizador.sock")
+
+
+class ClienteDemonio:
+    """
+    Conexión a un demonio en ejecución. Lanza OSError (ConnectionRefusedError,
+    FileNotFoundError) si no hay ninguno escuchando en la ruta y PermissionError
+    si el socket es de otro usuario (el código no se envía a un proceso ajeno).
+    """
+
+    def __init__(self, ruta=None):
+        self.ruta = ruta or ruta_socket()
+        verificar_propio(self.ruta)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(self.ruta)
+        except OSError:
+            self._socket.close()
+            raise
+        self._lector = self._socket.makefile("rb")
+        self._ultimo_id = 0
+
+    def _nuevo_id(self):
+        self._ultimo_id += 1
+        return self._ultimo_id
+
+    def _enviar(self, solicitud):
+        self._socket.sendall(json.dumps(solicitud, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _recibir(self):
+        linea = self._lector.readline()
+        if not linea:
+            raise ConnectionError("el demonio cerró la conexión")
+        return json.loads(linea)
+
+    def solicitar(self, operacion):
+        """Envía una operación sin código ("estado", "apagar") y retorna la respuesta."""
+        self._enviar({"id": self._nuevo_id(), "operacion": operacion})
+        return self._recibir()
+
+    def analizar(self, entradas, fases=FASES, detalle=True):
+        """
+        Analiza cada (nombre, codigo) de entradas y genera las respuestas en el
+        mismo orden. Las solicitudes se envían todas desde un hilo aparte mientras
+        se leen las respuestas, que el demonio entrega a medida que terminan.
+        Cada respuesta tiene "errores" (fase -> renglones de error), "resultados"
+        (fase -> renglones, solo con detalle) o "fallo" si no se pudo analizar.
+        """
+        entradas = list(entradas)
+        ids = [self._nuevo_id() for _ in entradas]
+        errores_envio = []
+
+        def enviar():
+            try:
+                for identificador, (nombre, codigo) in zip(ids, entradas):
+                    self._enviar({"id": identificador, "operacion": "analizar", "nombre": nombre,
+                                  "codigo": codigo, "fases": list(fases), "detalle": detalle})
+            except OSError as e:
+                errores_envio.append(e)
+
+        hilo = threading.Thread(target=enviar, name="cliente-envio", daemon=True)
+        hilo.start()
+        recibidas = {}
+        try:
+            for identificador in ids:
+                while identificador not in recibidas:
+                    respuesta = self._recibir()
+                    recibidas[respuesta.get("id")] = respuesta
+                yield recibidas.pop(identificador)
+        except ConnectionError:
+            if errores_envio:
+                raise errores_envio[0]
+            raise
+        finally:
+            hilo.join()
+
+    def cerrar(self):
+        self._lector.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def iniciar_demonio(ruta=None, espera=30.0, argumentos=()):
+    """
+    Lanza un demonio en segundo plano (desacoplado de esta terminal) y espera
+    a que acepte conexiones. Retorna un ClienteDemonio conectado.
+    """
+    ruta = ruta or ruta_socket()
+    cli = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+    subprocess.Popen([sys.executable, cli, "daemon", "--socket", ruta, *argumentos],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+    limite = time.monotonic() + espera
+    while True:
+        try:
+            return ClienteDemonio(ruta)
+        except PermissionError:
+            raise
+        except OSError:
+            if time.monotonic() > limite:
+                raise
+            time.sleep(0.05)
@@ -0,0 +1,263 @@
+# -------------------------------------------------------------
+# demonio.py - Demonio de análisis en un socket Unix
+#
+# Para hooks y CI que analizan pocos archivos por invocación: en lugar
+# de pagar en cada una el arranque de Python y la carga de las tablas
+# del lexer y del parser, un proceso de larga duración las carga una vez
+# y atiende solicitudes por un socket Unix (ver cliente.py):
+#   python src/cli.py daemon [--socket RUTA] [--jobs N] [--idle SEGUNDOS]
+# El frente es asyncio: cada conexión puede enviar varias solicitudes
+# sin esperar respuesta (pipelining) y se responden a medida que
+# terminan. El análisis corre en un pool de procesos ya cargados, con
+# a lo sumo PENDIENTES_POR_TRABAJADOR solicitudes en curso por proceso;
+# pasado ese límite se deja de leer de las conexiones hasta que haya
+# lugar. Sin conexiones ni solicitudes durante el tiempo de inactividad
+# el demonio termina solo y borra el socket.
+# El socket se crea con permisos 0600 (y, por defecto, en un directorio
+# 0700; ver cliente.ruta_socket): solo su dueño puede conectarse.
+# -------------------------------------------------------------
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from cliente import FASES, ruta_socket
+
+# Segundos sin conexiones ni solicitudes antes de terminar (0 = nunca)
+INACTIVIDAD = 600
+# Solicitudes en curso por proceso trabajador
+PENDIENTES_POR_TRABAJADOR = 4
+# Tamaño máximo de una solicitud (una línea JSON con el código)
+MAX_BYTES_SOLICITUD = 64 * 1024 * 1024
+
+
+def _inicializar_trabajador():
+    # Carga el lexer, el parser y sus tablas una vez por proceso
+    import main  # noqa: F401
+    import syntax  # noqa: F401
+    import semantic  # noqa: F401
+
+
+def _listo():
+    return os.getpid()
+
+
+def analizar_solicitud(codigo, fases, detalle):
+    """
+    Corre en un proceso trabajador. Retorna un diccionario con los renglones de
+    error de cada fase ("errores"), todos los renglones si detalle ("resultados")
+    y el tiempo de análisis ("segundos").
+    """
+    import main
+    inicio = time.perf_counter()
+    resultados = main.Analizador().analizar_fases(codigo, fases)
+    filtros = {"lex": main.errores_lexicos, "syntax": main.errores_sintacticos, "semantic": main.errores_semanticos}
+    respuesta = {"errores": {fase: filtros[fase](resultados[fase]) for fase in fases}}
+    if detalle:
+        respuesta["resultados"] = {fase: list(resultados[fase]) for fase in fases}
+    respuesta["segundos"] = time.perf_counter() - inicio
+    return respuesta
+
+
+def _socket_activo(ruta):
+    prueba = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        prueba.connect(ruta)
+        return True
+    except OSError:
+        return False
+    finally:
+        prueba.close()
+
+
+class DemonioAnalisis:
+    """
+    Servidor asyncio sobre un socket Unix con un pool de procesos trabajadores.
+    servir() retorna cuando se pide "apagar", llega SIGTERM/SIGINT o pasa el
+    tiempo de inactividad.
+    """
+
+    def __init__(self, ruta=None, trabajadores=None, inactividad=INACTIVIDAD):
+        self.ruta = ruta or ruta_socket()
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.inactividad = inactividad
+        self.atendidas = 0
+        self.inicio = None
+        self._pool = None
+        self._cupo = None
+        self._fin = None
+        self._conexiones = set()
+        self._atenciones = set()
+        self._en_curso = 0
+        self._ultima_actividad = time.monotonic()
+
+    def _crear_pool(self):
+        return ProcessPoolExecutor(max_workers=self.trabajadores, initializer=_inicializar_trabajador)
+
+    async def servir(self):
+        if os.path.lexists(self.ruta):
+            info = os.lstat(self.ruta)
+            if info.st_uid != os.getuid() or not stat.S_ISSOCK(info.st_mode):
+                raise RuntimeError(f"{self.ruta} ya existe y no es un socket del usuario actual; no se reemplaza")
+            if _socket_activo(self.ruta):
+                raise RuntimeError(f"ya hay un demonio escuchando en {self.ruta}")
+            # Socket de un demonio que terminó sin borrarlo
+            os.unlink(self.ruta)
+        loop = asyncio.get_running_loop()
+        self.inicio = time.time()
+        self._fin = asyncio.Event()
+        self._cupo = asyncio.Semaphore(self.trabajadores * PENDIENTES_POR_TRABAJADOR)
+        self._pool = self._crear_pool()
+        # Arranca y carga todos los procesos antes de aceptar conexiones
+        await asyncio.gather(*[loop.run_in_executor(self._pool, _listo) for _ in range(self.trabajadores)])
+        # Con esta umask el socket nace con permisos 0600, sin un instante accesible para otros
+        umask = os.umask(0o177)
+        try:
+            servidor = await asyncio.start_unix_server(self._atender, path=self.ruta, limit=MAX_BYTES_SOLICITUD)
+        finally:
+            os.umask(umask)
+        for senal in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(senal, self.detener)
+        vigilancia = asyncio.ensure_future(self._vigilar_inactividad())
+        try:
+            await self._fin.wait()
+        finally:
+            vigilancia.cancel()
+            servidor.close()
+            for escritor in list(self._conexiones):
+                escritor.close()
+            # Las conexiones cerradas terminan de responder lo que tenían en curso
+            if self._atenciones:
+                await asyncio.gather(*self._atenciones, return_exceptions=True)
+            if os.path.exists(self.ruta):
+                os.unlink(self.ruta)
+            self._pool.shutdown(wait=True)
+
+    def detener(self):
+        if self._fin is not None:
+            self._fin.set()
+
+    def _actividad(self):
+        self._ultima_actividad = time.monotonic()
+
+    async def _vigilar_inactividad(self):
+        if not self.inactividad:
+            return
+        while True:
+            await asyncio.sleep(min(self.inactividad, 1.0))
+            if not self._conexiones and not self._en_curso \
+                    and time.monotonic() - self._ultima_actividad >= self.inactividad:
+                self.detener()
+                return
+
+    # ---------- Conexiones ----------
+
+    async def _atender(self, lector, escritor):
+        atencion = asyncio.current_task()
+        self._atenciones.add(atencion)
+        self._conexiones.add(escritor)
+        self._actividad()
+        escritura = asyncio.Lock()
+        tareas = set()
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self._escribir(escritor, escritura, {"id": None, "fallo": "solicitud demasiado grande"})
+                    break
+                except ConnectionError:
+                    break
+                if not linea:
+                    break
+                # Con el cupo lleno se deja de leer: el cliente espera en su envío
+                await self._cupo.acquire()
+                self._en_curso += 1
+                self._actividad()
+                tarea = asyncio.ensure_future(self._responder(linea, escritor, escritura))
+                tareas.add(tarea)
+                tarea.add_done_callback(tareas.discard)
+            if tareas:
+                await asyncio.gather(*tareas, return_exceptions=True)
+        finally:
+            self._atenciones.discard(atencion)
+            self._conexiones.discard(escritor)
+            self._actividad()
+            escritor.close()
+
+    async def _responder(self, linea, escritor, escritura):
+        identificador = None
+        try:
+            solicitud = json.loads(linea)
+            identificador = solicitud.get("id")
+            respuesta = await self._resolver(solicitud)
+        except ValueError as e:
+            respuesta = {"fallo": f"solicitud no válida: {e}"}
+        except Exception as e:
+            respuesta = {"fallo": f"{type(e).__name__}: {e}"}
+        finally:
+            self._en_curso -= 1
+            self._cupo.release()
+            self._actividad()
+        respuesta["id"] = identificador
+        await self._escribir(escritor, escritura, respuesta)
+
+    async def _resolver(self, solicitud):
+        operacion = solicitud.get("operacion", "analizar")
+        if operacion == "analizar":
+            fases = [fase for fase in FASES if fase in solicitud.get("fases", FASES)]
+            if not fases or not isinstance(solicitud.get("codigo"), str):
+                raise ValueError("se esperaba 'codigo' (texto) y al menos una fase de " + ", ".join(FASES))
+            loop = asyncio.get_running_loop()
+            pool = self._pool
+            try:
+                respuesta = await loop.run_in_executor(pool, analizar_solicitud, solicitud["codigo"], fases,
+                                                       bool(solicitud.get("detalle", True)))
+            except BrokenProcessPool:
+                # Un trabajador murió (memoria, señal): se reemplaza el pool una sola vez
+                if pool is self._pool:
+                    self._pool = self._crear_pool()
+                    pool.shutdown(wait=False)
+                return {"fallo": "un proceso trabajador terminó inesperadamente"}
+            respuesta["nombre"] = solicitud.get("nombre")
+            self.atendidas += 1
+            return respuesta
+        if operacion == "estado":
+            return {"pid": os.getpid(), "trabajadores": self.trabajadores, "atendidas": self.atendidas,
+                    "conexiones": len(self._conexiones), "desde": self.inicio}
+        if operacion == "apagar":
+            asyncio.get_running_loop().call_soon(self.detener)
+            return {"apagando": True}
+        raise ValueError(f"operación desconocida: {operacion!r}")
+
+    async def _escribir(self, escritor, escritura, respuesta):
+        datos = json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n"
+        async with escritura:
+            try:
+                escritor.write(datos)
+                await escritor.drain()
+            except ConnectionError:
+                # El cliente se fue: la respuesta se descarta
+                pass
+
+
+def ejecutar(ruta=None, trabajadores=None, inactividad=INACTIVIDAD):
+    """Ejecuta el demonio hasta que termine. Retorna el código de salida."""
+    try:
+        demonio = DemonioAnalisis(ruta, trabajadores, inactividad)
+        asyncio.run(demonio.servir())
+    except (RuntimeError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(ejecutar())
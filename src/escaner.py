@@ -0,0 +1,159 @@
+# -------------------------------------------------------------
+# escaner.py - Lexer alternativo escrito a mano
+#
+# Reconoce exactamente los mismos tokens que las reglas de PLY de
+# lexer.py (mismo orden de prioridad, mismos valores, mismas líneas y
+# mismos caracteres no definidos), pero sin la expresión regular maestra
+# ni una función por token: decide por el primer carácter qué reconocer,
+# clasifica las palabras reservadas con la tabla reserved y llena la
+# TablaTokens directamente, sin crear LexToken.
+# Se elige con ANALIZADOR_LEXER=manual o lexer.usar_backend_lexer("manual").
+# -------------------------------------------------------------
+
+import re
+
+from lexer import TOKENS_POR_AVANCE, TablaTokens, reserved
+
+_CONTINUACION_ID = re.compile(r'[a-zA-Z0-9_]*')
+# \d como en las reglas de PLY (también reconoce dígitos Unicode)
+_NUMERO = re.compile(r'\d+(\.\d+[fF]?)?')
+_ESPACIOS = re.compile(r'[ \t]+')
+_SALTOS = re.compile(r'(?:\r\n|\r|\n)+')
+_CADENA = re.compile(r'"[^"\n]*"')
+_FIN_LINEA = re.compile(r'.*')
+_INVALIDOS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f#$'?@\\^`~\x7f]+")
+
+_OPERADORES_DOBLES = {
+    '++': 'PLUSPLUS', '+=': 'PLUSEQUAL', '--': 'MINUSMINUS', '-=': 'MINUSEQUAL',
+    '<=': 'LE', '>=': 'GE', '==': 'EQ', '!=': 'NE', '&&': 'AND', '||': 'OR',
+}
+_OPERADORES = {
+    '+': 'PLUS', '-': 'MINUS', '*': 'TIMES', '/': 'DIVIDE', '=': 'ASSIGN',
+    '(': 'LPAREN', ')': 'RPAREN', '{': 'LBRACE', '}': 'RBRACE', ';': 'SEMICOLON',
+    ',': 'COMMA', '.': 'DOT', '<': 'LT', '>': 'GT', '%': 'MOD', '!': 'NOT',
+    '[': 'LBRACKET', ']': 'RBRACKET', ':': 'COLON',
+}
+# Operadores que pueden ser el primer carácter de uno doble
+_INICIO_DOBLE = {par[0] for par in _OPERADORES_DOBLES}
+
+# Clase de cada carácter ASCII según lo que puede empezar
+_ID, _DIGITO, _ESPACIO, _SALTO, _OPERADOR, _BARRA, _COMILLA, _AMPERSAND, _BARRA_VERTICAL, _INVALIDO = range(10)
+_CLASE = {}
+for _c in map(chr, range(128)):
+    if _c.isalpha() or _c == '_':
+        _CLASE[_c] = _ID
+    elif _c.isdigit():
+        _CLASE[_c] = _DIGITO
+    elif _c in ' \t':
+        _CLASE[_c] = _ESPACIO
+    elif _c in '\r\n':
+        _CLASE[_c] = _SALTO
+    elif _c == '/':
+        _CLASE[_c] = _BARRA
+    elif _c == '"':
+        _CLASE[_c] = _COMILLA
+    elif _c == '&':
+        _CLASE[_c] = _AMPERSAND
+    elif _c == '|':
+        _CLASE[_c] = _BARRA_VERTICAL
+    elif _c in _OPERADORES:
+        _CLASE[_c] = _OPERADOR
+    else:
+        _CLASE[_c] = _INVALIDO
+
+
+def escanear(entrada, avance=None):
+    """
+    Tokeniza la entrada y retorna (TablaTokens, errores) con los mismos
+    tokens y errores (posición, texto) que el lexer de PLY.
+    avance(posicion, largo) se llama cada TOKENS_POR_AVANCE tokens.
+    """
+    tabla = TablaTokens()
+    agregar = tabla.agregar
+    errores = []
+    clase_de = _CLASE.get
+    reservada = reserved.get
+    largo = len(entrada)
+    pos = 0
+    linea = 1
+    n = 0
+    while pos < largo:
+        c = entrada[pos]
+        clase = clase_de(c)
+        inicio = pos
+
+        if clase is _ID:
+            # t_ADD va antes que t_ID: "Add" es un token aunque siga el identificador
+            if c == 'A' and entrada.startswith('Add', pos):
+                pos += 3
+                agregar('ADD', 'Add', linea, inicio, 3)
+            else:
+                pos = _CONTINUACION_ID.match(entrada, pos + 1).end()
+                texto = entrada[inicio:pos]
+                agregar(reservada(texto, 'ID'), texto, linea, inicio, pos - inicio)
+        elif clase is _ESPACIO:
+            pos = _ESPACIOS.match(entrada, pos).end()
+            continue
+        elif clase is _SALTO:
+            pos = _SALTOS.match(entrada, pos).end()
+            linea += entrada.count('\n', inicio, pos)
+            continue
+        elif clase is _OPERADOR:
+            if c in _INICIO_DOBLE and entrada[pos:pos + 2] in _OPERADORES_DOBLES:
+                pos += 2
+                agregar(_OPERADORES_DOBLES[entrada[inicio:pos]], entrada[inicio:pos], linea, inicio, 2)
+            else:
+                pos += 1
+                agregar(_OPERADORES[c], c, linea, inicio, 1)
+        elif clase is _DIGITO or (clase is None and _NUMERO.match(entrada, pos)):
+            coincidencia = _NUMERO.match(entrada, pos)
+            pos = coincidencia.end()
+            texto = coincidencia.group()
+            if coincidencia.group(1):
+                valor = float(texto[:-1]) if texto.endswith(('f', 'F')) else float(texto)
+                agregar('FLOAT_CONST', valor, linea, inicio, pos - inicio)
+            else:
+                agregar('INT_CONST', int(texto), linea, inicio, pos - inicio)
+        elif clase is _BARRA:
+            siguiente = entrada[pos + 1:pos + 2]
+            if siguiente == '/':
+                pos = _FIN_LINEA.match(entrada, pos).end()
+                continue
+            if siguiente == '*':
+                cierre = entrada.find('*/', pos + 2)
+                if cierre != -1:
+                    pos = cierre + 2
+                    linea += entrada.count('\n', inicio, pos)
+                    continue
+            pos += 1
+            agregar('DIVIDE', '/', linea, inicio, 1)
+        elif clase is _COMILLA:
+            coincidencia = _CADENA.match(entrada, pos)
+            if coincidencia is None:
+                pos += 1
+                errores.append((inicio, '"'))
+                continue
+            pos = coincidencia.end()
+            agregar('STRING_CONST', entrada[inicio + 1:pos - 1], linea, inicio, pos - inicio)
+        elif clase is _AMPERSAND or clase is _BARRA_VERTICAL:
+            # Un & o | suelto no está definido; doble es AND / OR
+            if entrada.startswith(c, pos + 1):
+                pos += 2
+                agregar(_OPERADORES_DOBLES[c + c], c + c, linea, inicio, 2)
+            else:
+                pos += 1
+                errores.append((inicio, c))
+                continue
+        elif clase is _INVALIDO:
+            pos = _INVALIDOS.match(entrada, pos).end()
+            errores.append((inicio, entrada[inicio:pos]))
+            continue
+        else:
+            # Carácter no ASCII que no es dígito: se ignora (t_ignore_unicode)
+            pos += 1
+            continue
+
+        n += 1
+        if avance is not None and n % TOKENS_POR_AVANCE == 0:
+            avance(inicio, largo)
+    return tabla, errores
@@ -1,19 +1,36 @@
 import os
+import re
+import threading
+from contextlib import nullcontext
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QFileDialog, QMessageBox, QTextEdit
+    QLabel, QFileDialog, QMessageBox, QListView, QAbstractItemView, QProgressBar, QCheckBox
 )
-from PyQt5.Qsci import QsciScintilla, QsciLexerCSharp
-from lexer import lexer
-from syntax import parser
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QBrush, QColor, QFontDatabase
+from PyQt5.Qsci import QsciScintilla, QsciScintillaBase, QsciLexerCSharp
 from main import (
-    analizar_lexico,
+    Analizador,
+    AnalisisCancelado,
     guardar_log_lexico,
-    analizar_sintactico,
     guardar_log_sintactico,
-    analizar_semantico,
     guardar_log_semantico
 )
+from incremental import AnalisisIncremental
+from perfil import Perfil
+from registro import escritor_logs
+
+# Milisegundos sin cambios en el editor antes de reanalizar en vivo
+ESPERA_ANALISIS_EN_VIVO = 300
+
+# Nombre visible de cada fase en la barra de progreso
+NOMBRES_FASES = {"lex": "Léxico", "syntax": "Sintáctico", "semantic": "Semántico"}
+
+# Severidad de cada renglón de resultado
+SEVERIDAD_NORMAL = 1
+SEVERIDAD_ERROR = 2
+
+_ETIQUETA_HTML = re.compile(r"<[^>]+>")
 
 def listar_archivos_test():
     carpeta = "test"
@@ -26,6 +43,165 @@ def cargar_archivo_test(nombre_archivo):
     with open(ruta, "r", encoding="utf-8") as f:
         return f.read()
 
+class ModeloResultados(QAbstractListModel):
+    """Modelo de solo lectura sobre una lista de renglones de resultado.
+
+    La vista pide únicamente los renglones visibles, así que mostrar medio
+    millón de tokens no arma ningún documento. Los renglones de error son los
+    índices que registró el análisis (Analizador.filas_error), no se deducen
+    del texto.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lineas = []
+        self._filas_error = frozenset()
+        self._color_error = QBrush(QColor("red"))
+
+    def establecer(self, lineas, filas_error=()):
+        if lineas is self._lineas:
+            return
+        self.beginResetModel()
+        self._lineas = lineas
+        self._filas_error = frozenset(filas_error)
+        self.endResetModel()
+
+    def limpiar(self):
+        self.establecer([])
+
+    def severidad(self, fila):
+        return SEVERIDAD_ERROR if fila in self._filas_error else SEVERIDAD_NORMAL
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lineas)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        fila = index.row()
+        if role == Qt.DisplayRole:
+            return _ETIQUETA_HTML.sub("", self._lineas[fila])
+        if role == Qt.ForegroundRole and self.severidad(fila) == SEVERIDAD_ERROR:
+            return self._color_error
+        return None
+
+def crear_vista_resultados(modelo):
+    vista = QListView()
+    vista.setModel(modelo)
+    # Con renglones de alto fijo la vista no mide cada fila para calcular el scroll
+    vista.setUniformItemSizes(True)
+    vista.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    vista.setSelectionMode(QAbstractItemView.ExtendedSelection)
+    return vista
+
+class TrabajadorAnalisis(QThread):
+    """Hilo que ejecuta los análisis fuera del hilo de la interfaz.
+
+    Atiende una solicitud a la vez; si llega otra mientras trabaja, cancela
+    la actual y solo se queda con la más reciente. Cada señal lleva el número
+    de solicitud para que la ventana descarte resultados viejos.
+    """
+    progreso = pyqtSignal(int, str, int)
+    terminado = pyqtSignal(int, object)
+    cancelado = pyqtSignal(int)
+    fallo = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._condicion = threading.Condition()
+        self._pendiente = None
+        self._analizador = None
+        self._detenido = False
+        # El análisis en vivo guarda estado entre ediciones; solo lo usa este hilo
+        self._incremental = AnalisisIncremental()
+
+    def solicitar(self, solicitud, tipo, entrada, perfilar=False):
+        # tipo: "completo" (tres fases y logs) o "en_vivo" (incremental, sin logs);
+        # perfilar solo se usa en el completo
+        with self._condicion:
+            self._pendiente = (solicitud, tipo, entrada, perfilar)
+            if self._analizador is not None:
+                self._analizador.cancelar()
+            self._condicion.notify()
+
+    def cancelar(self):
+        with self._condicion:
+            self._pendiente = None
+            if self._analizador is not None:
+                self._analizador.cancelar()
+
+    def detener(self):
+        with self._condicion:
+            self._detenido = True
+            self._pendiente = None
+            if self._analizador is not None:
+                self._analizador.cancelar()
+            self._condicion.notify()
+        self.wait()
+
+    def _siguiente(self):
+        with self._condicion:
+            while self._pendiente is None and not self._detenido:
+                self._condicion.wait()
+            if self._detenido:
+                return None
+            solicitud, self._pendiente = self._pendiente, None
+            return solicitud
+
+    def _notificador(self, solicitud):
+        # Solo emite cuando cambia el porcentaje, para no saturar la cola de eventos
+        ultimo = {}
+
+        def notificar(fase, hecho, total):
+            porcentaje = 100 * hecho // total if total else 100
+            if ultimo.get(fase) != porcentaje:
+                ultimo[fase] = porcentaje
+                self.progreso.emit(solicitud, fase, porcentaje)
+        return notificar
+
+    def _analisis_completo(self, solicitud, entrada, perfilar):
+        perfil = Perfil() if perfilar else None
+        analizador = Analizador(progreso=self._notificador(solicitud), perfil=perfil)
+        with self._condicion:
+            if self._pendiente is not None:
+                # Ya hay una solicitud más nueva: esta quedó obsoleta antes de empezar
+                raise AnalisisCancelado()
+            self._analizador = analizador
+        try:
+            resultados = analizador.analizar_codigo(entrada)
+        finally:
+            with self._condicion:
+                self._analizador = None
+        resultado_lexico, resultado_sintactico, resultado_semantico = resultados
+        # Al perfilar se espera en este hilo a que se escriban los logs, para medirlos
+        medir_logs = nullcontext() if perfil is None else perfil.escritura_logs(escritor_logs())
+        with medir_logs:
+            logs = (
+                guardar_log_lexico(resultado_lexico, entrada),
+                guardar_log_sintactico(resultado_sintactico, entrada),
+                guardar_log_semantico(resultado_semantico, entrada),
+            )
+        return resultados, dict(analizador.filas_error), logs, perfil
+
+    def run(self):
+        while True:
+            siguiente = self._siguiente()
+            if siguiente is None:
+                return
+            solicitud, tipo, entrada, perfilar = siguiente
+            try:
+                if tipo == "en_vivo":
+                    resultados = self._incremental.actualizar(entrada)
+                    resultado = (resultados, dict(self._incremental.filas_error), None, None)
+                else:
+                    resultado = self._analisis_completo(solicitud, entrada, perfilar)
+            except AnalisisCancelado:
+                self.cancelado.emit(solicitud)
+            except Exception as e:
+                self.fallo.emit(solicitud, str(e))
+            else:
+                self.terminado.emit(solicitud, resultado)
+
 class AnalizadorApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -53,6 +229,24 @@ class AnalizadorApp(QMainWindow):
         self.editor.setLexer(lexer)
         editor_layout.addWidget(self.editor)
 
+        # Los análisis corren en un hilo aparte para no congelar la interfaz;
+        # cada solicitud lleva un número y solo se muestra la más reciente
+        self._solicitud = 0
+        self._trabajador = TrabajadorAnalisis(self)
+        self._trabajador.progreso.connect(self._progreso_analisis)
+        self._trabajador.terminado.connect(self._analisis_terminado)
+        self._trabajador.cancelado.connect(self._analisis_cancelado)
+        self._trabajador.fallo.connect(self._analisis_fallido)
+        self._trabajador.start()
+
+        # Análisis en vivo: cada cambio reinicia el temporizador y al vencer se
+        # reanalizan solo las declaraciones editadas (ver incremental.py)
+        self._temporizador = QTimer(self)
+        self._temporizador.setSingleShot(True)
+        self._temporizador.setInterval(ESPERA_ANALISIS_EN_VIVO)
+        self._temporizador.timeout.connect(self.analizar_en_vivo)
+        self.editor.SCN_MODIFIED.connect(self._texto_modificado)
+
         # Panel derecho: Resultados y controles
         right_layout = QVBoxLayout()
         main_layout.addLayout(right_layout, 1)
@@ -67,26 +261,48 @@ class AnalizadorApp(QMainWindow):
         self.btn_sintactico.clicked.connect(self.mostrar_sintactico)
         botones_layout.addWidget(self.btn_tokens)
         botones_layout.addWidget(self.btn_semantico)
+        self.btn_perfil = QPushButton("Perfil")
+        self.btn_perfil.clicked.connect(self.mostrar_perfil)
         botones_layout.addWidget(self.btn_sintactico)
+        botones_layout.addWidget(self.btn_perfil)
         right_layout.addLayout(botones_layout)
 
-        # Áreas de resultados
-        self.resultado_tokens = QTextEdit()
-        self.resultado_tokens.setReadOnly(True)
-        self.resultado_semantico = QTextEdit()
-        self.resultado_semantico.setReadOnly(True)
-        self.resultado_sintactico = QTextEdit()
-        self.resultado_sintactico.setReadOnly(True)
-        right_layout.addWidget(self.resultado_tokens)
-        right_layout.addWidget(self.resultado_semantico)
-        right_layout.addWidget(self.resultado_sintactico)
-        self.resultado_semantico.hide()
-        self.resultado_sintactico.hide()
+        # Áreas de resultados: cada vista conserva su modelo al cambiar de pestaña
+        self.modelo_tokens = ModeloResultados(self)
+        self.modelo_semantico = ModeloResultados(self)
+        self.modelo_sintactico = ModeloResultados(self)
+        self.resultado_tokens = crear_vista_resultados(self.modelo_tokens)
+        self.resultado_semantico = crear_vista_resultados(self.modelo_semantico)
+        self.resultado_sintactico = crear_vista_resultados(self.modelo_sintactico)
+        # Reporte del último análisis perfilado (tablas alineadas: fuente de ancho fijo)
+        self.modelo_perfil = ModeloResultados(self)
+        self.resultado_perfil = crear_vista_resultados(self.modelo_perfil)
+        self.resultado_perfil.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self._vistas = (self.resultado_tokens, self.resultado_semantico, self.resultado_sintactico, self.resultado_perfil)
+        for vista in self._vistas:
+            right_layout.addWidget(vista)
+        self._mostrar_vista(self.resultado_tokens)
 
         # Mensaje de log
         self.mensaje_log = QLabel("")
         right_layout.addWidget(self.mensaje_log)
 
+        # Estado del perfil: tiempo de cada fase del último análisis perfilado
+        self.estado_perfil = QLabel("")
+        right_layout.addWidget(self.estado_perfil)
+        self.estado_perfil.hide()
+
+        # Progreso del análisis completo
+        progreso_layout = QHBoxLayout()
+        self.barra_progreso = QProgressBar()
+        self.barra_progreso.setRange(0, 100)
+        self.btn_cancelar = QPushButton("Cancelar")
+        self.btn_cancelar.clicked.connect(self.cancelar_analisis)
+        progreso_layout.addWidget(self.barra_progreso)
+        progreso_layout.addWidget(self.btn_cancelar)
+        right_layout.addLayout(progreso_layout)
+        self._mostrar_progreso(False)
+
         # Botones de acción
         acciones_layout = QHBoxLayout()
         btn_analizar = QPushButton("Analizar")
@@ -98,98 +314,127 @@ class AnalizadorApp(QMainWindow):
         acciones_layout.addWidget(btn_analizar)
         acciones_layout.addWidget(btn_archivo)
         acciones_layout.addWidget(btn_limpiar)
+        # Con "Perfilar" el análisis completo mide cada fase, regla y tipo de nodo (ver perfil.py)
+        self.check_perfil = QCheckBox("Perfilar")
+        acciones_layout.addWidget(self.check_perfil)
         right_layout.addLayout(acciones_layout)
 
+    def _mostrar_vista(self, visible):
+        for vista in self._vistas:
+            vista.setVisible(vista is visible)
+
     def mostrar_tokens(self):
-        self.resultado_tokens.show()
-        self.resultado_semantico.hide()
-        self.resultado_sintactico.hide()
-        if hasattr(self, "_ultimo_resultado_lexico"):
-            # Usa setHtml para mostrar HTML (colores)
-            # Si algún resultado contiene HTML, usa setHtml, si no, usa setPlainText
-            texto = "\n".join(self._ultimo_resultado_lexico)
-            if "<span style='color:red;'>" in texto or "<span style=\"color:red;\">" in texto:
-                self.resultado_tokens.setHtml(texto.replace("\n", "<br>"))
-            else:
-                self.resultado_tokens.setPlainText(texto)
+        self._mostrar_vista(self.resultado_tokens)
 
     def mostrar_semantico(self):
-        self.resultado_tokens.hide()
-        self.resultado_semantico.show()
-        self.resultado_sintactico.hide()
-        if hasattr(self, "_ultimo_resultado_semantico"):
-            texto = "\n".join(self._ultimo_resultado_semantico)
-            self.resultado_semantico.setHtml(self._resaltar_errores(texto))
+        self._mostrar_vista(self.resultado_semantico)
 
     def mostrar_sintactico(self):
-        self.resultado_tokens.hide()
-        self.resultado_semantico.hide()
-        self.resultado_sintactico.show()
-        if hasattr(self, "_ultimo_resultado_sintactico"):
-            texto = "\n".join(self._ultimo_resultado_sintactico)
-            self.resultado_sintactico.setHtml(self._resaltar_errores(texto))
-
-    def _resaltar_errores(self, texto):
-        # Resalta líneas que contienen 'error' o 'Este caracter no está definido' en rojo
-        lineas = texto.splitlines()
-        resaltadas = []
-        for linea in lineas:
-            if "error" in linea.lower() or "Este caracter no está definido" in linea:
-                resaltadas.append(f'<span style="color:red;">{linea}</span>')
-            elif linea.strip().startswith("<span style='color:red;'>"):
-                # Si ya viene con HTML, solo la agregamos
-                resaltadas.append(linea)
-            else:
-                resaltadas.append(linea)
-        return "<br>".join(resaltadas)
+        self._mostrar_vista(self.resultado_sintactico)
+
+    def mostrar_perfil(self):
+        self._mostrar_vista(self.resultado_perfil)
+
+    def _mostrar_resultados(self, resultados, filas_error):
+        resultado_lexico, resultado_sintactico, resultado_semantico = resultados
+        self.modelo_tokens.establecer(resultado_lexico, filas_error.get("lex", ()))
+        self.modelo_sintactico.establecer(resultado_sintactico, filas_error.get("syntax", ()))
+        self.modelo_semantico.establecer(resultado_semantico, filas_error.get("semantic", ()))
+
+    def _mostrar_perfil(self, perfil):
+        if perfil is None:
+            self.estado_perfil.hide()
+            return
+        self.modelo_perfil.establecer(perfil.formatear(limite_reglas=40))
+        fases = " · ".join(f"{NOMBRES_FASES.get(fase, fase)} {pared * 1000:.1f} ms"
+                           for fase, (_, pared, _) in perfil.fases.items())
+        self.estado_perfil.setText(f"⏱ {fases}")
+        self.estado_perfil.show()
+
+    def _texto_modificado(self, posicion, tipo, *args):
+        if tipo & (QsciScintillaBase.SC_MOD_INSERTTEXT | QsciScintillaBase.SC_MOD_DELETETEXT):
+            self._temporizador.start()
+
+    def _mostrar_progreso(self, visible):
+        self.barra_progreso.setVisible(visible)
+        self.btn_cancelar.setVisible(visible)
+        if visible:
+            self.barra_progreso.setValue(0)
+            self.barra_progreso.setFormat("%p%")
+
+    def _nueva_solicitud(self, tipo):
+        self._solicitud += 1
+        self._trabajador.solicitar(self._solicitud, tipo, self.editor.text(), self.check_perfil.isChecked())
+
+    def analizar_en_vivo(self):
+        # Sin logs: solo actualiza los resultados que se están viendo. Si había un
+        # análisis completo en curso, la edición lo deja obsoleto y se cancela
+        if self.btn_cancelar.isVisible():
+            self._mostrar_progreso(False)
+            self.mensaje_log.setText("")
+        self._nueva_solicitud("en_vivo")
 
     def analizar(self):
-        entrada = self.editor.text()
-        try:
-            from lexer import lexer
-            lexer.lineno = 1
-            self._ultimo_resultado_lexico = []
-            self._ultimo_resultado_sintactico = []
-            self._ultimo_resultado_semantico = []
-            
-            # Análisis léxico
-            resultado_lexico = analizar_lexico(entrada)
-            self._ultimo_resultado_lexico = resultado_lexico
-            if any("<span style='color:red;'>" in linea or "<span style=\"color:red;\">" in linea for linea in resultado_lexico):
-                self.resultado_tokens.setHtml("<br>".join(resultado_lexico))
-            else:
-                self.resultado_tokens.setPlainText("\n".join(resultado_lexico))
-            log_path_lexico = guardar_log_lexico(resultado_lexico)
-            
-            # Análisis sintáctico
-            resultado_sintactico = analizar_sintactico(entrada)
-            self._ultimo_resultado_sintactico = resultado_sintactico
-            self.resultado_sintactico.setPlainText("\n".join(resultado_sintactico))
-            log_path_sintactico = guardar_log_sintactico(resultado_sintactico)
-            
-            # Análisis semántico
-            resultado_semantico = analizar_semantico(entrada)
-            self._ultimo_resultado_semantico = resultado_semantico
-            self.resultado_semantico.setPlainText("\n".join(resultado_semantico))
-            log_path_semantico = guardar_log_semantico(resultado_semantico)
-            
+        # Análisis completo del archivo (con logs); descarta el análisis en vivo pendiente
+        self._temporizador.stop()
+        self._nueva_solicitud("completo")
+        self.mensaje_log.setText("⏳ Analizando...")
+        self._mostrar_progreso(True)
+
+    def cancelar_analisis(self):
+        self._trabajador.cancelar()
+
+    def _progreso_analisis(self, solicitud, fase, porcentaje):
+        if solicitud != self._solicitud:
+            return
+        self.barra_progreso.setValue(porcentaje)
+        self.barra_progreso.setFormat(f"{NOMBRES_FASES.get(fase, fase)}: %p%")
+
+    def _analisis_terminado(self, solicitud, resultado):
+        if solicitud != self._solicitud:
+            return
+        resultados, filas_error, logs, perfil = resultado
+        self._mostrar_resultados(resultados, filas_error)
+        if logs is None:
+            return
+        log_path_lexico, log_path_sintactico, log_path_semantico = logs
+        self._mostrar_progreso(False)
+        self._mostrar_perfil(perfil)
+        if log_path_lexico is None:
+            self.mensaje_log.setText("✅ Análisis completo (logs deshabilitados)")
+        else:
             self.mensaje_log.setText(
                 f"✅ Logs guardados:\nLéxico: '{log_path_lexico}'\nSintáctico: '{log_path_sintactico}'\nSemántico: '{log_path_semantico}'"
             )
-            self.mostrar_tokens()
-        except Exception as e:
-            self.mensaje_log.setText(f"❌ Error: {str(e)}")
+        self.mostrar_tokens()
+
+    def _analisis_cancelado(self, solicitud):
+        # Si la canceló una solicitud más nueva, esa se encarga de la interfaz
+        if solicitud != self._solicitud:
+            return
+        self._mostrar_progreso(False)
+        self.mensaje_log.setText("⏹ Análisis cancelado")
+
+    def _analisis_fallido(self, solicitud, mensaje):
+        if solicitud != self._solicitud:
+            return
+        self._mostrar_progreso(False)
+        self.mensaje_log.setText(f"❌ Error: {mensaje}")
+
+    def closeEvent(self, event):
+        self._temporizador.stop()
+        self._trabajador.detener()
+        super().closeEvent(event)
 
     def limpiar(self):
         self.editor.setText("")
-        self.resultado_tokens.clear()
-        self.resultado_semantico.clear()
-        self.resultado_sintactico.clear()
         self.mensaje_log.setText("")
         # Limpia los resultados previos para evitar mostrar resultados viejos
-        self._ultimo_resultado_lexico = []
-        self._ultimo_resultado_sintactico = []
-        self._ultimo_resultado_semantico = []
+        self.modelo_tokens.limpiar()
+        self.modelo_semantico.limpiar()
+        self.modelo_sintactico.limpiar()
+        self.modelo_perfil.limpiar()
+        self.estado_perfil.hide()
         self.mostrar_tokens()
 
     def abrir_modal_archivos(self):
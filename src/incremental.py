@@ -0,0 +1,676 @@
+# -------------------------------------------------------------
+# incremental.py - Reanálisis incremental para el editor de la GUI
+#
+# El texto se divide en segmentos de líneas completas, uno por cada
+# declaración de nivel superior (el corte se hace al final de una
+# línea que termina en ';' o '}' fuera de llaves, paréntesis,
+# comentarios y strings, salvo que lo siguiente sea un 'else').
+# Cada segmento guarda sus tokens, su árbol y sus mensajes con líneas
+# relativas, así que si solo se desplaza no hace falta volver a
+# analizarlo ni a formatearlo:
+#   - al editar, se vuelve a segmentar desde el segmento anterior a la
+#     edición hasta que los cortes coinciden con los anteriores;
+#   - solo los segmentos nuevos se tokenizan y parsean;
+#   - el análisis semántico empieza en el primer segmento cambiado, con
+#     la tabla de símbolos que dejaron los anteriores, y sigue en los
+#     siguientes solo mientras la tabla quede distinta a la de antes;
+#   - las medidas de cada segmento (caracteres, líneas, renglones de
+#     cada fase) se guardan en arrays, y los renglones se arman recién
+#     cuando se leen: el resultado son vistas que ubican cada renglón
+#     con bisect sobre las sumas parciales de esas medidas.
+# Así una edición cuesta lo que miden los segmentos que cambiaron, más
+# copias y sumas parciales de arrays hechas en C.
+# -------------------------------------------------------------
+
+import bisect
+import re
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate, chain, compress
+
+from lexer import AlimentadorTokens, _ejecutar_backend
+from main import Analizador, ResultadoLexico, formatear_lexico, partes_resumen_semantico
+from semantic import AUSENTE as _AUSENTE, AnalizadorSemantico, TablaSimbolos, renglon_semantico
+
+# Cada cuántos segmentos se guarda una copia de la tabla de símbolos (ver _estado_en)
+SEGMENTOS_POR_ESTADO = 128
+
+SIN_ARBOL = "No se pudo construir el árbol sintáctico; el análisis semántico no se ejecutó."
+
+# Lexemas que importan para decidir los cortes; los espacios no se recorren
+_PATRON_CORTES = re.compile(r'//[^\n]*|/\*[\s\S]*?\*/|"[^"\n]*"|\n|[{}();]|\w+|[^\s\w{}();"/]+|[/"]')
+
+
+def _sin_valor(entrada):
+    # El valor inicial guardado en la tabla no interviene en ningún mensaje de los
+    # segmentos siguientes; solo el tipo y las marcas (función, inferencia pendiente)
+    if isinstance(entrada, dict):
+        return {k: v for k, v in entrada.items() if k != "valor"}
+    return entrada
+
+
+def _aplicar(tabla, finales):
+    # Escribe las entradas finales de un segmento sin pasar por el registro de la tabla
+    for nombre, entrada in finales.items():
+        if entrada is _AUSENTE:
+            dict.pop(tabla, nombre, None)
+        else:
+            dict.__setitem__(tabla, nombre, entrada)
+
+
+def _linea_previa(registros, desplazamientos, s):
+    # Última línea con identificadores antes del segmento s (0 si no hay ninguna)
+    for r in range(s - 1, -1, -1):
+        ultima = registros[r].ultima_linea
+        if ultima is not None:
+            return ultima + desplazamientos[r]
+    return 0
+
+
+def _acumular(columna):
+    # Sumas parciales con un 0 adelante: acumulado[i] es el total de los elementos antes de i
+    acumulado = array("q", [0])
+    acumulado.extend(accumulate(columna))
+    return acumulado
+
+
+def cortes_segmentos(texto, inicio=0):
+    """
+    Genera las posiciones (a partir de inicio, que debe ser un corte) donde
+    termina cada declaración de nivel superior. Cada corte queda justo después
+    de un salto de línea.
+    """
+    llaves = parentesis = 0
+    cierra = False
+    pendiente = None
+    for m in _PATRON_CORTES.finditer(texto, inicio):
+        lexema = m.group()
+        if lexema == "\n":
+            if cierra and llaves == 0 and parentesis == 0 and pendiente is None:
+                pendiente = m.end()
+            continue
+        if lexema.startswith("//") or lexema.startswith("/*"):
+            continue
+        if pendiente is not None:
+            # Un 'else' continúa el if de la línea anterior
+            if lexema != "else":
+                yield pendiente
+            pendiente = None
+        if lexema == "{":
+            llaves += 1
+        elif lexema == "}":
+            llaves = max(0, llaves - 1)
+        elif lexema == "(":
+            parentesis += 1
+        elif lexema == ")":
+            parentesis = max(0, parentesis - 1)
+        cierra = lexema in (";", "}")
+
+
+def _longitud_prefijo_comun(a, b):
+    # Búsqueda binaria comparando rebanadas (la comparación se hace en C)
+    bajo, alto = 0, min(len(a), len(b))
+    while bajo < alto:
+        medio = (bajo + alto + 1) // 2
+        if a[bajo:medio] == b[bajo:medio]:
+            bajo = medio
+        else:
+            alto = medio - 1
+    return bajo
+
+
+def _longitud_sufijo_comun(a, b, maximo):
+    bajo, alto = 0, maximo
+    while bajo < alto:
+        medio = (bajo + alto + 1) // 2
+        if a[len(a) - medio:len(a) - bajo] == b[len(b) - medio:len(b) - bajo]:
+            bajo = medio
+        else:
+            alto = medio - 1
+    return bajo
+
+
+class Segmento:
+    """
+    Una declaración de nivel superior (líneas completas del texto).
+    - texto, lineas: contenido y cantidad de saltos de línea.
+    - buffer, arbol, traza, excepcion: resultado léxico y sintáctico con líneas relativas.
+    - lexico: renglones léxicos con líneas relativas (ResultadoLexico).
+    """
+
+    def __init__(self, texto):
+        self.texto = texto
+        self.lineas = texto.count("\n")
+        self.buffer = None
+        self.arbol = None
+        self.traza = None
+        self.excepcion = None
+        self.lexico = []
+
+    @property
+    def con_errores(self):
+        return bool(self.traza.errores or self.excepcion)
+
+    @property
+    def n_sintactico(self):
+        # Renglones sintácticos: la excepción (si la hubo) va primero y después la traza
+        return (1 if self.excepcion else 0) + len(self.traza.eventos)
+
+    def filas_error_sintactico(self):
+        inicio = 1 if self.excepcion else 0
+        return list(range(inicio)) + [inicio + i for i in self.traza.indices_error]
+
+
+class SemanticaSegmento:
+    """
+    Resultado semántico de un segmento, con líneas relativas.
+    - mensajes: (línea, mensaje) de cada renglón; la línea es None si el segmento
+      todavía no tenía identificadores y vale la última de los anteriores.
+    - filas_error: índice en mensajes de cada error.
+    - ubicaciones: Identificador de cada error (ver AnalizadorSemantico.ubicaciones_error).
+    - ultima_linea: línea del último identificador del segmento (None si no hubo).
+    - leidos: nombres que el segmento consultó en la tabla de símbolos.
+    - finales: entrada en la tabla de símbolos, al terminar el segmento, de cada
+      nombre que escribió.
+    - estado: copia de la tabla al empezar el segmento, solo en uno de cada
+      SEGMENTOS_POR_ESTADO (ver AnalisisIncremental._estado_en).
+    """
+
+    def __init__(self, mensajes=(), filas_error=(), ubicaciones=(), ultima_linea=None,
+                 leidos=frozenset(), finales=None):
+        self.mensajes = mensajes
+        self.filas_error = filas_error
+        self.ubicaciones = ubicaciones
+        self.ultima_linea = ultima_linea
+        self.leidos = leidos
+        self.finales = finales or {}
+        self.estado = None
+
+
+class _TablaLecturas(TablaSimbolos):
+    """TablaSimbolos que anota en leidos cada nombre que se consulta."""
+
+    def __init__(self):
+        super().__init__()
+        self.leidos = set()
+
+    def get(self, nombre, defecto=None):
+        self.leidos.add(nombre)
+        return super().get(nombre, defecto)
+
+    def __getitem__(self, nombre):
+        self.leidos.add(nombre)
+        return super().__getitem__(nombre)
+
+    def __contains__(self, nombre):
+        self.leidos.add(nombre)
+        return super().__contains__(nombre)
+
+
+class _AnalizadorSegmentos(AnalizadorSemantico):
+    """
+    AnalizadorSemantico que recorre un segmento por vez y retorna su
+    SemanticaSegmento; los mensajes quedan como (línea relativa, mensaje).
+    """
+
+    def analizar_segmento(self, declaraciones):
+        tabla = self.tabla
+        self.resultado, self.errores, self.filas_error, self.ubicaciones_error = [], [], [], []
+        self._linea = None
+        tabla.registro.clear()
+        tabla.leidos = set()
+        super().analizar_segmento(declaraciones)
+        finales = {nombre: dict.get(tabla, nombre, _AUSENTE) for nombre, _ in tabla.registro}
+        return SemanticaSegmento(self.resultado, self.filas_error, self.ubicaciones_error, self._linea,
+                                 tabla.leidos, finales)
+
+    def _renglon(self, linea, mensaje):
+        return linea, mensaje
+
+
+# Medidas de cada segmento que se guardan en columnas (ver AnalisisIncremental._reemplazar)
+_MEDIDAS_SEGMENTO = {
+    "texto": lambda segmento: len(segmento.texto),
+    "lineas": lambda segmento: segmento.lineas,
+    "lexico": lambda segmento: len(segmento.lexico),
+    "errores_lexicos": lambda segmento: len(segmento.buffer.errores),
+    "sintactico": lambda segmento: segmento.n_sintactico,
+    "errores_sintacticos": lambda segmento: segmento.con_errores,
+    "sin_arbol": lambda segmento: segmento.arbol is None,
+}
+_MEDIDAS_SEMANTICAS = {
+    "semantico": lambda registro: len(registro.mensajes),
+    "errores_semanticos": lambda registro: len(registro.filas_error),
+}
+
+
+# ---------- Resultados ----------
+
+class _Renglones(Sequence):
+    """
+    Base de los resultados de AnalisisIncremental: se usan como una lista de
+    strings (como ResultadoLexico) y no cambian con los actualizar() siguientes.
+    """
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("renglón fuera de rango")
+        return self._renglon(i)
+
+    def __eq__(self, otro):
+        if isinstance(otro, (list, tuple, _Renglones, ResultadoLexico)):
+            return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+        return NotImplemented
+
+    __hash__ = None
+
+
+class _RenglonesSegmentos(_Renglones):
+    """
+    Renglones de una fase: los de cada segmento, uno tras otro, con las líneas
+    desplazadas por las de los segmentos anteriores. lineas y cantidades son
+    copias de las columnas (líneas y renglones de cada segmento) y total es la
+    suma de cantidades; las sumas parciales se calculan la primera vez que se
+    lee un renglón.
+    """
+
+    def __init__(self, segmentos, lineas, cantidades, total):
+        self._segmentos = segmentos
+        self._lineas = lineas
+        self._cantidades = cantidades
+        self._total = total
+        self._acumulados = None
+
+    def _inicios(self):
+        if self._acumulados is None:
+            self._acumulados = _acumular(self._cantidades), _acumular(self._lineas)
+        return self._acumulados
+
+    def __len__(self):
+        return self._total
+
+    def _renglon(self, i):
+        inicios, desplazamientos = self._inicios()
+        s = bisect.bisect_right(inicios, i) - 1
+        return self._renglon_segmento(s, i - inicios[s], desplazamientos[s])
+
+    def __iter__(self):
+        _, desplazamientos = self._inicios()
+        for s in compress(range(len(self._cantidades)), self._cantidades):
+            yield from self._renglones_segmento(s, desplazamientos[s])
+
+
+class _RenglonesLexicos(_RenglonesSegmentos):
+
+    def _renglon_segmento(self, s, k, desplazamiento):
+        return formatear_lexico(self._segmentos[s].buffer, desplazamiento)[k]
+
+    def _renglones_segmento(self, s, desplazamiento):
+        return formatear_lexico(self._segmentos[s].buffer, desplazamiento)
+
+
+class _RenglonesSintacticos(_RenglonesSegmentos):
+
+    def _renglon_segmento(self, s, k, desplazamiento):
+        segmento = self._segmentos[s]
+        if segmento.excepcion:
+            if k == 0:
+                return segmento.excepcion
+            k -= 1
+        return segmento.traza.linea(k, desplazamiento)
+
+    def _renglones_segmento(self, s, desplazamiento):
+        segmento = self._segmentos[s]
+        if segmento.excepcion:
+            yield segmento.excepcion
+        yield from segmento.traza.lineas(desplazamiento)
+
+
+class _RenglonesSemanticos(_RenglonesSegmentos):
+    """Mensajes de cada SemanticaSegmento; con solo_errores, los de la sección de errores."""
+
+    def __init__(self, registros, lineas, cantidades, total, solo_errores=False):
+        super().__init__(registros, lineas, cantidades, total)
+        self._solo_errores = solo_errores
+
+    def _mensajes(self, s):
+        registro = self._segmentos[s]
+        if self._solo_errores:
+            return [registro.mensajes[f] for f in registro.filas_error]
+        return registro.mensajes
+
+    def _formatear(self, s, linea, mensaje, desplazamiento):
+        if linea is None:
+            linea = _linea_previa(self._segmentos, self._inicios()[1], s)
+        else:
+            linea += desplazamiento
+        return renglon_semantico(linea, mensaje)
+
+    def _renglon_segmento(self, s, k, desplazamiento):
+        return self._formatear(s, *self._mensajes(s)[k], desplazamiento)
+
+    def _renglones_segmento(self, s, desplazamiento):
+        for linea, mensaje in self._mensajes(s):
+            yield self._formatear(s, linea, mensaje, desplazamiento)
+
+
+class _Concatenacion(_Renglones):
+    """Varias secuencias de renglones, una después de otra."""
+
+    def __init__(self, partes):
+        self._partes = partes
+
+    def __len__(self):
+        return sum(map(len, self._partes))
+
+    def _renglon(self, i):
+        for parte in self._partes:
+            if i < len(parte):
+                return parte[i]
+            i -= len(parte)
+
+    def __iter__(self):
+        return chain.from_iterable(self._partes)
+
+
+class AnalisisIncremental:
+    """
+    Mantiene el último texto analizado y sus segmentos. actualizar(texto) retorna
+    (resultado_lexico, resultado_sintactico, resultado_semantico) en el mismo
+    formato que analizar_codigo, analizando de nuevo solo lo que cambió.
+    Para código sin errores de sintaxis el resultado es idéntico al de analizar_codigo;
+    con errores, la recuperación se hace dentro de cada declaración de nivel superior.
+    filas_error tiene, como Analizador.filas_error, los renglones de error de cada fase.
+    """
+
+    def __init__(self):
+        self.analizador = Analizador()
+        self.texto = ""
+        self.segmentos = []
+        # SemanticaSegmento de cada segmento (None: el próximo análisis semántico es completo)
+        self._semanticos = None
+        # Una columna por medida, con un valor por segmento, y sus totales
+        self._columnas = {nombre: array("q") for nombre in (*_MEDIDAS_SEGMENTO, *_MEDIDAS_SEMANTICAS)}
+        self._totales = dict.fromkeys(self._columnas, 0)
+        self._acumulados = {}
+        # Mensaje del último análisis semántico que terminó con una excepción
+        self._fallo_semantico = None
+
+    # ---------- Columnas ----------
+
+    def _reemplazar(self, medidas, primero, fin, elementos):
+        # Reemplaza los valores de los segmentos primero..fin por los de elementos
+        for nombre, medida in medidas.items():
+            columna = self._columnas[nombre]
+            valores = array("q", map(medida, elementos))
+            self._totales[nombre] += sum(valores) - sum(columna[primero:fin])
+            columna[primero:fin] = valores
+            self._acumulados.pop(nombre, None)
+
+    def _acumulado(self, nombre):
+        # Sumas parciales de una columna (ver _acumular); se recalculan solo si cambió
+        acumulado = self._acumulados.get(nombre)
+        if acumulado is None:
+            acumulado = self._acumulados[nombre] = _acumular(self._columnas[nombre])
+        return acumulado
+
+    def _copia(self, nombre):
+        # (columna, total) para una vista de renglones que no cambia con las ediciones siguientes
+        return self._columnas[nombre][:], self._totales[nombre]
+
+    def _con(self, nombre):
+        # Índices de los segmentos con un valor distinto de 0 en la columna
+        return compress(range(len(self.segmentos)), self._columnas[nombre])
+
+    # ---------- Segmentación ----------
+
+    def _crear_segmentos(self, texto, inicio, fin, cortes):
+        segmentos = []
+        for corte in cortes:
+            segmentos.append(Segmento(texto[inicio:corte]))
+            inicio = corte
+        if inicio < fin or (not segmentos and not self.segmentos):
+            segmentos.append(Segmento(texto[inicio:fin]))
+        return segmentos
+
+    def _resegmentar(self, texto):
+        """
+        Reemplaza en self.segmentos los segmentos afectados por la edición.
+        Retorna (primero, anteriores, nuevos): el índice del primer segmento
+        reemplazado, los segmentos que se quitaron y los que se agregaron.
+        """
+        anterior = self.texto
+        if not self.segmentos:
+            self.segmentos = self._crear_segmentos(texto, 0, len(texto), cortes_segmentos(texto))
+            return 0, [], list(self.segmentos)
+        if texto == anterior:
+            return len(self.segmentos), [], []
+        prefijo = _longitud_prefijo_comun(anterior, texto)
+        sufijo = _longitud_sufijo_comun(anterior, texto, min(len(anterior), len(texto)) - prefijo)
+        fin_edicion = len(texto) - sufijo
+        diferencia = len(anterior) - len(texto)
+        # Inicio de cada segmento (las sumas parciales sin el total final)
+        inicios, n = self._acumulado("texto"), len(self.segmentos)
+        # Desde el segmento anterior al editado: un 'else' escrito al inicio puede unirlos
+        primero = max(0, bisect.bisect_right(inicios, prefijo, 0, n) - 2)
+        inicio = inicios[primero]
+        nuevos_cortes = []
+        resto, fin = n, len(texto)
+        for corte in cortes_segmentos(texto, inicio):
+            # Pasada la edición, si el corte coincide con uno anterior el resto no cambia
+            if corte >= fin_edicion:
+                j = bisect.bisect_left(inicios, corte + diferencia, 0, n)
+                if j < n and inicios[j] == corte + diferencia:
+                    resto, fin = j, corte
+                    break
+            nuevos_cortes.append(corte)
+        anteriores = self.segmentos[primero:resto]
+        nuevos = self._crear_segmentos(texto, inicio, fin, nuevos_cortes)
+        self.segmentos[primero:resto] = nuevos
+        return primero, anteriores, nuevos
+
+    # ---------- Análisis ----------
+
+    def _analizar_segmento(self, segmento):
+        from syntax import parsear, SumideroTraza
+        segmento.buffer = _ejecutar_backend(segmento.texto, self.analizador.lexer)
+        segmento.lexico = formatear_lexico(segmento.buffer)
+        segmento.traza = SumideroTraza()
+        try:
+            segmento.arbol = parsear(AlimentadorTokens(segmento.buffer), segmento.traza,
+                                     self.analizador._obtener_parser())
+            if segmento.traza.errores:
+                segmento.traza = self.analizador.trazar(segmento.buffer)
+        except Exception as e:
+            segmento.arbol = None
+            segmento.excepcion = f"Excepción: {e}"
+
+    def _estado_en(self, indice):
+        """
+        Tabla de símbolos al inicio del segmento indice: la última copia guardada
+        hasta ese segmento más lo que escribieron los segmentos entre ambos.
+        Retorna (tabla, cantidad de segmentos aplicados sobre la copia).
+        """
+        registros = self._semanticos
+        tabla = _TablaLecturas()
+        desde = min(indice, len(registros))
+        while desde and (desde == len(registros) or registros[desde].estado is None):
+            desde -= 1
+        if desde < len(registros) and registros[desde].estado:
+            dict.update(tabla, registros[desde].estado)
+        for registro in registros[desde:indice]:
+            _aplicar(tabla, registro.finales)
+        return tabla, indice - desde
+
+    def _reanudar_semantico(self, primero, n_anteriores, n_nuevos):
+        """
+        Analiza los segmentos nuevos desde la tabla de símbolos que dejaron los
+        anteriores a primero. De los siguientes solo analiza de nuevo los que
+        consultan un nombre cuya entrada quedó distinta a la del análisis
+        anterior; los demás escriben lo mismo que antes. Termina cuando ya no
+        queda ningún nombre distinto.
+        """
+        if self._semanticos is None:
+            self._semanticos = []
+            self._reemplazar(_MEDIDAS_SEMANTICAS, 0, len(self._columnas["semantico"]), [])
+            primero, n_anteriores, n_nuevos = 0, 0, len(self.segmentos)
+        tabla, sin_copia = self._estado_en(primero)
+        semantico = _AnalizadorSegmentos(tabla)
+        # Entrada de cada nombre que pudo cambiar, en el análisis anterior, al llegar al segmento actual
+        anteriores = {}
+        for registro in self._semanticos[primero:primero + n_anteriores]:
+            anteriores.update(registro.finales)
+
+        def analizar(i):
+            nonlocal sin_copia
+            estado = dict(tabla) if sin_copia >= SEGMENTOS_POR_ESTADO else None
+            segmento = self.segmentos[i]
+            if segmento.arbol is None:
+                registro = SemanticaSegmento()
+            else:
+                registro = semantico.analizar_segmento(segmento.arbol)
+                # Un nombre que todavía no está en anteriores no cambió: lo que el
+                # segmento reemplazó es también la entrada del análisis anterior
+                for nombre, anterior in tabla.registro:
+                    anteriores.setdefault(nombre, anterior)
+            registro.estado = estado
+            sin_copia = 1 if estado is not None else sin_copia + 1
+            return registro
+
+        def distinto(nombre):
+            return _sin_valor(dict.get(tabla, nombre, _AUSENTE)) != _sin_valor(anteriores[nombre])
+
+        nuevos = [analizar(i) for i in range(primero, primero + n_nuevos)]
+        self._semanticos[primero:primero + n_anteriores] = nuevos
+        self._reemplazar(_MEDIDAS_SEMANTICAS, primero, primero + n_anteriores, nuevos)
+        cambiados = set(filter(distinto, anteriores))
+        i = primero + n_nuevos
+        while cambiados and i < len(self.segmentos):
+            registro = self._semanticos[i]
+            anteriores.update(registro.finales)
+            if registro.leidos.isdisjoint(cambiados):
+                # Consulta lo mismo que antes, así que su resultado y lo que escribe no cambian
+                if registro.estado is not None:
+                    registro.estado = dict(tabla)
+                    sin_copia = 0
+                _aplicar(tabla, registro.finales)
+                sin_copia += 1
+                cambiados.difference_update(registro.finales)
+            else:
+                nuevo = self._semanticos[i] = analizar(i)
+                self._reemplazar(_MEDIDAS_SEMANTICAS, i, i + 1, [nuevo])
+                for nombre in chain(registro.finales, nuevo.finales):
+                    if distinto(nombre):
+                        cambiados.add(nombre)
+                    else:
+                        cambiados.discard(nombre)
+            i += 1
+
+    def actualizar(self, texto):
+        """Analiza el texto reutilizando los segmentos que no cambiaron."""
+        primero, anteriores, nuevos = self._resegmentar(texto)
+        self.texto = texto
+        for segmento in nuevos:
+            self._analizar_segmento(segmento)
+        self._reemplazar(_MEDIDAS_SEGMENTO, primero, primero + len(anteriores), nuevos)
+        self._fallo_semantico = None
+        try:
+            self._reanudar_semantico(primero, len(anteriores), len(nuevos))
+        except Exception as e:
+            self._semanticos = None
+            self._fallo_semantico = f"Error durante el análisis semántico: {str(e)}"
+        return self._resultados()
+
+    def _resultados(self):
+        segmentos = list(self.segmentos)
+        lineas = self._columnas["lineas"][:]
+        lexico = _RenglonesLexicos(segmentos, lineas, *self._copia("lexico"))
+        sintactico = _RenglonesSintacticos(segmentos, lineas, *self._copia("sintactico"))
+        if not self._totales["errores_sintacticos"]:
+            sintactico = _Concatenacion([sintactico, ["Análisis sintáctico exitoso."]])
+        if self._fallo_semantico is not None:
+            return lexico, sintactico, [self._fallo_semantico]
+        if self._totales["sin_arbol"]:
+            return lexico, sintactico, [SIN_ARBOL]
+        registros = list(self._semanticos)
+        mensajes = _RenglonesSemanticos(registros, lineas, *self._copia("semantico"))
+        errores = _RenglonesSemanticos(registros, lineas, *self._copia("errores_semanticos"), solo_errores=True)
+        return lexico, sintactico, _Concatenacion([mensajes, *partes_resumen_semantico(errores)])
+
+    @property
+    def filas_error(self):
+        """Renglones de error de cada fase del último actualizar() (ver Analizador.filas_error)."""
+        lexicos, sintacticos = [], []
+        inicios = self._acumulado("lexico")
+        for i in self._con("errores_lexicos"):
+            lexicos.extend(inicios[i] + f for f in self.segmentos[i].lexico.filas_error)
+        inicios = self._acumulado("sintactico")
+        for i in self._con("errores_sintacticos"):
+            sintacticos.extend(inicios[i] + f for f in self.segmentos[i].filas_error_sintactico())
+        if self._fallo_semantico is not None or self._totales["sin_arbol"]:
+            return {"lex": lexicos, "syntax": sintacticos, "semantic": [0]}
+        semanticos = []
+        inicios = self._acumulado("semantico")
+        for i in self._con("errores_semanticos"):
+            semanticos.extend(inicios[i] + f for f in self._semanticos[i].filas_error)
+        # La sección de errores empieza después de los mensajes y de su título
+        inicio = inicios[-1] + 1
+        semanticos.extend(range(inicio, inicio + self._totales["errores_semanticos"]))
+        return {"lex": lexicos, "syntax": sintacticos, "semantic": semanticos}
+
+    def errores(self):
+        """
+        Errores del último actualizar() sin recorrer los renglones de todo el
+        resultado (ver lsp.py). Retorna (lexicos, sintacticos, semanticos):
+        - lexicos: (línea, columna, texto) de cada secuencia de caracteres no definidos;
+        - sintacticos: (línea, columna, longitud, renglón) del token de cada error
+          de sintaxis; línea y columna son None en las excepciones del parser;
+        - semanticos: (línea, columna, longitud, mensaje) de cada error semántico,
+          sin repetir; la columna y la longitud son las del identificador del que
+          salió la línea, o None si no hubo ninguno. Si el análisis semántico no
+          se pudo hacer, un solo error con línea None.
+        """
+        desplazamientos = self._acumulado("lineas")
+        lexicos = []
+        for i in self._con("errores_lexicos"):
+            buffer = self.segmentos[i].buffer
+            for pos, texto in buffer.errores:
+                linea, columna = buffer.posicion(pos)
+                lexicos.append((linea + desplazamientos[i], columna, texto))
+        sintacticos = []
+        for i in self._con("errores_sintacticos"):
+            segmento = self.segmentos[i]
+            if segmento.excepcion:
+                sintacticos.append((None, None, 0, segmento.excepcion))
+            buffer, traza = segmento.buffer, segmento.traza
+            tabla = buffer.tokens
+            for k, pos in zip(traza.indices_error, traza.posiciones_error):
+                if pos is None:
+                    # Fin del segmento: después de su último carácter visible
+                    pos, longitud = len(buffer.entrada.rstrip()), 0
+                else:
+                    longitud = tabla.longitudes[bisect.bisect_left(tabla.posiciones, pos)]
+                linea, columna = buffer.posicion(pos)
+                sintacticos.append((linea + desplazamientos[i], columna, longitud,
+                                    traza.linea(k, desplazamientos[i])))
+        if self._fallo_semantico is not None:
+            return lexicos, sintacticos, [(None, None, None, self._fallo_semantico)]
+        if self._totales["sin_arbol"]:
+            return lexicos, sintacticos, [(None, None, None, SIN_ARBOL)]
+        semanticos = []
+        for i in self._con("errores_semanticos"):
+            registro, buffer = self._semanticos[i], self.segmentos[i].buffer
+            for f, identificador in zip(registro.filas_error, registro.ubicaciones):
+                linea, mensaje = registro.mensajes[f]
+                if identificador is not None and identificador.lexpos is not None:
+                    linea, columna = buffer.posicion(identificador.lexpos)
+                    semanticos.append((linea + desplazamientos[i], columna, len(identificador), mensaje))
+                elif linea is None:
+                    semanticos.append((_linea_previa(self._semanticos, desplazamientos, i), None, None, mensaje))
+                else:
+                    semanticos.append((linea + desplazamientos[i], None, None, mensaje))
+        return lexicos, sintacticos, list(dict.fromkeys(semanticos))
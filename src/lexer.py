@@ -1,5 +1,12 @@
+import bisect
+from array import array
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict, namedtuple
 from ply import lex
+from tablas import DIRECTORIO_TABLAS, MODULO_LEXTAB, calcular_firma, reglas_de_modulo, sellar_tabla, tabla_vigente
 
 # ---------------------------
 # Definición de tokens y lexer para C#
@@ -93,10 +100,33 @@ def t_ADD(t):
     t.lineno = t.lexer.lineno
     return t
 
+class Identificador(str):
+    """
+    Valor de un token ID. Se comporta como str, pero permite distinguir en el AST
+    un identificador de una constante de cadena y conserva la línea y la posición
+    en la entrada (lexpos) donde aparece.
+    """
+    lineno = 0
+    lexpos = None
+
+
+class Booleano(str):
+    """
+    Valor de un literal true/false en el AST. Se muestra con el lexema de C#
+    (en la traza y en los mensajes), y el semántico lo distingue de una
+    constante de cadena por su clase, igual que a Identificador.
+    """
+    __slots__ = ()
+
+
 def t_ID(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'
     t.type = reserved.get(t.value, 'ID')
     t.lineno = t.lexer.lineno  # Asegura que todos los tokens, incluidos los reservados, tengan número de línea
+    if t.type == 'ID':
+        t.value = Identificador(t.value)
+        t.value.lineno = t.lineno
+        t.value.lexpos = t.lexpos
     return t
 
 def t_FLOAT_CONST(t):
@@ -125,13 +155,377 @@ def t_COMMENT(t):
 
 def t_multiline_comment(t):
     r'/\*[\s\S]*?\*/'
-    pass
+    t.lexer.lineno += t.value.count('\n')
 
 def t_ignore_unicode(t):
     r'[^\x00-\x7F]'
     pass
 
+# Secuencias de caracteres que no pueden iniciar ningún token: se consumen en un
+# solo paso para no invocar t_error (que copia el resto de la entrada) por cada uno.
+# Debe ir después de t_STRING_CONST para que '"' solo se reporte si no cierra.
+# La clase lista explícitamente los caracteres ASCII sin regla (compila más rápido
+# que la clase negada equivalente); los no ASCII los ignora t_ignore_unicode.
+def t_caracter_invalido(t):
+    r'[\x00-\x08\x0b\x0c\x0e-\x1f#$\'?@\\^`~\x7f]+|&(?!&)|\|(?!\|)|"'
+    t.lexer.errores.append((t.lexpos, t.value))
+
 def t_error(t):
+    # Registra el carácter no reconocido para que el análisis léxico lo reporte
+    t.lexer.errores.append((t.lexpos, t.lexer.lexdata[t.lexpos]))
     t.lexer.skip(1)
 
-lexer = lex.lex()
\ No newline at end of file
+def _construir_lexer():
+    """
+    Carga el lexer desde la tabla precompilada (lextab_cs.py) si su firma coincide
+    con las reglas actuales; si no, lo construye, guarda la tabla y la sella.
+    """
+    espacio = globals()
+    firma = calcular_firma(
+        tokens,
+        sorted((nombre, valor) for nombre, valor in espacio.items() if nombre.startswith('t_') and isinstance(valor, str)),
+        reglas_de_modulo(espacio, 't_'),
+    )
+    if tabla_vigente(MODULO_LEXTAB, firma):
+        return lex.lex(optimize=1, lextab=MODULO_LEXTAB)
+    nuevo = lex.lex()
+    try:
+        nuevo.writetab(MODULO_LEXTAB, DIRECTORIO_TABLAS)
+    except OSError:
+        return nuevo
+    sellar_tabla(MODULO_LEXTAB, firma)
+    return nuevo
+
+lexer = _construir_lexer()
+lexer.errores = []
+
+
+# ---------------------------
+# Buffer de tokens compartido por las tres fases
+# ---------------------------
+
+# Cantidad de entradas distintas cuyo resultado léxico se conserva en memoria
+MAX_BUFFERS_CACHE = 8
+
+# Cada cuántos tokens se informa el avance (y se revisa si se canceló el análisis)
+TOKENS_POR_AVANCE = 2048
+
+# Caracteres que lee por vez tokenizar_flujo
+TAMANO_BLOQUE = 1 << 20
+
+# Backends de tokenize(): "ply" (reglas de este módulo) o "manual" (escaner.py).
+# Ambos producen los mismos tokens; se elige con ANALIZADOR_LEXER o usar_backend_lexer
+BACKENDS_LEXER = ("ply", "manual")
+_backend_lexer = os.environ.get("ANALIZADOR_LEXER", "ply")
+if _backend_lexer not in BACKENDS_LEXER:
+    _backend_lexer = "ply"
+
+
+def usar_backend_lexer(nombre):
+    """Elige el backend con que tokenizar() reconoce los tokens de ahora en más."""
+    global _backend_lexer
+    if nombre not in BACKENDS_LEXER:
+        raise ValueError(f"backend de lexer desconocido: {nombre!r} (opciones: {', '.join(BACKENDS_LEXER)})")
+    _backend_lexer = nombre
+
+
+def backend_lexer():
+    return _backend_lexer
+
+
+_cache_buffers = OrderedDict()
+# El caché es compartido por todos los hilos; el lexer de cada análisis no (ver tokenizar)
+_cache_lock = threading.Lock()
+_lexer_lock = threading.Lock()
+
+
+def indice_lineas(entrada):
+    """Retorna la lista de posiciones donde comienza cada línea de la entrada."""
+    inicios = [0]
+    pos = entrada.find('\n')
+    while pos != -1:
+        inicios.append(pos + 1)
+        pos = entrada.find('\n', pos + 1)
+    return inicios
+
+
+def linea_columna(inicios, pos):
+    """Convierte una posición absoluta en (línea, columna), ambas desde 1, usando bisect."""
+    linea = bisect.bisect_right(inicios, pos)
+    return linea, pos - inicios[linea - 1] + 1
+
+
+# Número de cada tipo de token en las columnas de TablaTokens
+_NUMERO_TIPO = {tipo: i for i, tipo in enumerate(tokens)}
+
+
+class TablaTokens:
+    """
+    Tokens de una entrada guardados en columnas compactas en lugar de un
+    LexToken por token: tipo, línea, posición y largo en arrays paralelos y el
+    valor como índice a un conjunto de valores sin repetir (cada identificador
+    o constante distinta se guarda una sola vez).
+    Se usa como la lista de tokens de antes: len(), tabla[i] e iterar arman
+    el LexToken en el momento; para no crearlos, usar tipo/valor/las columnas.
+    """
+
+    def __init__(self):
+        self.tipos = array('B')
+        self.lineas = array('i')
+        self.posiciones = array('i')
+        self.longitudes = array('i')
+        self.valores = array('i')
+        self._conjunto_valores = []
+        self._indice_valores = {}
+
+    def agregar(self, tipo, valor, linea, posicion, longitud):
+        # La clave incluye la clase para no confundir 1, 1.0 y True
+        clave = (valor.__class__, valor)
+        indice = self._indice_valores.get(clave)
+        if indice is None:
+            indice = self._indice_valores[clave] = len(self._conjunto_valores)
+            # Los identificadores se guardan como str; valor() los vuelve a envolver
+            self._conjunto_valores.append(str(valor) if tipo == 'ID' else valor)
+        self.tipos.append(_NUMERO_TIPO[tipo])
+        self.lineas.append(linea)
+        self.posiciones.append(posicion)
+        self.longitudes.append(longitud)
+        self.valores.append(indice)
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def tipo(self, i):
+        return tokens[self.tipos[i]]
+
+    def valor(self, i):
+        valor = self._conjunto_valores[self.valores[i]]
+        if tokens[self.tipos[i]] == 'ID':
+            # Cada aparición lleva su propia línea y posición (ver Identificador)
+            valor = Identificador(valor)
+            valor.lineno = self.lineas[i]
+            valor.lexpos = self.posiciones[i]
+        return valor
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self.tipos)
+        tok = lex.LexToken()
+        tok.type = tokens[self.tipos[i]]
+        tok.value = self.valor(i)
+        tok.lineno = self.lineas[i]
+        tok.lexpos = self.posiciones[i]
+        tok.endlexpos = tok.lexpos + self.longitudes[i]
+        return tok
+
+    def __iter__(self):
+        for i in range(len(self.tipos)):
+            yield self[i]
+
+
+class BufferTokens:
+    """
+    Resultado de tokenizar una entrada una sola vez.
+    - tokens: TablaTokens con los tokens en orden de aparición.
+    - errores: lista de (posición, texto) con las secuencias no reconocidas.
+    """
+
+    def __init__(self, entrada, tokens, errores):
+        self.entrada = entrada
+        self.tokens = tokens
+        self.errores = errores
+        self._inicios_linea = None
+
+    def posicion(self, pos):
+        """Retorna (línea, columna) de una posición; el índice de líneas se calcula una vez."""
+        if self._inicios_linea is None:
+            self._inicios_linea = indice_lineas(self.entrada)
+        return linea_columna(self._inicios_linea, pos)
+
+
+class AlimentadorTokens:
+    """
+    Adaptador con la interfaz de lexer que espera PLY (input/token).
+    Entrega los tokens de un BufferTokens sin volver a tokenizar la entrada.
+    Si se indica avance, se llama como avance(tokens_entregados, total) cada
+    TOKENS_POR_AVANCE tokens; puede lanzar una excepción para cancelar el parseo.
+    """
+
+    def __init__(self, buffer, avance=None):
+        self.buffer = buffer
+        self.lineno = 1
+        # Posición del último token entregado (el lookahead del parser)
+        self.lexpos = 0
+        self._indice = 0
+        self._avance = avance
+
+    def input(self, entrada):
+        # La entrada ya fue tokenizada; solo reinicia la lectura del buffer
+        self._indice = 0
+
+    def token(self):
+        tokens = self.buffer.tokens
+        if self._indice >= len(tokens):
+            self.lexpos = len(self.buffer.entrada)
+            return None
+        if self._avance is not None and self._indice % TOKENS_POR_AVANCE == 0:
+            self._avance(self._indice, len(tokens))
+        tok = tokens[self._indice]
+        self._indice += 1
+        self.lineno = tok.lineno
+        self.lexpos = tok.lexpos
+        return tok
+
+
+def clave_entrada(entrada):
+    """Calcula el hash de contenido con el que se identifica una entrada."""
+    return hashlib.sha1(entrada.encode("utf-8")).hexdigest()
+
+
+def _ejecutar_lexer(lex_propio, entrada, avance=None):
+    lex_propio.lineno = 1
+    lex_propio.errores = []
+    lex_propio.input(entrada)
+    tabla = TablaTokens()
+    agregar = tabla.agregar
+    siguiente = lex_propio.token
+    n = 0
+    while True:
+        tok = siguiente()
+        if not tok:
+            break
+        # Al retornar el token, lex_propio.lexpos ya quedó al final del texto reconocido
+        agregar(tok.type, tok.value, tok.lineno, tok.lexpos, lex_propio.lexpos - tok.lexpos)
+        n += 1
+        if avance is not None and n % TOKENS_POR_AVANCE == 0:
+            avance(tok.lexpos, len(entrada))
+    errores = lex_propio.errores
+    lex_propio.errores = []
+    return BufferTokens(entrada, tabla, errores)
+
+
+def _ejecutar_backend(entrada, lex_propio=None, avance=None):
+    # Tokeniza con el backend elegido, sin pasar por el caché de buffers
+    if _backend_lexer == "manual":
+        # No tiene estado compartido: no necesita lexer propio ni lock
+        from escaner import escanear
+        tabla, errores = escanear(entrada, avance)
+        return BufferTokens(entrada, tabla, errores)
+    if lex_propio is not None:
+        return _ejecutar_lexer(lex_propio, entrada, avance)
+    with _lexer_lock:
+        return _ejecutar_lexer(lexer, entrada, avance)
+
+
+def tokenizar(entrada, lex_propio=None, avance=None):
+    """
+    Tokeniza la entrada una sola vez y retorna un BufferTokens.
+    Si el mismo contenido ya fue tokenizado recientemente, reutiliza el buffer
+    guardado (la clave es el hash del contenido) sin volver a ejecutar el lexer.
+    lex_propio es un lexer clonado (lexer.clone()) para analizar desde varios
+    hilos a la vez; sin él se usa el lexer del módulo, de a un hilo por vez.
+    Con el backend "manual" (ver usar_backend_lexer) se usa escaner.py.
+    avance(posicion, largo) se llama cada TOKENS_POR_AVANCE tokens y puede lanzar
+    una excepción para cancelar; en ese caso no se guarda nada en el caché.
+    """
+    clave = clave_entrada(entrada)
+    with _cache_lock:
+        buffer = _cache_buffers.get(clave)
+        if buffer is not None:
+            _cache_buffers.move_to_end(clave)
+            return buffer
+    buffer = _ejecutar_backend(entrada, lex_propio, avance)
+    with _cache_lock:
+        _cache_buffers[clave] = buffer
+        if len(_cache_buffers) > MAX_BUFFERS_CACHE:
+            _cache_buffers.popitem(last=False)
+    return buffer
+
+
+# ---------------------------
+# Tokenización por flujo (archivos grandes)
+# ---------------------------
+
+# Secuencia no reconocida dentro de un flujo; lexpos es la posición absoluta
+CaracterInvalido = namedtuple("CaracterInvalido", "lexpos value lineno columna")
+
+
+def tokenizar_flujo(archivo, tam_bloque=TAMANO_BLOQUE, lex_propio=None):
+    """
+    Generador que tokeniza un archivo de texto abierto leyendo de a tam_bloque
+    caracteres, sin tener nunca el archivo entero en memoria. Entrega, en orden
+    de aparición, los LexToken (con lexpos absoluta, como si se hubiera
+    tokenizado todo de una vez) y un CaracterInvalido por cada secuencia no
+    reconocida. No usa el caché de buffers.
+
+    Ningún token abarca un salto de línea salvo los comentarios /* */, así que
+    cada ventana se corta al final de la última línea completa leída. Si la
+    ventana deja un /* sin cerrar (el lexer lo ve como DIVIDE seguido de '*'),
+    se lee hasta encontrar el */ y se vuelve a tokenizar desde el /*. La
+    memoria depende del largo de las líneas y de los comentarios, no del archivo.
+    """
+    lex_propio = lex_propio if lex_propio is not None else lexer.clone()
+    lex_propio.lineno = 1
+    pendiente = ""       # texto leído y todavía no tokenizado
+    base = 0             # posición absoluta de pendiente[0]
+    lineas = 0           # saltos de línea anteriores a base
+    inicio_linea = 0     # posición absoluta donde empieza la línea de base
+    busca_cierre = -1    # con un /* abierto al inicio de pendiente, desde dónde buscar el */
+    while True:
+        bloque = archivo.read(tam_bloque)
+        fin = not bloque
+        pendiente += bloque
+        if fin:
+            corte = len(pendiente)
+        else:
+            corte = pendiente.rfind("\n") + 1
+            if busca_cierre >= 0:
+                cierre = pendiente.find("*/", busca_cierre)
+                if cierre == -1 or corte <= cierre:
+                    busca_cierre = cierre if cierre != -1 else max(2, len(pendiente) - 1)
+                    continue
+                busca_cierre = -1
+            if corte == 0:
+                continue
+        ventana, pendiente = pendiente[:corte], pendiente[corte:]
+
+        lex_propio.errores = []
+        lex_propio.input(ventana)
+        abierto = None
+        e = 0
+        # Cursor para calcular línea y columna de los errores sin recontar la ventana
+        cursor, lineas_cursor, inicio_cursor = 0, lineas, inicio_linea
+        while True:
+            tok = lex_propio.token()
+            limite = tok.lexpos if tok is not None else len(ventana)
+            if tok is not None and not fin and tok.type == "DIVIDE" and ventana.startswith("*", tok.lexpos + 1):
+                abierto = tok
+            errores = lex_propio.errores
+            while e < len(errores) and errores[e][0] < limite:
+                pos, texto = errores[e]
+                lineas_cursor += ventana.count("\n", cursor, pos)
+                salto = ventana.rfind("\n", cursor, pos)
+                if salto != -1:
+                    inicio_cursor = base + salto + 1
+                cursor = pos
+                yield CaracterInvalido(base + pos, texto, lineas_cursor + 1, base + pos - inicio_cursor + 1)
+                e += 1
+            if tok is None or abierto is not None:
+                break
+            tok.lexpos += base
+            yield tok
+
+        consumido = abierto.lexpos if abierto is not None else len(ventana)
+        salto = ventana.rfind("\n", 0, consumido)
+        if salto != -1:
+            inicio_linea = base + salto + 1
+        lineas += ventana.count("\n", 0, consumido)
+        base += consumido
+        if abierto is not None:
+            # Se retoma desde el /* con el número de línea que tenía
+            lex_propio.lineno = abierto.lineno
+            pendiente = ventana[consumido:] + pendiente
+            busca_cierre = 2
+        if fin:
+            lex_propio.errores = []
+            return
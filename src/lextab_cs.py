@@ -0,0 +1,11 @@
+# lextab_cs.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADD', 'AND', 'ASSIGN', 'BOOL', 'CHAR', 'CLASS', 'COLON', 'COMMA', 'CONSOLE', 'DIVIDE', 'DOT', 'DOUBLE', 'ELSE', 'EQ', 'FALSE', 'FLOAT', 'FLOAT_CONST', 'FOR', 'GE', 'GT', 'ID', 'IF', 'INT', 'INT_CONST', 'LBRACE', 'LBRACKET', 'LE', 'LIST', 'LPAREN', 'LT', 'MINUS', 'MINUSEQUAL', 'MINUSMINUS', 'MOD', 'NE', 'NEW', 'NOT', 'OR', 'PARSE', 'PLUS', 'PLUSEQUAL', 'PLUSPLUS', 'PRIVATE', 'PROTECTED', 'PUBLIC', 'RBRACE', 'RBRACKET', 'READLINE', 'RETURN', 'RPAREN', 'SEMICOLON', 'STRING', 'STRING_CONST', 'TIMES', 'TRUE', 'USING', 'VAR', 'VOID', 'WRITELINE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_STRING_CONST>"([^"\\n])*")|(?P<t_ADD>Add)|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_FLOAT_CONST>\\d+\\.\\d+([fF])?)|(?P<t_INT_CONST>\\d+)|(?P<t_ignore_whitespace>[ \\t]+)|(?P<t_newline>(\\r\\n|\\r|\\n)+)|(?P<t_COMMENT>//.*)|(?P<t_multiline_comment>/\\*[\\s\\S]*?\\*/)|(?P<t_ignore_unicode>[^\\x00-\\x7F])|(?P<t_caracter_invalido>[\\x00-\\x08\\x0b\\x0c\\x0e-\\x1f#$\\\'?@\\\\^`~\\x7f]+|&(?!&)|\\|(?!\\|)|")|(?P<t_PARSE>Parse)|(?P<t_OR>\\|\\|)|(?P<t_PLUSPLUS>\\+\\+)|(?P<t_PLUSEQUAL>\\+=)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_DOT>\\.)|(?P<t_LE><=)|(?P<t_GE>>=)|(?P<t_EQ>==)|(?P<t_NE>!=)|(?P<t_AND>&&)|(?P<t_MINUSMINUS>--)|(?P<t_MINUSEQUAL>-=)|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_ASSIGN>=)|(?P<t_SEMICOLON>;)|(?P<t_COMMA>,)|(?P<t_LT><)|(?P<t_GT>>)|(?P<t_MOD>%)|(?P<t_NOT>!)|(?P<t_COLON>:)', [None, ('t_STRING_CONST', 'STRING_CONST'), None, ('t_ADD', 'ADD'), ('t_ID', 'ID'), ('t_FLOAT_CONST', 'FLOAT_CONST'), None, ('t_INT_CONST', 'INT_CONST'), ('t_ignore_whitespace', 'ignore_whitespace'), ('t_newline', 'newline'), None, ('t_COMMENT', 'COMMENT'), ('t_multiline_comment', 'multiline_comment'), ('t_ignore_unicode', 'ignore_unicode'), ('t_caracter_invalido', 'caracter_invalido'), (None, 'PARSE'), (None, 'OR'), (None, 'PLUSPLUS'), (None, 'PLUSEQUAL'), (None, 'PLUS'), (None, 'TIMES'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'DOT'), (None, 'LE'), (None, 'GE'), (None, 'EQ'), (None, 'NE'), (None, 'AND'), (None, 'MINUSMINUS'), (None, 'MINUSEQUAL'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'ASSIGN'), (None, 'SEMICOLON'), (None, 'COMMA'), (None, 'LT'), (None, 'GT'), (None, 'MOD'), (None, 'NOT'), (None, 'COLON')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_firma_gramatica = '8cfe656aedfff3fc266cceefaa49932d972880c1'
@@ -0,0 +1,149 @@
+# -------------------------------------------------------------
+# lote.py - Análisis por lotes de archivos .cs con un pool de procesos
+#
+# Recibe directorios, globs o archivos, reparte los archivos entre
+# procesos trabajadores (cada uno carga las tablas del parser una sola
+# vez al iniciar) y entrega los resultados en el orden de entrada o a
+# medida que terminan. ResumenLote acumula archivos/seg, tiempo por
+# fase y fallos para la tabla final (y, al perfilar, el Perfil de todo
+# el lote, ver perfil.py).
+# -------------------------------------------------------------
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from perfil import Perfil
+
+FASES = ("lex", "syntax", "semantic")
+
+
+def expandir_rutas(entradas):
+    """
+    Convierte directorios (recorridos recursivamente), globs y archivos en una
+    lista ordenada y sin repetidos de archivos .cs.
+    """
+    rutas = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for raiz, _, archivos in os.walk(entrada):
+                rutas.extend(os.path.join(raiz, a) for a in archivos if a.endswith(".cs"))
+        elif glob.has_magic(entrada):
+            rutas.extend(r for r in glob.glob(entrada, recursive=True) if os.path.isfile(r))
+        else:
+            rutas.append(entrada)
+    return sorted(dict.fromkeys(rutas))
+
+
+def _inicializar_trabajador():
+    # Carga el lexer, el parser y sus tablas una vez por proceso
+    import main  # noqa: F401
+    import syntax  # noqa: F401
+    import semantic  # noqa: F401
+
+
+def analizar_archivo(ruta, fases=FASES, perfilar=False):
+    """
+    Analiza un archivo con las fases indicadas (Analizador.analizar_fases) y
+    retorna un diccionario con la ruta, el tiempo de cada fase (segundos), la
+    cantidad de errores por fase y, si el análisis falló, el motivo en "fallo".
+    Con el caché activado (ver cache.py), un archivo ya analizado se toma de
+    ahí ("desde_cache" es True y no hay tiempos por fase); si no, el resultado
+    se guarda cuando las fases incluyen el semántico.
+    Con perfilar, "perfil" tiene el reporte del Perfil del archivo (Perfil.a_dict).
+    """
+    import main
+    resultado = {"ruta": ruta, "tiempos": {}, "errores": {}, "fallo": None, "desde_cache": False}
+    # Los tiempos por fase salen siempre del Perfil; solo al perfilar se miden reglas e inferencia
+    perfil = Perfil(detalle=perfilar)
+    analizador = main.Analizador(perfil=perfil)
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            entrada = f.read()
+        resultados = analizador.analizar_fases(entrada, fases)
+        resultado["desde_cache"] = analizador.desde_cache
+        if "lex" in resultados:
+            resultado["errores"]["lex"] = len(main.errores_lexicos(resultados["lex"]))
+        if "syntax" in resultados:
+            resultado["errores"]["syntax"] = len(main.errores_sintacticos(resultados["syntax"]))
+        if "semantic" in resultados:
+            resultado["errores"]["semantic"] = len(main.errores_semanticos(resultados["semantic"]))
+    except Exception as e:
+        resultado["fallo"] = f"{type(e).__name__}: {e}"
+    resultado["tiempos"] = {fase: perfil.fases[fase][1] for fase in FASES if fase in perfil.fases}
+    if perfilar:
+        resultado["perfil"] = perfil.a_dict()
+    return resultado
+
+
+def analizar_lote(rutas, fases=FASES, procesos=None, ordenado=True, perfilar=False):
+    """
+    Genera el resultado de analizar_archivo para cada ruta.
+    - procesos: cantidad de trabajadores (por defecto, uno por núcleo); con 1 se analiza en este proceso.
+    - ordenado: si es True respeta el orden de rutas; si no, entrega cada archivo al terminar.
+    - perfilar: cada resultado lleva el perfil de su archivo.
+    """
+    fases = tuple(fases)
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or len(rutas) <= 1:
+        for ruta in rutas:
+            yield analizar_archivo(ruta, fases, perfilar)
+        return
+    # Bloques grandes reducen la comunicación entre procesos en lotes de muchos archivos
+    bloque = max(1, min(64, len(rutas) // (procesos * 8)))
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_trabajador) as pool:
+        if ordenado:
+            yield from pool.map(analizar_archivo, rutas, [fases] * len(rutas), [perfilar] * len(rutas),
+                                chunksize=bloque)
+        else:
+            futuros = [pool.submit(analizar_archivo, ruta, fases, perfilar) for ruta in rutas]
+            for futuro in as_completed(futuros):
+                yield futuro.result()
+
+
+class ResumenLote:
+    """Acumula los resultados de un lote y arma la tabla de resumen."""
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.archivos = 0
+        self.con_errores = 0
+        self.fallos = []
+        self.desde_cache = 0
+        self.tiempos = dict.fromkeys(FASES, 0.0)
+        # Suma de los perfiles de los archivos (None si el lote no se perfiló)
+        self.perfil = None
+
+    def agregar(self, resultado):
+        self.archivos += 1
+        if resultado["fallo"]:
+            self.fallos.append((resultado["ruta"], resultado["fallo"]))
+        elif any(resultado["errores"].values()):
+            self.con_errores += 1
+        self.desde_cache += resultado.get("desde_cache", False)
+        for fase, segundos in resultado["tiempos"].items():
+            self.tiempos[fase] += segundos
+        if "perfil" in resultado:
+            if self.perfil is None:
+                self.perfil = Perfil()
+            self.perfil.sumar(resultado["perfil"])
+
+    def formatear(self):
+        """Retorna la tabla de resumen como lista de líneas."""
+        total = time.perf_counter() - self.inicio
+        por_segundo = self.archivos / total if total > 0 else 0.0
+        lineas = [
+            "--- Resumen del lote ---",
+            f"{'archivos':<22}{self.archivos:>12}",
+            f"{'con errores':<22}{self.con_errores:>12}",
+            f"{'fallos':<22}{len(self.fallos):>12}",
+            f"{'desde caché':<22}{self.desde_cache:>12}",
+            f"{'tiempo total (s)':<22}{total:>12.2f}",
+            f"{'archivos/seg':<22}{por_segundo:>12.1f}",
+        ]
+        for fase in FASES:
+            lineas.append(f"{'tiempo ' + fase + ' (s)':<22}{self.tiempos[fase]:>12.2f}")
+        for ruta, motivo in self.fallos:
+            lineas.append(f"FALLO {ruta}: {motivo}")
+        return lineas
@@ -0,0 +1,443 @@
+# -------------------------------------------------------------
+# lsp.py - Servidor Language Server Protocol (stdio) del Analizador C#
+#
+# Permite ver los errores léxicos, sintácticos y semánticos en cualquier
+# editor con cliente LSP, sin la interfaz gráfica:
+#   python src/cli.py lsp        (o python src/lsp.py)
+# Solo usa la biblioteca estándar. Las tablas del lexer y del parser se
+# cargan una vez al iniciar y cada documento abierto conserva su
+# AnalisisIncremental (incremental.py), así que después de una edición
+# solo se reanalizan las declaraciones modificadas.
+# Los cambios llegan como ediciones incrementales (didChange con rangos);
+# los diagnósticos se publican cuando pasan ESPERA_DIAGNOSTICOS segundos
+# sin cambios en el documento, o a lo sumo ESPERA_MAXIMA después del
+# primer cambio sin publicar si se sigue escribiendo. La recolección
+# completa de ciclos se adelanta a cuando no llegan mensajes por
+# ESPERA_RECOLECCION segundos.
+# -------------------------------------------------------------
+
+import gc
+import io
+import json
+import queue
+import re
+import sys
+import threading
+import time
+import traceback
+
+from incremental import SIN_ARBOL, AnalisisIncremental
+from lexer import indice_lineas
+import syntax  # noqa: F401  (carga las tablas del parser al iniciar)
+
+NOMBRE_SERVIDOR = "analizador-cs"
+
+# Segundos sin cambios antes de analizar, y espera máxima mientras se sigue escribiendo
+ESPERA_DIAGNOSTICOS = 0.01
+ESPERA_MAXIMA = 0.2
+# Segundos sin mensajes antes de una recolección completa de ciclos (ver ServidorLSP.ejecutar)
+ESPERA_RECOLECCION = 1.0
+
+# TextDocumentSyncKind.Incremental y DiagnosticSeverity.Error
+SINCRONIZACION_INCREMENTAL = 2
+SEVERIDAD_ERROR = 1
+
+# Códigos de error de JSON-RPC / LSP
+ERROR_JSON = -32700
+ERROR_SOLICITUD = -32600
+METODO_DESCONOCIDO = -32601
+ERROR_INTERNO = -32603
+NO_INICIALIZADO = -32002
+
+
+
+# ---------------------------
+# Transporte (JSON-RPC con encabezados Content-Length)
+# ---------------------------
+
+def leer_mensaje(flujo):
+    """
+    Lee el cuerpo de un mensaje (bytes) de un flujo binario, o retorna None
+    si la entrada terminó.
+    """
+    longitud = None
+    while True:
+        linea = flujo.readline()
+        if not linea:
+            return None
+        linea = linea.strip()
+        if not linea:
+            if longitud is not None:
+                break
+            continue
+        nombre, _, valor = linea.decode("ascii", "replace").partition(":")
+        if nombre.strip().lower() == "content-length":
+            longitud = int(valor)
+    partes = []
+    while longitud > 0:
+        # Un flujo sin buffer puede entregar menos bytes que los pedidos
+        parte = flujo.read(longitud)
+        if not parte:
+            return None
+        partes.append(parte)
+        longitud -= len(parte)
+    return b"".join(partes)
+
+
+def escribir_mensaje(flujo, mensaje):
+    cuerpo = json.dumps(mensaje, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    flujo.write(b"Content-Length: %d\r\n\r\n" % len(cuerpo) + cuerpo)
+    flujo.flush()
+
+
+# ---------------------------
+# Posiciones
+# ---------------------------
+# El analizador cuenta columnas en caracteres (puntos de código). LSP usa
+# por defecto unidades UTF-16; si el cliente acepta "utf-32" se usan
+# directamente los índices de Python.
+
+def _desde_utf16(linea, unidades):
+    if linea.isascii():
+        return min(unidades, len(linea))
+    n = 0
+    for i, caracter in enumerate(linea):
+        if n >= unidades:
+            return i
+        n += 2 if ord(caracter) > 0xFFFF else 1
+    return len(linea)
+
+
+def _a_utf16(linea, columna):
+    if linea.isascii():
+        return columna
+    return columna + sum(1 for caracter in linea[:columna] if ord(caracter) > 0xFFFF)
+
+
+class Documento:
+    """
+    Texto de un documento abierto, su versión y su análisis incremental.
+    - pendiente_desde / ultimo_cambio: momentos (time.monotonic) del primer
+      cambio sin diagnósticos publicados y del último; None si está al día.
+    """
+
+    def __init__(self, uri, texto, version):
+        self.uri = uri
+        self.texto = texto
+        self.version = version
+        self.analisis = AnalisisIncremental()
+        self.pendiente_desde = None
+        self.ultimo_cambio = None
+        self._inicios = None
+
+    def _lineas(self):
+        if self._inicios is None:
+            self._inicios = indice_lineas(self.texto)
+        return self._inicios
+
+    def linea(self, numero):
+        """Texto de la línea numero (desde 0), sin el salto de línea."""
+        inicios = self._lineas()
+        if numero >= len(inicios):
+            return ""
+        fin = inicios[numero + 1] - 1 if numero + 1 < len(inicios) else len(self.texto)
+        return self.texto[inicios[numero]:fin]
+
+    def indice(self, posicion, codificacion):
+        """
+        Convierte una Position de LSP en (línea, índice del texto); las posiciones
+        fuera del texto se llevan al final de su línea o del texto.
+        """
+        inicios = self._lineas()
+        numero = posicion["line"]
+        if numero >= len(inicios):
+            return len(inicios) - 1, len(self.texto)
+        linea = self.linea(numero)
+        caracter = posicion["character"]
+        if codificacion == "utf-16":
+            caracter = _desde_utf16(linea, caracter)
+        return numero, inicios[numero] + min(caracter, len(linea))
+
+    def aplicar_cambios(self, cambios, codificacion):
+        """Aplica los TextDocumentContentChangeEvent de un didChange, en orden."""
+        for cambio in cambios:
+            if "range" not in cambio:
+                self.texto = cambio["text"]
+                self._inicios = None
+                continue
+            linea_inicio, inicio = self.indice(cambio["range"]["start"], codificacion)
+            linea_fin, fin = self.indice(cambio["range"]["end"], codificacion)
+            nuevo = cambio["text"]
+            self.texto = self.texto[:inicio] + nuevo + self.texto[fin:]
+            # El índice de líneas se corrige en lugar de recalcularse: las líneas
+            # del rango cambian y las siguientes solo se desplazan
+            diferencia = len(nuevo) - (fin - inicio)
+            agregadas = [inicio + m.end() for m in re.finditer("\n", nuevo)]
+            self._inicios[linea_inicio + 1:] = agregadas + [i + diferencia for i in self._inicios[linea_fin + 1:]]
+        ahora = time.monotonic()
+        self.ultimo_cambio = ahora
+        if self.pendiente_desde is None:
+            self.pendiente_desde = ahora
+
+    def vencimiento(self, espera, espera_maxima):
+        """Momento en que deben publicarse los diagnósticos (None si están al día)."""
+        if self.pendiente_desde is None:
+            return None
+        return min(self.ultimo_cambio + espera, self.pendiente_desde + espera_maxima)
+
+    # ---------- Diagnósticos ----------
+
+    def diagnosticos(self, codificacion):
+        """Analiza el texto actual y retorna la lista de Diagnostic de LSP."""
+        self.pendiente_desde = self.ultimo_cambio = None
+        try:
+            self.analisis.actualizar(self.texto)
+        except Exception:
+            # El estado incremental quedó inconsistente: se analiza todo de nuevo
+            self.analisis = AnalisisIncremental()
+            self.analisis.actualizar(self.texto)
+        lexicos, sintacticos, semanticos = self.analisis.errores()
+        diagnosticos = []
+        for numero, columna, texto in lexicos:
+            mensaje = (f"Este caracter no está definido: '{texto}'" if len(texto) == 1
+                       else f"Estos caracteres no están definidos: '{texto}'")
+            diagnosticos.append(self._diagnostico(numero - 1, columna - 1, columna - 1 + len(texto), mensaje,
+                                                  "lex", codificacion))
+        for numero, columna, longitud, mensaje in sintacticos:
+            if numero is None:
+                # Excepción del parser: sin posición
+                numero = columna = 1
+            diagnosticos.append(self._diagnostico(numero - 1, columna - 1, columna - 1 + longitud, mensaje,
+                                                  "syntax", codificacion))
+        for numero, columna, longitud, mensaje in semanticos:
+            if numero is None:
+                # "Error durante el análisis semántico": sin línea. El árbol no
+                # construido ya se informa con los errores de sintaxis
+                if mensaje != SIN_ARBOL:
+                    diagnosticos.append(self._diagnostico(0, 0, 0, mensaje, "semantic", codificacion))
+            elif columna is not None:
+                diagnosticos.append(self._diagnostico(numero - 1, columna - 1, columna - 1 + longitud, mensaje,
+                                                      "semantic", codificacion))
+            else:
+                # Nodo sin identificadores: toda la línea sin la sangría
+                linea = self.linea(numero - 1)
+                inicio = len(linea) - len(linea.lstrip())
+                diagnosticos.append(self._diagnostico(numero - 1, inicio, len(linea.rstrip()), mensaje,
+                                                      "semantic", codificacion))
+        return diagnosticos
+
+    def _diagnostico(self, numero, inicio, fin, mensaje, fase, codificacion):
+        if codificacion == "utf-16":
+            linea = self.linea(numero)
+            inicio, fin = _a_utf16(linea, inicio), _a_utf16(linea, fin)
+        return {
+            "range": {"start": {"line": numero, "character": inicio}, "end": {"line": numero, "character": fin}},
+            "severity": SEVERIDAD_ERROR,
+            "source": NOMBRE_SERVIDOR,
+            "code": fase,
+            "message": mensaje,
+        }
+
+
+# ---------------------------
+# Servidor
+# ---------------------------
+
+class ServidorLSP:
+    """
+    Atiende un cliente LSP sobre un par de flujos binarios. Un hilo lee los
+    mensajes y los encola; el hilo de ejecutar() los procesa en orden, aplica
+    las ediciones enseguida y analiza cada documento cuando vence su espera.
+    """
+
+    def __init__(self, entrada, salida, espera=ESPERA_DIAGNOSTICOS, espera_maxima=ESPERA_MAXIMA):
+        self.entrada = entrada
+        self.salida = salida
+        self.espera = espera
+        self.espera_maxima = espera_maxima
+        self.documentos = {}
+        self.codificacion = "utf-16"
+        self._cola = queue.Queue()
+        self._inicializado = False
+        self._apagado = False
+        self._terminar = False
+        # Hubo análisis (o documentos cerrados) desde la última recolección completa
+        self._recolectar = False
+        self._solicitudes = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown,
+        }
+        self._notificaciones = {
+            "initialized": lambda parametros: None,
+            "exit": self._exit,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close,
+            "textDocument/didSave": lambda parametros: None,
+        }
+
+    def _leer(self):
+        while True:
+            try:
+                cuerpo = leer_mensaje(self.entrada)
+            except (OSError, ValueError):
+                cuerpo = None
+            self._cola.put(cuerpo)
+            if cuerpo is None:
+                return
+
+    def ejecutar(self):
+        """Atiende mensajes hasta 'exit' o el fin de la entrada. Retorna el código de salida."""
+        threading.Thread(target=self._leer, name="lsp-entrada", daemon=True).start()
+        while not self._terminar:
+            vencimiento = self._proximo_vencimiento()
+            espera = None if vencimiento is None else max(0.0, vencimiento - time.monotonic())
+            # Sin análisis pendientes, la pasada completa del recolector se hace
+            # tras ESPERA_RECOLECCION sin mensajes y no en medio de una tecla
+            recolectar = espera is None and self._recolectar
+            try:
+                cuerpo = self._cola.get(timeout=ESPERA_RECOLECCION if recolectar else espera)
+            except queue.Empty:
+                if recolectar:
+                    gc.collect()
+                    self._recolectar = False
+                self._publicar_vencidos()
+                continue
+            if cuerpo is None:
+                break
+            self._procesar(cuerpo)
+            # Si los mensajes no dan respiro, igual se publica al pasar ESPERA_MAXIMA
+            self._publicar_vencidos()
+        return 0 if self._apagado else 1
+
+    def _proximo_vencimiento(self):
+        vencimientos = [v for v in (d.vencimiento(self.espera, self.espera_maxima) for d in self.documentos.values())
+                        if v is not None]
+        return min(vencimientos) if vencimientos else None
+
+    def _publicar_vencidos(self):
+        ahora = time.monotonic()
+        for documento in list(self.documentos.values()):
+            vencimiento = documento.vencimiento(self.espera, self.espera_maxima)
+            if vencimiento is not None and vencimiento <= ahora:
+                self._publicar(documento)
+
+    def _publicar(self, documento):
+        self._recolectar = True
+        try:
+            diagnosticos = documento.diagnosticos(self.codificacion)
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            return
+        self._notificar("textDocument/publishDiagnostics",
+                        {"uri": documento.uri, "version": documento.version, "diagnostics": diagnosticos})
+
+    # ---------- Mensajes ----------
+
+    def _procesar(self, cuerpo):
+        try:
+            mensaje = json.loads(cuerpo.decode("utf-8"))
+        except ValueError as e:
+            self._responder(None, error=(ERROR_JSON, f"JSON no válido: {e}"))
+            return
+        if not isinstance(mensaje, dict) or "method" not in mensaje:
+            # Respuestas del cliente a solicitudes del servidor: no se envía ninguna
+            if isinstance(mensaje, dict) and "id" in mensaje and ("result" in mensaje or "error" in mensaje):
+                return
+            self._responder(None, error=(ERROR_SOLICITUD, "mensaje JSON-RPC no válido"))
+            return
+        metodo, parametros = mensaje["method"], mensaje.get("params") or {}
+        if "id" not in mensaje:
+            manejador = self._notificaciones.get(metodo)
+            if manejador is not None and (self._inicializado or metodo == "exit"):
+                try:
+                    manejador(parametros)
+                except Exception:
+                    traceback.print_exc(file=sys.stderr)
+            return
+        identificador = mensaje["id"]
+        manejador = self._solicitudes.get(metodo)
+        if not self._inicializado and metodo != "initialize":
+            self._responder(identificador, error=(NO_INICIALIZADO, "el servidor no fue inicializado"))
+        elif manejador is None:
+            self._responder(identificador, error=(METODO_DESCONOCIDO, f"método no soportado: {metodo}"))
+        else:
+            try:
+                self._responder(identificador, manejador(parametros))
+            except Exception as e:
+                traceback.print_exc(file=sys.stderr)
+                self._responder(identificador, error=(ERROR_INTERNO, str(e)))
+
+    def _responder(self, identificador, resultado=None, error=None):
+        mensaje = {"jsonrpc": "2.0", "id": identificador}
+        if error is None:
+            mensaje["result"] = resultado
+        else:
+            mensaje["error"] = {"code": error[0], "message": error[1]}
+        escribir_mensaje(self.salida, mensaje)
+
+    def _notificar(self, metodo, parametros):
+        escribir_mensaje(self.salida, {"jsonrpc": "2.0", "method": metodo, "params": parametros})
+
+    # ---------- Ciclo de vida ----------
+
+    def _initialize(self, parametros):
+        codificaciones = parametros.get("capabilities", {}).get("general", {}).get("positionEncodings") or []
+        self.codificacion = "utf-32" if "utf-32" in codificaciones else "utf-16"
+        self._inicializado = True
+        return {
+            "capabilities": {
+                "positionEncoding": self.codificacion,
+                "textDocumentSync": {"openClose": True, "change": SINCRONIZACION_INCREMENTAL},
+            },
+            "serverInfo": {"name": NOMBRE_SERVIDOR},
+        }
+
+    def _shutdown(self, parametros):
+        self._apagado = True
+        return None
+
+    def _exit(self, parametros):
+        self._terminar = True
+
+    # ---------- Documentos ----------
+
+    def _did_open(self, parametros):
+        item = parametros["textDocument"]
+        documento = Documento(item["uri"], item["text"], item.get("version"))
+        self.documentos[documento.uri] = documento
+        self._publicar(documento)
+
+    def _did_change(self, parametros):
+        documento = self.documentos.get(parametros["textDocument"]["uri"])
+        if documento is None:
+            return
+        documento.version = parametros["textDocument"].get("version")
+        documento.aplicar_cambios(parametros["contentChanges"], self.codificacion)
+
+    def _did_close(self, parametros):
+        uri = parametros["textDocument"]["uri"]
+        if self.documentos.pop(uri, None) is not None:
+            self._recolectar = True
+            self._notificar("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+
+def servir_stdio(espera=ESPERA_DIAGNOSTICOS):
+    """
+    Atiende un cliente por la entrada y salida estándar. espera: segundos sin
+    cambios antes de publicar diagnósticos. Retorna el código de salida.
+    """
+    salida = sys.stdout.buffer
+    # La salida estándar es del protocolo: cualquier print va a stderr
+    sys.stdout = sys.stderr
+    # La entrada se lee sin buffer desde el hilo lector: al terminar, ese hilo
+    # puede seguir esperando datos sin retener el lock de sys.stdin
+    entrada = io.FileIO(sys.stdin.fileno(), "rb", closefd=False)
+    # Las tablas y los módulos ya cargados viven todo el proceso: se sacan una
+    # sola vez del recolector de ciclos para que sus pasadas no los recorran
+    gc.freeze()
+    return ServidorLSP(entrada, salida, espera).ejecutar()
+
+
+if __name__ == "__main__":
+    sys.exit(servir_stdio())
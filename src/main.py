@@ -8,21 +8,229 @@
 # y ejecutar pruebas automáticas.
 # -------------------------------------------------------------
 
-from datetime import datetime
+import bisect
 import os
-import subprocess
-from lexer import lexer  # Analizador léxico (definido en lexer.py)
-from syntax import parser  # Analizador sintáctico (definido en syntax.py)
-from semantic import validar_declaracion_variable, symbol_table  # Funciones y tabla semántica
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
+from lexer import lexer, tokenizar, tokenizar_flujo, AlimentadorTokens, CaracterInvalido, TAMANO_BLOQUE  # Analizador léxico y buffer de tokens (lexer.py)
+from registro import escritor_logs  # Escritura de logs en segundo plano (registro.py)
+# syntax.py y semantic.py se importan dentro de las funciones que los usan, para
+# que el análisis solo léxico (y la CLI) no cargue el parser ni sus tablas.
 
 
 # ---------------------------
 # Obtener nombre de usuario de Git para logs
 # ---------------------------
-try:
-    usuario_git = subprocess.check_output(["git", "config", "user.name"]).strip().decode('utf-8')
-except subprocess.CalledProcessError:
-    usuario_git = "desconocido"
+@lru_cache(maxsize=None)
+def obtener_usuario_git():
+    """
+    Retorna el nombre de usuario de Git para los nombres de los logs.
+    Se consulta solo la primera vez que se guarda un log.
+    """
+    import subprocess
+    try:
+        return subprocess.check_output(["git", "config", "user.name"], stderr=subprocess.DEVNULL).strip().decode('utf-8')
+    except (subprocess.CalledProcessError, OSError):
+        return "desconocido"
+
+
+def _cache_entorno():
+    # cache.py (y con él sqlite3) se importa solo si ANALIZADOR_CACHE activa el caché;
+    # los valores que lo desactivan son los mismos que en cache._ruta_entorno
+    if os.environ.get("ANALIZADOR_CACHE", "").lower() in ("", "0", "no", "false", "off"):
+        return None
+    from cache import cache_analisis
+    return cache_analisis()
+
+
+# ---------------------------
+# Analizador reentrante
+# ---------------------------
+class AnalisisCancelado(Exception):
+    """Se lanza dentro de un análisis cuando se pidió cancelarlo (ver Analizador.cancelar)."""
+
+
+class Analizador:
+    """
+    Ejecuta las tres fases con estado propio: un lexer clonado, una instancia
+    del parser y una tabla de símbolos. Varias instancias pueden analizar a la
+    vez desde distintos hilos (pool de hilos, servidor asíncrono); una misma
+    instancia no debe usarse desde dos hilos al mismo tiempo.
+    Las funciones analizar_* del módulo crean un Analizador nuevo en cada llamada.
+    - progreso: función opcional progreso(fase, hecho, total) que se llama durante
+      cada fase ('lex', 'syntax', 'semantic') desde el hilo que analiza.
+    - cancelar() puede llamarse desde otro hilo: el análisis en curso se detiene en
+      el siguiente punto de avance lanzando AnalisisCancelado.
+    - cache: CacheAnalisis (cache.py) donde analizar_codigo busca y guarda el
+      resultado completo; por defecto el de ANALIZADOR_CACHE (None si está desactivado).
+      desde_cache es True si el último analizar_fases salió del caché.
+    - perfil: Perfil opcional (perfil.py) donde se acumula el tiempo de cada fase,
+      las reducciones de cada regla del parser y las llamadas de la inferencia de tipos.
+    - filas_error: fase -> índices de los renglones de error del último resultado de
+      esa fase, tomados de los errores que registra cada una (ver gui.py).
+    """
+
+    def __init__(self, progreso=None, perfil=None):
+        self.lexer = lexer.clone()
+        self.lexer.errores = []
+        # TablaSimbolos del último análisis semántico (None si el resultado vino del caché)
+        self.tabla_simbolos = None
+        self.filas_error = {}
+        self.progreso = progreso
+        self._cancelacion = threading.Event()
+        self._parser = None
+        self._parser_traza = None
+        self.cache = _cache_entorno()
+        self.desde_cache = False
+        self.perfil = perfil
+
+    def cancelar(self):
+        self._cancelacion.set()
+
+    def _avance(self, fase):
+        # Función de avance de una fase: revisa la cancelación e informa el progreso
+        def avance(hecho, total):
+            if self._cancelacion.is_set():
+                raise AnalisisCancelado()
+            if self.progreso is not None:
+                self.progreso(fase, hecho, total)
+        return avance
+
+    def _medir(self, fase, funcion, *argumentos):
+        # Sin perfil solo llama a la función
+        if self.perfil is None:
+            return funcion(*argumentos)
+        with self.perfil.fase(fase):
+            return funcion(*argumentos)
+
+    def _obtener_parser(self):
+        # El parser se crea al primer análisis sintáctico (syntax.py se importa recién ahí)
+        if self._parser is None:
+            from syntax import nuevo_parser
+            self._parser = nuevo_parser()
+            if self.perfil is not None:
+                self._parser = self.perfil.instrumentar_parser(self._parser)
+        return self._parser
+
+    def trazar(self, buffer, avance=None):
+        """
+        Reparsea buffer con la gramática sin recuperación de errores y retorna su
+        SumideroTraza. Se usa cuando el parseo del árbol reportó errores: la traza y
+        los errores de sintaxis que se muestran son los de esa gramática, mientras que
+        el árbol (con lo que sigue a cada error) es el de la principal.
+        """
+        from syntax import parsear, nuevo_parser, SumideroTraza
+        if self._parser_traza is None:
+            self._parser_traza = nuevo_parser(traza=True)
+        sumidero = SumideroTraza()
+        parsear(AlimentadorTokens(buffer, avance), sumidero, self._parser_traza)
+        return sumidero
+
+    def tokenizar(self, entrada):
+        return self._medir("lex", tokenizar, entrada, self.lexer, self._avance("lex"))
+
+    def analizar_lexico(self, entrada):
+        resultado = formatear_lexico(self.tokenizar(entrada))
+        self.filas_error["lex"] = resultado.filas_error
+        return resultado
+
+    def parsear(self, entrada):
+        from syntax import parsear, SumideroTraza
+        resultado = []
+        arbol = None
+        excepcion = False
+        sumidero = SumideroTraza()
+        try:
+            buffer = self.tokenizar(entrada)
+            arbol = self._medir("syntax", parsear, AlimentadorTokens(buffer, self._avance("syntax")), sumidero,
+                                self._obtener_parser())
+            if sumidero.errores:
+                sumidero = self._medir("syntax", self.trazar, buffer, self._avance("syntax"))
+        except AnalisisCancelado:
+            raise
+        except Exception as e:
+            resultado.append(f"Excepción: {e}")
+            excepcion = True
+        # La excepción (si la hubo) es el primer renglón y la traza va a continuación
+        self.filas_error["syntax"] = list(range(len(resultado))) + [len(resultado) + i for i in sumidero.indices_error]
+        resultado.extend(sumidero.lineas())
+        if not sumidero.errores and not excepcion:
+            resultado.append("Análisis sintáctico exitoso.")
+        return arbol, resultado
+
+    def analizar_sintactico(self, entrada):
+        return self.parsear(entrada)[1]
+
+    def analizar_semantico(self, entrada, arbol=None):
+        from semantic import AnalizadorSemantico, TablaSimbolos, REGLAS_INFERENCIA
+        self.tabla_simbolos = TablaSimbolos()
+        resultado = ResultadoSemantico()
+        filas_error = self.filas_error["semantic"] = resultado.filas_error
+        try:
+            if arbol is None:
+                arbol = self.parsear(entrada)[0]
+            if arbol is None:
+                resultado.append("No se pudo construir el árbol sintáctico; el análisis semántico no se ejecutó.")
+                filas_error.append(0)
+                return resultado
+            reglas = REGLAS_INFERENCIA if self.perfil is None \
+                else self.perfil.instrumentar_reglas_inferencia(REGLAS_INFERENCIA)
+            analizador = AnalizadorSemantico(self.tabla_simbolos, reglas)
+            mensajes, errores = self._medir("semantic", analizador.analizar, arbol, self._avance("semantic"))
+            resultado.extend(resumen_semantico(mensajes, errores))
+            filas_error.extend(filas_error_semantico(mensajes, errores, analizador.filas_error))
+        except AnalisisCancelado:
+            raise
+        except Exception as e:
+            resultado.append(f"Error durante el análisis semántico: {str(e)}")
+            filas_error.append(len(resultado) - 1)
+        return resultado
+
+    def analizar_fases(self, entrada, fases=("lex", "syntax", "semantic")):
+        """
+        Ejecuta solo las fases pedidas y retorna un diccionario fase -> resultado.
+        El semántico reutiliza el árbol del sintáctico, que también se incluye.
+        Con caché, un acierto da las fases pedidas sin analizar nada (y deja
+        tabla_simbolos en None); si no está guardado, se ejecutan solo las pedidas
+        y el resultado se guarda cuando incluye el análisis semántico.
+        """
+        self.filas_error = {}
+        self.desde_cache = False
+        if self.cache is not None:
+            guardado = self._medir("cache", self.cache.obtener, entrada)
+            if guardado is not None:
+                self.desde_cache = True
+                buffer, _, resultado_sintactico, resultado_semantico, filas_error = guardado
+                self.tabla_simbolos = None
+                resultados = {}
+                if "lex" in fases:
+                    resultados["lex"] = formatear_lexico(buffer)
+                    self.filas_error["lex"] = resultados["lex"].filas_error
+                if "syntax" in fases or "semantic" in fases:
+                    resultados["syntax"] = resultado_sintactico
+                    self.filas_error["syntax"] = filas_error["syntax"]
+                if "semantic" in fases:
+                    resultados["semantic"] = ResultadoSemantico(resultado_semantico, filas_error["semantic"])
+                    self.filas_error["semantic"] = resultados["semantic"].filas_error
+                return resultados
+        resultados = {}
+        if "lex" in fases:
+            resultados["lex"] = self.analizar_lexico(entrada)
+        arbol = None
+        if "syntax" in fases or "semantic" in fases:
+            arbol, resultados["syntax"] = self.parsear(entrada)
+        if "semantic" in fases:
+            resultados["semantic"] = self.analizar_semantico(entrada, arbol)
+            if self.cache is not None:
+                # Los tokens ya están en el caché en memoria de tokenizar: no se vuelve a tokenizar
+                self._medir("cache", self.cache.guardar, entrada, self.tokenizar(entrada), arbol,
+                            resultados["syntax"], resultados["semantic"], self.filas_error)
+        return resultados
+
+    def analizar_codigo(self, entrada):
+        resultados = self.analizar_fases(entrada)
+        return resultados["lex"], resultados["syntax"], resultados["semantic"]
 
 
 # ---------------------------
@@ -30,257 +238,235 @@ except subprocess.CalledProcessError:
 # ---------------------------
 
 # ------------ Léxico -------------------
-def guardar_log_lexico(resultado):
+def guardar_log_lexico(resultado, entrada=None):
     """
     Guarda el resultado del análisis léxico en un archivo de log.
-    El nombre del archivo incluye el usuario y la fecha/hora.
+    El nombre del archivo incluye el usuario y la fecha/hora; la escritura
+    se hace en segundo plano (ver registro.py). Con entrada (el código
+    analizado) los registros del almacén llevan su hash. Retorna None si
+    los logs están deshabilitados.
+    """
+    return escritor_logs().guardar("lexico", "Tokens reconocidos:\n", resultado, obtener_usuario_git(),
+                                   entrada=entrada, errores=errores_lexicos)
+
+def _mensaje_caracter_invalido(buffer, pos, texto, desplazamiento_linea=0):
+    """Formatea el reporte de una secuencia de caracteres no definidos con su línea y columna."""
+    linea, columna = buffer.posicion(pos)
+    return _texto_caracter_invalido(texto, linea + desplazamiento_linea, columna)
+
+def _texto_caracter_invalido(texto, linea, columna):
+    if len(texto) == 1:
+        return f"<span style='color:red;'>Este caracter no está definido: '{texto}' en la línea {linea}, columna {columna}</span>"
+    return f"<span style='color:red;'>Estos caracteres no están definidos: '{texto}' en la línea {linea}, columna {columna}</span>"
+
+class ResultadoLexico(Sequence):
+    """
+    Resultado léxico de un BufferTokens: un renglón por token y los caracteres
+    no definidos intercalados según su posición en la entrada. Se usa como una
+    lista de strings, pero cada renglón se arma recién cuando se pide (al
+    mostrarlo o guardarlo), a partir de las columnas de la TablaTokens.
+    desplazamiento_linea se suma a los números de línea (para buffers que son
+    solo una parte del archivo, ver incremental.py).
+    filas_error tiene, en orden, el índice del renglón de cada error.
     """
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
-    fecha_hora = datetime.now().strftime("%Y%m%d-%H%M%S")
-    nombre_archivo = f"logs/lexico-{usuario_git}-{fecha_hora}.txt"
-    with open(nombre_archivo, "w", encoding="utf-8") as f:
-        f.write("Tokens reconocidos:\n")
-        f.write("\n".join(resultado))
-    return nombre_archivo
+
+    def __init__(self, buffer, desplazamiento_linea=0):
+        self.buffer = buffer
+        self.desplazamiento_linea = desplazamiento_linea
+        # Renglón de cada error: los tokens que empiezan antes que él más los errores previos
+        posiciones = buffer.tokens.posiciones
+        self.filas_error = [bisect.bisect_left(posiciones, pos) + k for k, (pos, _) in enumerate(buffer.errores)]
+
+    def __len__(self):
+        return len(self.buffer.tokens) + len(self.buffer.errores)
+
+    def _renglon_token(self, i):
+        tabla = self.buffer.tokens
+        return f"Línea {tabla.lineas[i] + self.desplazamiento_linea}: {tabla.tipo(i)} -> {tabla.valor(i)}"
+
+    def _renglon_error(self, k):
+        return _mensaje_caracter_invalido(self.buffer, *self.buffer.errores[k], self.desplazamiento_linea)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("renglón fuera de rango")
+        k = bisect.bisect_right(self.filas_error, i)
+        if k and self.filas_error[k - 1] == i:
+            return self._renglon_error(k - 1)
+        return self._renglon_token(i - k)
+
+    def __iter__(self):
+        e = 0
+        for i in range(len(self.buffer.tokens)):
+            while e < len(self.filas_error) and self.filas_error[e] == i + e:
+                yield self._renglon_error(e)
+                e += 1
+            yield self._renglon_token(i)
+        for k in range(e, len(self.filas_error)):
+            yield self._renglon_error(k)
+
+    def __eq__(self, otro):
+        if isinstance(otro, (list, tuple, ResultadoLexico)):
+            return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+        return NotImplemented
+
+    __hash__ = None
+
+    def errores(self):
+        """Solo los renglones de caracteres no definidos, sin armar los de los tokens."""
+        return [self._renglon_error(k) for k in range(len(self.filas_error))]
+
+def formatear_lexico(buffer, desplazamiento_linea=0):
+    """Retorna el resultado léxico de un BufferTokens (ver ResultadoLexico)."""
+    return ResultadoLexico(buffer, desplazamiento_linea)
 
 def analizar_lexico(entrada):
     """
-    Analiza el código fuente recibido y retorna una lista de tokens reconocidos.
-    Si encuentra caracteres no definidos, los reporta con su línea.
-    """
-    lexer.lineno = 1
-    lexer.input(entrada)
-    resultado = []
-    pos = 0
-    length = len(entrada)
-    while pos < length:
-        tok = lexer.token()
-        if tok:
-            resultado.append(f"Línea {tok.lineno}: {tok.type} -> {tok.value}")
-            pos = lexer.lexpos
+    Analiza el código fuente recibido y retorna los tokens reconocidos como
+    un ResultadoLexico (se usa como una lista de renglones).
+    Si encuentra caracteres no definidos, los reporta con su línea y columna;
+    las secuencias consecutivas de caracteres inválidos se reportan juntas.
+    Los tokens se toman del buffer compartido (ver tokenizar en lexer.py).
+    """
+    return Analizador().analizar_lexico(entrada)
+
+def analizar_lexico_flujo(archivo, tam_bloque=TAMANO_BLOQUE):
+    """
+    Versión por flujo de analizar_lexico para archivos muy grandes: recibe un
+    archivo de texto abierto y genera los mismos renglones de a uno, con
+    memoria constante (ver tokenizar_flujo en lexer.py).
+    """
+    for item in tokenizar_flujo(archivo, tam_bloque):
+        if isinstance(item, CaracterInvalido):
+            yield _texto_caracter_invalido(item.value, item.lineno, item.columna)
         else:
-            # Si hay un carácter no reconocido, repórtalo y avanza uno
-            if pos < length and not entrada[pos].isspace():
-                linea_actual = entrada.count('\n', 0, pos) + 1
-                resultado.append(f"<span style='color:red;'>Este caracter no está definido: '{entrada[pos]}' en la línea {linea_actual}</span>")
-            pos += 1
-            lexer.lexpos = pos
-            # Reinicia el lexer para continuar desde el nuevo pos
-            lexer.input(entrada[pos:])
-    return resultado
+            yield f"Línea {item.lineno}: {item.type} -> {item.value}"
 
 
 
 # ------------ Sintáctico -------------------
-def guardar_log_sintactico(resultado):
+def guardar_log_sintactico(resultado, entrada=None):
     """
     Guarda el resultado del análisis sintáctico en un archivo de log.
-    El nombre del archivo incluye el usuario y la fecha/hora.
+    El nombre del archivo incluye el usuario y la fecha/hora; la escritura
+    se hace en segundo plano (ver registro.py). Con entrada (el código
+    analizado) los registros del almacén llevan su hash. Retorna None si
+    los logs están deshabilitados.
     """
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
-    fecha_hora = datetime.now().strftime("%Y%m%d-%H%M%S")
-    nombre_archivo = f"logs/sintactico-{usuario_git}-{fecha_hora}.txt"
-    with open(nombre_archivo, "w", encoding="utf-8") as f:
-        f.write("Sintaxis:\n")
-        f.write("\n".join(resultado))
-    return nombre_archivo
+    return escritor_logs().guardar("sintactico", "Sintaxis:\n", resultado, obtener_usuario_git(),
+                                   entrada=entrada, errores=errores_sintacticos)
+
+def _parsear(entrada):
+    """
+    Ejecuta el parser sobre el buffer de tokens de la entrada.
+    Retorna (arbol, resultado): el AST de tuplas (o None si no se pudo construir)
+    y las reglas reconocidas y errores como lista de strings.
+    La traza se recibe en un SumideroTraza y se formatea al final.
+    """
+    return Analizador().parsear(entrada)
 
 def analizar_sintactico(entrada):
     """
     Realiza el análisis sintáctico del código fuente usando el parser de syntax.py.
     Captura reglas reconocidas y errores, y retorna el resultado como lista de strings.
     """
-    from syntax import parser
-    resultado = []
-    from lexer import lexer
-    lexer.lineno = 1
-    if hasattr(lexer, 'input'):
-        lexer.input('')
-    import io
-    import sys
-    old_stdout = sys.stdout
-    sys.stdout = mystdout = io.StringIO()
-    try:
-        parser.parse(entrada, lexer=lexer)
-    except Exception as e:
-        resultado.append(f"Excepción: {e}")
-    sys.stdout = old_stdout
-    reglas_y_errores = mystdout.getvalue().splitlines()
-    resultado.extend(reglas_y_errores)
-    if not resultado:
-        resultado.append("Análisis sintáctico exitoso.")
-    else:
-        if not any("Error de sintaxis" in r or "Excepción" in r for r in resultado):
-            resultado.append("Análisis sintáctico exitoso.")
-    return resultado
+    return _parsear(entrada)[1]
 
 
 # ------------ Semántico -------------------
-def guardar_log_semantico(resultado):
+class ResultadoSemantico(list):
+    """
+    Renglones del análisis semántico. filas_error tiene el índice de cada renglón
+    de error, según lo que registró el análisis (AnalizadorSemantico.filas_error),
+    no según el texto de los mensajes.
+    """
+
+    def __init__(self, renglones=(), filas_error=()):
+        super().__init__(renglones)
+        self.filas_error = list(filas_error)
+
+    def errores(self):
+        # Los del recorrido se repiten en la sección final: se listan una vez
+        return list(dict.fromkeys(self[i] for i in self.filas_error))
+
+def guardar_log_semantico(resultado, entrada=None):
     """
     Guarda el resultado del análisis semántico en un archivo de log.
-    El nombre del archivo incluye el usuario y la fecha/hora.
+    El nombre del archivo incluye el usuario y la fecha/hora; la escritura
+    se hace en segundo plano (ver registro.py). Con entrada (el código
+    analizado) los registros del almacén llevan su hash. Retorna None si
+    los logs están deshabilitados.
+    """
+    return escritor_logs().guardar("semantico", "Análisis Semántico:\n", resultado, obtener_usuario_git(),
+                                   entrada=entrada, errores=errores_semanticos)
+
+def resumen_semantico(resultado, errores_semanticos):
+    """Agrega al resultado semántico la sección de errores y la línea de resumen."""
+    resultado = list(resultado)
+    for parte in partes_resumen_semantico(errores_semanticos):
+        resultado.extend(parte)
+    return resultado
+
+def partes_resumen_semantico(errores_semanticos):
+    """Lo que resumen_semantico agrega al resultado, en partes y sin copiar errores_semanticos."""
+    if errores_semanticos:
+        return [["\n--- Errores Semánticos ---"], errores_semanticos,
+                [f"\nAnálisis semántico completado con {len(errores_semanticos)} error(es)."]]
+    return [["\nAnálisis semántico exitoso - No se encontraron errores."]]
+
+def filas_error_semantico(resultado, errores_semanticos, filas_error):
+    """
+    Índices de los renglones de error de resumen_semantico(resultado, errores_semanticos):
+    filas_error (los del recorrido, ver AnalizadorSemantico) y los de la sección de errores.
     """
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
-    fecha_hora = datetime.now().strftime("%Y%m%d-%H%M%S")
-    nombre_archivo = f"logs/semantico-{usuario_git}-{fecha_hora}.txt"
-    with open(nombre_archivo, "w", encoding="utf-8") as f:
-        f.write("Análisis Semántico:\n")
-        f.write("\n".join(resultado))
-    return nombre_archivo
+    inicio = len(resultado) + 1
+    return list(filas_error) + list(range(inicio, inicio + len(errores_semanticos)))
 
-def analizar_semantico(entrada):
+def analizar_semantico(entrada, arbol=None):
     """
     Realiza el análisis semántico del código fuente recibido.
-    Valida declaraciones, inferencias de tipo, asignaciones y reporta errores.
-    Utiliza la tabla de símbolos y funciones de semantic.py.
+    Recorre una sola vez el AST de syntax.py (ver AnalizadorSemantico en semantic.py):
+    valida declaraciones, inferencias de tipo, asignaciones, retornos y reporta errores.
+    Si no se recibe el árbol ya construido, se parsea la entrada.
     """
-    symbol_table.clear()
-    resultado = []
-    errores_semanticos = []
-    try:
-        lexer.lineno = 1
-        lexer.input(entrada)
-        tokens = []
-        while True:
-            tok = lexer.token()
-            if not tok:
-                break
-            tokens.append(tok)
-        tipo_actual = None
-        en_declaracion = False
-        nombre = None
-        valor = None
-        valor_tipo = None
-        for i, tok in enumerate(tokens):
-            # Detectar declaraciones de variables para cualquier tipo de dato reconocido por el lexer
-            if tok.type in ["ID", "INT", "FLOAT", "BOOL", "CHAR", "DOUBLE", "VAR", "STRING"]:
-                # Si es palabra reservada de tipo, usar su valor como tipo_actual
-                if tok.type in ["INT", "FLOAT", "BOOL", "CHAR", "DOUBLE"]:
-                    tipo_actual = tok.value
-                    en_declaracion = True
-                    resultado.append(f"Línea {tok.lineno}: Tipo '{tipo_actual}' detectado")
-                elif tok.type == "STRING":
-                    tipo_actual = "string"
-                    en_declaracion = True
-                    resultado.append(f"Línea {tok.lineno}: Tipo 'string' detectado")
-                elif tok.type == "VAR":
-                    tipo_actual = "var"
-                    en_declaracion = True
-                    resultado.append(f"Línea {tok.lineno}: Tipo 'var' detectado")
-                # Si es un identificador y estamos en declaración, es el nombre de la variable
-                elif en_declaracion and tok.type == "ID":
-                    nombre = tok.value
-                    valor = None
-                    valor_tipo = None
-                    # Busca inicialización en los siguientes tokens hasta el próximo punto y coma
-                    j = i + 1
-                    tiene_inicializacion = False
-                    while j < len(tokens) and tokens[j].type != "SEMICOLON":
-                        if tokens[j].type == "ASSIGN" and j + 1 < len(tokens):
-                            siguiente = tokens[j + 1]
-                            # Si es una expresión, intenta reconstruirla (solo para parser avanzado)
-                            if siguiente.type in ["INT_CONST", "FLOAT_CONST", "STRING_CONST", "ID", "TRUE", "FALSE"]:
-                                valor = siguiente.value
-                                valor_tipo = siguiente.type if siguiente.type not in ["TRUE", "FALSE"] else "BOOL_CONST"
-                            else:
-                                # Si es una expresión compleja, reconstruir el AST (requiere integración con parser)
-                                valor = siguiente.value
-                                valor_tipo = 'EXPR'
-                            tiene_inicializacion = True
-                            break
-                        j += 1
-                    # Si no hay inicialización, igual registrar la variable
-                    if not tiene_inicializacion:
-                        valor = None
-                        valor_tipo = None
-                    # Si es var, permitir declaración sin inicialización (C#-like)
-                    if tipo_actual == "var":
-                        if valor is not None:
-                            from semantic import inferir_tipo_expresion
-                            tipo_inferido = inferir_tipo_expresion(valor)
-                            tipo_actual = tipo_inferido
-                            mensajes = validar_declaracion_variable(tipo_actual, nombre, valor, valor_tipo)
-                        else:
-                            # Registrar como pendiente de inferencia
-                            if nombre not in symbol_table:
-                                symbol_table[nombre] = {"tipo": "var", "valor": None, "pending_inference": True}
-                            mensajes = [f"Línea {tok.lineno}: Variable 'var' declarada sin inicialización. El tipo se inferirá en la primera asignación."]
-                    else:
-                        mensajes = validar_declaracion_variable(tipo_actual, nombre, valor, valor_tipo)
-                    if mensajes:
-                        if isinstance(mensajes, str):
-                            mensajes = [mensajes]
-                        for msg in mensajes:
-                            if msg and ("error" in msg.lower() or "no permitido" in msg.lower() or "no declarada" in msg.lower()):
-                                errores_semanticos.append(f"Línea {tok.lineno}: {msg}")
-                            resultado.append(f"Línea {tok.lineno}: {msg}")
-                    else:
-                        resultado.append(f"Línea {tok.lineno}: Variable '{nombre}' declarada como {tipo_actual}")
-                        if valor is not None:
-                            resultado.append(f"Línea {tok.lineno}: Variable '{nombre}' inicializada con valor {valor}")
-                    en_declaracion = False
-                    tipo_actual = None
-            # Validar asignaciones fuera de declaración
-            if tok.type == "ID" and i + 1 < len(tokens) and tokens[i + 1].type == "ASSIGN":
-                nombre = tok.value
-                if nombre in symbol_table:
-                    valor = None
-                    valor_tipo = None
-                    siguiente = tokens[i + 2] if i + 2 < len(tokens) else None
-                    if siguiente:
-                        if siguiente.type in ["INT_CONST", "FLOAT_CONST", "STRING_CONST", "ID", "TRUE", "FALSE"]:
-                            valor = siguiente.value
-                            valor_tipo = siguiente.type if siguiente.type not in ["TRUE", "FALSE"] else "BOOL_CONST"
-                        else:
-                            valor = siguiente.value
-                            valor_tipo = 'EXPR'
-                        # Validar tipo de asignación
-                        tipo_var = symbol_table[nombre]["tipo"]
-                        from semantic import inferir_tipo_expresion
-                        tipo_valor = None
-                        if valor_tipo == 'EXPR':
-                            tipo_valor = inferir_tipo_expresion(valor)
-                        elif valor_tipo == "ID":
-                            tipo_valor = symbol_table[valor]["tipo"] if valor in symbol_table else None
-                        elif valor_tipo == "INT_CONST":
-                            tipo_valor = "int"
-                        elif valor_tipo == "FLOAT_CONST":
-                            tipo_valor = "float"
-                        elif valor_tipo == "STRING_CONST":
-                            tipo_valor = "string"
-                        elif valor_tipo == "BOOL_CONST":
-                            tipo_valor = "bool"
-                        else:
-                            tipo_valor = valor_tipo
-                        # Si la variable es var y pendiente de inferencia, infiere el tipo en la primera asignación
-                        if tipo_var == "var" and symbol_table[nombre].get("pending_inference", False):
-                            symbol_table[nombre]["tipo"] = tipo_valor
-                            symbol_table[nombre]["pending_inference"] = False
-                            tipo_var = tipo_valor
-                            resultado.append(f"Línea {tok.lineno}: Tipo de 'var' inferido como {tipo_valor} en la primera asignación a '{nombre}'.")
-                        if tipo_var == "float" and tipo_valor == "int":
-                            resultado.append(f"Línea {tok.lineno}: Casting implícito: Variable '{nombre}' de tipo float asignada con int. Se convierte automáticamente a float.")
-                        elif tipo_var == "double" and tipo_valor == "int":
-                            resultado.append(f"Línea {tok.lineno}: Casting implícito: Variable '{nombre}' de tipo double asignada con int. Se convierte automáticamente a double.")
-                        elif tipo_var != tipo_valor:
-                            errores_semanticos.append(f"Línea {tok.lineno}: Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_var} '{nombre}'.")
-                        else:
-                            resultado.append(f"Línea {tok.lineno}: Asignación correcta: {nombre} = {valor}")
-                else:
-                    errores_semanticos.append(f"Línea {tok.lineno}: Error semántico: Variable '{nombre}' no declarada antes de la asignación.")
-        if errores_semanticos:
-            resultado.extend(["\n--- Errores Semánticos ---"] + errores_semanticos)
-        if not errores_semanticos:
-            resultado.append("\nAnálisis semántico exitoso - No se encontraron errores.")
-        else:
-            resultado.append(f"\nAnálisis semántico completado con {len(errores_semanticos)} error(es).")
-    except Exception as e:
-        resultado.append(f"Error durante el análisis semántico: {str(e)}")
-    return resultado
+    return Analizador().analizar_semantico(entrada, arbol)
+
+
+
+# ------------ Conteo de errores -------------------
+def errores_lexicos(resultado):
+    """Filtra del resultado léxico los reportes de caracteres no definidos."""
+    if isinstance(resultado, ResultadoLexico):
+        return resultado.errores()
+    return [l for l in resultado if "no está definido" in l or "no están definidos" in l]
+
+def errores_sintacticos(resultado):
+    """Filtra del resultado sintáctico los errores de sintaxis y excepciones."""
+    return [l for l in resultado if l.startswith("Error de sintaxis") or l.startswith("Excepción")]
+
+def errores_semanticos(resultado):
+    """
+    Errores de un ResultadoSemantico (sin repetir los que se listan también en
+    la sección final). Incluye el aviso de árbol no construido.
+    """
+    return resultado.errores()
+
+
+# ------------ Análisis completo -------------------
+def analizar_codigo(entrada):
+    """
+    Punto de entrada único para las tres fases.
+    Tokeniza la entrada una sola vez y comparte el buffer de tokens entre el
+    análisis léxico y el sintáctico; el semántico recorre el árbol que construye
+    el sintáctico. Con el caché activado (ANALIZADOR_CACHE, ver cache.py) un
+    código ya analizado se devuelve sin volver a ejecutar las fases.
+    Retorna (resultado_lexico, resultado_sintactico, resultado_semantico).
+    """
+    return Analizador().analizar_codigo(entrada)
 
 
 
@@ -302,13 +488,8 @@ def analizar_archivo_prueba():
         with open(ruta, "r", encoding="utf-8") as f:
             entrada = f.read()
         contenido_total += f"// Archivo: {ruta}\n{entrada}\n\n"
-        lexer.lineno = 1
-        lexer.input(entrada)
         resultado_total.append(f"--- Tokens para {ruta} ---")
-        while True:
-            tok = lexer.token()
-            if not tok:
-                break
+        for tok in tokenizar(entrada).tokens:
             resultado_total.append(f"Línea {tok.lineno}: {tok.type} -> {tok.value}")
         resultado_total.append("")
     return contenido_total, resultado_total
@@ -318,23 +499,16 @@ def analizar_archivo_prueba():
 # Ejecución principal y GUI
 # ---------------------------
 if __name__ == "__main__":
-    # Si se ejecuta como script principal, lanza la interfaz gráfica (PyQt5)
+    import sys
+    # Con argumentos se usa la CLI sin interfaz gráfica (ver cli.py):
+    # python src/main.py archivo.cs  ->  python src/cli.py analyze archivo.cs
+    if len(sys.argv) > 1:
+        from cli import ejecutar
+        sys.exit(ejecutar(["analyze"] + sys.argv[1:]))
+    # Sin argumentos lanza la interfaz gráfica (PyQt5)
     from PyQt5.QtWidgets import QApplication
     from gui import AnalizadorApp
-    import sys
     app = QApplication(sys.argv)
     ventana = AnalizadorApp()
     ventana.show()
     sys.exit(app.exec_())
-
-    # --- Ejecución por terminal (opcional) ---
-    # Permite ejecutar el análisis sintáctico directamente desde terminal:
-    # python src/main.py archivo.cs
-    if len(sys.argv) > 1:
-        archivo = sys.argv[1]
-        with open(archivo, encoding="utf-8") as f:
-            data = f.read()
-        lexer.lineno = 1  # Reinicia el contador de líneas antes de analizar
-        parser.parse(data, lexer=lexer)
-    else:
-        print("Uso: python src/main.py <archivo.cs>")
\ No newline at end of file
@@ -0,0 +1,125 @@
+
+# parsetab_cs.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDrightNOTleftLTGTLEGEEQNEleftPLUSMINUSleftTIMESDIVIDErightUMINUSADD AND ASSIGN BOOL CHAR CLASS COLON COMMA CONSOLE DIVIDE DOT DOUBLE ELSE EQ FALSE FLOAT FLOAT_CONST FOR GE GT ID IF INT INT_CONST LBRACE LBRACKET LE LIST LPAREN LT MINUS MINUSEQUAL MINUSMINUS MOD NE NEW NOT OR PARSE PLUS PLUSEQUAL PLUSPLUS PRIVATE PROTECTED PUBLIC RBRACE RBRACKET READLINE RETURN RPAREN SEMICOLON STRING STRING_CONST TIMES TRUE USING VAR VOID WRITELINEprogram : declarationsdeclarations : declarations declarationdeclarations : declarationdeclarations : declaration : type ID ASSIGN expression SEMICOLONdeclaration : type ID SEMICOLONdeclaration : CONSOLE DOT WRITELINE LPAREN expression RPAREN SEMICOLONdeclaration : IF LPAREN expression RPAREN LBRACE declarations RBRACE else_partelse_part : ELSE LBRACE declarations RBRACEelse_part : ELSE IF LPAREN expression RPAREN LBRACE declarations RBRACE else_partelse_part : declaration : FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_iter RPAREN LBRACE declarations RBRACEfor_init : type ID ASSIGN expressionfor_init : ID ASSIGN expressionfor_init : expressionfor_init : for_cond : expressionfor_cond : for_iter : ID ASSIGN expressionfor_iter : expressionfor_iter : type : INT\n           | FLOAT\n           | BOOL\n           | STRING\n           | CHAR\n           | VAR\n           | DOUBLE\n           | list_typelist_type : LIST LT type GTexpression : NEW LIST LT type GT LPAREN RPARENexpression : NEW LIST LT type GT LBRACE list_elements RBRACElist_elements : list_elements COMMA expressionlist_elements : expressionlist_elements : expression : ID LBRACKET expression RBRACKETdeclaration : ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLONdeclaration : ID DOT ADD LPAREN expression RPAREN SEMICOLONexpression : expression PLUS expression\n                 | expression MINUS expression\n                 | expression TIMES expression\n                 | expression DIVIDE expressionexpression : expression GT expression\n                 | expression LT expression\n                 | expression GE expression\n                 | expression LE expression\n                 | expression EQ expression\n                 | expression NE expressionexpression : LPAREN expression RPARENexpression : INT_CONST\n                 | FLOAT_CONSTexpression : TRUE\n                 | FALSEexpression : STRING_CONSTexpression : IDexpression : MINUS expression %prec UMINUSexpression : CONSOLE DOT READLINE LPAREN RPARENexpression : INT DOT PARSE LPAREN expression RPARENexpression : expression AND expressionexpression : expression OR expressionexpression : NOT expressiondeclaration : type ID LPAREN params RPAREN LBRACE declarations RBRACEparams : params COMMA paramparams : paramparams : param : type IDexpression : ID LPAREN args RPARENargs : args COMMA expressionargs : expressionargs : declaration : ID LPAREN args RPAREN SEMICOLONdeclaration : RETURN expression SEMICOLONdeclaration : access_modifier CLASS ID LBRACE class_members RBRACEdeclaration : CLASS ID LBRACE class_members RBRACEaccess_modifier : PUBLIC\n                      | PRIVATE\n                      | PROTECTEDaccess_modifier : class_members : class_members class_memberclass_members : class_memberclass_members : class_member : access_modifier type ID SEMICOLONclass_member : access_modifier type ID ASSIGN expression SEMICOLONclass_member : type ID SEMICOLONclass_member : type ID ASSIGN expression SEMICOLONclass_member : access_modifier type ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : type ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : access_modifier VOID ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : VOID ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : access_modifier ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : ID LPAREN params RPAREN LBRACE declarations RBRACEdeclaration : ID ASSIGN expression SEMICOLONdeclaration : error SEMICOLON\n                   | error RBRACE'
+    
+_lr_action_items = {'CONSOLE':([0,2,3,9,25,27,28,30,32,33,36,38,46,49,50,52,53,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,96,97,99,100,102,104,131,135,137,140,143,149,152,159,164,165,170,176,179,180,181,182,183,188,192,199,200,203,207,215,217,220,221,224,226,227,228,229,230,233,234,235,236,237,238,240,241,243,249,250,251,252,],[6,6,-3,44,-2,44,44,44,44,44,44,44,44,-93,-94,44,-6,-72,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-92,44,44,44,44,44,-5,44,-71,6,44,44,-74,6,6,44,-73,44,6,-37,-38,-7,-11,44,44,-62,-8,44,6,6,6,44,6,6,6,6,6,44,6,6,6,6,6,6,-9,-12,6,6,6,6,-11,-10,]),'IF':([0,2,3,25,49,50,53,67,96,131,137,140,152,159,164,170,179,180,181,182,183,199,200,201,207,215,217,221,224,226,227,228,230,233,234,235,236,237,238,240,241,243,249,250,251,252,],[7,7,-3,-2,-93,-94,-6,-72,-92,-5,-71,7,-74,7,7,-73,7,-37,-38,-7,-11,-62,-8,216,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-9,-12,7,7,7,7,-11,-10,]),'FOR':([0,2,3,25,49,50,53,67,96,131,137,140,152,159,164,170,179,180,181,182,183,199,200,207,215,217,221,224,226,227,228,230,233,234,235,236,237,238,240,241,243,249,250,251,252,],[8,8,-3,-2,-93,-94,-6,-72,-92,-5,-71,8,-74,8,8,-73,8,-37,-38,-7,-11,-62,-8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-9,-12,8,8,8,8,-11,-10,]),'ID':([0,2,3,4,9,11,13,14,15,16,17,18,19,20,21,22,23,25,27,28,30,32,33,36,38,46,47,49,50,52,53,63,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,89,92,96,97,99,100,102,104,123,125,126,127,128,129,130,131,135,137,140,143,149,150,152,153,154,156,159,164,165,170,175,176,179,180,181,182,183,188,191,192,199,200,203,207,212,215,217,220,221,222,224,226,227,228,229,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[5,5,-3,26,37,48,-22,-23,-24,-25,-26,-27,-28,-29,-75,-76,-77,-2,37,37,37,37,64,37,37,37,88,-93,-94,37,-6,103,-22,-72,37,37,37,37,37,37,37,37,37,37,37,37,37,37,124,132,-92,37,37,37,37,37,124,124,-80,155,157,158,-30,-5,37,-71,5,37,37,124,-74,-79,172,174,5,5,185,-73,-84,37,5,-37,-38,-7,-11,37,-82,37,-62,-8,37,5,-85,5,5,37,5,-83,5,5,5,5,37,5,-91,5,5,5,5,5,-9,-12,5,-90,5,-87,-89,-86,-88,5,5,-11,-10,]),'RETURN':([0,2,3,25,49,50,53,67,96,131,137,140,152,159,164,170,179,180,181,182,183,199,200,207,215,217,221,224,226,227,228,230,233,234,235,236,237,238,240,241,243,249,250,251,252,],[9,9,-3,-2,-93,-94,-6,-72,-92,-5,-71,9,-74,9,9,-73,9,-37,-38,-7,-11,-62,-8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,-9,-12,9,9,9,9,-11,-10,]),'CLASS':([0,2,3,10,21,22,23,25,49,50,53,67,96,131,137,140,152,159,164,170,179,180,181,182,183,199,200,207,215,217,221,224,226,227,228,230,233,234,235,236,237,238,240,241,243,249,250,251,252,],[11,11,-3,47,-75,-76,-77,-2,-93,-94,-6,-72,-92,-5,-71,11,-74,11,11,-73,11,-37,-38,-7,-11,-62,-8,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-9,-12,11,11,11,11,-11,-10,]),'error':([0,2,3,25,49,50,53,67,96,131,137,140,152,159,164,170,179,180,181,182,183,199,200,207,215,217,221,224,226,227,228,230,233,234,235,236,237,238,240,241,243,249,250,251,252,],[12,12,-3,-2,-93,-94,-6,-72,-92,-5,-71,12,-74,12,12,-73,12,-37,-38,-7,-11,-62,-8,12,12,12,12,12,12,12,12,12,12,12,12,12,12,-9,-12,12,12,12,12,-11,-10,]),'INT':([0,2,3,9,21,22,23,25,27,28,30,32,33,36,38,46,49,50,51,52,53,54,67,68,69,70,71,72,73,74,75,76,77,78,79,82,83,89,96,97,99,100,102,104,117,123,125,126,127,131,134,135,137,140,143,149,150,151,152,153,159,164,165,170,173,175,176,177,178,179,180,181,182,183,188,191,192,193,195,199,200,203,207,212,215,217,220,221,222,224,226,227,228,229,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[13,13,-3,45,-75,-76,-77,-2,45,45,45,45,66,45,45,45,-93,-94,13,45,-6,13,-72,45,45,45,45,45,45,45,45,45,45,45,45,45,45,13,-92,45,45,45,45,45,13,13,13,-80,13,-5,13,45,-71,13,45,45,13,13,-74,-79,13,13,45,-73,13,-84,45,13,13,13,-37,-38,-7,-11,45,-82,45,13,13,-62,-8,45,13,-85,13,13,45,13,-83,13,13,13,13,45,13,-91,13,13,13,13,13,-9,-12,13,-90,13,-87,-89,-86,-88,13,13,-11,-10,]),'FLOAT':([0,2,3,21,22,23,25,33,49,50,51,53,54,67,89,96,117,123,125,126,127,131,134,137,140,150,151,152,153,159,164,170,173,175,177,178,179,180,181,182,183,191,193,195,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[14,14,-3,-75,-76,-77,-2,14,-93,-94,14,-6,14,-72,14,-92,14,14,14,-80,14,-5,14,-71,14,14,14,-74,-79,14,14,-73,14,-84,14,14,14,-37,-38,-7,-11,-82,14,14,-62,-8,14,-85,14,14,14,-83,14,14,14,14,14,-91,14,14,14,14,14,-9,-12,14,-90,14,-87,-89,-86,-88,14,14,-11,-10,]),'BOOL':([0,2,3,21,22,23,25,33,49,50,51,53,54,67,89,96,117,123,125,126,127,131,134,137,140,150,151,152,153,159,164,170,173,175,177,178,179,180,181,182,183,191,193,195,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[15,15,-3,-75,-76,-77,-2,15,-93,-94,15,-6,15,-72,15,-92,15,15,15,-80,15,-5,15,-71,15,15,15,-74,-79,15,15,-73,15,-84,15,15,15,-37,-38,-7,-11,-82,15,15,-62,-8,15,-85,15,15,15,-83,15,15,15,15,15,-91,15,15,15,15,15,-9,-12,15,-90,15,-87,-89,-86,-88,15,15,-11,-10,]),'STRING':([0,2,3,21,22,23,25,33,49,50,51,53,54,67,89,96,117,123,125,126,127,131,134,137,140,150,151,152,153,159,164,170,173,175,177,178,179,180,181,182,183,191,193,195,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[16,16,-3,-75,-76,-77,-2,16,-93,-94,16,-6,16,-72,16,-92,16,16,16,-80,16,-5,16,-71,16,16,16,-74,-79,16,16,-73,16,-84,16,16,16,-37,-38,-7,-11,-82,16,16,-62,-8,16,-85,16,16,16,-83,16,16,16,16,16,-91,16,16,16,16,16,-9,-12,16,-90,16,-87,-89,-86,-88,16,16,-11,-10,]),'CHAR':([0,2,3,21,22,23,25,33,49,50,51,53,54,67,89,96,117,123,125,126,127,131,134,137,140,150,151,152,153,159,164,170,173,175,177,178,179,180,181,182,183,191,193,195,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[17,17,-3,-75,-76,-77,-2,17,-93,-94,17,-6,17,-72,17,-92,17,17,17,-80,17,-5,17,-71,17,17,17,-74,-79,17,17,-73,17,-84,17,17,17,-37,-38,-7,-11,-82,17,17,-62,-8,17,-85,17,17,17,-83,17,17,17,17,17,-91,17,17,17,17,17,-9,-12,17,-90,17,-87,-89,-86,-88,17,17,-11,-10,]),'VAR':([0,2,3,21,22,23,25,33,49,50,51,53,54,67,89,96,117,123,125,126,127,131,134,137,140,150,151,152,153,159,164,170,173,175,177,178,179,180,181,182,183,191,193,195,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[18,18,-3,-75,-76,-77,-2,18,-93,-94,18,-6,18,-72,18,-92,18,18,18,-80,18,-5,18,-71,18,18,18,-74,-79,18,18,-73,18,-84,18,18,18,-37,-38,-7,-11,-82,18,18,-62,-8,18,-85,18,18,18,-83,18,18,18,18,18,-91,18,18,18,18,18,-9,-12,18,-90,18,-87,-89,-86,-88,18,18,-11,-10,]),'DOUBLE':([0,2,3,21,22,23,25,33,49,50,51,53,54,67,89,96,117,123,125,126,127,131,134,137,140,150,151,152,153,159,164,170,173,175,177,178,179,180,181,182,183,191,193,195,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[19,19,-3,-75,-76,-77,-2,19,-93,-94,19,-6,19,-72,19,-92,19,19,19,-80,19,-5,19,-71,19,19,19,-74,-79,19,19,-73,19,-84,19,19,19,-37,-38,-7,-11,-82,19,19,-62,-8,19,-85,19,19,19,-83,19,19,19,19,19,-91,19,19,19,19,19,-9,-12,19,-90,19,-87,-89,-86,-88,19,19,-11,-10,]),'PUBLIC':([0,2,3,25,49,50,53,67,89,96,123,125,126,131,137,140,150,152,153,159,164,170,175,179,180,181,182,183,191,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[21,21,-3,-2,-93,-94,-6,-72,21,-92,21,21,-80,-5,-71,21,21,-74,-79,21,21,-73,-84,21,-37,-38,-7,-11,-82,-62,-8,21,-85,21,21,21,-83,21,21,21,21,21,-91,21,21,21,21,21,-9,-12,21,-90,21,-87,-89,-86,-88,21,21,-11,-10,]),'PRIVATE':([0,2,3,25,49,50,53,67,89,96,123,125,126,131,137,140,150,152,153,159,164,170,175,179,180,181,182,183,191,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[22,22,-3,-2,-93,-94,-6,-72,22,-92,22,22,-80,-5,-71,22,22,-74,-79,22,22,-73,-84,22,-37,-38,-7,-11,-82,-62,-8,22,-85,22,22,22,-83,22,22,22,22,22,-91,22,22,22,22,22,-9,-12,22,-90,22,-87,-89,-86,-88,22,22,-11,-10,]),'PROTECTED':([0,2,3,25,49,50,53,67,89,96,123,125,126,131,137,140,150,152,153,159,164,170,175,179,180,181,182,183,191,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[23,23,-3,-2,-93,-94,-6,-72,23,-92,23,23,-80,-5,-71,23,23,-74,-79,23,23,-73,-84,23,-37,-38,-7,-11,-82,-62,-8,23,-85,23,23,23,-83,23,23,23,23,23,-91,23,23,23,23,23,-9,-12,23,-90,23,-87,-89,-86,-88,23,23,-11,-10,]),'LIST':([0,2,3,21,22,23,25,33,35,49,50,51,53,54,67,89,96,117,123,125,126,127,131,134,137,140,150,151,152,153,159,164,170,173,175,177,178,179,180,181,182,183,191,193,195,199,200,207,212,215,217,221,222,224,226,227,228,230,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[24,24,-3,-75,-76,-77,-2,24,80,-93,-94,24,-6,24,-72,24,-92,24,24,24,-80,24,-5,24,-71,24,24,24,-74,-79,24,24,-73,24,-84,24,24,24,-37,-38,-7,-11,-82,24,24,-62,-8,24,-85,24,24,24,-83,24,24,24,24,24,-91,24,24,24,24,24,-9,-12,24,-90,24,-87,-89,-86,-88,24,24,-11,-10,]),'$end':([0,1,2,3,25,49,50,53,67,96,131,137,152,170,180,181,182,183,199,200,238,240,251,252,],[-4,0,-1,-3,-2,-93,-94,-6,-72,-92,-5,-71,-74,-73,-37,-38,-7,-11,-62,-8,-9,-12,-11,-10,]),'RBRACE':([3,12,25,37,39,40,41,42,43,49,50,53,67,84,87,89,96,105,106,107,108,109,110,111,112,113,114,115,116,118,123,125,126,131,137,140,146,147,150,152,153,159,164,168,170,175,179,180,181,182,183,188,189,191,199,200,204,205,206,207,212,215,217,219,221,222,224,226,227,228,230,231,232,233,234,235,236,237,238,240,241,242,243,244,245,247,248,249,250,251,252,],[-3,50,-2,-55,-50,-51,-52,-53,-54,-93,-94,-6,-72,-56,-61,-81,-92,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,-81,152,-80,-5,-71,-4,-36,-67,170,-74,-79,-4,183,-57,-73,-84,199,-37,-38,-7,-11,-35,-58,-82,-62,-8,-31,219,-34,-4,-85,-4,-4,-32,232,-83,-4,-4,-4,238,240,-33,-91,-4,242,-4,244,245,-9,-12,247,-90,248,-87,-89,-86,-88,-4,251,-11,-10,]),'LBRACKET':([5,37,64,185,],[27,82,82,82,]),'DOT':([5,6,44,45,66,],[29,31,85,86,86,]),'LPAREN':([5,7,8,9,26,27,28,30,32,33,36,37,38,46,52,57,60,64,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,121,122,124,135,143,149,155,157,158,165,167,172,174,176,185,188,192,203,216,220,229,],[30,32,33,36,54,36,36,36,36,36,36,83,36,36,36,97,100,83,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,148,149,151,36,36,36,173,177,178,36,187,193,195,36,83,36,36,36,229,36,36,]),'ASSIGN':([5,26,64,95,103,157,172,185,],[28,52,104,135,143,176,192,203,]),'NEW':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'INT_CONST':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'FLOAT_CONST':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'TRUE':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'FALSE':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'STRING_CONST':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'MINUS':([9,27,28,30,32,33,34,36,37,38,39,40,41,42,43,46,52,55,56,59,61,64,65,68,69,70,71,72,73,74,75,76,77,78,79,81,82,83,84,87,91,97,99,100,102,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,135,136,138,139,142,143,144,146,147,149,161,165,166,168,169,176,185,186,188,189,192,196,203,204,206,208,218,219,220,229,231,239,],[38,38,38,38,38,38,69,38,-55,38,-50,-51,-52,-53,-54,38,38,69,69,69,69,-55,69,38,38,38,38,38,38,38,38,38,38,38,38,69,38,38,-56,69,69,38,38,38,38,38,-39,-40,-41,-42,69,69,69,69,69,69,69,69,-49,69,38,69,69,69,69,38,69,-36,-67,38,69,38,69,-57,69,38,-55,69,38,-58,38,69,38,-31,69,69,69,-32,38,38,69,69,]),'NOT':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'SEMICOLON':([12,26,33,34,37,39,40,41,42,43,56,62,64,65,84,87,91,98,102,105,106,107,108,109,110,111,112,113,114,115,116,118,141,142,144,146,147,157,161,162,163,166,168,172,189,196,204,208,219,],[49,53,-16,67,-55,-50,-51,-52,-53,-54,96,102,-55,-15,-56,-61,131,137,-18,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,165,-17,-14,-36,-67,175,180,181,182,-13,-57,191,-58,212,-31,222,-32,]),'GT':([13,14,15,16,17,18,19,20,34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,90,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,130,136,138,139,142,144,145,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[-22,-23,-24,-25,-26,-27,-28,-29,72,-55,-50,-51,-52,-53,-54,72,72,72,72,-55,72,72,-56,72,130,72,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,72,72,-49,72,-30,72,72,72,72,72,167,-36,-67,72,72,-57,72,-55,72,-58,72,-31,72,72,72,-32,72,72,]),'VOID':([21,22,23,89,123,125,126,127,150,153,175,191,212,222,232,242,244,245,247,248,],[-75,-76,-77,129,129,129,-80,156,129,-79,-84,-82,-85,-83,-91,-90,-87,-89,-86,-88,]),'LT':([24,34,37,39,40,41,42,43,55,56,59,61,64,65,80,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[51,73,-55,-50,-51,-52,-53,-54,73,73,73,73,-55,73,117,73,-56,73,73,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,73,73,-49,73,73,73,73,73,73,-36,-67,73,73,-57,73,-55,73,-58,73,-31,73,73,73,-32,73,73,]),'ADD':([29,],[57,]),'RPAREN':([30,37,39,40,41,42,43,54,58,59,61,81,83,84,87,93,94,105,106,107,108,109,110,111,112,113,114,115,116,118,120,132,136,138,139,146,147,148,151,160,165,168,169,171,173,177,178,184,185,186,187,189,193,194,195,197,198,204,209,211,218,219,239,],[-70,-55,-50,-51,-52,-53,-54,-65,98,-69,101,118,-70,-56,-61,133,-64,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,147,-66,162,-68,163,-36,-67,168,-65,-63,-21,-57,189,190,-65,-65,-65,202,-55,-20,204,-58,-65,210,-65,213,214,-31,223,225,-19,-32,246,]),'COMMA':([30,37,39,40,41,42,43,54,58,59,83,84,87,93,94,105,106,107,108,109,110,111,112,113,114,115,116,118,120,132,138,146,147,151,160,168,171,173,177,178,188,189,193,194,195,197,198,204,205,206,209,211,219,231,],[-70,-55,-50,-51,-52,-53,-54,-65,99,-69,-70,-56,-61,134,-64,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,99,-66,-68,-36,-67,-65,-63,-57,134,-65,-65,-65,-35,-58,-65,134,-65,134,134,-31,220,-34,134,134,-32,-33,]),'WRITELINE':([31,],[60,]),'PLUS':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[68,-55,-50,-51,-52,-53,-54,68,68,68,68,-55,68,68,-56,68,68,-39,-40,-41,-42,68,68,68,68,68,68,68,68,-49,68,68,68,68,68,68,-36,-67,68,68,-57,68,-55,68,-58,68,-31,68,68,68,-32,68,68,]),'TIMES':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[70,-55,-50,-51,-52,-53,-54,70,70,70,70,-55,70,70,-56,70,70,70,70,-41,-42,70,70,70,70,70,70,70,70,-49,70,70,70,70,70,70,-36,-67,70,70,-57,70,-55,70,-58,70,-31,70,70,70,-32,70,70,]),'DIVIDE':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[71,-55,-50,-51,-52,-53,-54,71,71,71,71,-55,71,71,-56,71,71,71,71,-41,-42,71,71,71,71,71,71,71,71,-49,71,71,71,71,71,71,-36,-67,71,71,-57,71,-55,71,-58,71,-31,71,71,71,-32,71,71,]),'GE':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[74,-55,-50,-51,-52,-53,-54,74,74,74,74,-55,74,74,-56,74,74,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,74,74,-49,74,74,74,74,74,74,-36,-67,74,74,-57,74,-55,74,-58,74,-31,74,74,74,-32,74,74,]),'LE':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[75,-55,-50,-51,-52,-53,-54,75,75,75,75,-55,75,75,-56,75,75,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,75,75,-49,75,75,75,75,75,75,-36,-67,75,75,-57,75,-55,75,-58,75,-31,75,75,75,-32,75,75,]),'EQ':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[76,-55,-50,-51,-52,-53,-54,76,76,76,76,-55,76,76,-56,76,76,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,76,76,-49,76,76,76,76,76,76,-36,-67,76,76,-57,76,-55,76,-58,76,-31,76,76,76,-32,76,76,]),'NE':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[77,-55,-50,-51,-52,-53,-54,77,77,77,77,-55,77,77,-56,77,77,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,77,77,-49,77,77,77,77,77,77,-36,-67,77,77,-57,77,-55,77,-58,77,-31,77,77,77,-32,77,77,]),'AND':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[78,-55,-50,-51,-52,-53,-54,78,78,78,78,-55,78,78,-56,-61,78,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,78,-49,78,78,78,78,78,78,-36,-67,78,78,-57,78,-55,78,-58,78,-31,78,78,78,-32,78,78,]),'OR':([34,37,39,40,41,42,43,55,56,59,61,64,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,118,119,136,138,139,142,144,146,147,161,166,168,169,185,186,189,196,204,206,208,218,219,231,239,],[79,-55,-50,-51,-52,-53,-54,79,79,79,79,-55,79,79,-56,-61,79,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,79,79,79,79,79,79,-36,-67,79,79,-57,79,-55,79,-58,79,-31,79,79,79,-32,79,79,]),'RBRACKET':([37,39,40,41,42,43,55,84,87,105,106,107,108,109,110,111,112,113,114,115,116,118,119,146,147,168,189,204,219,],[-55,-50,-51,-52,-53,-54,95,-56,-61,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,146,-36,-67,-57,-58,-31,-32,]),'LBRACE':([48,88,101,133,167,190,201,202,210,213,214,223,225,246,],[89,123,140,159,188,207,215,217,224,226,227,233,235,249,]),'READLINE':([85,],[121,]),'PARSE':([86,],[122,]),'ELSE':([183,251,],[201,201,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'declarations':([0,140,159,207,215,217,224,226,227,233,235,249,],[2,164,179,221,228,230,234,236,237,241,243,250,]),'declaration':([0,2,140,159,164,179,207,215,217,221,224,226,227,228,230,233,234,235,236,237,241,243,249,250,],[3,25,3,3,25,25,3,3,3,25,3,3,3,25,25,3,25,3,25,25,25,25,3,25,]),'type':([0,2,33,51,54,89,117,123,125,127,134,140,150,151,159,164,173,177,178,179,193,195,207,215,217,221,224,226,227,228,230,233,234,235,236,237,241,243,249,250,],[4,4,63,90,92,128,145,128,128,154,92,4,128,92,4,4,92,92,92,4,92,92,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'access_modifier':([0,2,89,123,125,140,150,159,164,179,207,215,217,221,224,226,227,228,230,233,234,235,236,237,241,243,249,250,],[10,10,127,127,127,10,127,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'list_type':([0,2,33,51,54,89,117,123,125,127,134,140,150,151,159,164,173,177,178,179,193,195,207,215,217,221,224,226,227,228,230,233,234,235,236,237,241,243,249,250,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'expression':([9,27,28,30,32,33,36,38,46,52,68,69,70,71,72,73,74,75,76,77,78,79,82,83,97,99,100,102,104,135,143,149,165,176,188,192,203,220,229,],[34,55,56,59,61,65,81,84,87,91,105,106,107,108,109,110,111,112,113,114,115,116,119,59,136,138,139,142,144,161,166,169,186,196,206,208,218,231,239,]),'args':([30,83,],[58,120,]),'for_init':([33,],[62,]),'params':([54,151,173,177,178,193,195,],[93,171,194,197,198,209,211,]),'param':([54,134,151,173,177,178,193,195,],[94,160,94,94,94,94,94,94,]),'class_members':([89,123,],[125,150,]),'class_member':([89,123,125,150,],[126,126,153,153,]),'for_cond':([102,],[141,]),'for_iter':([165,],[184,]),'else_part':([183,251,],[200,252,]),'list_elements':([188,],[205,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> declarations','program',1,'p_program','syntax.py',92),
+  ('declarations -> declarations declaration','declarations',2,'p_declarations_multiple','syntax.py',100),
+  ('declarations -> declaration','declarations',1,'p_declarations_single','syntax.py',105),
+  ('declarations -> <empty>','declarations',0,'p_declarations_empty','syntax.py',109),
+  ('declaration -> type ID ASSIGN expression SEMICOLON','declaration',5,'p_declaration_init','syntax.py',136),
+  ('declaration -> type ID SEMICOLON','declaration',3,'p_declaration_noinit','syntax.py',141),
+  ('declaration -> CONSOLE DOT WRITELINE LPAREN expression RPAREN SEMICOLON','declaration',7,'p_declaration_print','syntax.py',148),
+  ('declaration -> IF LPAREN expression RPAREN LBRACE declarations RBRACE else_part','declaration',8,'p_declaration_if_else','syntax.py',155),
+  ('else_part -> ELSE LBRACE declarations RBRACE','else_part',4,'p_else_part_else','syntax.py',160),
+  ('else_part -> ELSE IF LPAREN expression RPAREN LBRACE declarations RBRACE else_part','else_part',9,'p_else_part_elseif','syntax.py',165),
+  ('else_part -> <empty>','else_part',0,'p_else_part_empty','syntax.py',170),
+  ('declaration -> FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_iter RPAREN LBRACE declarations RBRACE','declaration',11,'p_declaration_for','syntax.py',176),
+  ('for_init -> type ID ASSIGN expression','for_init',4,'p_for_init_decl','syntax.py',182),
+  ('for_init -> ID ASSIGN expression','for_init',3,'p_for_init_assign','syntax.py',186),
+  ('for_init -> expression','for_init',1,'p_for_init_expr','syntax.py',190),
+  ('for_init -> <empty>','for_init',0,'p_for_init_empty','syntax.py',194),
+  ('for_cond -> expression','for_cond',1,'p_for_cond_expr','syntax.py',199),
+  ('for_cond -> <empty>','for_cond',0,'p_for_cond_empty','syntax.py',203),
+  ('for_iter -> ID ASSIGN expression','for_iter',3,'p_for_iter_assign','syntax.py',208),
+  ('for_iter -> expression','for_iter',1,'p_for_iter_expr','syntax.py',212),
+  ('for_iter -> <empty>','for_iter',0,'p_for_iter_empty','syntax.py',216),
+  ('type -> INT','type',1,'p_type','syntax.py',222),
+  ('type -> FLOAT','type',1,'p_type','syntax.py',223),
+  ('type -> BOOL','type',1,'p_type','syntax.py',224),
+  ('type -> STRING','type',1,'p_type','syntax.py',225),
+  ('type -> CHAR','type',1,'p_type','syntax.py',226),
+  ('type -> VAR','type',1,'p_type','syntax.py',227),
+  ('type -> DOUBLE','type',1,'p_type','syntax.py',228),
+  ('type -> list_type','type',1,'p_type','syntax.py',229),
+  ('list_type -> LIST LT type GT','list_type',4,'p_list_type','syntax.py',234),
+  ('expression -> NEW LIST LT type GT LPAREN RPAREN','expression',7,'p_expression_new_list','syntax.py',239),
+  ('expression -> NEW LIST LT type GT LBRACE list_elements RBRACE','expression',8,'p_expression_new_list_init','syntax.py',244),
+  ('list_elements -> list_elements COMMA expression','list_elements',3,'p_list_elements_multiple','syntax.py',249),
+  ('list_elements -> expression','list_elements',1,'p_list_elements_single','syntax.py',254),
+  ('list_elements -> <empty>','list_elements',0,'p_list_elements_empty','syntax.py',258),
+  ('expression -> ID LBRACKET expression RBRACKET','expression',4,'p_expression_list_access','syntax.py',263),
+  ('declaration -> ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLON','declaration',7,'p_declaration_list_assign','syntax.py',268),
+  ('declaration -> ID DOT ADD LPAREN expression RPAREN SEMICOLON','declaration',7,'p_declaration_list_add','syntax.py',274),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','syntax.py',281),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','syntax.py',282),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','syntax.py',283),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','syntax.py',284),
+  ('expression -> expression GT expression','expression',3,'p_expression_relop','syntax.py',288),
+  ('expression -> expression LT expression','expression',3,'p_expression_relop','syntax.py',289),
+  ('expression -> expression GE expression','expression',3,'p_expression_relop','syntax.py',290),
+  ('expression -> expression LE expression','expression',3,'p_expression_relop','syntax.py',291),
+  ('expression -> expression EQ expression','expression',3,'p_expression_relop','syntax.py',292),
+  ('expression -> expression NE expression','expression',3,'p_expression_relop','syntax.py',293),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','syntax.py',297),
+  ('expression -> INT_CONST','expression',1,'p_expression_number','syntax.py',301),
+  ('expression -> FLOAT_CONST','expression',1,'p_expression_number','syntax.py',302),
+  ('expression -> TRUE','expression',1,'p_expression_bool','syntax.py',306),
+  ('expression -> FALSE','expression',1,'p_expression_bool','syntax.py',307),
+  ('expression -> STRING_CONST','expression',1,'p_expression_string','syntax.py',311),
+  ('expression -> ID','expression',1,'p_expression_id','syntax.py',315),
+  ('expression -> MINUS expression','expression',2,'p_expression_negative','syntax.py',320),
+  ('expression -> CONSOLE DOT READLINE LPAREN RPAREN','expression',5,'p_expression_readline','syntax.py',325),
+  ('expression -> INT DOT PARSE LPAREN expression RPAREN','expression',6,'p_expression_parse_readline','syntax.py',330),
+  ('expression -> expression AND expression','expression',3,'p_expression_and','syntax.py',335),
+  ('expression -> expression OR expression','expression',3,'p_expression_or','syntax.py',340),
+  ('expression -> NOT expression','expression',2,'p_expression_not','syntax.py',345),
+  ('declaration -> type ID LPAREN params RPAREN LBRACE declarations RBRACE','declaration',8,'p_declaration_function','syntax.py',351),
+  ('params -> params COMMA param','params',3,'p_params_multiple','syntax.py',356),
+  ('params -> param','params',1,'p_params_single','syntax.py',361),
+  ('params -> <empty>','params',0,'p_params_empty','syntax.py',365),
+  ('param -> type ID','param',2,'p_param','syntax.py',369),
+  ('expression -> ID LPAREN args RPAREN','expression',4,'p_expression_func_call','syntax.py',374),
+  ('args -> args COMMA expression','args',3,'p_args_multiple','syntax.py',380),
+  ('args -> expression','args',1,'p_args_single','syntax.py',385),
+  ('args -> <empty>','args',0,'p_args_empty','syntax.py',389),
+  ('declaration -> ID LPAREN args RPAREN SEMICOLON','declaration',5,'p_declaration_func_call','syntax.py',394),
+  ('declaration -> RETURN expression SEMICOLON','declaration',3,'p_declaration_return','syntax.py',401),
+  ('declaration -> access_modifier CLASS ID LBRACE class_members RBRACE','declaration',6,'p_declaration_class','syntax.py',408),
+  ('declaration -> CLASS ID LBRACE class_members RBRACE','declaration',5,'p_declaration_class_no_modifier','syntax.py',413),
+  ('access_modifier -> PUBLIC','access_modifier',1,'p_access_modifier','syntax.py',420),
+  ('access_modifier -> PRIVATE','access_modifier',1,'p_access_modifier','syntax.py',421),
+  ('access_modifier -> PROTECTED','access_modifier',1,'p_access_modifier','syntax.py',422),
+  ('access_modifier -> <empty>','access_modifier',0,'p_access_modifier_empty','syntax.py',425),
+  ('class_members -> class_members class_member','class_members',2,'p_class_members_multiple','syntax.py',430),
+  ('class_members -> class_member','class_members',1,'p_class_members_single','syntax.py',435),
+  ('class_members -> <empty>','class_members',0,'p_class_members_empty','syntax.py',439),
+  ('class_member -> access_modifier type ID SEMICOLON','class_member',4,'p_class_member_field','syntax.py',445),
+  ('class_member -> access_modifier type ID ASSIGN expression SEMICOLON','class_member',6,'p_class_member_field_init','syntax.py',450),
+  ('class_member -> type ID SEMICOLON','class_member',3,'p_class_member_field_no_modifier','syntax.py',455),
+  ('class_member -> type ID ASSIGN expression SEMICOLON','class_member',5,'p_class_member_field_init_no_modifier','syntax.py',460),
+  ('class_member -> access_modifier type ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',9,'p_class_member_method','syntax.py',467),
+  ('class_member -> type ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',8,'p_class_member_method_no_modifier','syntax.py',472),
+  ('class_member -> access_modifier VOID ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',9,'p_class_member_void_method','syntax.py',479),
+  ('class_member -> VOID ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',8,'p_class_member_void_method_no_modifier','syntax.py',484),
+  ('class_member -> access_modifier ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',8,'p_class_member_constructor','syntax.py',491),
+  ('class_member -> ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',7,'p_class_member_constructor_no_modifier','syntax.py',496),
+  ('declaration -> ID ASSIGN expression SEMICOLON','declaration',4,'p_declaration_assign','syntax.py',502),
+  ('declaration -> error SEMICOLON','declaration',2,'p_declaration_error','syntax.py',511),
+  ('declaration -> error RBRACE','declaration',2,'p_declaration_error','syntax.py',512),
+]
+_firma_gramatica = '10cba7afb22d3fc463459934a2c6c7a1e42301fc'
@@ -0,0 +1,123 @@
+
+# parsetab_cs_traza.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDrightNOTleftLTGTLEGEEQNEleftPLUSMINUSleftTIMESDIVIDErightUMINUSADD AND ASSIGN BOOL CHAR CLASS COLON COMMA CONSOLE DIVIDE DOT DOUBLE ELSE EQ FALSE FLOAT FLOAT_CONST FOR GE GT ID IF INT INT_CONST LBRACE LBRACKET LE LIST LPAREN LT MINUS MINUSEQUAL MINUSMINUS MOD NE NEW NOT OR PARSE PLUS PLUSEQUAL PLUSPLUS PRIVATE PROTECTED PUBLIC RBRACE RBRACKET READLINE RETURN RPAREN SEMICOLON STRING STRING_CONST TIMES TRUE USING VAR VOID WRITELINEprogram : declarationsdeclarations : declarations declarationdeclarations : declarationdeclarations : declaration : type ID ASSIGN expression SEMICOLONdeclaration : type ID SEMICOLONdeclaration : CONSOLE DOT WRITELINE LPAREN expression RPAREN SEMICOLONdeclaration : IF LPAREN expression RPAREN LBRACE declarations RBRACE else_partelse_part : ELSE LBRACE declarations RBRACEelse_part : ELSE IF LPAREN expression RPAREN LBRACE declarations RBRACE else_partelse_part : declaration : FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_iter RPAREN LBRACE declarations RBRACEfor_init : type ID ASSIGN expressionfor_init : ID ASSIGN expressionfor_init : expressionfor_init : for_cond : expressionfor_cond : for_iter : ID ASSIGN expressionfor_iter : expressionfor_iter : type : INT\n           | FLOAT\n           | BOOL\n           | STRING\n           | CHAR\n           | VAR\n           | DOUBLE\n           | list_typelist_type : LIST LT type GTexpression : NEW LIST LT type GT LPAREN RPARENexpression : NEW LIST LT type GT LBRACE list_elements RBRACElist_elements : list_elements COMMA expressionlist_elements : expressionlist_elements : expression : ID LBRACKET expression RBRACKETdeclaration : ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLONdeclaration : ID DOT ADD LPAREN expression RPAREN SEMICOLONexpression : expression PLUS expression\n                 | expression MINUS expression\n                 | expression TIMES expression\n                 | expression DIVIDE expressionexpression : expression GT expression\n                 | expression LT expression\n                 | expression GE expression\n                 | expression LE expression\n                 | expression EQ expression\n                 | expression NE expressionexpression : LPAREN expression RPARENexpression : INT_CONST\n                 | FLOAT_CONSTexpression : TRUE\n                 | FALSEexpression : STRING_CONSTexpression : IDexpression : MINUS expression %prec UMINUSexpression : CONSOLE DOT READLINE LPAREN RPARENexpression : INT DOT PARSE LPAREN expression RPARENexpression : expression AND expressionexpression : expression OR expressionexpression : NOT expressiondeclaration : type ID LPAREN params RPAREN LBRACE declarations RBRACEparams : params COMMA paramparams : paramparams : param : type IDexpression : ID LPAREN args RPARENargs : args COMMA expressionargs : expressionargs : declaration : ID LPAREN args RPAREN SEMICOLONdeclaration : RETURN expression SEMICOLONdeclaration : access_modifier CLASS ID LBRACE class_members RBRACEdeclaration : CLASS ID LBRACE class_members RBRACEaccess_modifier : PUBLIC\n                      | PRIVATE\n                      | PROTECTEDaccess_modifier : class_members : class_members class_memberclass_members : class_memberclass_members : class_member : access_modifier type ID SEMICOLONclass_member : access_modifier type ID ASSIGN expression SEMICOLONclass_member : type ID SEMICOLONclass_member : type ID ASSIGN expression SEMICOLONclass_member : access_modifier type ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : type ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : access_modifier VOID ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : VOID ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : access_modifier ID LPAREN params RPAREN LBRACE declarations RBRACEclass_member : ID LPAREN params RPAREN LBRACE declarations RBRACEdeclaration : ID ASSIGN expression SEMICOLON'
+    
+_lr_action_items = {'CONSOLE':([0,2,3,9,24,26,27,29,31,32,35,37,45,49,50,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,93,94,96,97,99,101,128,132,134,137,140,146,149,156,161,162,167,173,176,177,178,179,180,185,189,196,197,200,204,212,214,217,218,221,223,224,225,226,227,230,231,232,233,234,235,237,238,240,246,247,248,249,],[6,6,-3,43,-2,43,43,43,43,43,43,43,43,43,-6,-72,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-92,43,43,43,43,43,-5,43,-71,6,43,43,-74,6,6,43,-73,43,6,-37,-38,-7,-11,43,43,-62,-8,43,6,6,6,43,6,6,6,6,6,43,6,6,6,6,6,6,-9,-12,6,6,6,6,-11,-10,]),'IF':([0,2,3,24,50,64,93,128,134,137,149,156,161,167,176,177,178,179,180,196,197,198,204,212,214,218,221,223,224,225,227,230,231,232,233,234,235,237,238,240,246,247,248,249,],[7,7,-3,-2,-6,-72,-92,-5,-71,7,-74,7,7,-73,7,-37,-38,-7,-11,-62,-8,213,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-9,-12,7,7,7,7,-11,-10,]),'FOR':([0,2,3,24,50,64,93,128,134,137,149,156,161,167,176,177,178,179,180,196,197,204,212,214,218,221,223,224,225,227,230,231,232,233,234,235,237,238,240,246,247,248,249,],[8,8,-3,-2,-6,-72,-92,-5,-71,8,-74,8,8,-73,8,-37,-38,-7,-11,-62,-8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-9,-12,8,8,8,8,-11,-10,]),'ID':([0,2,3,4,9,11,12,13,14,15,16,17,18,19,20,21,22,24,26,27,29,31,32,35,37,45,46,49,50,60,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,86,89,93,94,96,97,99,101,120,122,123,124,125,126,127,128,132,134,137,140,146,147,149,150,151,153,156,161,162,167,172,173,176,177,178,179,180,185,188,189,196,197,200,204,209,212,214,217,218,219,221,223,224,225,226,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[5,5,-3,25,36,47,-22,-23,-24,-25,-26,-27,-28,-29,-75,-76,-77,-2,36,36,36,36,61,36,36,36,85,36,-6,100,-22,-72,36,36,36,36,36,36,36,36,36,36,36,36,36,36,121,129,-92,36,36,36,36,36,121,121,-80,152,154,155,-30,-5,36,-71,5,36,36,121,-74,-79,169,171,5,5,182,-73,-84,36,5,-37,-38,-7,-11,36,-82,36,-62,-8,36,5,-85,5,5,36,5,-83,5,5,5,5,36,5,-91,5,5,5,5,5,-9,-12,5,-90,5,-87,-89,-86,-88,5,5,-11,-10,]),'RETURN':([0,2,3,24,50,64,93,128,134,137,149,156,161,167,176,177,178,179,180,196,197,204,212,214,218,221,223,224,225,227,230,231,232,233,234,235,237,238,240,246,247,248,249,],[9,9,-3,-2,-6,-72,-92,-5,-71,9,-74,9,9,-73,9,-37,-38,-7,-11,-62,-8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,-9,-12,9,9,9,9,-11,-10,]),'CLASS':([0,2,3,10,20,21,22,24,50,64,93,128,134,137,149,156,161,167,176,177,178,179,180,196,197,204,212,214,218,221,223,224,225,227,230,231,232,233,234,235,237,238,240,246,247,248,249,],[11,11,-3,46,-75,-76,-77,-2,-6,-72,-92,-5,-71,11,-74,11,11,-73,11,-37,-38,-7,-11,-62,-8,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-9,-12,11,11,11,11,-11,-10,]),'INT':([0,2,3,9,20,21,22,24,26,27,29,31,32,35,37,45,48,49,50,51,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,86,93,94,96,97,99,101,114,120,122,123,124,128,131,132,134,137,140,146,147,148,149,150,156,161,162,167,170,172,173,174,175,176,177,178,179,180,185,188,189,190,192,196,197,200,204,209,212,214,217,218,219,221,223,224,225,226,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[12,12,-3,44,-75,-76,-77,-2,44,44,44,44,63,44,44,44,12,44,-6,12,-72,44,44,44,44,44,44,44,44,44,44,44,44,44,44,12,-92,44,44,44,44,44,12,12,12,-80,12,-5,12,44,-71,12,44,44,12,12,-74,-79,12,12,44,-73,12,-84,44,12,12,12,-37,-38,-7,-11,44,-82,44,12,12,-62,-8,44,12,-85,12,12,44,12,-83,12,12,12,12,44,12,-91,12,12,12,12,12,-9,-12,12,-90,12,-87,-89,-86,-88,12,12,-11,-10,]),'FLOAT':([0,2,3,20,21,22,24,32,48,50,51,64,86,93,114,120,122,123,124,128,131,134,137,147,148,149,150,156,161,167,170,172,174,175,176,177,178,179,180,188,190,192,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[13,13,-3,-75,-76,-77,-2,13,13,-6,13,-72,13,-92,13,13,13,-80,13,-5,13,-71,13,13,13,-74,-79,13,13,-73,13,-84,13,13,13,-37,-38,-7,-11,-82,13,13,-62,-8,13,-85,13,13,13,-83,13,13,13,13,13,-91,13,13,13,13,13,-9,-12,13,-90,13,-87,-89,-86,-88,13,13,-11,-10,]),'BOOL':([0,2,3,20,21,22,24,32,48,50,51,64,86,93,114,120,122,123,124,128,131,134,137,147,148,149,150,156,161,167,170,172,174,175,176,177,178,179,180,188,190,192,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[14,14,-3,-75,-76,-77,-2,14,14,-6,14,-72,14,-92,14,14,14,-80,14,-5,14,-71,14,14,14,-74,-79,14,14,-73,14,-84,14,14,14,-37,-38,-7,-11,-82,14,14,-62,-8,14,-85,14,14,14,-83,14,14,14,14,14,-91,14,14,14,14,14,-9,-12,14,-90,14,-87,-89,-86,-88,14,14,-11,-10,]),'STRING':([0,2,3,20,21,22,24,32,48,50,51,64,86,93,114,120,122,123,124,128,131,134,137,147,148,149,150,156,161,167,170,172,174,175,176,177,178,179,180,188,190,192,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[15,15,-3,-75,-76,-77,-2,15,15,-6,15,-72,15,-92,15,15,15,-80,15,-5,15,-71,15,15,15,-74,-79,15,15,-73,15,-84,15,15,15,-37,-38,-7,-11,-82,15,15,-62,-8,15,-85,15,15,15,-83,15,15,15,15,15,-91,15,15,15,15,15,-9,-12,15,-90,15,-87,-89,-86,-88,15,15,-11,-10,]),'CHAR':([0,2,3,20,21,22,24,32,48,50,51,64,86,93,114,120,122,123,124,128,131,134,137,147,148,149,150,156,161,167,170,172,174,175,176,177,178,179,180,188,190,192,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[16,16,-3,-75,-76,-77,-2,16,16,-6,16,-72,16,-92,16,16,16,-80,16,-5,16,-71,16,16,16,-74,-79,16,16,-73,16,-84,16,16,16,-37,-38,-7,-11,-82,16,16,-62,-8,16,-85,16,16,16,-83,16,16,16,16,16,-91,16,16,16,16,16,-9,-12,16,-90,16,-87,-89,-86,-88,16,16,-11,-10,]),'VAR':([0,2,3,20,21,22,24,32,48,50,51,64,86,93,114,120,122,123,124,128,131,134,137,147,148,149,150,156,161,167,170,172,174,175,176,177,178,179,180,188,190,192,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[17,17,-3,-75,-76,-77,-2,17,17,-6,17,-72,17,-92,17,17,17,-80,17,-5,17,-71,17,17,17,-74,-79,17,17,-73,17,-84,17,17,17,-37,-38,-7,-11,-82,17,17,-62,-8,17,-85,17,17,17,-83,17,17,17,17,17,-91,17,17,17,17,17,-9,-12,17,-90,17,-87,-89,-86,-88,17,17,-11,-10,]),'DOUBLE':([0,2,3,20,21,22,24,32,48,50,51,64,86,93,114,120,122,123,124,128,131,134,137,147,148,149,150,156,161,167,170,172,174,175,176,177,178,179,180,188,190,192,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[18,18,-3,-75,-76,-77,-2,18,18,-6,18,-72,18,-92,18,18,18,-80,18,-5,18,-71,18,18,18,-74,-79,18,18,-73,18,-84,18,18,18,-37,-38,-7,-11,-82,18,18,-62,-8,18,-85,18,18,18,-83,18,18,18,18,18,-91,18,18,18,18,18,-9,-12,18,-90,18,-87,-89,-86,-88,18,18,-11,-10,]),'PUBLIC':([0,2,3,24,50,64,86,93,120,122,123,128,134,137,147,149,150,156,161,167,172,176,177,178,179,180,188,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[20,20,-3,-2,-6,-72,20,-92,20,20,-80,-5,-71,20,20,-74,-79,20,20,-73,-84,20,-37,-38,-7,-11,-82,-62,-8,20,-85,20,20,20,-83,20,20,20,20,20,-91,20,20,20,20,20,-9,-12,20,-90,20,-87,-89,-86,-88,20,20,-11,-10,]),'PRIVATE':([0,2,3,24,50,64,86,93,120,122,123,128,134,137,147,149,150,156,161,167,172,176,177,178,179,180,188,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[21,21,-3,-2,-6,-72,21,-92,21,21,-80,-5,-71,21,21,-74,-79,21,21,-73,-84,21,-37,-38,-7,-11,-82,-62,-8,21,-85,21,21,21,-83,21,21,21,21,21,-91,21,21,21,21,21,-9,-12,21,-90,21,-87,-89,-86,-88,21,21,-11,-10,]),'PROTECTED':([0,2,3,24,50,64,86,93,120,122,123,128,134,137,147,149,150,156,161,167,172,176,177,178,179,180,188,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[22,22,-3,-2,-6,-72,22,-92,22,22,-80,-5,-71,22,22,-74,-79,22,22,-73,-84,22,-37,-38,-7,-11,-82,-62,-8,22,-85,22,22,22,-83,22,22,22,22,22,-91,22,22,22,22,22,-9,-12,22,-90,22,-87,-89,-86,-88,22,22,-11,-10,]),'LIST':([0,2,3,20,21,22,24,32,34,48,50,51,64,86,93,114,120,122,123,124,128,131,134,137,147,148,149,150,156,161,167,170,172,174,175,176,177,178,179,180,188,190,192,196,197,204,209,212,214,218,219,221,223,224,225,227,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[23,23,-3,-75,-76,-77,-2,23,77,23,-6,23,-72,23,-92,23,23,23,-80,23,-5,23,-71,23,23,23,-74,-79,23,23,-73,23,-84,23,23,23,-37,-38,-7,-11,-82,23,23,-62,-8,23,-85,23,23,23,-83,23,23,23,23,23,-91,23,23,23,23,23,-9,-12,23,-90,23,-87,-89,-86,-88,23,23,-11,-10,]),'$end':([0,1,2,3,24,50,64,93,128,134,149,167,177,178,179,180,196,197,235,237,248,249,],[-4,0,-1,-3,-2,-6,-72,-92,-5,-71,-74,-73,-37,-38,-7,-11,-62,-8,-9,-12,-11,-10,]),'RBRACE':([3,24,36,38,39,40,41,42,50,64,81,84,86,93,102,103,104,105,106,107,108,109,110,111,112,113,115,120,122,123,128,134,137,143,144,147,149,150,156,161,165,167,172,176,177,178,179,180,185,186,188,196,197,201,202,203,204,209,212,214,216,218,219,221,223,224,225,227,228,229,230,231,232,233,234,235,237,238,239,240,241,242,244,245,246,247,248,249,],[-3,-2,-55,-50,-51,-52,-53,-54,-6,-72,-56,-61,-81,-92,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,-81,149,-80,-5,-71,-4,-36,-67,167,-74,-79,-4,180,-57,-73,-84,196,-37,-38,-7,-11,-35,-58,-82,-62,-8,-31,216,-34,-4,-85,-4,-4,-32,229,-83,-4,-4,-4,235,237,-33,-91,-4,239,-4,241,242,-9,-12,244,-90,245,-87,-89,-86,-88,-4,248,-11,-10,]),'LBRACKET':([5,36,61,182,],[26,79,79,79,]),'DOT':([5,6,43,44,63,],[28,30,82,83,83,]),'LPAREN':([5,7,8,9,25,26,27,29,31,32,35,36,37,45,49,54,57,61,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,118,119,121,132,140,146,152,154,155,162,164,169,171,173,182,185,189,200,213,217,226,],[29,31,32,35,51,35,35,35,35,35,35,80,35,35,35,94,97,80,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,145,146,148,35,35,35,170,174,175,35,184,190,192,35,80,35,35,35,226,35,35,]),'ASSIGN':([5,25,61,92,100,154,169,182,],[27,49,101,132,140,173,189,200,]),'NEW':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'INT_CONST':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'FLOAT_CONST':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'TRUE':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'FALSE':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'STRING_CONST':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'MINUS':([9,26,27,29,31,32,33,35,36,37,38,39,40,41,42,45,49,52,53,56,58,61,62,65,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,88,94,96,97,99,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,132,133,135,136,139,140,141,143,144,146,158,162,163,165,166,173,182,183,185,186,189,193,200,201,203,205,215,216,217,226,228,236,],[37,37,37,37,37,37,66,37,-55,37,-50,-51,-52,-53,-54,37,37,66,66,66,66,-55,66,37,37,37,37,37,37,37,37,37,37,37,37,66,37,37,-56,66,66,37,37,37,37,37,-39,-40,-41,-42,66,66,66,66,66,66,66,66,-49,66,37,66,66,66,66,37,66,-36,-67,37,66,37,66,-57,66,37,-55,66,37,-58,37,66,37,-31,66,66,66,-32,37,37,66,66,]),'NOT':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'GT':([12,13,14,15,16,17,18,19,33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,87,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,127,133,135,136,139,141,142,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[-22,-23,-24,-25,-26,-27,-28,-29,69,-55,-50,-51,-52,-53,-54,69,69,69,69,-55,69,69,-56,69,127,69,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,69,69,-49,69,-30,69,69,69,69,69,164,-36,-67,69,69,-57,69,-55,69,-58,69,-31,69,69,69,-32,69,69,]),'VOID':([20,21,22,86,120,122,123,124,147,150,172,188,209,219,229,239,241,242,244,245,],[-75,-76,-77,126,126,126,-80,153,126,-79,-84,-82,-85,-83,-91,-90,-87,-89,-86,-88,]),'LT':([23,33,36,38,39,40,41,42,52,53,56,58,61,62,77,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[48,70,-55,-50,-51,-52,-53,-54,70,70,70,70,-55,70,114,70,-56,70,70,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,70,70,-49,70,70,70,70,70,70,-36,-67,70,70,-57,70,-55,70,-58,70,-31,70,70,70,-32,70,70,]),'SEMICOLON':([25,32,33,36,38,39,40,41,42,53,59,61,62,81,84,88,95,99,102,103,104,105,106,107,108,109,110,111,112,113,115,138,139,141,143,144,154,158,159,160,163,165,169,186,193,201,205,216,],[50,-16,64,-55,-50,-51,-52,-53,-54,93,99,-55,-15,-56,-61,128,134,-18,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,162,-17,-14,-36,-67,172,177,178,179,-13,-57,188,-58,209,-31,219,-32,]),'ADD':([28,],[54,]),'RPAREN':([29,36,38,39,40,41,42,51,55,56,58,78,80,81,84,90,91,102,103,104,105,106,107,108,109,110,111,112,113,115,117,129,133,135,136,143,144,145,148,157,162,165,166,168,170,174,175,181,182,183,184,186,190,191,192,194,195,201,206,208,215,216,236,],[-70,-55,-50,-51,-52,-53,-54,-65,95,-69,98,115,-70,-56,-61,130,-64,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,144,-66,159,-68,160,-36,-67,165,-65,-63,-21,-57,186,187,-65,-65,-65,199,-55,-20,201,-58,-65,207,-65,210,211,-31,220,222,-19,-32,243,]),'COMMA':([29,36,38,39,40,41,42,51,55,56,80,81,84,90,91,102,103,104,105,106,107,108,109,110,111,112,113,115,117,129,135,143,144,148,157,165,168,170,174,175,185,186,190,191,192,194,195,201,202,203,206,208,216,228,],[-70,-55,-50,-51,-52,-53,-54,-65,96,-69,-70,-56,-61,131,-64,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,96,-66,-68,-36,-67,-65,-63,-57,131,-65,-65,-65,-35,-58,-65,131,-65,131,131,-31,217,-34,131,131,-32,-33,]),'WRITELINE':([30,],[57,]),'PLUS':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[65,-55,-50,-51,-52,-53,-54,65,65,65,65,-55,65,65,-56,65,65,-39,-40,-41,-42,65,65,65,65,65,65,65,65,-49,65,65,65,65,65,65,-36,-67,65,65,-57,65,-55,65,-58,65,-31,65,65,65,-32,65,65,]),'TIMES':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[67,-55,-50,-51,-52,-53,-54,67,67,67,67,-55,67,67,-56,67,67,67,67,-41,-42,67,67,67,67,67,67,67,67,-49,67,67,67,67,67,67,-36,-67,67,67,-57,67,-55,67,-58,67,-31,67,67,67,-32,67,67,]),'DIVIDE':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[68,-55,-50,-51,-52,-53,-54,68,68,68,68,-55,68,68,-56,68,68,68,68,-41,-42,68,68,68,68,68,68,68,68,-49,68,68,68,68,68,68,-36,-67,68,68,-57,68,-55,68,-58,68,-31,68,68,68,-32,68,68,]),'GE':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[71,-55,-50,-51,-52,-53,-54,71,71,71,71,-55,71,71,-56,71,71,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,71,71,-49,71,71,71,71,71,71,-36,-67,71,71,-57,71,-55,71,-58,71,-31,71,71,71,-32,71,71,]),'LE':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[72,-55,-50,-51,-52,-53,-54,72,72,72,72,-55,72,72,-56,72,72,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,72,72,-49,72,72,72,72,72,72,-36,-67,72,72,-57,72,-55,72,-58,72,-31,72,72,72,-32,72,72,]),'EQ':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[73,-55,-50,-51,-52,-53,-54,73,73,73,73,-55,73,73,-56,73,73,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,73,73,-49,73,73,73,73,73,73,-36,-67,73,73,-57,73,-55,73,-58,73,-31,73,73,73,-32,73,73,]),'NE':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[74,-55,-50,-51,-52,-53,-54,74,74,74,74,-55,74,74,-56,74,74,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,74,74,-49,74,74,74,74,74,74,-36,-67,74,74,-57,74,-55,74,-58,74,-31,74,74,74,-32,74,74,]),'AND':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[75,-55,-50,-51,-52,-53,-54,75,75,75,75,-55,75,75,-56,-61,75,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,75,-49,75,75,75,75,75,75,-36,-67,75,75,-57,75,-55,75,-58,75,-31,75,75,75,-32,75,75,]),'OR':([33,36,38,39,40,41,42,52,53,56,58,61,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,115,116,133,135,136,139,141,143,144,158,163,165,166,182,183,186,193,201,203,205,215,216,228,236,],[76,-55,-50,-51,-52,-53,-54,76,76,76,76,-55,76,76,-56,-61,76,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,76,76,76,76,76,76,-36,-67,76,76,-57,76,-55,76,-58,76,-31,76,76,76,-32,76,76,]),'RBRACKET':([36,38,39,40,41,42,52,81,84,102,103,104,105,106,107,108,109,110,111,112,113,115,116,143,144,165,186,201,216,],[-55,-50,-51,-52,-53,-54,92,-56,-61,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-59,-60,-49,143,-36,-67,-57,-58,-31,-32,]),'LBRACE':([47,85,98,130,164,187,198,199,207,210,211,220,222,243,],[86,120,137,156,185,204,212,214,221,223,224,230,232,246,]),'READLINE':([82,],[118,]),'PARSE':([83,],[119,]),'ELSE':([180,248,],[198,198,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'declarations':([0,137,156,204,212,214,221,223,224,230,232,246,],[2,161,176,218,225,227,231,233,234,238,240,247,]),'declaration':([0,2,137,156,161,176,204,212,214,218,221,223,224,225,227,230,231,232,233,234,238,240,246,247,],[3,24,3,3,24,24,3,3,3,24,3,3,3,24,24,3,24,3,24,24,24,24,3,24,]),'type':([0,2,32,48,51,86,114,120,122,124,131,137,147,148,156,161,170,174,175,176,190,192,204,212,214,218,221,223,224,225,227,230,231,232,233,234,238,240,246,247,],[4,4,60,87,89,125,142,125,125,151,89,4,125,89,4,4,89,89,89,4,89,89,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'access_modifier':([0,2,86,120,122,137,147,156,161,176,204,212,214,218,221,223,224,225,227,230,231,232,233,234,238,240,246,247,],[10,10,124,124,124,10,124,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'list_type':([0,2,32,48,51,86,114,120,122,124,131,137,147,148,156,161,170,174,175,176,190,192,204,212,214,218,221,223,224,225,227,230,231,232,233,234,238,240,246,247,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'expression':([9,26,27,29,31,32,35,37,45,49,65,66,67,68,69,70,71,72,73,74,75,76,79,80,94,96,97,99,101,132,140,146,162,173,185,189,200,217,226,],[33,52,53,56,58,62,78,81,84,88,102,103,104,105,106,107,108,109,110,111,112,113,116,56,133,135,136,139,141,158,163,166,183,193,203,205,215,228,236,]),'args':([29,80,],[55,117,]),'for_init':([32,],[59,]),'params':([51,148,170,174,175,190,192,],[90,168,191,194,195,206,208,]),'param':([51,131,148,170,174,175,190,192,],[91,157,91,91,91,91,91,91,]),'class_members':([86,120,],[122,147,]),'class_member':([86,120,122,147,],[123,123,150,150,]),'for_cond':([99,],[138,]),'for_iter':([162,],[181,]),'else_part':([180,248,],[197,249,]),'list_elements':([185,],[202,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> declarations','program',1,'p_program','syntax.py',92),
+  ('declarations -> declarations declaration','declarations',2,'p_declarations_multiple','syntax.py',100),
+  ('declarations -> declaration','declarations',1,'p_declarations_single','syntax.py',105),
+  ('declarations -> <empty>','declarations',0,'p_declarations_empty','syntax.py',109),
+  ('declaration -> type ID ASSIGN expression SEMICOLON','declaration',5,'p_declaration_init','syntax.py',136),
+  ('declaration -> type ID SEMICOLON','declaration',3,'p_declaration_noinit','syntax.py',141),
+  ('declaration -> CONSOLE DOT WRITELINE LPAREN expression RPAREN SEMICOLON','declaration',7,'p_declaration_print','syntax.py',148),
+  ('declaration -> IF LPAREN expression RPAREN LBRACE declarations RBRACE else_part','declaration',8,'p_declaration_if_else','syntax.py',155),
+  ('else_part -> ELSE LBRACE declarations RBRACE','else_part',4,'p_else_part_else','syntax.py',160),
+  ('else_part -> ELSE IF LPAREN expression RPAREN LBRACE declarations RBRACE else_part','else_part',9,'p_else_part_elseif','syntax.py',165),
+  ('else_part -> <empty>','else_part',0,'p_else_part_empty','syntax.py',170),
+  ('declaration -> FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_iter RPAREN LBRACE declarations RBRACE','declaration',11,'p_declaration_for','syntax.py',176),
+  ('for_init -> type ID ASSIGN expression','for_init',4,'p_for_init_decl','syntax.py',182),
+  ('for_init -> ID ASSIGN expression','for_init',3,'p_for_init_assign','syntax.py',186),
+  ('for_init -> expression','for_init',1,'p_for_init_expr','syntax.py',190),
+  ('for_init -> <empty>','for_init',0,'p_for_init_empty','syntax.py',194),
+  ('for_cond -> expression','for_cond',1,'p_for_cond_expr','syntax.py',199),
+  ('for_cond -> <empty>','for_cond',0,'p_for_cond_empty','syntax.py',203),
+  ('for_iter -> ID ASSIGN expression','for_iter',3,'p_for_iter_assign','syntax.py',208),
+  ('for_iter -> expression','for_iter',1,'p_for_iter_expr','syntax.py',212),
+  ('for_iter -> <empty>','for_iter',0,'p_for_iter_empty','syntax.py',216),
+  ('type -> INT','type',1,'p_type','syntax.py',222),
+  ('type -> FLOAT','type',1,'p_type','syntax.py',223),
+  ('type -> BOOL','type',1,'p_type','syntax.py',224),
+  ('type -> STRING','type',1,'p_type','syntax.py',225),
+  ('type -> CHAR','type',1,'p_type','syntax.py',226),
+  ('type -> VAR','type',1,'p_type','syntax.py',227),
+  ('type -> DOUBLE','type',1,'p_type','syntax.py',228),
+  ('type -> list_type','type',1,'p_type','syntax.py',229),
+  ('list_type -> LIST LT type GT','list_type',4,'p_list_type','syntax.py',234),
+  ('expression -> NEW LIST LT type GT LPAREN RPAREN','expression',7,'p_expression_new_list','syntax.py',239),
+  ('expression -> NEW LIST LT type GT LBRACE list_elements RBRACE','expression',8,'p_expression_new_list_init','syntax.py',244),
+  ('list_elements -> list_elements COMMA expression','list_elements',3,'p_list_elements_multiple','syntax.py',249),
+  ('list_elements -> expression','list_elements',1,'p_list_elements_single','syntax.py',254),
+  ('list_elements -> <empty>','list_elements',0,'p_list_elements_empty','syntax.py',258),
+  ('expression -> ID LBRACKET expression RBRACKET','expression',4,'p_expression_list_access','syntax.py',263),
+  ('declaration -> ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLON','declaration',7,'p_declaration_list_assign','syntax.py',268),
+  ('declaration -> ID DOT ADD LPAREN expression RPAREN SEMICOLON','declaration',7,'p_declaration_list_add','syntax.py',274),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_binop','syntax.py',281),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_binop','syntax.py',282),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_binop','syntax.py',283),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_binop','syntax.py',284),
+  ('expression -> expression GT expression','expression',3,'p_expression_relop','syntax.py',288),
+  ('expression -> expression LT expression','expression',3,'p_expression_relop','syntax.py',289),
+  ('expression -> expression GE expression','expression',3,'p_expression_relop','syntax.py',290),
+  ('expression -> expression LE expression','expression',3,'p_expression_relop','syntax.py',291),
+  ('expression -> expression EQ expression','expression',3,'p_expression_relop','syntax.py',292),
+  ('expression -> expression NE expression','expression',3,'p_expression_relop','syntax.py',293),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_group','syntax.py',297),
+  ('expression -> INT_CONST','expression',1,'p_expression_number','syntax.py',301),
+  ('expression -> FLOAT_CONST','expression',1,'p_expression_number','syntax.py',302),
+  ('expression -> TRUE','expression',1,'p_expression_bool','syntax.py',306),
+  ('expression -> FALSE','expression',1,'p_expression_bool','syntax.py',307),
+  ('expression -> STRING_CONST','expression',1,'p_expression_string','syntax.py',311),
+  ('expression -> ID','expression',1,'p_expression_id','syntax.py',315),
+  ('expression -> MINUS expression','expression',2,'p_expression_negative','syntax.py',320),
+  ('expression -> CONSOLE DOT READLINE LPAREN RPAREN','expression',5,'p_expression_readline','syntax.py',325),
+  ('expression -> INT DOT PARSE LPAREN expression RPAREN','expression',6,'p_expression_parse_readline','syntax.py',330),
+  ('expression -> expression AND expression','expression',3,'p_expression_and','syntax.py',335),
+  ('expression -> expression OR expression','expression',3,'p_expression_or','syntax.py',340),
+  ('expression -> NOT expression','expression',2,'p_expression_not','syntax.py',345),
+  ('declaration -> type ID LPAREN params RPAREN LBRACE declarations RBRACE','declaration',8,'p_declaration_function','syntax.py',351),
+  ('params -> params COMMA param','params',3,'p_params_multiple','syntax.py',356),
+  ('params -> param','params',1,'p_params_single','syntax.py',361),
+  ('params -> <empty>','params',0,'p_params_empty','syntax.py',365),
+  ('param -> type ID','param',2,'p_param','syntax.py',369),
+  ('expression -> ID LPAREN args RPAREN','expression',4,'p_expression_func_call','syntax.py',374),
+  ('args -> args COMMA expression','args',3,'p_args_multiple','syntax.py',380),
+  ('args -> expression','args',1,'p_args_single','syntax.py',385),
+  ('args -> <empty>','args',0,'p_args_empty','syntax.py',389),
+  ('declaration -> ID LPAREN args RPAREN SEMICOLON','declaration',5,'p_declaration_func_call','syntax.py',394),
+  ('declaration -> RETURN expression SEMICOLON','declaration',3,'p_declaration_return','syntax.py',401),
+  ('declaration -> access_modifier CLASS ID LBRACE class_members RBRACE','declaration',6,'p_declaration_class','syntax.py',408),
+  ('declaration -> CLASS ID LBRACE class_members RBRACE','declaration',5,'p_declaration_class_no_modifier','syntax.py',413),
+  ('access_modifier -> PUBLIC','access_modifier',1,'p_access_modifier','syntax.py',420),
+  ('access_modifier -> PRIVATE','access_modifier',1,'p_access_modifier','syntax.py',421),
+  ('access_modifier -> PROTECTED','access_modifier',1,'p_access_modifier','syntax.py',422),
+  ('access_modifier -> <empty>','access_modifier',0,'p_access_modifier_empty','syntax.py',425),
+  ('class_members -> class_members class_member','class_members',2,'p_class_members_multiple','syntax.py',430),
+  ('class_members -> class_member','class_members',1,'p_class_members_single','syntax.py',435),
+  ('class_members -> <empty>','class_members',0,'p_class_members_empty','syntax.py',439),
+  ('class_member -> access_modifier type ID SEMICOLON','class_member',4,'p_class_member_field','syntax.py',445),
+  ('class_member -> access_modifier type ID ASSIGN expression SEMICOLON','class_member',6,'p_class_member_field_init','syntax.py',450),
+  ('class_member -> type ID SEMICOLON','class_member',3,'p_class_member_field_no_modifier','syntax.py',455),
+  ('class_member -> type ID ASSIGN expression SEMICOLON','class_member',5,'p_class_member_field_init_no_modifier','syntax.py',460),
+  ('class_member -> access_modifier type ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',9,'p_class_member_method','syntax.py',467),
+  ('class_member -> type ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',8,'p_class_member_method_no_modifier','syntax.py',472),
+  ('class_member -> access_modifier VOID ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',9,'p_class_member_void_method','syntax.py',479),
+  ('class_member -> VOID ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',8,'p_class_member_void_method_no_modifier','syntax.py',484),
+  ('class_member -> access_modifier ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',8,'p_class_member_constructor','syntax.py',491),
+  ('class_member -> ID LPAREN params RPAREN LBRACE declarations RBRACE','class_member',7,'p_class_member_constructor_no_modifier','syntax.py',496),
+  ('declaration -> ID ASSIGN expression SEMICOLON','declaration',4,'p_declaration_assign','syntax.py',502),
+]
+_firma_gramatica = '9964285ab350cb3eaa3c5296cc9109fc5c383b57'
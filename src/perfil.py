@@ -0,0 +1,177 @@
+# -------------------------------------------------------------
+# perfil.py - Medición de dónde se va el tiempo del análisis
+#
+# Un Perfil acumula, para un análisis (o un lote):
+# - por fase ('lex', 'syntax', 'semantic', 'cache', 'logs'): llamadas,
+#   tiempo de pared y tiempo de CPU del hilo que la ejecuta;
+# - por regla p_* de syntax.py: reducciones y tiempo acumulado de su acción;
+# - por tipo de nodo de la inferencia de tipos: reglas aplicadas (sin
+#   contar los tipos que salen del caché de InferenciaTipos).
+# Sin perfil (Analizador(perfil=None), lo normal) no se mide nada: el
+# parser y las reglas de inferencia instrumentados son copias que solo se
+# arman al perfilar. Se usa con --profile en la CLI y desde la GUI; con
+# detalle=False solo mide las fases (los tiempos por fase de lote.py).
+# -------------------------------------------------------------
+
+import copy
+import json
+import time
+from contextlib import contextmanager
+
+FASES = ("lex", "syntax", "semantic", "cache", "logs")
+
+
+class Perfil:
+    """
+    Acumulador de mediciones. Lo llena un solo hilo (el del análisis);
+    a_dict() arma el reporte y sumar() combina reportes (por ejemplo, los
+    de los procesos de un lote).
+    Con detalle=False no instrumenta el parser ni la inferencia: solo se
+    miden las fases.
+    """
+
+    def __init__(self, detalle=True):
+        self.detalle = detalle
+        # fase -> [llamadas, pared, cpu]
+        self.fases = {}
+        # nombre de la regla p_* -> [reducciones, segundos]
+        self.reglas = {}
+        # tipo de nodo ('+', 'func_call', ...) -> reglas de inferencia aplicadas
+        self.inferencia = {}
+
+    # ---------- Fases ----------
+
+    @contextmanager
+    def fase(self, nombre):
+        """Mide el bloque como una llamada de la fase nombre."""
+        pared, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.agregar_fase(nombre, time.perf_counter() - pared, time.thread_time() - cpu)
+
+    def agregar_fase(self, nombre, pared, cpu, llamadas=1):
+        acumulado = self.fases.setdefault(nombre, [0, 0.0, 0.0])
+        acumulado[0] += llamadas
+        acumulado[1] += pared
+        acumulado[2] += cpu
+
+    @contextmanager
+    def escritura_logs(self, escritor):
+        """
+        Mide como fase 'logs' lo que tarda el hilo de escritor (un EscritorLogs,
+        ver registro.py) en escribir los logs guardados dentro del bloque.
+        Al salir espera a que se terminen de escribir.
+        """
+        antes = dict(escritor.estadisticas)
+        yield
+        escritor.vaciar()
+        despues = escritor.estadisticas
+        if despues["logs"] > antes["logs"]:
+            self.agregar_fase("logs", despues["pared"] - antes["pared"], despues["cpu"] - antes["cpu"],
+                              despues["logs"] - antes["logs"])
+
+    # ---------- Reglas del parser ----------
+
+    def instrumentar_parser(self, parser):
+        """
+        Retorna una copia del parser (comparte las tablas LALR) en la que cada
+        regla p_* cuenta sus reducciones y el tiempo de su acción.
+        Sin detalle retorna el mismo parser.
+        """
+        if not self.detalle:
+            return parser
+        propio = copy.copy(parser)
+        producciones = []
+        for produccion in parser.productions:
+            copia = copy.copy(produccion)
+            if produccion.callable is not None:
+                copia.callable = self._regla_medida(produccion.callable)
+            producciones.append(copia)
+        propio.productions = producciones
+        return propio
+
+    def _regla_medida(self, regla):
+        # Una misma función p_* puede atender varias producciones: se acumulan juntas
+        acumulado = self.reglas.setdefault(regla.__name__, [0, 0.0])
+        reloj = time.perf_counter
+
+        def medida(p):
+            inicio = reloj()
+            regla(p)
+            acumulado[0] += 1
+            acumulado[1] += reloj() - inicio
+        return medida
+
+    # ---------- Inferencia de tipos ----------
+
+    def instrumentar_reglas_inferencia(self, reglas):
+        """
+        Retorna una copia de REGLAS_INFERENCIA (semantic.py) en la que cada
+        regla cuenta cuántas veces se aplica a su tipo de nodo.
+        Sin detalle retorna las mismas reglas.
+        """
+        if not self.detalle:
+            return reglas
+        return {tipo: (self._regla_contada(tipo, regla), n) for tipo, (regla, n) in reglas.items()}
+
+    def _regla_contada(self, tipo, regla):
+        conteo = self.inferencia
+        conteo.setdefault(tipo, 0)
+
+        def contada(*argumentos):
+            conteo[tipo] += 1
+            return regla(*argumentos)
+        return contada
+
+    # ---------- Reporte ----------
+
+    def a_dict(self):
+        """Reporte serializable en JSON (ver guardar_json)."""
+        return {
+            "fases": {fase: {"llamadas": n, "pared": pared, "cpu": cpu}
+                      for fase, (n, pared, cpu) in self.fases.items()},
+            "reglas": {nombre: {"reducciones": n, "segundos": segundos}
+                       for nombre, (n, segundos) in sorted(self.reglas.items()) if n},
+            "inferencia": {tipo: n for tipo, n in sorted(self.inferencia.items()) if n},
+        }
+
+    def sumar(self, reporte):
+        """Agrega un reporte de a_dict() (de otro Perfil, u otro proceso) a este."""
+        for fase, datos in reporte["fases"].items():
+            self.agregar_fase(fase, datos["pared"], datos["cpu"], datos["llamadas"])
+        for nombre, datos in reporte["reglas"].items():
+            acumulado = self.reglas.setdefault(nombre, [0, 0.0])
+            acumulado[0] += datos["reducciones"]
+            acumulado[1] += datos["segundos"]
+        for tipo, n in reporte["inferencia"].items():
+            self.inferencia[tipo] = self.inferencia.get(tipo, 0) + n
+
+    def guardar_json(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.a_dict(), f, indent=2)
+
+    def formatear(self, limite_reglas=15):
+        """
+        Retorna el reporte como lista de renglones: las fases, las limite_reglas
+        reglas del parser con más tiempo y las llamadas de inferencia por tipo de nodo.
+        """
+        lineas = ["--- Perfil ---", f"{'fase':<12}{'llamadas':>10}{'pared ms':>12}{'CPU ms':>12}"]
+        orden = [f for f in FASES if f in self.fases] + sorted(f for f in self.fases if f not in FASES)
+        for fase in orden:
+            n, pared, cpu = self.fases[fase]
+            lineas.append(f"{fase:<12}{n:>10}{pared * 1000:>12.2f}{cpu * 1000:>12.2f}")
+        reglas = sorted(((d[1], nombre, d[0]) for nombre, d in self.reglas.items() if d[0]), reverse=True)
+        if reglas:
+            total = sum(segundos for segundos, _, _ in reglas)
+            lineas.append(f"{'regla':<36}{'reducciones':>12}{'acción ms':>12}{'%':>7}")
+            for segundos, nombre, n in reglas[:limite_reglas]:
+                lineas.append(f"{nombre:<36}{n:>12}{segundos * 1000:>12.2f}{100 * segundos / total:>7.1f}")
+            if len(reglas) > limite_reglas:
+                lineas.append(f"... {len(reglas) - limite_reglas} reglas más")
+        inferencia = sorted(((n, tipo) for tipo, n in self.inferencia.items() if n), reverse=True)
+        if inferencia:
+            lineas.append(f"{'inferencia (tipo de nodo)':<36}{'llamadas':>12}")
+            for n, tipo in inferencia:
+                lineas.append(f"{tipo:<36}{n:>12}")
+        return lineas
@@ -0,0 +1,261 @@
+# -------------------------------------------------------------
+# registro.py - Escritura de logs en segundo plano
+#
+# Los guardar_log_* de main.py solo encolan el resultado y retornan el
+# nombre del archivo; un hilo escritor vacía la cola por tandas, escribe
+# los archivos y aplica la retención de logs/ (antigüedad y tamaño total).
+# La variable de entorno ANALIZADOR_LOGS elige dónde se guardan:
+#   texto (por defecto)  archivos .txt como siempre
+#   sqlite               registros estructurados en el almacén (almacen.py)
+#   ambos                las dos cosas
+#   0                    no se escribe nada
+# -------------------------------------------------------------
+
+import atexit
+import gzip
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+CARPETA_LOGS = "logs"
+# Logs encolados como máximo; si el disco no da abasto, guardar() espera
+MAX_PENDIENTES = 64
+# Retención: se borran los logs más viejos que MAX_DIAS_LOGS y, si aún así
+# la carpeta supera MAX_BYTES_LOGS, los más antiguos hasta quedar por debajo
+MAX_DIAS_LOGS = 30
+MAX_BYTES_LOGS = 50 * 1024 * 1024
+# Con COMPRIMIR_LOGS cada log se escribe directamente como .txt.gz
+COMPRIMIR_LOGS = False
+
+# Prefijos de los archivos que maneja la retención (no toca nada más de logs/)
+TIPOS_LOG = ("lexico", "sintactico", "semantico")
+
+
+def _opciones_entorno():
+    # Opciones de EscritorLogs según ANALIZADOR_LOGS
+    modo = os.environ.get("ANALIZADOR_LOGS", "texto").lower()
+    if modo in ("0", "no", "false", "off"):
+        return {"habilitado": False}
+    if modo not in ("sqlite", "ambos"):
+        return {}
+    # almacen.py (y sqlite3) solo se importa si se usa el almacén
+    from almacen import RUTA_ALMACEN
+    if modo == "sqlite":
+        return {"texto": False, "almacen": RUTA_ALMACEN}
+    return {"almacen": RUTA_ALMACEN}
+
+
+class EscritorLogs:
+    """
+    Cola acotada más un hilo escritor. guardar() reserva un nombre único y
+    retorna enseguida; el hilo se crea con el primer log y al salir del
+    programa se esperan los logs pendientes.
+    - texto: escribe cada log como archivo en la carpeta.
+    - almacen: ruta de la base SQLite donde además (o en su lugar) se
+      agregan los errores como registros estructurados; None para no usarla.
+    """
+
+    def __init__(self, carpeta=CARPETA_LOGS, max_pendientes=MAX_PENDIENTES, max_dias=MAX_DIAS_LOGS,
+                 max_bytes=MAX_BYTES_LOGS, comprimir=COMPRIMIR_LOGS, habilitado=True,
+                 texto=True, almacen=None):
+        self.carpeta = carpeta
+        self.max_dias = max_dias
+        self.max_bytes = max_bytes
+        self.comprimir = comprimir
+        self.habilitado = habilitado and (texto or almacen is not None)
+        self.texto = texto
+        self.almacen = almacen
+        self._almacen = None
+        self.errores = []
+        # Logs escritos y tiempo de pared y de CPU que llevó escribirlos (para perfil.py)
+        self.estadisticas = {"logs": 0, "pared": 0.0, "cpu": 0.0}
+        self._cola = queue.Queue(max_pendientes)
+        self._lock = threading.Lock()
+        self._hilo = None
+        self._atexit_registrado = False
+        # Nombres ya usados en este proceso en el segundo actual, para no pisarlos
+        self._segundo = None
+        self._usados = set()
+
+    def _reservar_nombre(self, tipo, usuario):
+        fecha_hora = datetime.now().strftime("%Y%m%d-%H%M%S")
+        extension = ".txt.gz" if self.comprimir else ".txt"
+        base = f"{self.carpeta}/{tipo}-{usuario}-{fecha_hora}"
+        with self._lock:
+            if fecha_hora != self._segundo:
+                self._segundo = fecha_hora
+                self._usados.clear()
+            nombre, n = base + extension, 1
+            while nombre in self._usados:
+                n += 1
+                nombre = f"{base}-{n}{extension}"
+            self._usados.add(nombre)
+        return nombre
+
+    def _iniciar(self):
+        with self._lock:
+            if self._hilo is None:
+                self._hilo = threading.Thread(target=self._escribir, name="escritor-logs", daemon=True)
+                self._hilo.start()
+                if not self._atexit_registrado:
+                    atexit.register(self.cerrar)
+                    self._atexit_registrado = True
+
+    def guardar(self, tipo, encabezado, resultado, usuario, entrada=None, errores=None):
+        """
+        Encola un log y retorna su ruta: el archivo de texto o, si solo se usa
+        el almacén, la base SQLite (None si los logs están deshabilitados).
+        El archivo aparece cuando el hilo escritor procesa la cola; vaciar()
+        espera a que eso ocurra.
+        Para el almacén, errores(resultado) filtra los renglones de error y
+        entrada es el código analizado (se guarda su hash); ambos se evalúan
+        en el hilo escritor.
+        """
+        if not self.habilitado:
+            return None
+        nombre = self._reservar_nombre(tipo, usuario) if self.texto else None
+        self._iniciar()
+        self._cola.put({
+            "tipo": tipo, "nombre": nombre, "encabezado": encabezado, "resultado": resultado,
+            "usuario": usuario, "fecha": time.time(), "entrada": entrada, "errores": errores,
+        })
+        return nombre if self.texto else self.almacen
+
+    def vaciar(self):
+        """Espera a que se escriban todos los logs encolados hasta ahora."""
+        if self._hilo is not None:
+            self._cola.join()
+
+    def cerrar(self):
+        with self._lock:
+            hilo, self._hilo = self._hilo, None
+        if hilo is not None:
+            self._cola.put(None)
+            hilo.join()
+
+    # ---------------------------
+    # Hilo escritor
+    # ---------------------------
+    def _escribir(self):
+        while True:
+            tanda = [self._cola.get()]
+            # Toma todo lo que ya esté encolado para escribirlo junto
+            while True:
+                try:
+                    tanda.append(self._cola.get_nowait())
+                except queue.Empty:
+                    break
+            terminar = None in tanda
+            pendientes = [p for p in tanda if p is not None]
+            pared, cpu = time.perf_counter(), time.thread_time()
+            # Un error de disco no detiene el hilo: se anota y se sigue con el resto
+            try:
+                os.makedirs(self.carpeta, exist_ok=True)
+            except OSError as e:
+                self.errores.append(str(e))
+            if self.texto:
+                for pendiente in pendientes:
+                    try:
+                        self._escribir_archivo(pendiente["nombre"], pendiente["encabezado"], pendiente["resultado"])
+                    except OSError as e:
+                        self.errores.append(str(e))
+                try:
+                    self._aplicar_retencion()
+                except OSError as e:
+                    self.errores.append(str(e))
+            if self.almacen is not None and pendientes:
+                import sqlite3
+                try:
+                    self._agregar_al_almacen(pendientes)
+                except (OSError, sqlite3.Error) as e:
+                    self.errores.append(str(e))
+            # Antes de task_done, para que quien sale de vaciar() vea la tanda contada
+            self.estadisticas["logs"] += len(pendientes)
+            self.estadisticas["pared"] += time.perf_counter() - pared
+            self.estadisticas["cpu"] += time.thread_time() - cpu
+            for _ in tanda:
+                self._cola.task_done()
+            if terminar:
+                if self._almacen is not None:
+                    self._almacen.cerrar()
+                    self._almacen = None
+                return
+
+    def _agregar_al_almacen(self, pendientes):
+        # Toda la tanda va en una sola transacción
+        from almacen import AlmacenLogs, hash_entrada, registros_de_resultado
+        if self._almacen is None:
+            os.makedirs(os.path.dirname(self.almacen) or ".", exist_ok=True)
+            self._almacen = AlmacenLogs(self.almacen)
+        registros = []
+        for p in pendientes:
+            hash_codigo = hash_entrada(p["entrada"]) if p["entrada"] is not None else None
+            errores = p["errores"](p["resultado"]) if p["errores"] is not None else []
+            registros.extend(registros_de_resultado(p["tipo"], p["usuario"], p["fecha"], hash_codigo, errores))
+        self._almacen.agregar(registros)
+
+    def _escribir_archivo(self, nombre, encabezado, resultado):
+        texto = encabezado + "\n".join(resultado)
+        try:
+            self._crear(nombre, texto)
+        except FileExistsError:
+            # Otro proceso usó el mismo nombre en el mismo segundo
+            extension = ".txt.gz" if self.comprimir else ".txt"
+            self._crear(f"{nombre[:-len(extension)]}-{os.getpid()}{extension}", texto)
+
+    def _crear(self, nombre, texto):
+        if self.comprimir:
+            with open(nombre, "xb") as crudo, gzip.open(crudo, "wt", encoding="utf-8") as f:
+                f.write(texto)
+        else:
+            with open(nombre, "x", encoding="utf-8") as f:
+                f.write(texto)
+
+    def _aplicar_retencion(self):
+        archivos = []
+        with os.scandir(self.carpeta) as entradas:
+            for entrada in entradas:
+                if entrada.is_file() and entrada.name.split("-", 1)[0] in TIPOS_LOG:
+                    info = entrada.stat()
+                    archivos.append((info.st_mtime, info.st_size, entrada.path))
+        archivos.sort()
+        limite_fecha = time.time() - self.max_dias * 86400
+        total = sum(tamano for _, tamano, _ in archivos)
+        for fecha, tamano, ruta in archivos:
+            if fecha >= limite_fecha and total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+            total -= tamano
+
+
+_escritor = None
+_escritor_lock = threading.Lock()
+
+
+def escritor_logs():
+    """Retorna el EscritorLogs compartido del proceso (lo crea la primera vez)."""
+    global _escritor
+    with _escritor_lock:
+        if _escritor is None:
+            _escritor = EscritorLogs(**_opciones_entorno())
+        return _escritor
+
+
+def configurar_logs(**opciones):
+    """
+    Reemplaza el escritor compartido por uno con las opciones dadas
+    (carpeta, max_pendientes, max_dias, max_bytes, comprimir, habilitado,
+    texto, almacen); las que no se indican salen de ANALIZADOR_LOGS.
+    Los logs pendientes del anterior se escriben antes del cambio.
+    """
+    global _escritor
+    with _escritor_lock:
+        if _escritor is not None:
+            _escritor.cerrar()
+        _escritor = EscritorLogs(**dict(_opciones_entorno(), **opciones))
+        return _escritor
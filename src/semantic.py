@@ -5,24 +5,145 @@
 # Aquí valido tipos, declaraciones, asignaciones y listas.
 # ---------------------------------------------
 
+from array import array
+from collections import namedtuple
+
+from lexer import Booleano, Identificador
+
+# ---------------------------
+# Tabla de símbolos con ámbitos
+# ---------------------------
+
+# Valor anterior que se registra cuando el nombre no estaba en la tabla
+AUSENTE = object()
+
+
+class TablaSimbolos(dict):
+    """
+    Tabla de símbolos con ámbitos anidados (funciones, clases, bloques de
+    if/else/for) guardada en un solo dict: cada nombre apunta a la entrada
+    visible ({"tipo", "valor", ...}), así que buscar cuesta lo mismo a
+    cualquier profundidad.
+    - registro: cada escritura como (nombre, valor anterior); permite cerrar
+      un ámbito y deshacer lo que hicieron los últimos segmentos analizados
+      (ver incremental.py). Las entradas no se modifican en el lugar: siempre se reemplazan.
+    - abrir_ambito() / cerrar_ambito(): al cerrar se restauran las entradas
+      que el ámbito ocultó o agregó (cerrar_ambito retorna sus nombres); las
+      actualizaciones de entradas de ámbitos exteriores (var inferido dentro
+      de un bloque) se conservan.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.registro = []
+        # Por ámbito abierto: [marca en registro, {nombre: índice de su declaración}, frontera]
+        self._ambitos = []
+
+    @property
+    def nivel(self):
+        """Cantidad de ámbitos abiertos (0: nivel superior del programa)."""
+        return len(self._ambitos)
+
+    def abrir_ambito(self, frontera=False):
+        """
+        Abre un ámbito. Con frontera (cuerpo de función o de clase), sus
+        declaraciones pueden ocultar nombres de los ámbitos exteriores.
+        """
+        self._ambitos.append([len(self.registro), {}, frontera])
+
+    def cerrar_ambito(self):
+        marca, declarados, _ = self._ambitos.pop()
+        conservados = []
+        restaurados = set()
+        for indice in range(len(self.registro) - 1, marca - 1, -1):
+            nombre, anterior = self.registro[indice]
+            if indice >= declarados.get(nombre, len(self.registro)):
+                self._restaurar(nombre, anterior)
+                restaurados.add(nombre)
+            else:
+                conservados.append((nombre, anterior))
+        del self.registro[marca:]
+        self.registro.extend(reversed(conservados))
+        return restaurados
+
+    def declarar(self, nombre, entrada):
+        """Declara nombre en el ámbito actual (aunque oculte uno exterior)."""
+        if self._ambitos:
+            self._ambitos[-1][1].setdefault(nombre, len(self.registro))
+        self.registro.append((nombre, self.get(nombre, AUSENTE)))
+        super().__setitem__(nombre, entrada)
+
+    def __setitem__(self, nombre, entrada):
+        # Reemplaza la entrada visible; si el nombre no existe, lo declara
+        if nombre not in self:
+            self.declarar(nombre, entrada)
+            return
+        self.registro.append((nombre, self[nombre]))
+        super().__setitem__(nombre, entrada)
+
+    def declarado_en_ambito(self, nombre):
+        """
+        Indica si declarar nombre sería una redeclaración: ya está en el ámbito
+        actual o en uno exterior hasta el cuerpo de función o clase que lo contiene.
+        """
+        for _, declarados, frontera in reversed(self._ambitos):
+            if nombre in declarados:
+                return True
+            if frontera:
+                return False
+        return nombre in self
+
+    def deshacer_hasta(self, marca):
+        while len(self.registro) > marca:
+            self._restaurar(*self.registro.pop())
+
+    def clear(self):
+        super().clear()
+        self.registro.clear()
+        self._ambitos.clear()
+
+    def _restaurar(self, nombre, anterior):
+        if anterior is AUSENTE:
+            super().__delitem__(nombre)
+        else:
+            super().__setitem__(nombre, anterior)
+
+
+def renglon_semantico(linea, mensaje):
+    """Renglón del resultado semántico para un mensaje en la línea indicada."""
+    return f"Línea {linea}: {mensaje}"
+
+
+def _ya_declarado(tabla, nombre):
+    if isinstance(tabla, TablaSimbolos):
+        return tabla.declarado_en_ambito(nombre)
+    return nombre in tabla
+
+
+def _declarar_en(tabla, nombre, entrada):
+    if isinstance(tabla, TablaSimbolos):
+        tabla.declarar(nombre, entrada)
+    else:
+        tabla[nombre] = entrada
+
+
 # Tabla de símbolos global para almacenar información de variables declaradas
-symbol_table = {}
+symbol_table = TablaSimbolos()
 
-# Esta función valida la declaración de una variable, su tipo y valor inicial.
-# Permite tipos simples y listas (List<T>), impide la redeclaración,
-# valida el tipo y almacena la variable en la tabla de símbolos si es válida.
-# Devuelve mensajes de éxito o error.
-def validar_declaracion_variable(tipo, nombre, valor, valor_tipo=None):
+def validar_declaracion_variable(tipo, nombre, valor, valor_tipo=None, tabla=None):
     """
     Valida la declaración de una variable, su tipo y valor inicial.
     - Permite tipos simples y listas (List<T>).
-    - Impide la redeclaración de variables.
+    - Impide la redeclaración de variables en el mismo ámbito (si tabla es una TablaSimbolos).
     - Valida que el tipo de la variable sea permitido.
     - Si hay valor inicial, valida que el tipo del valor coincida o sea compatible (casting implícito).
+      valor_tipo puede ser el tipo ya inferido del valor (o su ErrorTipo) para no volver a inferirlo.
     - Para listas, valida que no sean listas de listas y que el tipo de los elementos sea válido.
-    - Almacena la variable en la tabla de símbolos si es válida.
-    - Devuelve mensajes de éxito o error.
+    - Almacena la variable en la tabla de símbolos si es válida (tabla, por defecto symbol_table).
+    - Devuelve (mensaje, es_error) por cada mensaje de éxito o error.
     """
+    if tabla is None:
+        tabla = symbol_table
     tipos_validos = ["int", "float", "bool", "string", "char", "var", "double"]
     mensajes = []
     # Detecta si el tipo es una lista (por ejemplo, ('list_type', 'int'))
@@ -33,31 +154,31 @@ def validar_declaracion_variable(tipo, nombre, valor, valor_tipo=None):
         tipo_interno = tipo[1]
         # No se permiten listas de listas
         if isinstance(tipo_interno, tuple) and tipo_interno[0] == 'list_type':
-            mensajes.append(f"Error semántico: No se permiten listas de listas para la variable '{nombre}'.")
+            mensajes.append((f"Error semántico: No se permiten listas de listas para la variable '{nombre}'.", True))
             return mensajes
         if tipo_interno not in tipos_validos:
-            mensajes.append(f"Error semántico: Tipo de elemento '{tipo_interno}' no válido en la lista para variable '{nombre}'.")
+            mensajes.append((f"Error semántico: Tipo de elemento '{tipo_interno}' no válido en la lista para variable '{nombre}'.", True))
             return mensajes
         tipo_lista_str = f"list<{tipo_interno}>"
-    # Impide redeclaración
-    if nombre in symbol_table:
-        mensajes.append(f"Error semántico: La variable '{nombre}' ya está declarada. No se permite redeclaración.")
+    # Impide redeclaración (en el mismo ámbito, ver TablaSimbolos.declarado_en_ambito)
+    if _ya_declarado(tabla, nombre):
+        mensajes.append((f"Error semántico: La variable '{nombre}' ya está declarada. No se permite redeclaración.", True))
         return mensajes
     # Valida tipo permitido
     if not es_lista and tipo not in tipos_validos:
-        mensajes.append(f"Error semántico: Tipo '{tipo}' no válido para variable '{nombre}'. Solo se permiten: {', '.join(tipos_validos)}.")
+        mensajes.append((f"Error semántico: Tipo '{tipo}' no válido para variable '{nombre}'. Solo se permiten: {', '.join(tipos_validos)}.", True))
         return mensajes
     # Validación de tipo para literales, identificadores y expresiones
     if valor is not None:
         tipo_valor = None
         # Si es una expresión compleja, infiere el tipo
         if valor_tipo is None or valor_tipo == 'EXPR':
-            tipo_valor = inferir_tipo_expresion(valor)
+            tipo_valor = inferir_tipo_expresion(valor, tabla)
         elif valor_tipo == "ID":
-            if valor not in symbol_table:
-                mensajes.append(f"Error semántico: La variable '{valor}' usada en la inicialización de '{nombre}' no está declarada.")
+            if valor not in tabla:
+                mensajes.append((f"Error semántico: La variable '{valor}' usada en la inicialización de '{nombre}' no está declarada.", True))
                 return mensajes
-            tipo_valor = symbol_table[valor]["tipo"]
+            tipo_valor = tabla[valor]["tipo"]
         elif valor_tipo == "INT_CONST":
             tipo_valor = "int"
         elif valor_tipo == "FLOAT_CONST":
@@ -68,273 +189,763 @@ def validar_declaracion_variable(tipo, nombre, valor, valor_tipo=None):
             tipo_valor = "bool"
         else:
             tipo_valor = valor_tipo
+        # Si la inferencia falló, reporta el motivo en lugar de un tipo inválido
+        if isinstance(tipo_valor, ErrorTipo):
+            mensajes.append((f"Error semántico: {tipo_valor.mensaje} en la inicialización de '{nombre}'.", True))
+            return mensajes
         # Validación para listas
         if es_lista:
             # Permite solo asignación de listas del mismo tipo
             if isinstance(tipo_valor, str) and tipo_valor.startswith("list<"):
                 if tipo_valor != tipo_lista_str:
-                    mensajes.append(f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_lista_str} '{nombre}'.")
+                    mensajes.append((f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_lista_str} '{nombre}'.", True))
                     return mensajes
             elif tipo_valor != tipo_interno:
-                mensajes.append(f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_lista_str} '{nombre}'. Solo se permiten listas del tipo correcto.")
+                mensajes.append((f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_lista_str} '{nombre}'. Solo se permiten listas del tipo correcto.", True))
                 return mensajes
         else:
             # Permite casting implícito de int a float/double
             if tipo == "float" and tipo_valor == "int":
-                mensajes.append(f"Casting implícito: Variable '{nombre}' de tipo float inicializada con int. Se convierte automáticamente a float.")
-            elif tipo == "double" and tipo_valor == "int":
-                mensajes.append(f"Casting implícito: Variable '{nombre}' de tipo double inicializada con int. Se convierte automáticamente a double.")
+                mensajes.append((f"Casting implícito: Variable '{nombre}' de tipo float inicializada con int. Se convierte automáticamente a float.", False))
+            elif tipo == "double" and tipo_valor in ["int", "float"]:
+                mensajes.append((f"Casting implícito: Variable '{nombre}' de tipo double inicializada con {tipo_valor}. Se convierte automáticamente a double.", False))
             elif tipo_valor != tipo:
-                mensajes.append(f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo} '{nombre}'.")
+                mensajes.append((f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo} '{nombre}'.", True))
                 return mensajes
     # Guarda la variable en la tabla de símbolos
     if es_lista:
-        symbol_table[nombre] = {"tipo": tipo_lista_str, "valor": valor}
-        mensajes.append(f"Variable declarada correctamente: {tipo_lista_str} {nombre} = {valor}")
+        _declarar_en(tabla, nombre, {"tipo": tipo_lista_str, "valor": valor})
+        mensajes.append((f"Variable declarada correctamente: {tipo_lista_str} {nombre} = {valor}", False))
     else:
-        symbol_table[nombre] = {"tipo": tipo, "valor": valor}
-        mensajes.append(f"Variable declarada correctamente: {tipo} {nombre} = {valor}")
+        _declarar_en(tabla, nombre, {"tipo": tipo, "valor": valor})
+        mensajes.append((f"Variable declarada correctamente: {tipo} {nombre} = {valor}", False))
     return mensajes
 
-# Esta función infiere el tipo de una expresión (nodo del AST).
-# Soporta literales, identificadores, operaciones aritméticas, lógicas y relacionales.
-# Para operaciones, valida compatibilidad de tipos y retorna el tipo resultante.
-# Para llamadas a función y acceso a listas, retorna un tipo por defecto (mejorable).
-# Si no puede inferir el tipo, retorna un mensaje de error.
-def inferir_tipo_expresion(expr):
+
+# ---------------------------
+# Inferencia de tipos de expresiones
+# ---------------------------
+
+class ErrorTipo(namedtuple("ErrorTipo", "codigo mensaje")):
     """
-    Dada una expresión (nodo del AST), infiere y retorna su tipo:
-    - Soporta literales, identificadores, operaciones aritméticas, lógicas y relacionales.
-    - Para operaciones, valida compatibilidad de tipos y retorna el tipo resultante.
-    - Para llamadas a función y acceso a listas, retorna un tipo por defecto (mejorable).
-    - Si no puede inferir el tipo, retorna un mensaje de error.
+    Error de inferencia de tipos, en lugar de un texto que empiece con "Error".
+    - codigo: clase de error ('no_declarada', 'incompatibles', 'logico', ...).
+    - mensaje: descripción para el usuario, sin el prefijo "Error: ".
+    str() da el texto de antes ("Error: <mensaje>").
     """
-    if isinstance(expr, int):
-        return 'int'
-    if isinstance(expr, float):
-        return 'float'
-    if isinstance(expr, str):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"Error: {self.mensaje}"
+
+
+# Tipos numéricos; int, float y double se pueden comparar entre sí
+NUMERICOS = frozenset({'int', 'float', 'double'})
+
+# Tipo resultante de operar dos numéricos distintos (los iguales dan su mismo tipo)
+_PROMOCION_NUMERICA = {
+    ('int', 'float'): 'float', ('float', 'int'): 'float',
+    ('int', 'double'): 'double', ('double', 'int'): 'double',
+    ('float', 'double'): 'double', ('double', 'float'): 'double',
+}
+
+# Profundidad hasta la que InferenciaTipos recorre con llamadas recursivas
+PROFUNDIDAD_RECURSIVA = 200
+
+# Tipo de cada literal según su clase (bool no se confunde con int ni Booleano con str:
+# la clase es exacta)
+_TIPOS_LITERALES = {Booleano: 'bool', bool: 'bool', int: 'int', float: 'float', str: 'string'}
+
+
+def _aritmetica(tabla, nodo, izq, der):
+    # Mismo tipo (o el mismo error, que se propaga igual)
+    if izq == der:
+        return izq
+    # Un error en una subexpresión se propaga sin envolverlo
+    if izq.__class__ is ErrorTipo:
+        return izq
+    if der.__class__ is ErrorTipo:
+        return der
+    # Concatenación: string + cualquier tipo produce string
+    if nodo[0] == '+' and (izq == 'string' or der == 'string'):
         return 'string'
-    if isinstance(expr, bool):
+    # int + float = float, int + double = double, float + double = double
+    tipo = _PROMOCION_NUMERICA.get((izq, der))
+    if tipo:
+        return tipo
+    return ErrorTipo('incompatibles', f"Operación entre tipos incompatibles: {izq} y {der}")
+
+
+def _logica(tabla, nodo, izq, der):
+    if izq == der == 'bool':
         return 'bool'
-    if isinstance(expr, tuple):
-        op = expr[0]
-        # Operaciones binarias aritméticas
-        if op in ['+', '-', '*', '/']:
-            tipo_izq = inferir_tipo_expresion(expr[1])
-            tipo_der = inferir_tipo_expresion(expr[2])
-            if tipo_izq == tipo_der:
-                return tipo_izq
-            # Permite int + float = float, int + double = double, float + double = double
-            if 'double' in (tipo_izq, tipo_der):
-                if tipo_izq in ['int', 'float', 'double'] and tipo_der in ['int', 'float', 'double']:
-                    return 'double'
-            if 'float' in (tipo_izq, tipo_der):
-                if tipo_izq in ['int', 'float'] and tipo_der in ['int', 'float']:
-                    return 'float'
-            return f"Error: Operación entre tipos incompatibles: {tipo_izq} y {tipo_der}"
-        # Operadores lógicos
-        if op in ['and', 'or']:
-            tipo_izq = inferir_tipo_expresion(expr[1])
-            tipo_der = inferir_tipo_expresion(expr[2])
-            if tipo_izq == tipo_der == 'bool':
-                return 'bool'
-            return f"Error: Operador lógico requiere booleanos, se recibió {tipo_izq} y {tipo_der}"
-        # Operador not
-        if op == 'not':
-            tipo = inferir_tipo_expresion(expr[1])
-            if tipo == 'bool':
-                return 'bool'
-            return f"Error: Operador 'not' requiere booleano, se recibió {tipo}"
-        # Operadores relacionales
-        if op in ['>', '<', '>=', '<=', '==', '!=']:
-            tipo_izq = inferir_tipo_expresion(expr[1])
-            tipo_der = inferir_tipo_expresion(expr[2])
-            if tipo_izq == tipo_der or (tipo_izq in ['int', 'float', 'double'] and tipo_der in ['int', 'float', 'double']):
-                return 'bool'
-            return f"Error: Comparación entre tipos incompatibles: {tipo_izq} y {tipo_der}"
-        # Operador unario negativo
-        if op == 'neg':
-            tipo = inferir_tipo_expresion(expr[1])
-            if tipo in ['int', 'float', 'double']:
-                return tipo
-            return f"Error: Operador unario '-' requiere tipo numérico, se recibió {tipo}"
-        # Llamada a función (por defecto retorna int, mejorable)
-        if op == 'func_call':
-            return 'int'
-        # Acceso a lista (por defecto retorna int, mejorable)
-        if op == 'list_access':
-            return 'int'
-        # Parseo de tipo (ej: int.Parse)
-        if op == 'parse':
-            return expr[1]
-        # Lectura de consola
-        if op == 'readline':
-            return 'string'
-    # Si es un identificador declarado, retorna su tipo
-    if isinstance(expr, str) and expr in symbol_table:
-        return symbol_table[expr]['tipo']
-    return f"Error: No se puede inferir el tipo de la expresión {expr}"
+    if izq.__class__ is ErrorTipo:
+        return izq
+    if der.__class__ is ErrorTipo:
+        return der
+    return ErrorTipo('logico', f"Operador lógico requiere booleanos, se recibió {izq} y {der}")
 
-# Tabla de símbolos global para almacenar información de variables declaradas
-symbol_table = {}
 
-def validar_declaracion_variable(tipo, nombre, valor, valor_tipo=None):
+def _relacional(tabla, nodo, izq, der):
+    if izq.__class__ is ErrorTipo:
+        return izq
+    if der.__class__ is ErrorTipo:
+        return der
+    if izq == der or (izq in NUMERICOS and der in NUMERICOS):
+        return 'bool'
+    return ErrorTipo('comparacion', f"Comparación entre tipos incompatibles: {izq} y {der}")
+
+
+def _negacion_logica(tabla, nodo, tipo):
+    if isinstance(tipo, ErrorTipo) or tipo == 'bool':
+        return tipo
+    return ErrorTipo('not', f"Operador 'not' requiere booleano, se recibió {tipo}")
+
+
+def _negativo(tabla, nodo, tipo):
+    if isinstance(tipo, ErrorTipo) or tipo in NUMERICOS:
+        return tipo
+    return ErrorTipo('negativo', f"Operador unario '-' requiere tipo numérico, se recibió {tipo}")
+
+
+def _llamada(tabla, nodo):
+    # Usa el tipo de retorno registrado (por defecto int)
+    entrada = tabla.get(nodo[1])
+    if entrada is not None and entrada.get("funcion"):
+        return entrada['tipo']
+    return 'int'
+
+
+def tipo_elementos(tabla, nombre):
+    """Retorna el tipo de los elementos de la lista nombre, o un ErrorTipo."""
+    entrada = tabla.get(nombre)
+    if entrada is None:
+        return ErrorTipo('no_declarada', f"Variable '{nombre}' no declarada")
+    tipo_lista = entrada['tipo']
+    if isinstance(tipo_lista, str) and tipo_lista.startswith("list<"):
+        return tipo_lista[5:-1]
+    return ErrorTipo('no_es_lista', f"La variable '{nombre}' no es una lista")
+
+
+def _acceso_lista(tabla, nodo):
+    return tipo_elementos(tabla, nodo[1])
+
+
+def _lista_vacia(tabla, nodo):
+    return f"list<{nodo[1]}>"
+
+
+def _lista_con_elementos(tabla, nodo, *tipos):
+    for tipo_elem in tipos:
+        if isinstance(tipo_elem, ErrorTipo):
+            return tipo_elem
+        if tipo_elem != nodo[1] and not (nodo[1] in ('float', 'double') and tipo_elem in ('int', 'float')):
+            return ErrorTipo('elemento_lista', f"Elemento de tipo {tipo_elem} en una lista de {nodo[1]}")
+    return f"list<{nodo[1]}>"
+
+
+def _parseo(tabla, nodo):
+    # int.Parse(...)
+    return nodo[1]
+
+
+def _lectura(tabla, nodo):
+    return 'string'
+
+
+def _desconocida(tabla, nodo):
+    return ErrorTipo('desconocida', f"No se puede inferir el tipo de la expresión {nodo}")
+
+
+# Operandos de new_list_init: los elementos de la lista nodo[2]
+ELEMENTOS = -1
+
+# Por tipo de nodo: (regla, operandos). operandos es cuántos hijos (nodo[1],
+# nodo[2], ...) son operandos, o ELEMENTOS. La regla recibe la tabla de
+# símbolos, el nodo y el tipo ya inferido de cada operando, en orden
+REGLAS_INFERENCIA = {
+    **{op: (_aritmetica, 2) for op in ('+', '-', '*', '/')},
+    **{op: (_relacional, 2) for op in ('>', '<', '>=', '<=', '==', '!=')},
+    'and': (_logica, 2),
+    'or': (_logica, 2),
+    'not': (_negacion_logica, 1),
+    'neg': (_negativo, 1),
+    'func_call': (_llamada, 0),
+    'list_access': (_acceso_lista, 0),
+    'new_list': (_lista_vacia, 0),
+    'new_list_init': (_lista_con_elementos, ELEMENTOS),
+    'parse': (_parseo, 0),
+    'readline': (_lectura, 0),
+}
+_DESCONOCIDA = (_desconocida, 0)
+
+
+class InferenciaTipos:
     """
-    Valida la declaración de una variable, su tipo y valor inicial.
-    - Permite tipos simples y listas (List<T>).
-    - Impide la redeclaración de variables.
-    - Valida que el tipo de la variable sea permitido.
-    - Si hay valor inicial, valida que el tipo del valor coincida o sea compatible (casting implícito).
-    - Para listas, valida que no sean listas de listas y que el tipo de los elementos sea válido.
-    - Almacena la variable en la tabla de símbolos si es válida.
-    - Devuelve mensajes de éxito o error.
+    Infiere el tipo de las expresiones del AST de tuplas.
+    - Cada nodo se despacha con REGLAS_INFERENCIA según su tipo ('+', 'and', 'func_call', ...).
+    - Las expresiones cortas se recorren con llamadas y las más profundas que
+      PROFUNDIDAD_RECURSIVA con una pila propia, así que las cadenas largas
+      (a + b + c + ...) no dependen del límite de recursión.
+    - El tipo de cada nodo y de cada identificador ya inferido se guarda durante
+      todo el análisis. invalidar(nombre) se llama cada vez que cambia la entrada
+      de nombre en la tabla de símbolos, y solo deja de valer lo que la leyó.
+    Retorna el tipo como texto ('int', 'list<int>') o un ErrorTipo.
+    reglas reemplaza a REGLAS_INFERENCIA (perfil.py pasa una copia que cuenta las llamadas).
     """
-    tipos_validos = ["int", "float", "bool", "string", "char", "var", "double"]
-    mensajes = []
-    # Detecta si el tipo es una lista (por ejemplo, ('list_type', 'int'))
-    es_lista = False
-    tipo_lista_str = None
-    if isinstance(tipo, tuple) and tipo[0] == 'list_type':
-        es_lista = True
-        tipo_interno = tipo[1]
-        # No se permiten listas de listas
-        if isinstance(tipo_interno, tuple) and tipo_interno[0] == 'list_type':
-            mensajes.append(f"Error semántico: No se permiten listas de listas para la variable '{nombre}'.")
-            return mensajes
-        if tipo_interno not in tipos_validos:
-            mensajes.append(f"Error semántico: Tipo de elemento '{tipo_interno}' no válido en la lista para variable '{nombre}'.")
-            return mensajes
-        tipo_lista_str = f"list<{tipo_interno}>"
-    # Impide redeclaración
-    if nombre in symbol_table:
-        mensajes.append(f"Error semántico: La variable '{nombre}' ya está declarada. No se permite redeclaración.")
-        return mensajes
-    # Valida tipo permitido
-    if not es_lista and tipo not in tipos_validos:
-        mensajes.append(f"Error semántico: Tipo '{tipo}' no válido para variable '{nombre}'. Solo se permiten: {', '.join(tipos_validos)}.")
-        return mensajes
-    # Validación de tipo para literales, identificadores y expresiones
-    if valor is not None:
-        tipo_valor = None
-        # Si es una expresión compleja, infiere el tipo
-        if valor_tipo is None or valor_tipo == 'EXPR':
-            tipo_valor = inferir_tipo_expresion(valor)
-        elif valor_tipo == "ID":
-            if valor not in symbol_table:
-                mensajes.append(f"Error semántico: La variable '{valor}' usada en la inicialización de '{nombre}' no está declarada.")
-                return mensajes
-            tipo_valor = symbol_table[valor]["tipo"]
-        elif valor_tipo == "INT_CONST":
-            tipo_valor = "int"
-        elif valor_tipo == "FLOAT_CONST":
-            tipo_valor = "float"
-        elif valor_tipo == "STRING_CONST":
-            tipo_valor = "string"
-        elif valor_tipo == "BOOL_CONST":
-            tipo_valor = "bool"
+
+    def __init__(self, tabla, reglas=REGLAS_INFERENCIA):
+        self.tabla = tabla
+        self._reglas = reglas
+        # id(nodo) -> (tipo, número de la llamada a inferir() que lo guardó)
+        self._tipos = {}
+        # nombre -> tipo (o ErrorTipo) de cada identificador ya resuelto
+        self._tipos_nombres = {}
+        # Cantidad de invalidar(nombre) y, por nombre, el número del último
+        self._cambios = 0
+        self._cambio_nombre = {}
+        # Por llamada a inferir(): la expresión (que además mantiene vivos los nodos
+        # guardados, así su id no se reutiliza) y los cambios hasta entonces. Los
+        # nombres que leyó se calculan recién si se vuelve a pedir uno de sus nodos
+        self._raices = []
+        self._cambios_llamada = array('q')
+        self._nombres_llamada = {}
+        self._llamada = -1
+
+    def invalidar(self, nombre=None):
+        """
+        Avisa que cambió la entrada de nombre en la tabla: dejan de valer su tipo
+        y el de los nodos cuya inferencia lo leyó. Sin nombre (la tabla cambió
+        por completo) se descarta todo.
+        """
+        if nombre is None:
+            self._tipos.clear()
+            self._tipos_nombres.clear()
+            self._cambio_nombre.clear()
+            self._raices.clear()
+            del self._cambios_llamada[:]
+            self._nombres_llamada.clear()
+            return
+        self._cambios += 1
+        self._cambio_nombre[nombre] = self._cambios
+        self._tipos_nombres.pop(nombre, None)
+
+    def _vigente(self, llamada):
+        # Un nodo guardado por otra llamada vale si ninguno de los nombres que esa
+        # llamada leyó cambió después
+        if llamada == self._llamada:
+            return True
+        nombres = self._nombres_llamada.get(llamada)
+        if nombres is None:
+            nombres = self._nombres_llamada[llamada] = _nombres_en(self._raices[llamada])
+        cambios = self._cambios_llamada[llamada]
+        cambio_nombre = self._cambio_nombre
+        for nombre in nombres:
+            if cambio_nombre.get(nombre, 0) > cambios:
+                return False
+        return True
+
+    def inferir(self, expr):
+        clase = expr.__class__
+        if clase is tuple:
+            self._llamada = len(self._raices)
+            self._raices.append(expr)
+            self._cambios_llamada.append(self._cambios)
+            try:
+                return self._inferir_nodo(expr, 0)
+            finally:
+                self._llamada = -1
+        return (self._tipos_nombres.get(expr) if clase is Identificador else _TIPOS_LITERALES.get(clase)) \
+            or self._tipo_hoja(expr)
+
+    def _inferir_nodo(self, nodo, profundidad):
+        # Las expresiones comunes son cortas: se recorren con llamadas, que es lo
+        # más rápido; a partir de PROFUNDIDAD_RECURSIVA se sigue con una pila propia
+        guardado = self._tipos.get(id(nodo))
+        if guardado is not None and self._vigente(guardado[1]):
+            return guardado[0]
+        if profundidad >= PROFUNDIDAD_RECURSIVA:
+            return self._inferir_con_pila(nodo)
+        regla, n = self._reglas.get(nodo[0], _DESCONOCIDA)
+        if n == 2:
+            # Operandos que son identificadores ya resueltos o literales: sin más llamadas
+            izq, der = nodo[1], nodo[2]
+            clase = izq.__class__
+            izq = (self._tipos_nombres.get(izq) if clase is Identificador else _TIPOS_LITERALES.get(clase)) \
+                or self._operando(izq, profundidad)
+            clase = der.__class__
+            der = (self._tipos_nombres.get(der) if clase is Identificador else _TIPOS_LITERALES.get(clase)) \
+                or self._operando(der, profundidad)
+            tipo = regla(self.tabla, nodo, izq, der)
+        elif n == 1:
+            tipo = regla(self.tabla, nodo, self._operando(nodo[1], profundidad))
+        elif n == 0:
+            tipo = regla(self.tabla, nodo)
         else:
-            tipo_valor = valor_tipo
-        # Validación para listas
-        if es_lista:
-            # Permite solo asignación de listas del mismo tipo
-            if isinstance(tipo_valor, str) and tipo_valor.startswith("list<"):
-                if tipo_valor != tipo_lista_str:
-                    mensajes.append(f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_lista_str} '{nombre}'.")
-                    return mensajes
-            elif tipo_valor != tipo_interno:
-                mensajes.append(f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_lista_str} '{nombre}'. Solo se permiten listas del tipo correcto.")
-                return mensajes
+            tipo = regla(self.tabla, nodo, *[self._operando(e, profundidad) for e in nodo[2]])
+        self._tipos[id(nodo)] = (tipo, self._llamada)
+        return tipo
+
+    def _operando(self, expr, profundidad):
+        clase = expr.__class__
+        if clase is tuple:
+            return self._inferir_nodo(expr, profundidad + 1)
+        if clase is Identificador:
+            tipo = self._tipos_nombres.get(expr)
+            if tipo is not None:
+                return tipo
         else:
-            # Permite casting implícito de int a float/double
-            if tipo == "float" and tipo_valor == "int":
-                mensajes.append(f"Casting implícito: Variable '{nombre}' de tipo float inicializada con int. Se convierte automáticamente a float.")
-            elif tipo == "double" and tipo_valor == "int":
-                mensajes.append(f"Casting implícito: Variable '{nombre}' de tipo double inicializada con int. Se convierte automáticamente a double.")
-            elif tipo_valor != tipo:
-                mensajes.append(f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo} '{nombre}'.")
-                return mensajes
-    # Guarda la variable en la tabla de símbolos
-    if es_lista:
-        symbol_table[nombre] = {"tipo": tipo_lista_str, "valor": valor}
-        mensajes.append(f"Variable declarada correctamente: {tipo_lista_str} {nombre} = {valor}")
-    else:
-        symbol_table[nombre] = {"tipo": tipo, "valor": valor}
-        mensajes.append(f"Variable declarada correctamente: {tipo} {nombre} = {valor}")
-    return mensajes
+            tipo = _TIPOS_LITERALES.get(clase)
+            if tipo is not None:
+                return tipo
+        return self._tipo_hoja(expr)
 
+    def _inferir_con_pila(self, expr):
+        tipos, tabla, operando, reglas = self._tipos, self.tabla, self._operando, self._reglas
+        llamada = self._llamada
+        # pendientes: nodos por inferir y, después de sus operandos, [nodo, regla, n]
+        # para combinar los n últimos tipos de la pila valores
+        pendientes = [expr]
+        valores = []
+        while pendientes:
+            nodo = pendientes.pop()
+            clase = nodo.__class__
+            if clase is list:
+                nodo, regla, n = nodo
+                if n == 2:
+                    der = valores.pop()
+                    tipo = regla(tabla, nodo, valores.pop(), der)
+                elif n == 1:
+                    tipo = regla(tabla, nodo, valores.pop())
+                elif n == 0:
+                    tipo = regla(tabla, nodo)
+                else:
+                    tipo = regla(tabla, nodo, *valores[-n:])
+                    del valores[-n:]
+                tipos[id(nodo)] = (tipo, llamada)
+                valores.append(tipo)
+            elif clase is tuple:
+                guardado = tipos.get(id(nodo))
+                if guardado is not None and self._vigente(guardado[1]):
+                    valores.append(guardado[0])
+                    continue
+                regla, n = reglas.get(nodo[0], _DESCONOCIDA)
+                # Los operandos se apilan al revés, para inferirlos en orden
+                if n == 2:
+                    pendientes += ([nodo, regla, 2], nodo[2], nodo[1])
+                elif n == 1:
+                    pendientes += ([nodo, regla, 1], nodo[1])
+                elif n == 0:
+                    pendientes.append([nodo, regla, 0])
+                else:
+                    elementos = nodo[2]
+                    pendientes.append([nodo, regla, len(elementos)])
+                    pendientes.extend(reversed(elementos))
+            else:
+                valores.append(operando(nodo, 0))
+        return valores[-1]
 
+    def _tipo_hoja(self, expr):
+        # Los identificadores llegan como Identificador (subclase de str): se busca su
+        # tipo una vez y se guarda por nombre hasta que cambie la tabla
+        if expr.__class__ is Identificador:
+            tipo = self._tipos_nombres.get(expr)
+            if tipo is not None:
+                return tipo
+            entrada = self.tabla.get(expr)
+            if entrada is None:
+                tipo = ErrorTipo('no_declarada', f"Variable '{expr}' no declarada")
+            elif entrada.get("pending_inference"):
+                tipo = ErrorTipo('var_sin_valor', f"Variable 'var' '{expr}' usada antes de asignarle un valor")
+            else:
+                tipo = entrada['tipo']
+            if tipo is not None:
+                self._tipos_nombres[expr] = tipo
+            return tipo
+        tipo = _TIPOS_LITERALES.get(expr.__class__)
+        if tipo is None:
+            if isinstance(expr, str):
+                return 'string'
+            return ErrorTipo('desconocida', f"No se puede inferir el tipo de la expresión {expr}")
+        return tipo
+
+
+def _nombres_en(expr):
+    # Identificadores de la expresión: los nombres que su inferencia pudo leer de la
+    # tabla (también el de func_call y list_access, que la consultan por nodo[1])
+    nombres = set()
+    pendientes = [expr]
+    while pendientes:
+        actual = pendientes.pop()
+        if actual.__class__ is Identificador:
+            nombres.add(actual)
+        elif isinstance(actual, (tuple, list)):
+            pendientes.extend(actual)
+    return frozenset(nombres)
+
+
+def inferir_tipo_expresion(expr, tabla=None):
     """
-    Dada una expresión (nodo del AST), infiere y retorna su tipo:
-    - Soporta literales, identificadores, operaciones aritméticas, lógicas y relacionales.
-    - Para operaciones, valida compatibilidad de tipos y retorna el tipo resultante.
-    - Para llamadas a función y acceso a listas, retorna un tipo por defecto (mejorable).
-    - Si no puede inferir el tipo, retorna un mensaje de error.
+    Dada una expresión (nodo del AST), infiere y retorna su tipo, o un ErrorTipo
+    si no se puede (ver InferenciaTipos). tabla es la tabla de símbolos a
+    consultar (por defecto, symbol_table). Dentro de un análisis conviene usar
+    una sola InferenciaTipos, que guarda los tipos ya inferidos.
     """
-    if isinstance(expr, int):
-        return 'int'
-    if isinstance(expr, float):
-        return 'float'
-    if isinstance(expr, str):
-        return 'string'
-    if isinstance(expr, bool):
-        return 'bool'
-    if isinstance(expr, tuple):
-        op = expr[0]
-        # Operaciones binarias aritméticas
-        if op in ['+', '-', '*', '/']:
-            tipo_izq = inferir_tipo_expresion(expr[1])
-            tipo_der = inferir_tipo_expresion(expr[2])
-            if tipo_izq == tipo_der:
-                return tipo_izq
-            # Permite int + float = float, int + double = double, float + double = double
-            if 'double' in (tipo_izq, tipo_der):
-                if tipo_izq in ['int', 'float', 'double'] and tipo_der in ['int', 'float', 'double']:
-                    return 'double'
-            if 'float' in (tipo_izq, tipo_der):
-                if tipo_izq in ['int', 'float'] and tipo_der in ['int', 'float']:
-                    return 'float'
-            return f"Error: Operación entre tipos incompatibles: {tipo_izq} y {tipo_der}"
-        # Operadores lógicos
-        if op in ['and', 'or']:
-            tipo_izq = inferir_tipo_expresion(expr[1])
-            tipo_der = inferir_tipo_expresion(expr[2])
-            if tipo_izq == tipo_der == 'bool':
-                return 'bool'
-            return f"Error: Operador lógico requiere booleanos, se recibió {tipo_izq} y {tipo_der}"
-        # Operador not
-        if op == 'not':
-            tipo = inferir_tipo_expresion(expr[1])
-            if tipo == 'bool':
-                return 'bool'
-            return f"Error: Operador 'not' requiere booleano, se recibió {tipo}"
-        # Operadores relacionales
-        if op in ['>', '<', '>=', '<=', '==', '!=']:
-            tipo_izq = inferir_tipo_expresion(expr[1])
-            tipo_der = inferir_tipo_expresion(expr[2])
-            if tipo_izq == tipo_der or (tipo_izq in ['int', 'float', 'double'] and tipo_der in ['int', 'float', 'double']):
-                return 'bool'
-            return f"Error: Comparación entre tipos incompatibles: {tipo_izq} y {tipo_der}"
-        # Operador unario negativo
-        if op == 'neg':
-            tipo = inferir_tipo_expresion(expr[1])
-            if tipo in ['int', 'float', 'double']:
-                return tipo
-            return f"Error: Operador unario '-' requiere tipo numérico, se recibió {tipo}"
-        # Llamada a función (por defecto retorna int, mejorable)
-        if op == 'func_call':
-            return 'int'
-        # Acceso a lista (por defecto retorna int, mejorable)
-        if op == 'list_access':
-            return 'int'
-        # Parseo de tipo (ej: int.Parse)
-        if op == 'parse':
-            return expr[1]
-        # Lectura de consola
-        if op == 'readline':
-            return 'string'
-    # Si es un identificador declarado, retorna su tipo
-    if isinstance(expr, str) and expr in symbol_table:
-        return symbol_table[expr]['tipo']
-    return f"Error: No se puede inferir el tipo de la expresión {expr}"
+    return InferenciaTipos(symbol_table if tabla is None else tabla).inferir(expr)
+
+# Tipos numéricos que aceptan casting implícito desde otro tipo
+CASTING_IMPLICITO = {
+    "float": ["int"],
+    "double": ["int", "float"],
+}
+
+
+def _nombre_tipo(tipo):
+    """Representa un tipo del AST como texto (('list_type', 'int') -> 'List<int>')."""
+    if isinstance(tipo, tuple) and tipo[0] == 'list_type':
+        return f"List<{_nombre_tipo(tipo[1])}>"
+    return tipo
+
+
+def _tipo_desde_inferencia(tipo):
+    """Convierte un tipo inferido ('list<int>') al formato del AST (('list_type', 'int'))."""
+    if isinstance(tipo, str) and tipo.startswith("list<"):
+        return ('list_type', tipo[5:-1])
+    return tipo
+
+
+class AnalizadorSemantico:
+    """
+    Recorre una sola vez el AST de tuplas generado por syntax.py.
+    - Cada nodo se despacha según su tipo ('decl_var_init', 'assign', 'for', 'if_else', ...).
+    - Las expresiones completas se pasan a una InferenciaTipos propia del análisis.
+    - Acumula los mensajes en resultado y los errores también en errores; filas_error
+      guarda el índice en resultado de cada error.
+    La línea de cada mensaje se toma de los identificadores (ver Identificador en lexer.py).
+    Cada instancia usa su propia tabla de símbolos (o la que se le pase), así que
+    varios análisis pueden ejecutarse a la vez en distintos hilos. Con una
+    TablaSimbolos, los cuerpos de funciones, clases, if/else y for son ámbitos:
+    lo que se declara adentro no se ve afuera.
+    reglas_inferencia se pasa a InferenciaTipos (ver perfil.py).
+    """
+
+    def __init__(self, tabla=None, reglas_inferencia=REGLAS_INFERENCIA):
+        self.tabla = TablaSimbolos() if tabla is None else tabla
+        self.resultado = []
+        self.errores = []
+        # Índice en resultado de cada mensaje de errores (uno por error, en el mismo orden)
+        self.filas_error = []
+        # Identificador del que salió la línea de cada error (None si el nodo no tenía
+        # ninguno y se usó la última línea conocida); ver lsp.py
+        self.ubicaciones_error = []
+        self.desplazamiento_linea = 0
+        self._linea = 0
+        self._identificador = None
+        self._funcion_actual = None
+        self._inferencia = InferenciaTipos(self.tabla, reglas_inferencia)
+        self._inferir = self._inferencia.inferir
+        self._visitantes = {
+            'decl_var_init': self._visitar_declaracion,
+            'decl_var': self._visitar_declaracion,
+            'field': self._visitar_campo,
+            'field_init': self._visitar_campo,
+            'assign': self._visitar_asignacion,
+            'print': self._visitar_impresion,
+            'if_else': self._visitar_if,
+            'elseif': self._visitar_if,
+            'else': self._visitar_else,
+            'for': self._visitar_for,
+            'function': self._visitar_funcion,
+            'method': self._visitar_metodo,
+            'constructor': self._visitar_constructor,
+            'class': self._visitar_clase,
+            'return': self._visitar_return,
+            'list_assign': self._visitar_asignacion_lista,
+            'list_add': self._visitar_agregar_lista,
+        }
+
+    def analizar(self, arbol, avance=None):
+        """
+        Recorre la lista de declaraciones del programa y retorna (resultado, errores).
+        Si se indica, avance(declaraciones_recorridas, total) se llama antes de cada
+        declaración de nivel superior y puede lanzar una excepción para cancelar.
+        """
+        self._inferencia.invalidar()
+        if avance is None:
+            self._visitar_bloque(arbol)
+            return self.resultado, self.errores
+        for i, nodo in enumerate(arbol or []):
+            avance(i, len(arbol))
+            self._visitar(nodo)
+        return self.resultado, self.errores
+
+    def analizar_segmento(self, declaraciones, desplazamiento_linea=0):
+        """
+        Recorre una parte del programa cuyos identificadores tienen líneas relativas
+        (la primera línea de la parte es desplazamiento_linea + 1). Ver incremental.py.
+        """
+        self.desplazamiento_linea = desplazamiento_linea
+        # La tabla pudo cambiar desde afuera (TablaSimbolos.deshacer_hasta en incremental.py)
+        self._inferencia.invalidar()
+        self._visitar_bloque(declaraciones)
+
+    # ---------- Utilidades ----------
+
+    def _linea_de(self, nodo):
+        # Busca el primer identificador del nodo para conocer la línea; si no hay, usa la última conocida
+        pendientes = [nodo]
+        while pendientes:
+            actual = pendientes.pop()
+            if isinstance(actual, Identificador):
+                self._linea = actual.lineno + self.desplazamiento_linea
+                self._identificador = actual
+                break
+            if isinstance(actual, (tuple, list)):
+                pendientes.extend(reversed(actual))
+        else:
+            self._identificador = None
+        return self._linea
+
+    def _agregar(self, linea, mensaje, error=False):
+        # error lo indica cada visitante: el texto del mensaje no decide nada
+        renglon = self._renglon(linea, mensaje)
+        self.resultado.append(renglon)
+        if error:
+            self.errores.append(renglon)
+            self.filas_error.append(len(self.resultado) - 1)
+            # Cada visitante calcula la línea con _linea_de justo antes de sus mensajes
+            self.ubicaciones_error.append(self._identificador)
+
+    def _renglon(self, linea, mensaje):
+        # incremental.py guarda la línea aparte para desplazarla sin volver a analizar
+        return renglon_semantico(linea, mensaje)
+
+    def _visitar(self, nodo):
+        if isinstance(nodo, tuple):
+            visitante = self._visitantes.get(nodo[0])
+            if visitante:
+                visitante(nodo)
+
+    def _visitar_bloque(self, declaraciones):
+        for nodo in declaraciones or []:
+            self._visitar(nodo)
+
+    def _abrir_ambito(self, frontera=False):
+        if isinstance(self.tabla, TablaSimbolos):
+            self.tabla.abrir_ambito(frontera)
+
+    def _cerrar_ambito(self):
+        if isinstance(self.tabla, TablaSimbolos):
+            # Vuelven a verse las entradas que el ámbito ocultaba
+            for nombre in self.tabla.cerrar_ambito():
+                self._inferencia.invalidar(nombre)
+
+    def _visitar_bloque_en_ambito(self, declaraciones):
+        self._abrir_ambito()
+        try:
+            self._visitar_bloque(declaraciones)
+        finally:
+            self._cerrar_ambito()
+
+    def _declarar(self, linea, tipo, nombre, valor):
+        """Registra una variable (con o sin inicialización) validando su tipo."""
+        self._agregar(linea, f"Tipo '{_nombre_tipo(tipo)}' detectado")
+        if tipo == "var" and valor is None:
+            if not _ya_declarado(self.tabla, nombre):
+                _declarar_en(self.tabla, nombre, {"tipo": "var", "valor": None, "pending_inference": True})
+                self._inferencia.invalidar(nombre)
+            self._agregar(linea, f"Variable '{nombre}' declarada como var sin inicialización. El tipo se inferirá en la primera asignación.")
+            return
+        # El tipo del valor se infiere una sola vez y se pasa a validar_declaracion_variable
+        tipo_valor = self._inferir(valor) if valor is not None else None
+        if tipo == "var":
+            if isinstance(tipo_valor, ErrorTipo):
+                self._agregar(linea, f"Error semántico: {tipo_valor.mensaje} en la inicialización de '{nombre}'.", error=True)
+                return
+            tipo = _tipo_desde_inferencia(tipo_valor)
+        for mensaje, error in validar_declaracion_variable(tipo, nombre, valor, tipo_valor, self.tabla):
+            self._agregar(linea, mensaje, error)
+        self._inferencia.invalidar(nombre)
+
+    def _declarar_parametros(self, linea, params):
+        for tipo, nombre in params:
+            self._declarar(linea, tipo, nombre, None)
+
+    # ---------- Declaraciones y asignaciones ----------
+
+    def _visitar_declaracion(self, nodo):
+        # ('decl_var_init', tipo, nombre, expr) | ('decl_var', tipo, nombre)
+        tipo, nombre = nodo[1], nodo[2]
+        valor = nodo[3] if nodo[0] == 'decl_var_init' else None
+        self._declarar(self._linea_de(nombre), tipo, nombre, valor)
+
+    def _visitar_campo(self, nodo):
+        # ('field', modificador, tipo, nombre) | ('field_init', modificador, tipo, nombre, expr)
+        tipo, nombre = nodo[2], nodo[3]
+        valor = nodo[4] if nodo[0] == 'field_init' else None
+        self._declarar(self._linea_de(nombre), tipo, nombre, valor)
+
+    def _visitar_asignacion(self, nodo):
+        # ('assign', nombre, expr)
+        nombre, valor = nodo[1], nodo[2]
+        linea = self._linea_de(nombre)
+        if nombre not in self.tabla:
+            self._agregar(linea, f"Error semántico: Variable '{nombre}' no declarada antes de la asignación.", error=True)
+            return
+        tipo_var = self.tabla[nombre]["tipo"]
+        tipo_valor = self._inferir(valor)
+        if isinstance(tipo_valor, ErrorTipo):
+            self._agregar(linea, f"Error semántico: {tipo_valor.mensaje} en la asignación a '{nombre}'.", error=True)
+            return
+        # Si la variable es var y pendiente de inferencia, infiere el tipo en la primera asignación
+        if tipo_var == "var" and self.tabla[nombre].get("pending_inference", False):
+            # Se reemplaza la entrada en lugar de modificarla: el registro guarda el valor anterior
+            self.tabla[nombre] = dict(self.tabla[nombre], tipo=tipo_valor, pending_inference=False)
+            self._inferencia.invalidar(nombre)
+            tipo_var = tipo_valor
+            self._agregar(linea, f"Tipo de 'var' inferido como {tipo_valor} en la primera asignación a '{nombre}'.")
+        if tipo_valor in CASTING_IMPLICITO.get(tipo_var, []):
+            self._agregar(linea, f"Casting implícito: Variable '{nombre}' de tipo {tipo_var} asignada con {tipo_valor}. Se convierte automáticamente a {tipo_var}.")
+        elif tipo_var != tipo_valor:
+            self._agregar(linea, f"Error semántico: No se puede asignar valor de tipo {tipo_valor} a variable {tipo_var} '{nombre}'.", error=True)
+        else:
+            self._agregar(linea, f"Asignación correcta: {nombre} = {valor}")
+
+    def _visitar_asignacion_lista(self, nodo):
+        # ('list_assign', nombre, indice, expr)
+        nombre, indice, valor = nodo[1], nodo[2], nodo[3]
+        linea = self._linea_de(nombre)
+        tipo_elem = tipo_elementos(self.tabla, nombre)
+        if isinstance(tipo_elem, ErrorTipo):
+            self._agregar(linea, f"Error semántico: {tipo_elem.mensaje}.", error=True)
+            return
+        self._validar_indice(linea, indice)
+        self._validar_elemento(linea, nombre, tipo_elem, valor, "asignado")
+
+    def _visitar_agregar_lista(self, nodo):
+        # ('list_add', nombre, expr)
+        nombre, valor = nodo[1], nodo[2]
+        linea = self._linea_de(nombre)
+        tipo_elem = tipo_elementos(self.tabla, nombre)
+        if isinstance(tipo_elem, ErrorTipo):
+            self._agregar(linea, f"Error semántico: {tipo_elem.mensaje}.", error=True)
+            return
+        self._validar_elemento(linea, nombre, tipo_elem, valor, "agregado")
+
+    def _validar_indice(self, linea, indice):
+        tipo_indice = self._inferir(indice)
+        if tipo_indice != 'int':
+            self._agregar(linea, f"Error semántico: El índice de una lista debe ser int, se recibió {tipo_indice}.", error=True)
+
+    def _validar_elemento(self, linea, nombre, tipo_elem, valor, accion):
+        tipo_valor = self._inferir(valor)
+        if isinstance(tipo_valor, ErrorTipo):
+            self._agregar(linea, f"Error semántico: {tipo_valor.mensaje} en la lista '{nombre}'.", error=True)
+        elif tipo_valor == tipo_elem or tipo_valor in CASTING_IMPLICITO.get(tipo_elem, []):
+            self._agregar(linea, f"Elemento de tipo {tipo_valor} {accion} correctamente en la lista '{nombre}'.")
+        else:
+            self._agregar(linea, f"Error semántico: No se puede guardar un valor de tipo {tipo_valor} en la lista '{nombre}' de {tipo_elem}.", error=True)
+
+    def _visitar_impresion(self, nodo):
+        # ('print', expr)
+        tipo = self._inferir(nodo[1])
+        if isinstance(tipo, ErrorTipo):
+            self._agregar(self._linea_de(nodo[1]), f"Error semántico: {tipo.mensaje} en Console.WriteLine.", error=True)
+
+    # ---------- Control de flujo ----------
+
+    def _validar_condicion(self, condicion, estructura):
+        if condicion is None:
+            return
+        tipo = self._inferir(condicion)
+        if tipo != 'bool':
+            detalle = tipo.mensaje if isinstance(tipo, ErrorTipo) else f"se recibió {tipo}"
+            self._agregar(self._linea_de(condicion), f"Error semántico: La condición del {estructura} debe ser bool ({detalle}).", error=True)
+
+    def _visitar_if(self, nodo):
+        # ('if_else', cond, cuerpo, else_part) | ('elseif', cond, cuerpo, else_part)
+        self._validar_condicion(nodo[1], "if")
+        self._visitar_bloque_en_ambito(nodo[2])
+        self._visitar(nodo[3])
+
+    def _visitar_else(self, nodo):
+        # ('else', cuerpo)
+        self._visitar_bloque_en_ambito(nodo[1])
+
+    def _visitar_for(self, nodo):
+        # ('for', init, cond, iter, cuerpo): la variable del init solo existe en el for
+        self._abrir_ambito()
+        try:
+            self._visitar(nodo[1])
+            self._validar_condicion(nodo[2], "for")
+            self._visitar(nodo[3])
+            self._visitar_bloque_en_ambito(nodo[4])
+        finally:
+            self._cerrar_ambito()
+
+    # ---------- Funciones y clases ----------
+
+    def _registrar_funcion(self, linea, tipo, nombre):
+        if _ya_declarado(self.tabla, nombre):
+            self._agregar(linea, f"Error semántico: El nombre '{nombre}' ya está declarado. No se permite redeclaración.", error=True)
+            return
+        _declarar_en(self.tabla, nombre, {"tipo": tipo, "valor": None, "funcion": True})
+        self._inferencia.invalidar(nombre)
+        self._agregar(linea, f"Función declarada correctamente: {_nombre_tipo(tipo)} {nombre}")
+
+    def _visitar_cuerpo_funcion(self, linea, tipo, nombre, params, cuerpo):
+        anterior = self._funcion_actual
+        self._funcion_actual = (nombre, tipo)
+        self._abrir_ambito(frontera=True)
+        try:
+            self._declarar_parametros(linea, params)
+            self._visitar_bloque(cuerpo)
+        finally:
+            self._cerrar_ambito()
+            self._funcion_actual = anterior
+
+    def _visitar_funcion(self, nodo):
+        # ('function', tipo, nombre, params, cuerpo)
+        tipo, nombre, params, cuerpo = nodo[1], nodo[2], nodo[3], nodo[4]
+        linea = self._linea_de(nombre)
+        self._registrar_funcion(linea, tipo, nombre)
+        self._visitar_cuerpo_funcion(linea, tipo, nombre, params, cuerpo)
+
+    def _visitar_metodo(self, nodo):
+        # ('method', modificador, tipo, nombre, params, cuerpo)
+        tipo, nombre, params, cuerpo = nodo[2], nodo[3], nodo[4], nodo[5]
+        linea = self._linea_de(nombre)
+        self._registrar_funcion(linea, tipo, nombre)
+        self._visitar_cuerpo_funcion(linea, tipo, nombre, params, cuerpo)
+
+    def _visitar_constructor(self, nodo):
+        # ('constructor', modificador, nombre, params, cuerpo)
+        nombre, params, cuerpo = nodo[2], nodo[3], nodo[4]
+        self._visitar_cuerpo_funcion(self._linea_de(nombre), 'void', nombre, params, cuerpo)
+
+    def _visitar_clase(self, nodo):
+        # ('class', modificador, nombre, miembros)
+        self._agregar(self._linea_de(nodo[2]), f"Clase '{nodo[2]}' detectada")
+        self._abrir_ambito(frontera=True)
+        try:
+            self._visitar_bloque(nodo[3])
+        finally:
+            self._cerrar_ambito()
+
+    def _visitar_return(self, nodo):
+        # ('return', expr): valida el tipo contra el de la función que lo contiene
+        if self._funcion_actual is None:
+            return
+        nombre, tipo_funcion = self._funcion_actual
+        linea = self._linea_de(nodo[1])
+        tipo = self._inferir(nodo[1])
+        if isinstance(tipo, ErrorTipo):
+            self._agregar(linea, f"Error semántico: {tipo.mensaje} en el return de '{nombre}'.", error=True)
+        elif tipo_funcion == 'void':
+            self._agregar(linea, f"Error semántico: La función '{nombre}' es void y no puede retornar un valor.", error=True)
+        elif _tipo_desde_inferencia(tipo) != tipo_funcion and tipo not in CASTING_IMPLICITO.get(tipo_funcion, []):
+            self._agregar(linea, f"Error semántico: La función '{nombre}' debe retornar {_nombre_tipo(tipo_funcion)}, pero retorna {tipo}.", error=True)
+        else:
+            self._agregar(linea, f"Retorno correcto en '{nombre}': {tipo}")
+
 
@@ -1,11 +1,86 @@
+import copy
+import threading
+import types
 import ply.yacc as yacc
-from lexer import tokens
+from lexer import tokens, Booleano
+from tablas import DIRECTORIO_TABLAS, MODULO_PARSETAB, MODULO_PARSETAB_TRAZA, calcular_firma, reglas_de_modulo, sellar_tabla, tabla_vigente
+
+# ---------------------------
+# Sumideros de eventos del parser
+# ---------------------------
+# Cada regla reconocida y cada error de sintaxis se envían a un sumidero como
+# (plantilla, línea, nodos). El texto se arma solo cuando se consulta la traza,
+# y no se usa sys.stdout. El sumidero activo es propio de cada hilo.
+
+class SumideroNulo:
+    """Descarta todos los eventos. Para ejecuciones donde solo interesa el AST."""
+    activo = False
+
+    def regla(self, plantilla, linea, nodos):
+        pass
+
+    def error(self, linea, valor, posicion=None):
+        pass
+
+
+class SumideroTraza:
+    """
+    Guarda referencias a los eventos del parser y los formatea bajo demanda.
+    - eventos: lista de (plantilla, línea, nodos); en los errores la plantilla es None.
+    - errores: cantidad de errores de sintaxis recibidos.
+    - posiciones_error: posición en la entrada del token de cada error (None al final).
+    - indices_error: índice en eventos (y en lineas()) de cada error.
+    """
+    activo = True
+
+    def __init__(self):
+        self.eventos = []
+        self.errores = 0
+        self.posiciones_error = []
+        self.indices_error = []
+
+    def regla(self, plantilla, linea, nodos):
+        self.eventos.append((plantilla, linea, nodos))
+
+    def error(self, linea, valor, posicion=None):
+        self.errores += 1
+        self.indices_error.append(len(self.eventos))
+        self.eventos.append((None, linea, valor))
+        self.posiciones_error.append(posicion)
+
+    def lineas(self, desplazamiento_linea=0):
+        """
+        Genera el texto de cada evento, en el mismo formato de la traza original.
+        desplazamiento_linea se suma a las líneas (traza de una parte del archivo).
+        """
+        for indice in range(len(self.eventos)):
+            yield self.linea(indice, desplazamiento_linea)
+
+    def linea(self, indice, desplazamiento_linea=0):
+        """Texto de un solo evento, como lo genera lineas()."""
+        plantilla, linea, nodos = self.eventos[indice]
+        if linea and desplazamiento_linea:
+            linea += desplazamiento_linea
+        if plantilla is not None:
+            return f"Línea {linea}: " + plantilla.format(*nodos)
+        if linea is not None:
+            return f"Error de sintaxis en la línea {linea}: token '{nodos}'"
+        return "Error de sintaxis al final del archivo"
+
+
+_SUMIDERO_NULO = SumideroNulo()
+_estado = threading.local()
+
+def _sumidero_actual():
+    return getattr(_estado, 'sumidero', _SUMIDERO_NULO)
+
 
 # Precedencia para expresiones simples
 precedence = (
     ('left', 'OR'),
     ('left', 'AND'),
     ('right', 'NOT'),
+    ('left', 'LT', 'GT', 'LE', 'GE', 'EQ', 'NE'),
     ('left', 'PLUS', 'MINUS'),
     ('left', 'TIMES', 'DIVIDE'),
     ('right', 'UMINUS'),
@@ -18,10 +93,13 @@ def p_program(p):
     p[0] = p[1]
 
 # Lista de declaraciones
+# Las listas (declaraciones, parámetros, argumentos, elementos y miembros) se
+# extienden con append sobre la misma lista en lugar de copiarla en cada reducción
 
 def p_declarations_multiple(p):
     '''declarations : declarations declaration'''
-    p[0] = p[1] + [p[2]]
+    p[1].append(p[2])
+    p[0] = p[1]
 
 def p_declarations_single(p):
     '''declarations : declaration'''
@@ -33,7 +111,7 @@ def p_declarations_empty(p):
 
 # Declaración de variable (con o sin inicialización)
 
-def _msg(p, regla):
+def _linea(p):
     # Busca el primer elemento que sea un objeto token (PLY usa objetos LexToken)
     lineno = None
     for i in range(1, len(p)):
@@ -45,40 +123,47 @@ def _msg(p, regla):
             continue
     if not lineno:
         lineno = getattr(p.slice[1], 'lineno', 0) if len(p.slice) > 1 else 0
-    print(f"Línea {lineno}: {regla}")
+    return lineno
+
+def _msg(p, plantilla, *nodos):
+    # Notifica la regla reconocida al sumidero activo; la plantilla y los nodos
+    # solo se formatean si alguien lee la traza (ver SumideroTraza)
+    sumidero = _sumidero_actual()
+    if sumidero.activo:
+        sumidero.regla(plantilla, _linea(p), nodos)
 
 def p_declaration_init(p):
     '''declaration : type ID ASSIGN expression SEMICOLON'''
-    _msg(p, f"declaracion_variable : {p[1]} {p[2]} = {p[4]}")
+    _msg(p, "declaracion_variable : {} {} = {}", p[1], p[2], p[4])
     p[0] = ('decl_var_init', p[1], p[2], p[4])
 
 def p_declaration_noinit(p):
     '''declaration : type ID SEMICOLON'''
-    _msg(p, f"declaracion_variable : {p[1]} {p[2]}")
+    _msg(p, "declaracion_variable : {} {}", p[1], p[2])
     p[0] = ('decl_var', p[1], p[2])
 
 # Reglas para impresión por pantalla (Console.WriteLine)
 
 def p_declaration_print(p):
     '''declaration : CONSOLE DOT WRITELINE LPAREN expression RPAREN SEMICOLON'''
-    _msg(p, f"impresion : Console.WriteLine({p[5]})")
+    _msg(p, "impresion : Console.WriteLine({})", p[5])
     p[0] = ('print', p[5])
 
 # Estructura if-else y else if
 
 def p_declaration_if_else(p):
     '''declaration : IF LPAREN expression RPAREN LBRACE declarations RBRACE else_part'''
-    _msg(p, f"if : if ({p[3]}) {{ ... }} {p[7]}")
+    _msg(p, "if : if ({}) {{ ... }} {}", p[3], p[7])
     p[0] = ('if_else', p[3], p[6], p[8])
 
 def p_else_part_else(p):
     '''else_part : ELSE LBRACE declarations RBRACE'''
-    _msg(p, f"else : else {{ ... }}")
+    _msg(p, "else : else {{ ... }}")
     p[0] = ('else', p[3])
 
 def p_else_part_elseif(p):
     '''else_part : ELSE IF LPAREN expression RPAREN LBRACE declarations RBRACE else_part'''
-    _msg(p, f"else if : else if ({p[4]}) {{ ... }} {p[8]}")
+    _msg(p, "else if : else if ({}) {{ ... }} {}", p[4], p[8])
     p[0] = ('elseif', p[4], p[7], p[9])
 
 def p_else_part_empty(p):
@@ -89,7 +174,7 @@ def p_else_part_empty(p):
 
 def p_declaration_for(p):
     '''declaration : FOR LPAREN for_init SEMICOLON for_cond SEMICOLON for_iter RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"for : for ({p[3]}; {p[5]}; {p[7]}) {{ ... }}")
+    _msg(p, "for : for ({}; {}; {}) {{ ... }}", p[3], p[5], p[7])
     p[0] = ('for', p[3], p[5], p[7], p[10])
 
 # Inicialización del for (puede ser declaración, asignación o expresión vacía)
@@ -162,7 +247,8 @@ def p_expression_new_list_init(p):
 # Elementos de la lista
 def p_list_elements_multiple(p):
     '''list_elements : list_elements COMMA expression'''
-    p[0] = p[1] + [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 def p_list_elements_single(p):
     '''list_elements : expression'''
@@ -180,13 +266,13 @@ def p_expression_list_access(p):
 # Asignación a elemento de lista: lista[indice] = valor
 def p_declaration_list_assign(p):
     '''declaration : ID LBRACKET expression RBRACKET ASSIGN expression SEMICOLON'''
-    _msg(p, f"asignacion_lista : {p[1]}[{p[3]}] = {p[6]}")
+    _msg(p, "asignacion_lista : {}[{}] = {}", p[1], p[3], p[6])
     p[0] = ('list_assign', p[1], p[3], p[6])
 
 # Métodos de lista: lista.Add(elemento)
 def p_declaration_list_add(p):
     '''declaration : ID DOT ADD LPAREN expression RPAREN SEMICOLON'''
-    _msg(p, f"agregar_lista : {p[1]}.Add({p[5]})")
+    _msg(p, "agregar_lista : {}.Add({})", p[1], p[5])
     p[0] = ('list_add', p[1], p[5])
 
 # Expresiones simples
@@ -219,7 +305,7 @@ def p_expression_number(p):
 def p_expression_bool(p):
     '''expression : TRUE
                  | FALSE'''
-    p[0] = p[1]
+    p[0] = Booleano(p[1])
 
 def p_expression_string(p):
     '''expression : STRING_CONST'''
@@ -263,12 +349,13 @@ def p_expression_not(p):
 
 def p_declaration_function(p):
     '''declaration : type ID LPAREN params RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"funcion : {p[1]} {p[2]}({p[4]}) {{ ... }}")
+    _msg(p, "funcion : {} {}({}) {{ ... }}", p[1], p[2], p[4])
     p[0] = ('function', p[1], p[2], p[4], p[7])
 
 def p_params_multiple(p):
     '''params : params COMMA param'''
-    p[0] = p[1] + [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 def p_params_single(p):
     '''params : param'''
@@ -291,7 +378,8 @@ def p_expression_func_call(p):
 
 def p_args_multiple(p):
     '''args : args COMMA expression'''
-    p[0] = p[1] + [p[3]]
+    p[1].append(p[3])
+    p[0] = p[1]
 
 def p_args_single(p):
     '''args : expression'''
@@ -304,26 +392,26 @@ def p_args_empty(p):
 # Llamada a función como declaración (opcional, pero puede causar conflicto si no se usa correctamente)
 def p_declaration_func_call(p):
     '''declaration : ID LPAREN args RPAREN SEMICOLON'''
-    _msg(p, f"llamada_funcion : {p[1]}({p[3]})")
+    _msg(p, "llamada_funcion : {}({})", p[1], p[3])
     p[0] = ('func_call', p[1], p[3])
 
 # Regla para return
 
 def p_declaration_return(p):
     '''declaration : RETURN expression SEMICOLON'''
-    _msg(p, f"return : return {p[2]}")
+    _msg(p, "return : return {}", p[2])
     p[0] = ('return', p[2])
 
 # Reglas para definición de clases
 
 def p_declaration_class(p):
     '''declaration : access_modifier CLASS ID LBRACE class_members RBRACE'''
-    _msg(p, f"clase : {p[1]} class {p[3]} {{ ... }}")
+    _msg(p, "clase : {} class {} {{ ... }}", p[1], p[3])
     p[0] = ('class', p[1], p[3], p[5])
 
 def p_declaration_class_no_modifier(p):
     '''declaration : CLASS ID LBRACE class_members RBRACE'''
-    _msg(p, f"clase : class {p[2]} {{ ... }}")
+    _msg(p, "clase : class {} {{ ... }}", p[2])
     p[0] = ('class', None, p[2], p[4])
 
 # Modificadores de acceso
@@ -340,7 +428,8 @@ def p_access_modifier_empty(p):
 
 def p_class_members_multiple(p):
     '''class_members : class_members class_member'''
-    p[0] = p[1] + [p[2]]
+    p[1].append(p[2])
+    p[0] = p[1]
 
 def p_class_members_single(p):
     '''class_members : class_member'''
@@ -354,74 +443,137 @@ def p_class_members_empty(p):
 
 def p_class_member_field(p):
     '''class_member : access_modifier type ID SEMICOLON'''
-    _msg(p, f"campo : {p[1]} {p[2]} {p[3]}")
+    _msg(p, "campo : {} {} {}", p[1], p[2], p[3])
     p[0] = ('field', p[1], p[2], p[3])
 
 def p_class_member_field_init(p):
     '''class_member : access_modifier type ID ASSIGN expression SEMICOLON'''
-    _msg(p, f"campo_inicializado : {p[1]} {p[2]} {p[3]} = {p[5]}")
+    _msg(p, "campo_inicializado : {} {} {} = {}", p[1], p[2], p[3], p[5])
     p[0] = ('field_init', p[1], p[2], p[3], p[5])
 
 def p_class_member_field_no_modifier(p):
     '''class_member : type ID SEMICOLON'''
-    _msg(p, f"campo : {p[1]} {p[2]}")
+    _msg(p, "campo : {} {}", p[1], p[2])
     p[0] = ('field', None, p[1], p[2])
 
 def p_class_member_field_init_no_modifier(p):
     '''class_member : type ID ASSIGN expression SEMICOLON'''
-    _msg(p, f"campo_inicializado : {p[1]} {p[2]} = {p[4]}")
+    _msg(p, "campo_inicializado : {} {} = {}", p[1], p[2], p[4])
     p[0] = ('field_init', None, p[1], p[2], p[4])
 
 # Métodos de clase
 
 def p_class_member_method(p):
     '''class_member : access_modifier type ID LPAREN params RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"metodo : {p[1]} {p[2]} {p[3]}({p[5]}) {{ ... }}")
+    _msg(p, "metodo : {} {} {}({}) {{ ... }}", p[1], p[2], p[3], p[5])
     p[0] = ('method', p[1], p[2], p[3], p[5], p[8])
 
 def p_class_member_method_no_modifier(p):
     '''class_member : type ID LPAREN params RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"metodo : {p[1]} {p[2]}({p[4]}) {{ ... }}")
+    _msg(p, "metodo : {} {}({}) {{ ... }}", p[1], p[2], p[4])
     p[0] = ('method', None, p[1], p[2], p[4], p[7])
 
 # Métodos void
 
 def p_class_member_void_method(p):
     '''class_member : access_modifier VOID ID LPAREN params RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"metodo_void : {p[1]} void {p[3]}({p[5]}) {{ ... }}")
+    _msg(p, "metodo_void : {} void {}({}) {{ ... }}", p[1], p[3], p[5])
     p[0] = ('method', p[1], 'void', p[3], p[5], p[8])
 
 def p_class_member_void_method_no_modifier(p):
     '''class_member : VOID ID LPAREN params RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"metodo_void : void {p[2]}({p[4]}) {{ ... }}")
+    _msg(p, "metodo_void : void {}({}) {{ ... }}", p[2], p[4])
     p[0] = ('method', None, 'void', p[2], p[4], p[7])
 
 # Constructores de clase
 
 def p_class_member_constructor(p):
     '''class_member : access_modifier ID LPAREN params RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"constructor : {p[1]} {p[2]}({p[4]}) {{ ... }}")
+    _msg(p, "constructor : {} {}({}) {{ ... }}", p[1], p[2], p[4])
     p[0] = ('constructor', p[1], p[2], p[4], p[7])
 
 def p_class_member_constructor_no_modifier(p):
     '''class_member : ID LPAREN params RPAREN LBRACE declarations RBRACE'''
-    _msg(p, f"constructor : {p[1]}({p[3]}) {{ ... }}")
+    _msg(p, "constructor : {}({}) {{ ... }}", p[1], p[3])
     p[0] = ('constructor', None, p[1], p[3], p[6])
 
 # Asignación simple (después de las reglas de declaración existentes)
 def p_declaration_assign(p):
     '''declaration : ID ASSIGN expression SEMICOLON'''
-    _msg(p, f"asignacion : {p[1]} = {p[3]}")
+    _msg(p, "asignacion : {} = {}", p[1], p[3])
     p[0] = ('assign', p[1], p[3])
 
+# Recuperación de errores: descarta la sentencia inválida hasta el siguiente ';' o '}'
+# para que el resto del programa siga formando parte del árbol sintáctico.
+# No interviene en la traza ni en los errores reportados (ver _construir_parser)
+
+def p_declaration_error(p):
+    '''declaration : error SEMICOLON
+                   | error RBRACE'''
+    p[0] = ('error',)
+
 # Manejo de errores
 
 def p_error(p):
     if p:
-        print(f"Error de sintaxis en la línea {p.lineno}: token '{p.value}'")
+        _sumidero_actual().error(p.lineno, p.value, p.lexpos)
     else:
-        print("Error de sintaxis al final del archivo")
+        _sumidero_actual().error(None, None)
 
 
 # Construir el parser
-parser = yacc.yacc()
+# La tabla principal incluye las producciones de recuperación (p_declaration_error)
+# para que el árbol conserve lo que sigue a un error de sintaxis. La traza y la
+# cantidad de errores que se reportan salen de la gramática sin ellas
+# (parsetab_cs_traza.py), que se usa solo para reparsear una entrada con errores.
+
+REGLAS_RECUPERACION = ('p_declaration_error',)
+
+def _construir_parser(modulo=MODULO_PARSETAB, excluidas=()):
+    """
+    Carga el parser desde la tabla LALR precompilada (modulo) si su firma
+    coincide con la gramática actual; si no, regenera la tabla y la sella.
+    excluidas son funciones p_* que no forman parte de esta gramática.
+    Nunca escribe parser.out.
+    """
+    espacio = {nombre: valor for nombre, valor in globals().items() if nombre not in excluidas}
+    gramatica = types.SimpleNamespace(**espacio)
+    firma = calcular_firma(espacio.get('start'), precedence, tokens, reglas_de_modulo(espacio, 'p_'))
+    if tabla_vigente(modulo, firma):
+        return yacc.yacc(module=gramatica, tabmodule=modulo, optimize=True, debug=False, write_tables=False)
+    nuevo = yacc.yacc(module=gramatica, tabmodule=modulo, debug=False, outputdir=DIRECTORIO_TABLAS)
+    sellar_tabla(modulo, firma)
+    return nuevo
+
+parser = _construir_parser()
+_parser_traza = None
+_bloqueo_traza = threading.Lock()
+
+
+def nuevo_parser(traza=False):
+    """
+    Retorna otra instancia del parser que comparte las tablas LALR (de solo lectura)
+    pero no las pilas de estado, para parsear desde varios hilos a la vez.
+    Con traza=True es el parser sin recuperación de errores, que se carga al primer uso.
+    """
+    global _parser_traza
+    if not traza:
+        return copy.copy(parser)
+    with _bloqueo_traza:
+        if _parser_traza is None:
+            _parser_traza = _construir_parser(MODULO_PARSETAB_TRAZA, REGLAS_RECUPERACION)
+    return copy.copy(_parser_traza)
+
+
+def parsear(lexer, sumidero=None, parser_propio=None):
+    """
+    Parsea los tokens que entrega lexer (por ejemplo un AlimentadorTokens) y
+    retorna el AST. Los eventos de la traza van a sumidero (SumideroNulo si no se indica).
+    Para parsear en paralelo, cada hilo debe pasar su propia instancia (nuevo_parser()).
+    """
+    anterior = _sumidero_actual()
+    _estado.sumidero = sumidero if sumidero is not None else _SUMIDERO_NULO
+    try:
+        return (parser_propio or parser).parse(lexer=lexer)
+    finally:
+        _estado.sumidero = anterior
@@ -0,0 +1,92 @@
+# -------------------------------------------------------------
+# tablas.py - Tablas precompiladas del lexer y del parser
+#
+# Las tablas de PLY se guardan como módulos importables versionados
+# en el repositorio (lextab_cs.py, parsetab_cs.py y parsetab_cs_traza.py).
+# Cada módulo lleva la firma (hash) de las reglas con que se generó: al
+# importar lexer.py y syntax.py se compara la firma y solo se regeneran
+# si la gramática cambió. Nunca se escriben archivos de depuración (parser.out).
+#
+# Uso: python src/tablas.py   (regenera las tablas y muestra los
+# avisos de conflictos de la gramática)
+# -------------------------------------------------------------
+
+import hashlib
+import importlib
+import os
+import sys
+
+from ply import __version__ as version_ply
+
+DIRECTORIO_TABLAS = os.path.dirname(os.path.abspath(__file__))
+MODULO_LEXTAB = "lextab_cs"
+MODULO_PARSETAB = "parsetab_cs"
+# Gramática sin las producciones de recuperación de errores (ver syntax.py)
+MODULO_PARSETAB_TRAZA = "parsetab_cs_traza"
+
+
+def calcular_firma(*partes):
+    """Retorna el hash SHA-1 de las partes que definen una gramática (y de la versión de PLY)."""
+    h = hashlib.sha1(version_ply.encode("utf-8"))
+    for parte in partes:
+        h.update(b"\0")
+        h.update(repr(parte).encode("utf-8"))
+    return h.hexdigest()
+
+
+def reglas_de_modulo(espacio, prefijo):
+    """
+    Lista (nombre, docstring) de las funciones de reglas de un módulo en orden de
+    definición. En PLY el docstring de cada función es la regla (regex o producción).
+    """
+    funciones = [
+        valor for nombre, valor in espacio.items()
+        if nombre.startswith(prefijo) and callable(valor) and hasattr(valor, "__code__")
+    ]
+    funciones.sort(key=lambda f: f.__code__.co_firstlineno)
+    return [(f.__name__, f.__doc__) for f in funciones]
+
+
+def tabla_vigente(modulo, firma):
+    """Indica si el módulo de tablas existe y fue generado con la firma indicada."""
+    try:
+        tabla = importlib.import_module(modulo)
+    except ImportError:
+        return False
+    return getattr(tabla, "_firma_gramatica", None) == firma
+
+
+def sellar_tabla(modulo, firma):
+    """
+    Agrega (o reemplaza) la firma al final del módulo de tablas generado por PLY.
+    Si el directorio es de solo lectura, las tablas quedan solo en memoria.
+    """
+    ruta = os.path.join(DIRECTORIO_TABLAS, modulo + ".py")
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            lineas = [linea for linea in f if not linea.startswith("_firma_gramatica")]
+        lineas.append(f"_firma_gramatica = {firma!r}\n")
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.writelines(lineas)
+    except OSError:
+        return False
+    sys.modules.pop(modulo, None)
+    return True
+
+
+def regenerar_tablas():
+    """Borra las tablas guardadas y las vuelve a generar importando lexer.py y syntax.py."""
+    for modulo in (MODULO_LEXTAB, MODULO_PARSETAB, MODULO_PARSETAB_TRAZA):
+        sys.modules.pop(modulo, None)
+        ruta = os.path.join(DIRECTORIO_TABLAS, modulo + ".py")
+        if os.path.exists(ruta):
+            os.remove(ruta)
+    import lexer  # noqa: F401
+    import syntax
+    syntax.nuevo_parser(traza=True)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, DIRECTORIO_TABLAS)
+    regenerar_tablas()
+    print(f"Tablas generadas en {DIRECTORIO_TABLAS}: {MODULO_LEXTAB}.py, {MODULO_PARSETAB}.py, {MODULO_PARSETAB_TRAZA}.py")